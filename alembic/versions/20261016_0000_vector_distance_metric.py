@@ -0,0 +1,47 @@
+"""Align the vector index operator class with the configured distance metric
+
+Revision ID: vector_distance_metric
+Revises: phase2_ml_tables
+Create Date: 2026-10-16 00:00:00.000000
+
+pgvector only uses an ANN index when the query operator matches the index
+operator class. Search queries now take their operator from
+VECTOR_DISTANCE_METRIC (truthgraph.db_queries.distance, default cosine), so
+this migration makes sure the IVFFlat index for that metric exists and drops
+indexes built for the other metrics.
+
+With the default (cosine) this keeps idx_embeddings_vector_cosine as created
+by phase2_ml_tables. To switch metrics later, set VECTOR_DISTANCE_METRIC and
+re-run this migration (downgrade, upgrade) or QueryBuilder.create_vector_index().
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from truthgraph.db_queries.distance import DistanceMetric, get_distance_metric
+
+# revision identifiers, used by Alembic.
+revision: str = "vector_distance_metric"
+down_revision: Union[str, None] = "phase2_ml_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches the phase2_ml_tables index; ~sqrt(rows) for larger corpora
+IVFFLAT_LISTS = 100
+
+
+def _use_metric(metric: DistanceMetric) -> None:
+    op.execute(metric.create_ivfflat_index_sql(table="embeddings", lists=IVFFLAT_LISTS))
+    for other in DistanceMetric:
+        if other is not metric:
+            op.execute(f"DROP INDEX IF EXISTS {other.index_name('embeddings')}")
+
+
+def upgrade() -> None:
+    """Upgrade database schema - index the configured distance metric."""
+    _use_metric(get_distance_metric())
+
+
+def downgrade() -> None:
+    """Downgrade database schema - restore the cosine index only."""
+    _use_metric(DistanceMetric.COSINE)
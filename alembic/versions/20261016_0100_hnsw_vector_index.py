@@ -0,0 +1,59 @@
+"""Optional HNSW vector index
+
+Revision ID: hnsw_vector_index
+Revises: vector_distance_metric
+Create Date: 2026-10-16 01:00:00.000000
+
+HNSW indexes need no training step, so unlike IVFFlat they do not degrade as
+the corpus grows past the data the lists were built from, and the recall /
+latency tradeoff is tuned per query with hnsw.ef_search instead of by
+rebuilding (see truthgraph.db_queries.vector_index).
+
+With VECTOR_INDEX_TYPE=hnsw this builds idx_embeddings_vector_hnsw_<metric>
+for VECTOR_DISTANCE_METRIC using HNSW_M / HNSW_EF_CONSTRUCTION (default 16 /
+64) and drops the IVFFlat index so the planner has a single vector index to
+choose. With the default (ivfflat) the schema is left as it is. Building HNSW
+on a large table is much faster when maintenance_work_mem fits the graph.
+
+Downgrade removes HNSW indexes and restores the IVFFlat index.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from truthgraph.db_queries.distance import DistanceMetric, get_distance_metric
+from truthgraph.db_queries.vector_index import HNSWParams, VectorIndexType, get_vector_index_type
+
+# revision identifiers, used by Alembic.
+revision: str = "hnsw_vector_index"
+down_revision: Union[str, None] = "vector_distance_metric"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches the vector_distance_metric index
+IVFFLAT_LISTS = 100
+
+
+def _drop_hnsw_indexes(keep: DistanceMetric | None = None) -> None:
+    for metric in DistanceMetric:
+        if metric is not keep:
+            op.execute(f"DROP INDEX IF EXISTS {metric.index_name('embeddings', 'hnsw')}")
+
+
+def upgrade() -> None:
+    """Upgrade database schema - build the HNSW index when configured."""
+    metric = get_distance_metric()
+    if get_vector_index_type() is not VectorIndexType.HNSW:
+        _drop_hnsw_indexes()
+        return
+
+    op.execute(HNSWParams.from_env().index_sql(metric, table="embeddings"))
+    _drop_hnsw_indexes(keep=metric)
+    for other in DistanceMetric:
+        op.execute(f"DROP INDEX IF EXISTS {other.index_name('embeddings')}")
+
+
+def downgrade() -> None:
+    """Downgrade database schema - back to the IVFFlat index."""
+    op.execute(get_distance_metric().create_ivfflat_index_sql("embeddings", lists=IVFFLAT_LISTS))
+    _drop_hnsw_indexes()
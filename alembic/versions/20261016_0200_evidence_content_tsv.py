@@ -0,0 +1,44 @@
+"""Generated tsvector column and GIN index for keyword search
+
+Revision ID: evidence_content_tsv
+Revises: hnsw_vector_index
+Create Date: 2026-10-16 02:00:00.000000
+
+The keyword branch of hybrid search matched and ranked on
+to_tsvector('english', content) computed per row and per query, which no
+index could serve, so every keyword query re-tokenized the evidence table.
+This stores the tsvector as a generated column (kept current by Postgres on
+every insert and update of content) and indexes it with GIN.
+
+Adding a STORED generated column rewrites the evidence table under an ACCESS
+EXCLUSIVE lock; on a large table run it in a maintenance window.
+
+Downgrade drops the index and the column.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "evidence_content_tsv"
+down_revision: Union[str, None] = "hnsw_vector_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add and index evidence.content_tsv."""
+    op.execute(
+        "ALTER TABLE evidence ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_evidence_content_tsv ON evidence USING gin (content_tsv)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - remove evidence.content_tsv."""
+    op.execute("DROP INDEX IF EXISTS idx_evidence_content_tsv")
+    op.execute("ALTER TABLE evidence DROP COLUMN IF EXISTS content_tsv")
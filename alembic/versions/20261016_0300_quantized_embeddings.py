@@ -0,0 +1,69 @@
+"""Optional quantized shadow columns for two-stage vector search
+
+Revision ID: quantized_embeddings
+Revises: evidence_content_tsv
+Create Date: 2026-10-16 03:00:00.000000
+
+With VECTOR_SEARCH_QUANTIZATION=halfvec or binary this adds embedding_half
+(halfvec(384)) and embedding_binary (bit(384)) to embeddings, plus a trigger
+that fills both from embedding on every insert and embedding update (see
+truthgraph.db_queries.quantization), and builds the HNSW index for the
+configured column. Adding nullable columns does not rewrite the table;
+existing rows stay NULL until scripts/backfill_quantized_embeddings.py has
+run. On a large table it is cheaper to backfill first and build the index
+afterwards with ``backfill_quantized_embeddings.py --create-index``.
+
+With the default (none) the schema is left as it is, so embedding writes do
+not pay for the trigger and older pgvector versions keep working. To enable
+quantization later, run ``backfill_quantized_embeddings.py --install``.
+Enabling it requires pgvector >= 0.7 (halfvec, bit indexes, binary_quantize).
+
+Downgrade drops the indexes, the trigger and the columns if they exist.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from truthgraph.db_queries.distance import DistanceMetric, get_distance_metric
+from truthgraph.db_queries.quantization import (
+    INSTALL_SQL,
+    UNINSTALL_SQL,
+    VectorQuantization,
+    get_vector_quantization,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "quantized_embeddings"
+down_revision: Union[str, None] = "evidence_content_tsv"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_quantized_indexes(keep: str | None = None) -> None:
+    names = {
+        quantization.index_name(metric)
+        for quantization in (VectorQuantization.HALFVEC, VectorQuantization.BINARY)
+        for metric in DistanceMetric
+    }
+    for name in sorted(names - {keep}):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add and index the quantized columns if enabled."""
+    quantization = get_vector_quantization()
+    if quantization is VectorQuantization.NONE:
+        return
+    for statement in INSTALL_SQL:
+        op.execute(statement)
+
+    metric = get_distance_metric()
+    op.execute(quantization.index_sql(metric))
+    _drop_quantized_indexes(keep=quantization.index_name(metric))
+
+
+def downgrade() -> None:
+    """Downgrade database schema - remove the quantized columns."""
+    _drop_quantized_indexes()
+    for statement in UNINSTALL_SQL:
+        op.execute(statement)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Backfill the quantized shadow columns of the embeddings table.
+
+With VECTOR_SEARCH_QUANTIZATION=halfvec or binary, the quantized_embeddings
+migration adds embedding_half (halfvec) and embedding_binary (bit) columns and
+a trigger that keeps them in sync for new writes. Databases migrated with the
+default (none) have neither; --install adds them (requires pgvector >= 0.7).
+Rows written before the columns existed stay NULL, and are invisible to
+two-stage searches, until this script has filled them.
+
+Updates run in committed batches with FOR UPDATE SKIP LOCKED, so the script is
+safe to run against a live database and can be interrupted and re-run.
+
+Usage:
+    # Backfill every tenant
+    python scripts/backfill_quantized_embeddings.py
+
+    # Enable quantization on a database migrated without it, then backfill
+    VECTOR_SEARCH_QUANTIZATION=halfvec python scripts/backfill_quantized_embeddings.py \
+        --install --create-index
+
+    # One tenant, smaller transactions
+    python scripts/backfill_quantized_embeddings.py --tenant-id acme --batch-size 1000
+
+    # Build the HNSW index for VECTOR_SEARCH_QUANTIZATION afterwards
+    python scripts/backfill_quantized_embeddings.py --create-index
+
+Environment Variables:
+    DATABASE_URL - Database connection string
+    VECTOR_SEARCH_QUANTIZATION - Column to index with --create-index (halfvec or binary)
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from truthgraph.db import SessionLocal
+from truthgraph.db_queries.distance import get_distance_metric
+from truthgraph.db_queries.quantization import (
+    VectorQuantization,
+    backfill_quantized_embeddings,
+    get_vector_quantization,
+    install_quantized_columns,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    """Main entry point for the backfill script."""
+    parser = argparse.ArgumentParser(
+        description="Fill embedding_half / embedding_binary for existing embeddings",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Rows per transaction (default: 5000)"
+    )
+    parser.add_argument("--tenant-id", default=None, help="Only backfill this tenant")
+    parser.add_argument(
+        "--install",
+        action="store_true",
+        help="Add the shadow columns and their sync trigger before the backfill",
+    )
+    parser.add_argument(
+        "--create-index",
+        action="store_true",
+        help="Build the HNSW index for VECTOR_SEARCH_QUANTIZATION after the backfill",
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        if args.install:
+            install_quantized_columns(session)
+        start = time.perf_counter()
+        updated = backfill_quantized_embeddings(
+            session, batch_size=args.batch_size, tenant_id=args.tenant_id
+        )
+        logger.info(f"Backfilled {updated} rows in {time.perf_counter() - start:.1f}s")
+
+        if args.create_index:
+            quantization = get_vector_quantization()
+            if quantization is VectorQuantization.NONE:
+                logger.error("--create-index needs VECTOR_SEARCH_QUANTIZATION=halfvec or binary")
+                return 1
+            statement = quantization.index_sql(get_distance_metric())
+            logger.info(f"Building index: {statement}")
+            start = time.perf_counter()
+            session.execute(text(statement))
+            session.commit()
+            logger.info(f"Index built in {time.perf_counter() - start:.1f}s")
+        return 0
+    except (RuntimeError, ValueError) as e:
+        logger.error(str(e))
+        return 1
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Index build failed: {e}")
+        return 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
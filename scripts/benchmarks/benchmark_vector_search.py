@@ -6,6 +6,8 @@ This script measures vector search performance across various dimensions:
 - Batch query throughput
 - IVFFlat index parameter testing (lists and probes)
 - Recall accuracy vs speed tradeoffs
+- Quantized two-stage search (halfvec / binary + re-rank) recall against the
+  full-precision path
 - Memory usage and index size
 - Scaling characteristics
 
@@ -56,6 +58,11 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from truthgraph.db import Base
+from truthgraph.db_queries.quantization import (
+    VectorQuantization,
+    backfill_quantized_embeddings,
+    install_quantized_columns,
+)
 from truthgraph.schemas import Embedding, Evidence
 from truthgraph.services.vector_search_service import VectorSearchService
 
@@ -501,6 +508,102 @@ def benchmark_index_parameters(
     return results
 
 
+def benchmark_quantized_search(
+    session,
+    service: VectorSearchService,
+    quantizations: list[VectorQuantization],
+    oversample_values: list[int],
+    tenant_id: str,
+    num_queries: int = 30,
+    top_k: int = 10,
+) -> dict[str, Any]:
+    """Benchmark two-stage quantized search against the current full-precision path.
+
+    Recall@k is the fraction of the full-precision search's results that the
+    two-stage search also returns for the same query.
+
+    Args:
+        session: Database session
+        service: Full-precision VectorSearchService (the reference)
+        quantizations: Stage-one representations to test
+        oversample_values: Candidates fetched per requested result
+        tenant_id: Tenant ID
+        num_queries: Number of queries per configuration
+        top_k: Results per query
+
+    Returns:
+        Latency and recall for the reference and every configuration
+    """
+    print("\n" + "=" * 80)
+    print("BENCHMARK: Quantized Two-Stage Search")
+    print("=" * 80)
+
+    install_quantized_columns(session)
+    backfilled = backfill_quantized_embeddings(session, tenant_id=tenant_id)
+    print(f"Backfilled shadow columns for {backfilled} rows")
+    for quantization in quantizations:
+        session.execute(text(quantization.index_sql(service.metric)))
+    session.commit()
+
+    queries = [
+        [i / num_queries + (0.001 * k) for k in range(service.embedding_dimension)]
+        for i in range(num_queries)
+    ]
+
+    def run(search_service: VectorSearchService) -> tuple[list[float], list[set]]:
+        times, found = [], []
+        for query in queries:
+            start = time.perf_counter()
+            results = search_service.search_similar_evidence(
+                db=session, query_embedding=query, top_k=top_k, tenant_id=tenant_id
+            )
+            times.append((time.perf_counter() - start) * 1000)
+            found.append({r.evidence_id for r in results})
+        return times, found
+
+    reference_times, reference = run(service)
+    results = {
+        "top_k": top_k,
+        "num_queries": num_queries,
+        "reference": {
+            "quantization": "none",
+            "mean_query_ms": mean(reference_times),
+            "median_query_ms": median(reference_times),
+        },
+        "configurations": [],
+    }
+    print(f"  full precision: {mean(reference_times):.1f}ms mean")
+
+    for quantization in quantizations:
+        for oversample in oversample_values:
+            two_stage = VectorSearchService(
+                embedding_dimension=service.embedding_dimension,
+                metric=service.metric,
+                quantization=quantization,
+                rerank_oversample=oversample,
+            )
+            times, found = run(two_stage)
+            recalls = [
+                len(got & expected) / len(expected)
+                for got, expected in zip(found, reference, strict=True)
+                if expected
+            ]
+            config = {
+                "quantization": quantization.value,
+                "rerank_oversample": oversample,
+                "mean_query_ms": mean(times),
+                "median_query_ms": median(times),
+                "recall_at_k": mean(recalls) if recalls else 0.0,
+            }
+            results["configurations"].append(config)
+            print(
+                f"  {quantization.value:8s} x{oversample:<3d} "
+                f"{config['mean_query_ms']:.1f}ms mean, recall@{top_k}={config['recall_at_k']:.3f}"
+            )
+
+    return results
+
+
 def save_results(results: dict[str, Any], output_path: Path) -> None:
     """Save results to JSON file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -606,6 +709,23 @@ def main() -> int:
     parser.add_argument(
         "--probes", type=str, default="1,5,10,25", help="Comma-separated probes values to test"
     )
+    parser.add_argument(
+        "--test-quantization",
+        action="store_true",
+        help="Compare quantized two-stage search with the full-precision path",
+    )
+    parser.add_argument(
+        "--quantizations",
+        type=str,
+        default="halfvec,binary",
+        help="Comma-separated stage-one representations to test",
+    )
+    parser.add_argument(
+        "--rerank-oversample",
+        type=str,
+        default="2,4,10",
+        help="Comma-separated candidates-per-result values to test",
+    )
     parser.add_argument("--csv-output", type=str, help="Optional CSV output file for latency data")
 
     args = parser.parse_args()
@@ -614,6 +734,8 @@ def main() -> int:
     corpus_sizes = [int(x.strip()) for x in args.corpus_sizes.split(",")]
     lists_values = [int(x.strip()) for x in args.lists.split(",")]
     probes_values = [int(x.strip()) for x in args.probes.split(",")]
+    quantizations = [VectorQuantization.parse(x) for x in args.quantizations.split(",")]
+    oversample_values = [int(x.strip()) for x in args.rerank_oversample.split(",")]
 
     # Database URL from env var or use default
     database_url = args.database_url or os.getenv(
@@ -664,7 +786,9 @@ def main() -> int:
         session = SessionLocal()
         try:
             create_test_corpus(session, standard_size, args.embedding_dim, tenant_id)
-            service = VectorSearchService(embedding_dimension=args.embedding_dim)
+            service = VectorSearchService(
+                embedding_dimension=args.embedding_dim, quantization=VectorQuantization.NONE
+            )
 
             # Query latency
             all_results["benchmarks"]["query_latency"] = benchmark_query_latency(
@@ -687,6 +811,12 @@ def main() -> int:
                     session, service, lists_values, probes_values, tenant_id
                 )
 
+            # Quantized two-stage search vs the full-precision path
+            if args.test_quantization:
+                all_results["benchmarks"]["quantized_search"] = benchmark_quantized_search(
+                    session, service, quantizations, oversample_values, tenant_id
+                )
+
         finally:
             session.close()
 
@@ -724,6 +854,16 @@ def main() -> int:
                 print(f"  lists={opt['lists']}, probes={opt['probes']}")
                 print(f"  Mean latency: {opt['mean_query_ms']:.1f} ms")
 
+        if "quantized_search" in all_results["benchmarks"]:
+            qs = all_results["benchmarks"]["quantized_search"]
+            print(f"\nQuantized search (recall@{qs['top_k']} vs full precision):")
+            print(f"  full precision:  {qs['reference']['mean_query_ms']:6.1f} ms mean")
+            for config in qs["configurations"]:
+                print(
+                    f"  {config['quantization']:8s} x{config['rerank_oversample']:<3d}    "
+                    f"{config['mean_query_ms']:6.1f} ms mean, recall {config['recall_at_k']:.3f}"
+                )
+
         # Save results
         if args.output:
             output_path = Path(args.output)
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
-"""IVFFlat index parameter optimization for pgvector.
+"""Vector index (IVFFlat and HNSW) parameter optimization for pgvector.
 
-This script systematically tests different IVFFlat index configurations to find
-optimal parameters for:
-- lists: Number of inverted lists (partitions)
-- probes: Number of lists to search during queries
+This script systematically tests different IVFFlat and HNSW index configurations
+to find optimal parameters for:
+- lists: Number of inverted lists (partitions) - IVFFlat
+- probes: Number of lists to search during queries - IVFFlat
+- m: Links per graph node - HNSW
+- ef_construction: Candidate list size while building - HNSW
+- ef_search: Candidate list size while searching - HNSW
 
 Performance targets:
 - Search latency: <3 seconds for 10K items
@@ -23,6 +26,17 @@ Recommended ranges:
 - For 1k items: lists in [10, 25], probes in [1, 5]
 - For 10k items: lists in [25, 100], probes in [5, 25]
 - For 50k items: lists in [50, 200], probes in [10, 50]
+
+HNSW Parameter Guidelines:
+- m: 16 is a good default; 32+ helps high-dimensional or very large corpora
+- ef_construction: >= 2 * m; higher builds a better graph but more slowly
+- ef_search: tuned per query (no rebuild), must be >= top_k
+  - Low ef_search: Fast but lower recall
+  - High ef_search: Slower but better recall
+
+Example:
+    python scripts/benchmarks/index_optimization.py --index-types ivfflat,hnsw \\
+        --hnsw-m 8,16 --ef-search 10,40,100
 """
 
 import argparse
@@ -155,37 +169,34 @@ def create_test_corpus(
     return ground_truth_embeddings
 
 
-def create_ivfflat_index(session, lists: int, embedding_dim: int, tenant_id: str) -> dict[str, Any]:
-    """Create IVFFlat index with specified parameters.
+IVFFLAT_INDEX_NAME = "embeddings_ivfflat_idx"
+HNSW_INDEX_NAME = "embeddings_hnsw_idx"
+HNSW_PARAMETER_KEYS = ("m", "ef_construction", "ef_search")
+
+
+def _create_benchmark_index(session, index_name: str, index_sql: str) -> dict[str, Any]:
+    """Replace the benchmark vector indexes with a new one and time its build.
+
+    Both benchmark indexes are dropped first so each configuration is measured
+    with a single candidate index.
 
     Args:
         session: Database session
-        lists: Number of inverted lists
-        embedding_dim: Embedding dimension
-        tenant_id: Tenant ID
+        index_name: Name of the index created by index_sql
+        index_sql: CREATE INDEX statement
 
     Returns:
         Dictionary with index creation statistics
     """
-    print(f"\nCreating IVFFlat index: lists={lists}, dim={embedding_dim}...")
-
-    # Drop existing index if present
+    # Drop existing indexes if present
     try:
-        session.execute(text("DROP INDEX IF EXISTS embeddings_ivfflat_idx"))
+        for name in (IVFFLAT_INDEX_NAME, HNSW_INDEX_NAME):
+            session.execute(text(f"DROP INDEX IF EXISTS {name}"))
         session.commit()
     except Exception as e:
         print(f"  Warning: Could not drop index: {e}")
         session.rollback()
 
-    # Create index with timing
-    index_sql = f"""
-    CREATE INDEX embeddings_ivfflat_idx
-    ON embeddings
-    USING ivfflat (embedding vector_cosine_ops)
-    WITH (lists = {lists})
-    WHERE entity_type = 'evidence' AND tenant_id = '{tenant_id}'
-    """
-
     start_time = time.perf_counter()
     try:
         session.execute(text(index_sql))
@@ -196,14 +207,13 @@ def create_ivfflat_index(session, lists: int, embedding_dim: int, tenant_id: str
 
         # Get index size
         size_result = session.execute(
-            text("SELECT pg_size_pretty(pg_relation_size('embeddings_ivfflat_idx')) as size")
+            text(f"SELECT pg_size_pretty(pg_relation_size('{index_name}')) as size")
         )
         index_size = size_result.fetchone()[0]
 
         print(f"  Index created in {build_time_sec:.2f} seconds, size: {index_size}")
 
         return {
-            "lists": lists,
             "build_time_sec": build_time_sec,
             "index_size": index_size,
             "success": True,
@@ -213,7 +223,6 @@ def create_ivfflat_index(session, lists: int, embedding_dim: int, tenant_id: str
         print(f"  ERROR: Index creation failed: {e}")
         session.rollback()
         return {
-            "lists": lists,
             "build_time_sec": 0.0,
             "index_size": "0 bytes",
             "success": False,
@@ -221,6 +230,65 @@ def create_ivfflat_index(session, lists: int, embedding_dim: int, tenant_id: str
         }
 
 
+def create_ivfflat_index(session, lists: int, embedding_dim: int, tenant_id: str) -> dict[str, Any]:
+    """Create IVFFlat index with specified parameters.
+
+    Args:
+        session: Database session
+        lists: Number of inverted lists
+        embedding_dim: Embedding dimension
+        tenant_id: Tenant ID
+
+    Returns:
+        Dictionary with index creation statistics
+    """
+    print(f"\nCreating IVFFlat index: lists={lists}, dim={embedding_dim}...")
+
+    index_sql = f"""
+    CREATE INDEX {IVFFLAT_INDEX_NAME}
+    ON embeddings
+    USING ivfflat (embedding vector_cosine_ops)
+    WITH (lists = {lists})
+    WHERE entity_type = 'evidence' AND tenant_id = '{tenant_id}'
+    """
+
+    return {"lists": lists, **_create_benchmark_index(session, IVFFLAT_INDEX_NAME, index_sql)}
+
+
+def create_hnsw_index(
+    session, m: int, ef_construction: int, embedding_dim: int, tenant_id: str
+) -> dict[str, Any]:
+    """Create HNSW index with specified parameters.
+
+    Args:
+        session: Database session
+        m: Links per graph node
+        ef_construction: Candidate list size while building
+        embedding_dim: Embedding dimension
+        tenant_id: Tenant ID
+
+    Returns:
+        Dictionary with index creation statistics
+    """
+    print(
+        f"\nCreating HNSW index: m={m}, ef_construction={ef_construction}, dim={embedding_dim}..."
+    )
+
+    index_sql = f"""
+    CREATE INDEX {HNSW_INDEX_NAME}
+    ON embeddings
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = {m}, ef_construction = {ef_construction})
+    WHERE entity_type = 'evidence' AND tenant_id = '{tenant_id}'
+    """
+
+    return {
+        "m": m,
+        "ef_construction": ef_construction,
+        **_create_benchmark_index(session, HNSW_INDEX_NAME, index_sql),
+    }
+
+
 def set_ivfflat_probes(session, probes: int) -> None:
     """Set ivfflat.probes parameter for current session.
 
@@ -238,6 +306,7 @@ def measure_search_accuracy(
     num_queries: int,
     top_k: int,
     tenant_id: str,
+    ef_search: int | None = None,
 ) -> dict[str, Any]:
     """Measure search accuracy using ground truth embeddings.
 
@@ -251,6 +320,7 @@ def measure_search_accuracy(
         num_queries: Number of queries to test
         top_k: Number of results to retrieve
         tenant_id: Tenant ID
+        ef_search: HNSW ef_search applied to each search (None: server setting)
 
     Returns:
         Dictionary with accuracy metrics
@@ -269,7 +339,11 @@ def measure_search_accuracy(
         query_embedding = ground_truth_embeddings[query_idx].tolist()
 
         results = service.search_similar_evidence(
-            db=session, query_embedding=query_embedding, top_k=top_k, tenant_id=tenant_id
+            db=session,
+            query_embedding=query_embedding,
+            top_k=top_k,
+            tenant_id=tenant_id,
+            ef_search=ef_search,
         )
 
         if not results:
@@ -300,34 +374,27 @@ def measure_search_accuracy(
     }
 
 
-def benchmark_index_configuration(
+def _benchmark_queries(
     session,
     service: VectorSearchService,
-    lists: int,
-    probes: int,
     ground_truth_embeddings: list[np.ndarray],
     num_queries: int,
     tenant_id: str,
+    ef_search: int | None = None,
 ) -> dict[str, Any]:
-    """Benchmark a specific index configuration.
+    """Measure search latency and accuracy for the current index settings.
 
     Args:
         session: Database session
         service: VectorSearchService instance
-        lists: Number of inverted lists
-        probes: Number of probes
         ground_truth_embeddings: Ground truth embeddings
         num_queries: Number of queries to test
         tenant_id: Tenant ID
+        ef_search: HNSW ef_search applied to each search (None: server setting)
 
     Returns:
-        Benchmark results
+        Latency and accuracy metrics
     """
-    print(f"\nBenchmarking: lists={lists}, probes={probes}")
-
-    # Set probes
-    set_ivfflat_probes(session, probes)
-
     # Measure latency
     query_times = []
 
@@ -337,8 +404,12 @@ def benchmark_index_configuration(
         query_embedding = ground_truth_embeddings[query_idx].tolist()
 
         start_time = time.perf_counter()
-        results = service.search_similar_evidence(
-            db=session, query_embedding=query_embedding, top_k=10, tenant_id=tenant_id
+        service.search_similar_evidence(
+            db=session,
+            query_embedding=query_embedding,
+            top_k=10,
+            tenant_id=tenant_id,
+            ef_search=ef_search,
         )
         end_time = time.perf_counter()
 
@@ -346,12 +417,16 @@ def benchmark_index_configuration(
 
     # Measure accuracy
     accuracy_metrics = measure_search_accuracy(
-        session, service, ground_truth_embeddings, num_queries=20, top_k=10, tenant_id=tenant_id
+        session,
+        service,
+        ground_truth_embeddings,
+        num_queries=20,
+        top_k=10,
+        tenant_id=tenant_id,
+        ef_search=ef_search,
     )
 
     result = {
-        "lists": lists,
-        "probes": probes,
         "num_queries": num_queries,
         "mean_latency_ms": mean(query_times),
         "median_latency_ms": median(query_times),
@@ -371,6 +446,126 @@ def benchmark_index_configuration(
     return result
 
 
+def benchmark_index_configuration(
+    session,
+    service: VectorSearchService,
+    lists: int,
+    probes: int,
+    ground_truth_embeddings: list[np.ndarray],
+    num_queries: int,
+    tenant_id: str,
+) -> dict[str, Any]:
+    """Benchmark a specific IVFFlat index configuration.
+
+    Args:
+        session: Database session
+        service: VectorSearchService instance
+        lists: Number of inverted lists
+        probes: Number of probes
+        ground_truth_embeddings: Ground truth embeddings
+        num_queries: Number of queries to test
+        tenant_id: Tenant ID
+
+    Returns:
+        Benchmark results
+    """
+    print(f"\nBenchmarking: lists={lists}, probes={probes}")
+
+    # Set probes
+    set_ivfflat_probes(session, probes)
+
+    metrics = _benchmark_queries(session, service, ground_truth_embeddings, num_queries, tenant_id)
+    return {"index_type": "ivfflat", "lists": lists, "probes": probes, **metrics}
+
+
+def benchmark_hnsw_configuration(
+    session,
+    service: VectorSearchService,
+    m: int,
+    ef_construction: int,
+    ef_search: int,
+    ground_truth_embeddings: list[np.ndarray],
+    num_queries: int,
+    tenant_id: str,
+) -> dict[str, Any]:
+    """Benchmark a specific HNSW index configuration.
+
+    ef_search is passed per request, so it is applied with SET LOCAL semantics
+    exactly as in production searches.
+
+    Args:
+        session: Database session
+        service: VectorSearchService instance
+        m: Links per graph node
+        ef_construction: Candidate list size used to build the index
+        ef_search: Candidate list size while searching
+        ground_truth_embeddings: Ground truth embeddings
+        num_queries: Number of queries to test
+        tenant_id: Tenant ID
+
+    Returns:
+        Benchmark results
+    """
+    print(f"\nBenchmarking: m={m}, ef_construction={ef_construction}, ef_search={ef_search}")
+
+    metrics = _benchmark_queries(
+        session, service, ground_truth_embeddings, num_queries, tenant_id, ef_search=ef_search
+    )
+    return {
+        "index_type": "hnsw",
+        "m": m,
+        "ef_construction": ef_construction,
+        "ef_search": ef_search,
+        **metrics,
+    }
+
+
+def _configuration_parameters(config: dict[str, Any]) -> dict[str, Any]:
+    """Index-specific parameters of a benchmarked configuration."""
+    keys = ("lists", "probes") if config["index_type"] == "ivfflat" else HNSW_PARAMETER_KEYS
+    return {"index_type": config["index_type"], **{k: config[k] for k in keys}}
+
+
+def _format_parameters(config: dict[str, Any]) -> str:
+    """Format configuration parameters for the summary."""
+    return ", ".join(f"{k}={v}" for k, v in _configuration_parameters(config).items())
+
+
+def select_optimal_configuration(configurations: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Pick the fastest configuration that meets the recall target.
+
+    Args:
+        configurations: Benchmarked configurations
+
+    Returns:
+        Summary of the chosen configuration, or None if there are none
+    """
+    # Optimize for: latency <3000ms and top1_recall >0.95
+    valid_configs = [
+        c
+        for c in configurations
+        if c.get("top1_recall", 0) >= 0.90  # Allow some tolerance
+    ]
+
+    if valid_configs:
+        # Among valid configs, choose fastest
+        optimal = min(valid_configs, key=lambda c: c["mean_latency_ms"])
+        reasoning = "Fastest configuration with top-1 recall >= 90%"
+    elif configurations:
+        # No config meets accuracy target, report best accuracy
+        optimal = max(configurations, key=lambda c: c.get("top1_recall", 0))
+        reasoning = "Best accuracy configuration (did not meet 90% target)"
+    else:
+        return None
+
+    return {
+        **_configuration_parameters(optimal),
+        "mean_latency_ms": optimal["mean_latency_ms"],
+        "top1_recall": optimal.get("top1_recall", 0),
+        "reasoning": reasoning,
+    }
+
+
 def optimize_index_parameters(
     engine,
     SessionLocal,
@@ -378,6 +573,10 @@ def optimize_index_parameters(
     embedding_dim: int,
     lists_values: list[int],
     probes_values: list[int],
+    hnsw_m_values: list[int] | None = None,
+    hnsw_ef_construction_values: list[int] | None = None,
+    ef_search_values: list[int] | None = None,
+    index_types: list[str] | None = None,
 ) -> dict[str, Any]:
     """Optimize index parameters across corpus sizes.
 
@@ -388,10 +587,16 @@ def optimize_index_parameters(
         embedding_dim: Embedding dimension
         lists_values: List of 'lists' parameter values to test
         probes_values: List of 'probes' parameter values to test
+        hnsw_m_values: List of HNSW 'm' values to test
+        hnsw_ef_construction_values: List of HNSW 'ef_construction' values to test
+        ef_search_values: List of HNSW 'ef_search' values to test
+        index_types: Index types to sweep (default: ["ivfflat"])
 
     Returns:
         Optimization results
     """
+    index_types = index_types or ["ivfflat"]
+
     print("\n" + "=" * 80)
     print(f"OPTIMIZING INDEX PARAMETERS: corpus_size={corpus_size}")
     print("=" * 80)
@@ -414,7 +619,7 @@ def optimize_index_parameters(
         }
 
         # Test each lists value
-        for lists in lists_values:
+        for lists in lists_values if "ivfflat" in index_types else []:
             # Create index
             index_stats = create_ivfflat_index(session, lists, embedding_dim, tenant_id)
 
@@ -442,37 +647,51 @@ def optimize_index_parameters(
 
                 results["configurations"].append(config_result)
 
-        # Find optimal configuration
-        # Optimize for: latency <3000ms and top1_recall >0.95
-        valid_configs = [
-            c
-            for c in results["configurations"]
-            if c.get("top1_recall", 0) >= 0.90  # Allow some tolerance
-        ]
-
-        if valid_configs:
-            # Among valid configs, choose fastest
-            optimal = min(valid_configs, key=lambda c: c["mean_latency_ms"])
-            results["optimal_configuration"] = {
-                "lists": optimal["lists"],
-                "probes": optimal["probes"],
-                "mean_latency_ms": optimal["mean_latency_ms"],
-                "top1_recall": optimal["top1_recall"],
-                "reasoning": "Fastest configuration with top-1 recall >= 90%",
-            }
-        else:
-            # No config meets accuracy target, report best accuracy
-            if results["configurations"]:
-                best_accuracy = max(
-                    results["configurations"], key=lambda c: c.get("top1_recall", 0)
-                )
-                results["optimal_configuration"] = {
-                    "lists": best_accuracy["lists"],
-                    "probes": best_accuracy["probes"],
-                    "mean_latency_ms": best_accuracy["mean_latency_ms"],
-                    "top1_recall": best_accuracy.get("top1_recall", 0),
-                    "reasoning": "Best accuracy configuration (did not meet 90% target)",
-                }
+        # Test each HNSW build configuration
+        if "hnsw" in index_types:
+            for m in hnsw_m_values or []:
+                for ef_construction in hnsw_ef_construction_values or []:
+                    if ef_construction < 2 * m:
+                        # Skip invalid configurations (pgvector requires ef_construction >= 2m)
+                        continue
+
+                    index_stats = create_hnsw_index(
+                        session, m, ef_construction, embedding_dim, tenant_id
+                    )
+
+                    if not index_stats["success"]:
+                        continue
+
+                    # Test each ef_search value (no rebuild needed)
+                    for ef_search in ef_search_values or []:
+                        config_result = benchmark_hnsw_configuration(
+                            session,
+                            service,
+                            m,
+                            ef_construction,
+                            ef_search,
+                            ground_truth,
+                            num_queries=50,
+                            tenant_id=tenant_id,
+                        )
+
+                        config_result["index_build_time_sec"] = index_stats["build_time_sec"]
+                        config_result["index_size"] = index_stats["index_size"]
+
+                        results["configurations"].append(config_result)
+
+        # Find optimal configuration overall and per index type
+        optimal = select_optimal_configuration(results["configurations"])
+        if optimal is not None:
+            results["optimal_configuration"] = optimal
+
+        results["optimal_by_index_type"] = {}
+        for index_type in index_types:
+            optimal = select_optimal_configuration(
+                [c for c in results["configurations"] if c["index_type"] == index_type]
+            )
+            if optimal is not None:
+                results["optimal_by_index_type"][index_type] = optimal
 
         return results
 
@@ -490,13 +709,19 @@ def save_results(results: dict[str, Any], output_path: Path) -> None:
 
 def main() -> int:
     """Main optimization execution."""
-    parser = argparse.ArgumentParser(description="IVFFlat index parameter optimization")
+    parser = argparse.ArgumentParser(description="IVFFlat and HNSW index parameter optimization")
     parser.add_argument(
         "--corpus-sizes",
         type=str,
         default="1000,5000,10000",
         help="Comma-separated corpus sizes (default: 1000,5000,10000)",
     )
+    parser.add_argument(
+        "--index-types",
+        type=str,
+        default="ivfflat,hnsw",
+        help="Comma-separated index types to sweep (default: ivfflat,hnsw)",
+    )
     parser.add_argument(
         "--lists",
         type=str,
@@ -509,6 +734,24 @@ def main() -> int:
         default="1,5,10,25",
         help="Comma-separated probes values (default: 1,5,10,25)",
     )
+    parser.add_argument(
+        "--hnsw-m",
+        type=str,
+        default="8,16,32",
+        help="Comma-separated HNSW m values (default: 8,16,32)",
+    )
+    parser.add_argument(
+        "--hnsw-ef-construction",
+        type=str,
+        default="64,128",
+        help="Comma-separated HNSW ef_construction values (default: 64,128)",
+    )
+    parser.add_argument(
+        "--ef-search",
+        type=str,
+        default="10,40,100,200",
+        help="Comma-separated HNSW ef_search values (default: 10,40,100,200)",
+    )
     parser.add_argument(
         "--embedding-dim", type=int, default=384, choices=[384, 1536], help="Embedding dimension"
     )
@@ -525,8 +768,16 @@ def main() -> int:
 
     # Parse parameters
     corpus_sizes = [int(x.strip()) for x in args.corpus_sizes.split(",")]
+    index_types = [x.strip().lower() for x in args.index_types.split(",")]
     lists_values = [int(x.strip()) for x in args.lists.split(",")]
     probes_values = [int(x.strip()) for x in args.probes.split(",")]
+    hnsw_m_values = [int(x.strip()) for x in args.hnsw_m.split(",")]
+    hnsw_ef_construction_values = [int(x.strip()) for x in args.hnsw_ef_construction.split(",")]
+    ef_search_values = [int(x.strip()) for x in args.ef_search.split(",")]
+
+    unknown_types = set(index_types) - {"ivfflat", "hnsw"}
+    if unknown_types:
+        parser.error(f"Unknown index types: {', '.join(sorted(unknown_types))}")
 
     # Database URL
     database_url = args.database_url or os.getenv(
@@ -535,11 +786,17 @@ def main() -> int:
     )
 
     print("=" * 80)
-    print("IVFFLAT INDEX PARAMETER OPTIMIZATION")
+    print("VECTOR INDEX PARAMETER OPTIMIZATION")
     print("=" * 80)
     print(f"\nCorpus sizes:   {corpus_sizes}")
-    print(f"Lists values:   {lists_values}")
-    print(f"Probes values:  {probes_values}")
+    print(f"Index types:    {index_types}")
+    if "ivfflat" in index_types:
+        print(f"Lists values:   {lists_values}")
+        print(f"Probes values:  {probes_values}")
+    if "hnsw" in index_types:
+        print(f"HNSW m:         {hnsw_m_values}")
+        print(f"HNSW ef_constr: {hnsw_ef_construction_values}")
+        print(f"HNSW ef_search: {ef_search_values}")
     print(f"Embedding dim:  {args.embedding_dim}")
     print(f"Database:       {database_url.split('@')[-1]}")
 
@@ -569,6 +826,10 @@ def main() -> int:
                 args.embedding_dim,
                 lists_values,
                 probes_values,
+                hnsw_m_values=hnsw_m_values,
+                hnsw_ef_construction_values=hnsw_ef_construction_values,
+                ef_search_values=ef_search_values,
+                index_types=index_types,
             )
             all_results["optimization_runs"].append(run_result)
 
@@ -582,10 +843,15 @@ def main() -> int:
             if "optimal_configuration" in run:
                 opt = run["optimal_configuration"]
                 print(f"\nCorpus size: {corpus_size}")
-                print(f"  Optimal: lists={opt['lists']}, probes={opt['probes']}")
+                print(f"  Optimal: {_format_parameters(opt)}")
                 print(f"  Latency: {opt['mean_latency_ms']:.1f} ms")
                 print(f"  Top-1 recall: {opt['top1_recall']:.3f}")
                 print(f"  {opt['reasoning']}")
+                for index_type, best in run["optimal_by_index_type"].items():
+                    print(
+                        f"  Best {index_type}: {_format_parameters(best)} "
+                        f"({best['mean_latency_ms']:.1f} ms, top-1 {best['top1_recall']:.3f})"
+                    )
 
         # Save results
         if args.output:
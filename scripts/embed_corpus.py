@@ -6,6 +6,10 @@ and stores them in the database with progress tracking and error handling.
 
 Features:
     - Batch processing for efficient embedding generation
+    - Length-aware batching: each read batch is sorted by token length and
+      encoded in calls bounded by a padded-token budget (--max-batch-tokens)
+    - Binary COPY writes: each batch's evidence and embedding rows are
+      streamed with COPY in one transaction, with a rows/sec report
     - Progress tracking with tqdm
     - Checkpoint-based resume capability
     - Memory-efficient processing for large datasets
@@ -19,6 +23,10 @@ Usage:
     # Load JSONL corpus with custom batch size
     python scripts/embed_corpus.py data/evidence.jsonl --format jsonl --batch-size 64
 
+    # Larger read batches give the length sort more to work with
+    python scripts/embed_corpus.py data/evidence.jsonl --format jsonl \
+        --batch-size 512 --max-batch-tokens 16384
+
     # Resume interrupted load
     python scripts/embed_corpus.py data/evidence.csv --format csv --resume
 
@@ -39,6 +47,7 @@ import sys
 import time
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import structlog
 from tqdm import tqdm
@@ -48,8 +57,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from corpus_loaders import get_loader
 
-from truthgraph.db_async import AsyncSessionLocal
-from truthgraph.schemas import Embedding, Evidence
+from truthgraph.db import SessionLocal
+from truthgraph.db_queries import OptimizedQueries
 from truthgraph.services.ml.embedding_service import EmbeddingService
 
 # Configure logging
@@ -166,15 +175,24 @@ async def process_batch(
     embedding_service: EmbeddingService,
     tenant_id: str,
     dry_run: bool,
+    max_batch_tokens: int | None = None,
+    write_stats: dict[str, float] | None = None,
 ) -> tuple[int, int]:
     """Process a batch of evidence items.
 
+    Evidence and embedding rows are written with binary COPY (psycopg) in a
+    single transaction, so a failed batch leaves nothing behind.
+
     Args:
-        session: Database session
+        session: Database session (sync, psycopg)
         batch: List of evidence items
         embedding_service: Embedding service instance
         tenant_id: Tenant identifier
         dry_run: If True, skip database operations
+        max_batch_tokens: Padded-token budget per encode call (None uses the
+            service default)
+        write_stats: If given, "rows" and "seconds" are incremented by the
+            rows written and time spent writing them
 
     Returns:
         Tuple of (success_count, error_count)
@@ -182,62 +200,61 @@ async def process_batch(
     if not batch:
         return 0, 0
 
-    success_count = 0
-    error_count = 0
-
     try:
         # Extract content for batch embedding
         contents = [item["content"] for item in batch]
 
-        # Generate embeddings in batch
-        embeddings = embedding_service.embed_batch(contents, show_progress=False)
-
-        # Process each item
-        for item, embedding_vector in zip(batch, embeddings, strict=None):
-            try:
-                if dry_run:
-                    # Just validate, don't insert
-                    logger.debug(f"[DRY RUN] Would insert: {item['id']}")
-                    success_count += 1
-                    continue
-
-                # Create Evidence record
-                evidence = Evidence(
-                    content=item["content"],
-                    source_url=item.get("url"),
-                    source_type=item.get("source"),
-                )
-                session.add(evidence)
-                await session.flush()  # Get evidence.id
-
-                # Create Embedding record
-                embedding = Embedding(
-                    entity_type="evidence",
-                    entity_id=evidence.id,
-                    embedding=embedding_vector,
-                    model_name=embedding_service.MODEL_NAME,
-                    tenant_id=tenant_id,
-                )
-                session.add(embedding)
+        # Generate embeddings in batch. The whole read batch is handed to the
+        # token-budget planner, so encode calls are sized by length, not count.
+        embeddings = embedding_service.embed_batch_array(
+            contents,
+            batch_size=len(contents),
+            show_progress=False,
+            max_batch_tokens=max_batch_tokens,
+        )
 
-                success_count += 1
+        if dry_run:
+            # Just validate, don't insert
+            for item in batch:
+                logger.debug(f"[DRY RUN] Would insert: {item['id']}")
+            return len(batch), 0
+
+        # COPY returns IDs in no particular order, so generate them here to keep
+        # each embedding paired with its evidence row
+        evidence_ids = [uuid4() for _ in batch]
+        queries = OptimizedQueries()
+        evidence = queries.copy_create_evidence(
+            session,
+            (
+                {
+                    "id": evidence_id,
+                    "content": item["content"],
+                    "source_url": item.get("url"),
+                    "source_type": item.get("source"),
+                }
+                for evidence_id, item in zip(evidence_ids, batch, strict=True)
+            ),
+            commit=False,
+        )
+        # Commits the evidence and embeddings together
+        stored = queries.copy_upsert_embeddings(
+            session,
+            evidence_ids,
+            embeddings,
+            model_name=embedding_service.MODEL_NAME,
+            tenant_id=tenant_id,
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to process item {item.get('id', 'unknown')}: {e}")
-                error_count += 1
-                continue
+        if write_stats is not None:
+            write_stats["rows"] += evidence.rows + stored.rows
+            write_stats["seconds"] += evidence.duration_seconds + stored.duration_seconds
 
-        # Commit batch
-        if not dry_run:
-            await session.commit()
+        return len(batch), 0
 
     except Exception as e:
+        # The COPY writers roll back on failure
         logger.error(f"Batch processing failed: {e}")
-        if not dry_run:
-            await session.rollback()
-        error_count = len(batch)
-
-    return success_count, error_count
+        return 0, len(batch)
 
 
 async def embed_corpus(
@@ -248,6 +265,7 @@ async def embed_corpus(
     resume: bool = False,
     tenant_id: str = "default",
     dry_run: bool = False,
+    max_batch_tokens: int | None = None,
 ) -> dict[str, Any]:
     """Load corpus, generate embeddings, and store in database.
 
@@ -259,6 +277,7 @@ async def embed_corpus(
         resume: If True, resume from checkpoint
         tenant_id: Tenant identifier
         dry_run: If True, validate without database operations
+        max_batch_tokens: Padded-token budget per encode call
 
     Returns:
         Statistics dictionary with processing results
@@ -296,9 +315,10 @@ async def embed_corpus(
         "skipped": 0,
         "start_time": time.time(),
     }
+    write_stats = {"rows": 0, "seconds": 0.0}
 
     # Process with progress bar
-    async with AsyncSessionLocal() as session:
+    with SessionLocal() as session:
         batch: list[dict[str, Any]] = []
         current_idx = 0
 
@@ -326,7 +346,13 @@ async def embed_corpus(
                 # Process batch when full
                 if len(batch) >= batch_size:
                     success, errors = await process_batch(
-                        session, batch, embedding_service, tenant_id, dry_run
+                        session,
+                        batch,
+                        embedding_service,
+                        tenant_id,
+                        dry_run,
+                        max_batch_tokens,
+                        write_stats,
                     )
                     stats["processed"] += success
                     stats["errors"] += errors
@@ -348,7 +374,13 @@ async def embed_corpus(
             # Process remaining batch
             if batch:
                 success, errors = await process_batch(
-                    session, batch, embedding_service, tenant_id, dry_run
+                    session,
+                    batch,
+                    embedding_service,
+                    tenant_id,
+                    dry_run,
+                    max_batch_tokens,
+                    write_stats,
                 )
                 stats["processed"] += success
                 stats["errors"] += errors
@@ -360,6 +392,10 @@ async def embed_corpus(
     stats["items_per_second"] = (
         stats["processed"] / stats["duration_seconds"] if stats["duration_seconds"] > 0 else 0
     )
+    stats["db_rows_written"] = write_stats["rows"]
+    stats["db_rows_per_second"] = (
+        write_stats["rows"] / write_stats["seconds"] if write_stats["seconds"] > 0 else 0
+    )
 
     # Clear checkpoint on successful completion
     if not dry_run and stats["errors"] == 0:
@@ -386,7 +422,15 @@ def main() -> int:
         "--batch-size",
         type=int,
         default=32,
-        help="Batch size for embedding generation (default: 32)",
+        help="Items per read/insert batch (default: 32)",
+    )
+
+    parser.add_argument(
+        "--max-batch-tokens",
+        type=int,
+        default=None,
+        help="Padded-token budget per encode call "
+        f"(default: {EmbeddingService.MAX_BATCH_TOKENS}, 4x on GPU)",
     )
 
     parser.add_argument(
@@ -427,6 +471,7 @@ def main() -> int:
         logger.info(f"Input file: {args.input_file}")
         logger.info(f"Format: {args.format}")
         logger.info(f"Batch size: {args.batch_size}")
+        logger.info(f"Max batch tokens: {args.max_batch_tokens or 'service default'}")
         logger.info(f"Resume: {args.resume}")
         logger.info(f"Dry run: {args.dry_run}")
         logger.info("=" * 60)
@@ -441,6 +486,7 @@ def main() -> int:
                 resume=args.resume,
                 tenant_id=args.tenant_id,
                 dry_run=args.dry_run,
+                max_batch_tokens=args.max_batch_tokens,
             )
         )
 
@@ -454,6 +500,10 @@ def main() -> int:
         logger.info(f"Skipped (resumed): {stats['skipped']}")
         logger.info(f"Duration: {stats['duration_seconds']:.2f} seconds")
         logger.info(f"Throughput: {stats['items_per_second']:.2f} items/sec")
+        logger.info(
+            f"Database writes: {stats['db_rows_written']} rows "
+            f"({stats['db_rows_per_second']:.0f} rows/sec via COPY)"
+        )
         logger.info("=" * 60)
 
         return 0 if stats["errors"] == 0 else 1
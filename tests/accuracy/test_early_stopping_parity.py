@@ -0,0 +1,141 @@
+"""Verdict parity of adaptive early-stopping NLI with full evidence NLI.
+
+Runs the real embedding and NLI models on the real-world claim/evidence
+fixtures. Each claim retrieves its top-k evidence by cosine similarity from
+the whole fixture corpus, and the pipeline classifies it twice: once with
+every item (the default) and once with NLIEarlyStopping. Early stopping
+must reproduce every verdict, and the report shows how many NLI calls it
+saved.
+
+Test execution:
+    pip install -e '.[ml]'
+    pytest tests/accuracy/test_early_stopping_parity.py -v -s
+
+Tests skip when the models cannot be loaded.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from truthgraph.services.ml.embedding_service import EmbeddingService
+from truthgraph.services.ml.nli_service import NLIService
+from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_pipeline_service import (
+    NLIEarlyStopping,
+    VerificationPipelineService,
+)
+
+pytestmark = [pytest.mark.slow, pytest.mark.integration]
+
+TOP_K_EVIDENCE = 10
+
+
+@pytest.fixture(scope="module")
+def ranked_evidence(
+    real_world_claims_file: Path, real_world_evidence_file: Path
+) -> List[Tuple[Dict[str, Any], List[SearchResult]]]:
+    """Each fixture claim with its top-k evidence from the whole fixture corpus."""
+    claims = json.loads(real_world_claims_file.read_text())["claims"]
+    evidence = json.loads(real_world_evidence_file.read_text())["evidence"]
+
+    try:
+        embedder = EmbeddingService.get_instance()
+        claim_vectors = np.asarray(embedder.embed_batch([c["text"] for c in claims]))
+        evidence_vectors = np.asarray(embedder.embed_batch([e["content"] for e in evidence]))
+    except Exception as e:
+        pytest.skip(f"Embedding model unavailable: {e}")
+
+    ranked = []
+    for claim, similarities in zip(claims, claim_vectors @ evidence_vectors.T, strict=True):
+        top = np.argsort(-similarities)[:TOP_K_EVIDENCE]
+        ranked.append(
+            (
+                claim,
+                [
+                    SearchResult(
+                        evidence_id=uuid4(),
+                        content=evidence[i]["content"],
+                        source_url=evidence[i].get("url"),
+                        similarity=float(similarities[i]),
+                    )
+                    for i in top
+                ],
+            )
+        )
+    return ranked
+
+
+@pytest.fixture(scope="module")
+def nli_service() -> NLIService:
+    """Load the NLI model."""
+    service = NLIService.get_instance()
+    try:
+        service.verify_batch(pairs=[("The sky is blue.", "The sky has a color.")], batch_size=1)
+    except Exception as e:
+        pytest.skip(f"NLI model unavailable: {e}")
+    return service
+
+
+def _verdicts(
+    pipeline: VerificationPipelineService,
+    ranked_evidence: List[Tuple[Dict[str, Any], List[SearchResult]]],
+) -> List[str]:
+    async def verify() -> List[str]:
+        verdicts = []
+        for claim, search_results in ranked_evidence:
+            items = await pipeline._verify_evidence_batch(claim["text"], search_results)
+            skipped, below_floor = pipeline._unanalyzed_evidence(search_results, items)
+            result = pipeline._aggregate_verdict(
+                claim_id=uuid4(),
+                claim_text=claim["text"],
+                evidence_items=items,
+                pipeline_duration_ms=0.0,
+                skipped_evidence=skipped,
+                below_floor_evidence=below_floor,
+            )
+            verdicts.append(result.verdict.value)
+        return verdicts
+
+    return asyncio.run(verify())
+
+
+@pytest.mark.parametrize("step_size", [1, 3])
+def test_early_stopping_keeps_verdicts(
+    ranked_evidence: List[Tuple[Dict[str, Any], List[SearchResult]]],
+    nli_service: NLIService,
+    step_size: int,
+) -> None:
+    """Test that early stopping reproduces every verdict while skipping NLI calls."""
+    full = VerificationPipelineService(
+        embedding_service=Mock(), nli_service=nli_service, vector_search_service=Mock()
+    )
+    adaptive = VerificationPipelineService(
+        embedding_service=Mock(),
+        nli_service=nli_service,
+        vector_search_service=Mock(),
+        early_stopping=NLIEarlyStopping(step_size=step_size, min_similarity=0.0),
+    )
+
+    expected = _verdicts(full, ranked_evidence)
+    actual = _verdicts(adaptive, ranked_evidence)
+
+    correct = sum(
+        verdict == claim["expected_verdict"]
+        for verdict, (claim, _) in zip(actual, ranked_evidence, strict=True)
+    )
+    total_pairs = full.nli_pairs_evaluated
+    print(
+        f"\nearly stopping (step_size={step_size}): "
+        f"{adaptive.nli_pairs_evaluated}/{total_pairs} NLI calls, "
+        f"{adaptive.nli_pairs_saved} saved ({adaptive.nli_pairs_saved / total_pairs:.0%}); "
+        f"accuracy {correct}/{len(actual)}"
+    )
+    assert actual == expected
+    assert adaptive.nli_pairs_evaluated + adaptive.nli_pairs_saved == total_pairs
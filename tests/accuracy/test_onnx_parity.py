@@ -0,0 +1,166 @@
+"""Accuracy parity between the PyTorch and ONNX Runtime inference backends.
+
+Runs the real embedding and NLI models through both backends on the
+real-world claim/evidence fixtures and checks that the ONNX exports (fp32
+and int8-quantized) agree with PyTorch closely enough to be swapped in.
+
+Test execution:
+    pip install -e '.[ml,onnx]'
+    pytest tests/accuracy/test_onnx_parity.py -v
+
+The first run exports both models to ONNX_CACHE_DIR; later runs reuse them.
+Tests skip when onnxruntime is missing or the models cannot be downloaded.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+import torch
+
+pytest.importorskip("onnxruntime")
+
+from truthgraph.services.ml.embedding_service import EmbeddingService  # noqa: E402
+from truthgraph.services.ml.nli_service import NLIService  # noqa: E402
+from truthgraph.services.ml.onnx_backend import (  # noqa: E402
+    OnnxSentenceEncoder,
+    OnnxSequenceClassifier,
+)
+
+pytestmark = [pytest.mark.slow, pytest.mark.integration]
+
+# Minimum agreement thresholds
+FP32_LABEL_AGREEMENT = 0.99
+FP32_MAX_PROB_DIFF = 1e-3
+INT8_LABEL_AGREEMENT = 0.90
+FP32_MIN_COSINE = 0.9999
+INT8_MIN_MEAN_COSINE = 0.98
+
+
+@pytest.fixture(scope="module")
+def claim_evidence_pairs(
+    real_world_claims_file: Path, real_world_evidence_file: Path
+) -> List[Tuple[str, str]]:
+    """Build (evidence, claim) NLI pairs from the real-world fixtures."""
+    claims = json.loads(real_world_claims_file.read_text())["claims"]
+    evidence = {
+        e["id"]: e["content"] for e in json.loads(real_world_evidence_file.read_text())["evidence"]
+    }
+    return [
+        (evidence[ev_id], claim["text"])
+        for claim in claims
+        for ev_id in claim.get("evidence_ids", [])
+        if ev_id in evidence
+    ]
+
+
+@pytest.fixture(scope="module")
+def torch_nli() -> Tuple[Any, Any]:
+    """Load the PyTorch NLI model and tokenizer."""
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(NLIService._model_name, model_max_length=512)
+        model = AutoModelForSequenceClassification.from_pretrained(NLIService._model_name)
+    except OSError as e:
+        pytest.skip(f"NLI model unavailable: {e}")
+    return model.eval(), tokenizer
+
+
+@pytest.fixture(scope="module")
+def torch_encoder() -> Any:
+    """Load the PyTorch sentence-transformers model."""
+    from sentence_transformers import SentenceTransformer
+
+    try:
+        return SentenceTransformer(EmbeddingService.MODEL_NAME, device="cpu")
+    except OSError as e:
+        pytest.skip(f"Embedding model unavailable: {e}")
+
+
+def _nli_probabilities(model: Any, tokenizer: Any, pairs: List[Tuple[str, str]]) -> np.ndarray:
+    """Run NLI pairs in batches of 8 and return softmax probabilities."""
+    chunks = []
+    for i in range(0, len(pairs), 8):
+        batch = pairs[i : i + 8]
+        inputs = tokenizer(
+            [p for p, _ in batch],
+            [h for _, h in batch],
+            truncation=True,
+            padding=True,
+            max_length=512,
+            return_tensors="pt",
+        )
+        with torch.no_grad():
+            chunks.append(torch.softmax(model(**inputs).logits, dim=-1).numpy())
+    return np.concatenate(chunks)
+
+
+def _agreement(a: np.ndarray, b: np.ndarray) -> float:
+    return float((a.argmax(axis=1) == b.argmax(axis=1)).mean())
+
+
+class TestNLIParity:
+    """Compare ONNX NLI predictions against PyTorch."""
+
+    def test_fp32_matches_pytorch(
+        self, torch_nli: Tuple[Any, Any], claim_evidence_pairs: List[Tuple[str, str]]
+    ) -> None:
+        """Test that the fp32 export reproduces PyTorch probabilities."""
+        model, tokenizer = torch_nli
+        expected = _nli_probabilities(model, tokenizer, claim_evidence_pairs)
+
+        onnx_model = OnnxSequenceClassifier.from_pretrained(NLIService._model_name)
+        actual = _nli_probabilities(onnx_model, onnx_model.tokenizer, claim_evidence_pairs)
+
+        assert _agreement(actual, expected) >= FP32_LABEL_AGREEMENT
+        assert float(np.abs(actual - expected).max()) < FP32_MAX_PROB_DIFF
+
+    def test_int8_label_agreement(
+        self, torch_nli: Tuple[Any, Any], claim_evidence_pairs: List[Tuple[str, str]]
+    ) -> None:
+        """Test that int8 quantization keeps predicted labels stable."""
+        model, tokenizer = torch_nli
+        expected = _nli_probabilities(model, tokenizer, claim_evidence_pairs)
+
+        onnx_model = OnnxSequenceClassifier.from_pretrained(NLIService._model_name, quantize=True)
+        actual = _nli_probabilities(onnx_model, onnx_model.tokenizer, claim_evidence_pairs)
+
+        agreement = _agreement(actual, expected)
+        print(f"\nint8 NLI label agreement: {agreement:.1%} on {len(expected)} pairs")
+        assert agreement >= INT8_LABEL_AGREEMENT
+
+
+class TestEmbeddingParity:
+    """Compare ONNX embeddings against sentence-transformers."""
+
+    @pytest.fixture(scope="class")
+    def texts(self, claim_evidence_pairs: List[Tuple[str, str]]) -> List[str]:
+        """Unique claim and evidence texts from the fixtures."""
+        return sorted({t for pair in claim_evidence_pairs for t in pair})
+
+    @pytest.mark.parametrize(
+        "quantize,min_cosine",
+        [(False, FP32_MIN_COSINE), (True, INT8_MIN_MEAN_COSINE)],
+        ids=["fp32", "int8"],
+    )
+    def test_embeddings_match(
+        self, torch_encoder: Any, texts: List[str], quantize: bool, min_cosine: float
+    ) -> None:
+        """Test cosine similarity between backend embeddings."""
+        expected = torch_encoder.encode(texts, normalize_embeddings=True, batch_size=32)
+
+        encoder = OnnxSentenceEncoder.from_pretrained(
+            EmbeddingService.MODEL_NAME, quantize=quantize
+        )
+        actual = encoder.encode(texts, normalize_embeddings=True, batch_size=32)
+
+        cosines = np.sum(actual * expected, axis=1)
+        summary: Dict[str, float] = {"mean": float(cosines.mean()), "min": float(cosines.min())}
+        print(f"\nembedding cosine ({'int8' if quantize else 'fp32'}): {summary}")
+        if quantize:
+            assert summary["mean"] >= min_cosine
+        else:
+            assert summary["min"] >= min_cosine
@@ -1,5 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
+import pytest
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -10,3 +12,13 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
+
+
+@pytest.fixture(autouse=True)
+def _reset_verification_cache():
+    """Give each test a fresh process-wide verification result cache."""
+    from truthgraph.services.verification_cache import VerificationCache
+
+    VerificationCache._instance = None
+    yield
+    VerificationCache._instance = None
@@ -252,11 +252,11 @@ class TestEmbeddingGeneration:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_generate_embedding_with_retry(self):
+    async def test_generate_embedding_with_retry(self):
         """Test embedding generation with retry logic."""
         service = VerificationPipelineService(embedding_dimension=384)
 
-        embedding = service._generate_embedding_with_retry("The Earth orbits the Sun")
+        embedding = await service._generate_embedding_with_retry("The Earth orbits the Sun")
 
         assert embedding is not None
         assert len(embedding) == 384
@@ -264,12 +264,12 @@ class TestEmbeddingGeneration:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_generate_embedding_different_texts(self):
+    async def test_generate_embedding_different_texts(self):
         """Test that different texts produce different embeddings."""
         service = VerificationPipelineService(embedding_dimension=384)
 
-        embedding1 = service._generate_embedding_with_retry("The Earth orbits the Sun")
-        embedding2 = service._generate_embedding_with_retry(
+        embedding1 = await service._generate_embedding_with_retry("The Earth orbits the Sun")
+        embedding2 = await service._generate_embedding_with_retry(
             "Water is composed of hydrogen and oxygen"
         )
 
@@ -359,7 +359,7 @@ class TestPerformance:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_embedding_generation_performance(self):
+    async def test_embedding_generation_performance(self):
         """Test embedding generation performance."""
         import time
 
@@ -367,7 +367,7 @@ class TestPerformance:
         claim_text = "The Earth orbits the Sun" * 10  # Longer text
 
         start_time = time.time()
-        embedding = service._generate_embedding_with_retry(claim_text)
+        embedding = await service._generate_embedding_with_retry(claim_text)
         duration_ms = (time.time() - start_time) * 1000
 
         assert embedding is not None
@@ -401,7 +401,7 @@ class TestErrorHandling:
             )
 
     @pytest.mark.integration
-    def test_retry_logic_on_transient_failure(self):
+    async def test_retry_logic_on_transient_failure(self):
         """Test retry logic handles transient failures."""
         from unittest.mock import patch
 
@@ -413,5 +413,5 @@ class TestErrorHandling:
             "embed_text",
             side_effect=[RuntimeError("Transient error"), [0.1] * 384],
         ):
-            embedding = service._generate_embedding_with_retry("Test")
+            embedding = await service._generate_embedding_with_retry("Test")
             assert len(embedding) == 384
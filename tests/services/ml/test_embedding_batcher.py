@@ -0,0 +1,123 @@
+"""Unit tests for the async embedding micro-batcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from truthgraph.monitoring.metrics_collector import MetricsCollector
+from truthgraph.services.ml.embedding_batcher import EmbeddingMicroBatcher
+
+
+@pytest.fixture
+def mock_embedding_service():
+    """Create an embedding service whose vectors encode the input text length."""
+    service = Mock()
+    service.embed_batch.side_effect = lambda texts: [[float(len(t))] * 3 for t in texts]
+    return service
+
+
+@pytest.fixture
+def mock_metrics_collector():
+    """Create a mock metrics collector."""
+    collector = Mock(spec=MetricsCollector)
+    collector.set_gauge = AsyncMock()
+    collector.record_histogram = AsyncMock()
+    return collector
+
+
+class TestEmbeddingMicroBatcher:
+    """Test cases for EmbeddingMicroBatcher."""
+
+    async def test_concurrent_requests_share_one_encode(self, mock_embedding_service):
+        """Test that concurrent callers are served by a single embed_batch call."""
+        batcher = EmbeddingMicroBatcher(mock_embedding_service, max_wait_ms=20)
+
+        results = await asyncio.gather(*(batcher.embed("x" * n) for n in range(1, 6)))
+
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        mock_embedding_service.embed_batch.assert_called_once_with(
+            ["x", "xx", "xxx", "xxxx", "xxxxx"]
+        )
+        await batcher.stop()
+
+    async def test_max_batch_size_splits_batches(self, mock_embedding_service):
+        """Test that batches never exceed max_batch_size."""
+        batcher = EmbeddingMicroBatcher(mock_embedding_service, max_batch_size=2, max_wait_ms=20)
+
+        await asyncio.gather(*(batcher.embed(f"text {i}") for i in range(5)))
+
+        sizes = [len(c.args[0]) for c in mock_embedding_service.embed_batch.call_args_list]
+        assert sizes == [2, 2, 1]
+        stats = batcher.get_stats()
+        assert stats["batches"] == 3
+        assert stats["batch_size_distribution"] == {"<=2": 2, "<=1": 1}
+        await batcher.stop()
+
+    async def test_encode_failure_propagates_to_all_callers(self, mock_embedding_service):
+        """Test that a failed encode raises RuntimeError for every waiting caller."""
+        mock_embedding_service.embed_batch.side_effect = Exception("CUDA OOM")
+        batcher = EmbeddingMicroBatcher(mock_embedding_service, max_wait_ms=10)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.get_stats()["failed_batches"] == 1
+        await batcher.stop()
+
+    async def test_short_result_fails_batch_and_loop_survives(self, mock_embedding_service):
+        """Test that a result-count mismatch fails that batch without stopping the loop."""
+        mock_embedding_service.embed_batch.side_effect = [[[1.0]], [[2.0], [3.0]]]
+        batcher = EmbeddingMicroBatcher(mock_embedding_service, max_wait_ms=10)
+
+        failed = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+        served = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("c"), batcher.embed("d")), timeout=1
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in failed)
+        assert served == [[2.0], [3.0]]
+        assert batcher.get_stats()["running"]
+        await batcher.stop()
+
+    async def test_invalid_text_raises(self, mock_embedding_service):
+        """Test that empty input is rejected before queueing."""
+        batcher = EmbeddingMicroBatcher(mock_embedding_service)
+
+        with pytest.raises(ValueError, match="non-empty string"):
+            await batcher.embed("")
+
+    def test_invalid_configuration_raises(self, mock_embedding_service):
+        """Test constructor validation."""
+        with pytest.raises(ValueError, match="max_wait_ms"):
+            EmbeddingMicroBatcher(mock_embedding_service, max_wait_ms=-1)
+
+    async def test_metrics_exported(self, mock_embedding_service, mock_metrics_collector):
+        """Test queue depth and batch size metrics are exported."""
+        batcher = EmbeddingMicroBatcher(
+            mock_embedding_service, max_wait_ms=20, metrics_collector=mock_metrics_collector
+        )
+
+        await asyncio.gather(batcher.embed("a"), batcher.embed("b"), batcher.embed("c"))
+        await asyncio.sleep(0)
+
+        mock_metrics_collector.set_gauge.assert_any_call("embedding.batcher.queue_depth", 3)
+        mock_metrics_collector.record_histogram.assert_any_call("embedding.batcher.batch_size", 3)
+        await batcher.stop()
+
+    async def test_stop_resets_state(self, mock_embedding_service):
+        """Test that stop() halts the background task and it restarts on demand."""
+        batcher = EmbeddingMicroBatcher(mock_embedding_service, max_wait_ms=0)
+        await batcher.embed("first")
+        assert batcher.get_stats()["running"] is True
+
+        await batcher.stop()
+        assert batcher.get_stats()["running"] is False
+
+        assert await batcher.embed("again") == [5.0, 5.0, 5.0]
+        assert batcher.get_stats()["requests"] == 2
+        await batcher.stop()
@@ -0,0 +1,225 @@
+"""Unit tests for the two-level embedding cache and its EmbeddingService wiring."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from truthgraph.services.ml.embedding_cache import (
+    DiskEmbeddingStore,
+    EmbeddingCache,
+    make_cache_key,
+    normalize_text,
+)
+from truthgraph.services.ml.embedding_service import EmbeddingService
+
+MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reset the singleton and keep the disk tier off unless a test enables it."""
+    monkeypatch.delenv("EMBEDDING_CACHE_DIR", raising=False)
+    monkeypatch.delenv("EMBEDDING_CACHE_SIZE", raising=False)
+    EmbeddingService._instance = None
+    EmbeddingService._model = None
+    EmbeddingService._device = None
+
+
+class TestCacheKeys:
+    """Test key normalization."""
+
+    def test_whitespace_is_normalized(self) -> None:
+        """Test that whitespace differences map to the same key."""
+        assert normalize_text("  The  Earth\n orbits\tthe Sun ") == "The Earth orbits the Sun"
+        assert make_cache_key(MODEL, "a  b") == make_cache_key(MODEL, " a b")
+
+    def test_key_includes_model_name(self) -> None:
+        """Test that keys differ between models."""
+        assert make_cache_key(MODEL, "text") != make_cache_key("other-model", "text")
+
+    def test_case_is_preserved(self) -> None:
+        """Test that case is not folded into the key."""
+        assert make_cache_key(MODEL, "Paris") != make_cache_key(MODEL, "paris")
+
+
+class TestEmbeddingCache:
+    """Test the in-memory and disk tiers."""
+
+    def test_memory_hit_and_miss_counters(self) -> None:
+        """Test hit/miss accounting for the memory tier."""
+        cache = EmbeddingCache(MODEL, 4)
+
+        assert cache.get("hello") is None
+        cache.put("hello", [1.0, 0.0, 0.0, 0.0])
+        assert cache.get("hello") == [1.0, 0.0, 0.0, 0.0]
+
+        stats = cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self) -> None:
+        """Test least-recently-used eviction."""
+        cache = EmbeddingCache(MODEL, 2, max_entries=2)
+        cache.put("a", [1.0, 0.0])
+        cache.put("b", [0.0, 1.0])
+        cache.get("a")  # "b" becomes least recently used
+        cache.put("c", [1.0, 1.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_negative_capacity_raises(self) -> None:
+        """Test that a negative capacity raises ValueError."""
+        with pytest.raises(ValueError, match="non-negative"):
+            EmbeddingCache(MODEL, 4, max_entries=-1)
+
+    def test_disk_tier_survives_new_instance(self, tmp_path: Path) -> None:
+        """Test that disk entries are visible to a fresh cache."""
+        vector = np.arange(4, dtype=np.float32)
+        EmbeddingCache(MODEL, 4, cache_dir=tmp_path).put("persisted", vector)
+
+        fresh = EmbeddingCache(MODEL, 4, cache_dir=tmp_path)
+        assert fresh.get("persisted") == vector.tolist()
+        assert fresh.get_stats()["disk_hits"] == 1
+
+    def test_disk_store_sees_rows_from_other_writer(self, tmp_path: Path) -> None:
+        """Test that a reader picks up rows appended by another store."""
+        reader = DiskEmbeddingStore(tmp_path, 3)
+        writer = DiskEmbeddingStore(tmp_path, 3)
+
+        writer.put("k1", np.ones(3, dtype=np.float32))
+        writer.put("k2", np.full(3, 2.0, dtype=np.float32))
+        writer.put("k1", np.zeros(3, dtype=np.float32))  # duplicate ignored
+
+        np.testing.assert_array_equal(reader.get("k2"), np.full(3, 2.0))
+        np.testing.assert_array_equal(reader.get("k1"), np.ones(3))
+        assert len(reader) == 2
+
+    def test_disk_store_rejects_wrong_dimension(self, tmp_path: Path) -> None:
+        """Test that mismatched vector shapes are rejected."""
+        store = DiskEmbeddingStore(tmp_path, 3)
+        with pytest.raises(ValueError, match="shape"):
+            store.put("k", np.ones(4, dtype=np.float32))
+
+
+class TestEmbeddingServiceCache:
+    """Test cache use inside EmbeddingService."""
+
+    @patch("truthgraph.services.ml.embedding_service.SentenceTransformer")
+    @patch("truthgraph.services.ml.embedding_service.EmbeddingService._detect_device")
+    def test_embed_text_second_call_is_cached(
+        self,
+        mock_detect: Mock,
+        mock_transformer: Mock,
+    ) -> None:
+        """Test that a repeated text is served from cache."""
+        mock_detect.return_value = "cpu"
+        mock_model = MagicMock()
+        mock_model.encode.return_value = np.random.rand(384).astype(np.float32)
+        mock_transformer.return_value = mock_model
+
+        service = EmbeddingService.get_instance()
+        first = service.embed_text("The Earth orbits the Sun")
+        second = service.embed_text("The Earth  orbits the Sun")
+
+        assert first == second
+        mock_model.encode.assert_called_once()
+        assert service.get_cache_stats()["hits"] == 1
+
+    @patch("truthgraph.services.ml.embedding_service.SentenceTransformer")
+    @patch("truthgraph.services.ml.embedding_service.EmbeddingService._detect_device")
+    def test_cached_arrays_are_read_only(
+        self,
+        mock_detect: Mock,
+        mock_transformer: Mock,
+    ) -> None:
+        """Test that the shared cached buffer cannot be modified in place."""
+        mock_detect.return_value = "cpu"
+        mock_model = MagicMock()
+        mock_model.encode.return_value = np.ones(384, dtype=np.float32)
+        mock_transformer.return_value = mock_model
+
+        service = EmbeddingService.get_instance()
+        miss = service.embed_text_array("The Earth orbits the Sun")
+        hit = service.embed_text_array("The Earth orbits the Sun")
+
+        for array in (miss, hit):
+            with pytest.raises(ValueError):
+                array[0] = 0.0
+        assert service.embed_text_array("The Earth orbits the Sun")[0] == 1.0
+
+    @patch("truthgraph.services.ml.embedding_service.SentenceTransformer")
+    @patch("truthgraph.services.ml.embedding_service.EmbeddingService._detect_device")
+    def test_embed_batch_encodes_only_unique_misses(
+        self,
+        mock_detect: Mock,
+        mock_transformer: Mock,
+    ) -> None:
+        """Test that only unique misses are encoded and order is kept."""
+        mock_detect.return_value = "cpu"
+        mock_model = MagicMock()
+        cached_vec = np.full(384, 0.5, dtype=np.float32)
+        new_vecs = np.stack([np.full(384, 1.0), np.full(384, 2.0)]).astype(np.float32)
+        mock_model.encode.side_effect = [cached_vec, new_vecs]
+        mock_transformer.return_value = mock_model
+
+        service = EmbeddingService.get_instance()
+        service.embed_text("cached")
+        result = service.embed_batch(["new a", "cached", "new b", "new a"])
+
+        assert mock_model.encode.call_args_list[1][0][0] == ["new a", "new b"]
+        assert result[0] == result[3] == new_vecs[0].tolist()
+        assert result[1] == cached_vec.tolist()
+        assert result[2] == new_vecs[1].tolist()
+
+    @patch("truthgraph.services.ml.embedding_service.SentenceTransformer")
+    @patch("truthgraph.services.ml.embedding_service.EmbeddingService._detect_device")
+    def test_embed_batch_all_cached_skips_model(
+        self,
+        mock_detect: Mock,
+        mock_transformer: Mock,
+    ) -> None:
+        """Test that a fully cached batch never calls the model."""
+        mock_detect.return_value = "cpu"
+        mock_model = MagicMock()
+        mock_model.encode.return_value = np.random.rand(2, 384).astype(np.float32)
+        mock_transformer.return_value = mock_model
+
+        service = EmbeddingService.get_instance()
+        first = service.embed_batch(["one", "two"])
+        second = service.embed_batch(["two", "one"])
+
+        assert second == [first[1], first[0]]
+        mock_model.encode.assert_called_once()
+
+    def test_model_cache_reports_embedding_cache_stats(self) -> None:
+        """Test that ModelCache exposes embedding cache stats."""
+        from truthgraph.services.ml.model_cache import ModelCache
+
+        cache = ModelCache.__new__(ModelCache)
+        cache._stats = {}
+        cache._embedding_service = EmbeddingService.get_instance()
+
+        stats = cache.get_cache_stats()
+
+        assert stats["embedding_cache"]["misses"] == 0
+        assert stats["embedding_cache"]["model_name"] == f"{MODEL}:torch:fp32"
+
+    def test_namespace_separates_backends(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that torch, ONNX fp32 and ONNX int8 vectors never share cache entries."""
+        monkeypatch.delenv("EMBEDDING_BACKEND", raising=False)
+        monkeypatch.delenv("ONNX_QUANTIZE", raising=False)
+        torch_namespace = EmbeddingService.cache_namespace()
+        monkeypatch.setenv("EMBEDDING_BACKEND", "onnx")
+        onnx_namespace = EmbeddingService.cache_namespace()
+        monkeypatch.setenv("ONNX_QUANTIZE", "int8")
+        int8_namespace = EmbeddingService.cache_namespace()
+
+        assert int8_namespace == f"{MODEL}:onnx:int8"
+        assert len({torch_namespace, onnx_namespace, int8_namespace}) == 3
+        keys = {make_cache_key(ns, "text") for ns in (torch_namespace, int8_namespace)}
+        assert len(keys) == 2
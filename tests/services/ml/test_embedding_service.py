@@ -385,10 +385,11 @@ class TestEmbedBatch:
         mock_detect.return_value = "cpu"
         mock_model = MagicMock()
 
-        # Create large batch
+        # Create large batch (encoded in several token-budget batches)
         texts = [f"Text {i}" for i in range(1500)]
-        expected_embeddings = np.random.rand(1500, 384).astype(np.float32)
-        mock_model.encode.return_value = expected_embeddings
+        mock_model.encode.side_effect = lambda batch, **kwargs: np.random.rand(
+            len(batch), 384
+        ).astype(np.float32)
         mock_transformer.return_value = mock_model
 
         service = EmbeddingService.get_instance()
@@ -397,6 +398,56 @@ class TestEmbedBatch:
         # Should trigger gc.collect()
         mock_gc.assert_called()
 
+    @patch("truthgraph.services.ml.embedding_service.SentenceTransformer")
+    @patch("truthgraph.services.ml.embedding_service.EmbeddingService._detect_device")
+    def test_embed_batch_groups_by_token_length(
+        self,
+        mock_detect: Mock,
+        mock_transformer: Mock,
+    ) -> None:
+        """Test that a long text is not batched with short ones and order is restored."""
+        mock_detect.return_value = "cpu"
+        mock_model = MagicMock()
+        mock_model.tokenizer.side_effect = lambda texts, *args, **kwargs: {
+            "input_ids": [[0] * len(t.split()) for t in texts]
+        }
+        # Encode each text to a vector holding its word count
+        mock_model.encode.side_effect = lambda batch, **kwargs: np.array(
+            [[float(len(t.split()))] * 384 for t in batch], dtype=np.float32
+        )
+        mock_transformer.return_value = mock_model
+
+        texts = ["short one", "word " * 200, "tiny", "another short text"]
+        service = EmbeddingService.get_instance()
+        result = service.embed_batch(texts, max_batch_tokens=256)
+
+        assert [emb[0] for emb in result] == [2.0, 200.0, 1.0, 3.0]
+        batches = [c.args[0] for c in mock_model.encode.call_args_list]
+        assert batches == [[texts[1]], ["another short text", "short one", "tiny"]]
+
+    @patch("truthgraph.services.ml.embedding_service.SentenceTransformer")
+    @patch("truthgraph.services.ml.embedding_service.EmbeddingService._detect_device")
+    def test_embed_batch_array_returns_float32_matrix(
+        self,
+        mock_detect: Mock,
+        mock_transformer: Mock,
+    ) -> None:
+        """Test that embed_batch_array returns one float32 matrix including cached rows."""
+        mock_detect.return_value = "cpu"
+        mock_model = MagicMock()
+        mock_model.encode.side_effect = lambda batch, **kwargs: np.ones((len(batch), 384))
+        mock_transformer.return_value = mock_model
+
+        service = EmbeddingService.get_instance()
+        service.clear_cache()
+        service.embed_batch(["cached"])
+        result = service.embed_batch_array(["fresh", "cached", "fresh"])
+
+        assert result.shape == (3, 384)
+        assert result.dtype == np.float32
+        assert result.flags["C_CONTIGUOUS"]
+        assert mock_model.encode.call_args.args[0] == ["fresh"]
+
 
 class TestUtilityMethods:
     """Test utility methods."""
@@ -0,0 +1,132 @@
+"""Unit tests for the shared NLI continuous-batching scheduler."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from truthgraph.monitoring.metrics_collector import MetricsCollector
+from truthgraph.services.ml.nli_scheduler import NLIBatchScheduler, NLIDeadlineExceeded
+from truthgraph.services.ml.nli_service import NLILabel, NLIResult
+
+
+def _result_for(premise: str) -> NLIResult:
+    return NLIResult(
+        label=NLILabel.ENTAILMENT,
+        confidence=0.9,
+        scores={"entailment": 0.9, "neutral": 0.05, "contradiction": 0.05, "premise": premise},
+    )
+
+
+@pytest.fixture
+def mock_nli_service():
+    """Create an NLI service that echoes each premise back in its scores."""
+    service = Mock()
+    service.verify_batch.side_effect = lambda pairs, batch_size: [
+        _result_for(premise) for premise, _ in pairs
+    ]
+    return service
+
+
+def _batches(service: Mock) -> list[list[str]]:
+    return [[p for p, _ in c.kwargs["pairs"]] for c in service.verify_batch.call_args_list]
+
+
+class TestNLIBatchScheduler:
+    """Test cases for NLIBatchScheduler."""
+
+    async def test_results_match_submission_order(self, mock_nli_service):
+        """Test that each caller gets its own results in order."""
+        scheduler = NLIBatchScheduler(mock_nli_service, batch_size=8, max_wait_ms=5)
+
+        first, second = await asyncio.gather(
+            scheduler.verify([("a1", "claim a"), ("a2", "claim a")]),
+            scheduler.verify([("b1", "claim b")]),
+        )
+
+        assert [r.scores["premise"] for r in first] == ["a1", "a2"]
+        assert [r.scores["premise"] for r in second] == ["b1"]
+        assert _batches(mock_nli_service) == [["a1", "b1", "a2"]]
+        await scheduler.stop()
+
+    async def test_round_robin_packing_is_fair(self, mock_nli_service):
+        """Test that a large request cannot monopolize a batch."""
+        scheduler = NLIBatchScheduler(mock_nli_service, batch_size=4, max_wait_ms=5)
+
+        big = [(f"big{i}", "claim") for i in range(6)]
+        small = [("small0", "claim"), ("small1", "claim")]
+        await asyncio.gather(scheduler.verify(big), scheduler.verify(small))
+
+        assert _batches(mock_nli_service)[0] == ["big0", "small0", "big1", "small1"]
+        assert scheduler.get_stats()["processed_pairs"] == 8
+        await scheduler.stop()
+
+    async def test_earliest_deadline_served_first(self, mock_nli_service):
+        """Test that requests with tighter deadlines are packed first."""
+        scheduler = NLIBatchScheduler(mock_nli_service, batch_size=1, max_wait_ms=5)
+
+        await asyncio.gather(
+            scheduler.verify([("relaxed", "claim")]),
+            scheduler.verify([("urgent", "claim")], deadline_ms=5000),
+        )
+
+        assert _batches(mock_nli_service)[0] == ["urgent"]
+        await scheduler.stop()
+
+    async def test_expired_pairs_fail_without_inference(self, mock_nli_service):
+        """Test that pairs past their deadline are dropped with NLIDeadlineExceeded."""
+        release = threading.Event()
+        mock_nli_service.verify_batch.side_effect = lambda pairs, batch_size: (
+            release.wait(1),
+            [_result_for(p) for p, _ in pairs],
+        )[1]
+        scheduler = NLIBatchScheduler(mock_nli_service, batch_size=1, max_wait_ms=0)
+
+        blocker = asyncio.ensure_future(scheduler.verify([("slow", "claim")]))
+        await asyncio.sleep(0.01)
+        doomed = asyncio.ensure_future(scheduler.verify([("late", "claim")], deadline_ms=1))
+        await asyncio.sleep(0.02)
+        release.set()
+
+        await blocker
+        with pytest.raises(NLIDeadlineExceeded):
+            await doomed
+        assert _batches(mock_nli_service) == [["slow"]]
+        assert scheduler.get_stats()["expired_pairs"] == 1
+        await scheduler.stop()
+
+    async def test_inference_failure_propagates(self, mock_nli_service):
+        """Test that a failed batch raises RuntimeError for its callers."""
+        mock_nli_service.verify_batch.side_effect = Exception("model crashed")
+        scheduler = NLIBatchScheduler(mock_nli_service, batch_size=4, max_wait_ms=0)
+
+        with pytest.raises(RuntimeError, match="model crashed"):
+            await scheduler.verify([("p", "h")])
+        assert scheduler.get_stats()["failed_batches"] == 1
+        await scheduler.stop()
+
+    async def test_invalid_pairs_raise(self, mock_nli_service):
+        """Test input validation."""
+        scheduler = NLIBatchScheduler(mock_nli_service)
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            scheduler.submit([])
+        with pytest.raises(ValueError, match="Premise at index 0"):
+            scheduler.submit([("  ", "claim")])
+
+    async def test_metrics_exported(self, mock_nli_service):
+        """Test batch metrics are sent to the metrics collector."""
+        collector = Mock(spec=MetricsCollector)
+        collector.set_gauge = AsyncMock()
+        collector.record_histogram = AsyncMock()
+        collector.increment_counter = AsyncMock()
+        scheduler = NLIBatchScheduler(
+            mock_nli_service, batch_size=4, max_wait_ms=5, metrics_collector=collector
+        )
+
+        await asyncio.gather(scheduler.verify([("a", "x")]), scheduler.verify([("b", "y")]))
+
+        collector.record_histogram.assert_any_call("nli.scheduler.batch_size", 2)
+        collector.record_histogram.assert_any_call("nli.scheduler.requests_per_batch", 2)
+        await scheduler.stop()
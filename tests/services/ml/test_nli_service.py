@@ -218,6 +218,42 @@ class TestNLIServiceMocked:
         # Model should be called 3 times (2+2+1)
         assert mock_model.call_count >= 3
 
+    def test_verify_batch_token_budget_restores_order(
+        self, nli_service, mock_model, mock_tokenizer
+    ):
+        """Test that pairs are batched by token length and results keep input order."""
+        label_ids = {"entails": 1, "contradicts": 0, "neutral": 2}
+
+        def tokenize(premises, hypotheses, **kwargs):
+            if "return_tensors" not in kwargs:
+                # Length measurement: one token per word
+                return {"input_ids": [[0] * len(p.split()) for p in premises]}
+            # Inference: carry the expected label index in the first token
+            return {
+                "input_ids": torch.tensor([[label_ids[p.split()[0]]] for p in premises]),
+            }
+
+        def forward(input_ids):
+            return MagicMock(logits=torch.nn.functional.one_hot(input_ids[:, 0], 3) * 5.0)
+
+        mock_tokenizer.side_effect = tokenize
+        mock_model.side_effect = forward
+
+        pairs = [
+            ("entails short", "Claim"),
+            ("contradicts " + "word " * 300, "Claim"),
+            ("neutral tiny", "Claim"),
+        ]
+        results = nli_service.verify_batch(pairs, batch_size=8, max_batch_tokens=512)
+
+        assert [r.label for r in results] == [
+            NLILabel.ENTAILMENT,
+            NLILabel.CONTRADICTION,
+            NLILabel.NEUTRAL,
+        ]
+        # The long premise is isolated in its own forward pass
+        assert mock_model.call_count == 2
+
     def test_verify_batch_empty_pairs(self, nli_service):
         """Test that empty pairs list raises ValueError."""
         with pytest.raises(ValueError, match="Pairs list cannot be empty"):
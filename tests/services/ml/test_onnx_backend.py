@@ -0,0 +1,211 @@
+"""Unit tests for the ONNX Runtime inference backend.
+
+These tests export tiny randomly initialized BERT models (no downloads) and
+check that ONNX Runtime reproduces the PyTorch outputs.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import torch
+
+pytest.importorskip("onnxruntime")
+
+from transformers import (  # noqa: E402
+    BertConfig,
+    BertForSequenceClassification,
+    BertModel,
+    BertTokenizerFast,
+)
+
+from truthgraph.services.ml.onnx_backend import (  # noqa: E402
+    OnnxSentenceEncoder,
+    OnnxSequenceClassifier,
+    export_sentence_encoder,
+    export_sequence_classifier,
+    get_backend,
+    quantize_int8,
+)
+
+VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [
+    w
+    for w in (
+        "the earth orbits sun moon is a planet water boils at 100 degrees paris capital "
+        "of france warmup premise text second longer sentence for tracing hypothesis another ,"
+    ).split()
+]
+TINY_CONFIG = {
+    "vocab_size": len(VOCAB),
+    "hidden_size": 16,
+    "num_hidden_layers": 1,
+    "num_attention_heads": 2,
+    "intermediate_size": 32,
+    "max_position_embeddings": 64,
+}
+
+
+@pytest.fixture
+def tiny_tokenizer(tmp_path: Path) -> BertTokenizerFast:
+    """Create a word-level BERT tokenizer over a tiny vocabulary."""
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(VOCAB) + "\n")
+    return BertTokenizerFast(vocab_file=str(vocab_file), model_max_length=64)
+
+
+@pytest.fixture
+def tiny_classifier() -> BertForSequenceClassification:
+    """Create a tiny 3-label classifier with random weights."""
+    torch.manual_seed(0)
+    return BertForSequenceClassification(BertConfig(num_labels=3, **TINY_CONFIG)).eval()
+
+
+class TestBackendSelection:
+    """Test backend configuration helpers."""
+
+    def test_default_backend_is_torch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that torch is used when the variable is unset."""
+        monkeypatch.delenv("NLI_BACKEND", raising=False)
+        assert get_backend("NLI_BACKEND") == "torch"
+
+    def test_invalid_backend_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that unknown backend names are rejected."""
+        monkeypatch.setenv("NLI_BACKEND", "tensorrt")
+        with pytest.raises(ValueError, match="NLI_BACKEND"):
+            get_backend("NLI_BACKEND")
+
+
+class TestSequenceClassifierExport:
+    """Test NLI model export and inference parity."""
+
+    def test_logits_match_pytorch(
+        self,
+        tmp_path: Path,
+        tiny_tokenizer: BertTokenizerFast,
+        tiny_classifier: BertForSequenceClassification,
+    ) -> None:
+        """Test that exported logits match PyTorch for variable-length batches."""
+        export_sequence_classifier(tiny_classifier, tiny_tokenizer, tmp_path / "nli")
+        onnx_model = OnnxSequenceClassifier(tmp_path / "nli")
+
+        inputs = tiny_tokenizer(
+            ["the earth orbits the sun", "water boils"],
+            ["the sun is a planet", "water boils at 100 degrees"],
+            padding=True,
+            return_tensors="pt",
+        )
+        with torch.no_grad():
+            expected = tiny_classifier(**inputs).logits
+
+        actual = onnx_model(**inputs).logits
+
+        assert isinstance(actual, torch.Tensor)
+        torch.testing.assert_close(actual, expected, atol=1e-5, rtol=1e-4)
+
+    def test_export_is_cached(
+        self,
+        tmp_path: Path,
+        tiny_tokenizer: BertTokenizerFast,
+        tiny_classifier: BertForSequenceClassification,
+    ) -> None:
+        """Test that from_pretrained reuses an existing export."""
+        export_sequence_classifier(tiny_classifier, tiny_tokenizer, tmp_path / "nli" / "tiny")
+
+        with patch("transformers.AutoModelForSequenceClassification") as mock_auto:
+            model = OnnxSequenceClassifier.from_pretrained("tiny", cache_dir=tmp_path)
+
+        mock_auto.from_pretrained.assert_not_called()
+        assert model.device == "cpu"
+
+    def test_int8_quantization(
+        self,
+        tmp_path: Path,
+        tiny_tokenizer: BertTokenizerFast,
+        tiny_classifier: BertForSequenceClassification,
+    ) -> None:
+        """Test that int8 quantization produces a usable, cached model."""
+        model_dir = export_sequence_classifier(tiny_classifier, tiny_tokenizer, tmp_path / "nli")
+
+        quantized = OnnxSequenceClassifier(model_dir, quantize=True)
+        inputs = tiny_tokenizer(["the earth"], ["the sun"], return_tensors="pt")
+
+        assert quantized(**inputs).logits.shape == (1, 3)
+        assert quantize_int8(model_dir) == model_dir / "model.int8.onnx"
+
+
+class TestSentenceEncoderExport:
+    """Test embedding model export and encode() parity."""
+
+    def test_encode_matches_sentence_transformers(
+        self, tmp_path: Path, tiny_tokenizer: BertTokenizerFast
+    ) -> None:
+        """Test that ONNX embeddings match SentenceTransformer embeddings."""
+        from sentence_transformers import SentenceTransformer, models
+
+        torch.manual_seed(0)
+        hf_dir = tmp_path / "hf"
+        BertModel(BertConfig(**TINY_CONFIG)).save_pretrained(hf_dir)
+        tiny_tokenizer.save_pretrained(hf_dir)
+        transformer = models.Transformer(str(hf_dir), max_seq_length=32)
+        pooling = models.Pooling(TINY_CONFIG["hidden_size"], pooling_mode="mean")
+        st_model = SentenceTransformer(modules=[transformer, pooling], device="cpu")
+
+        export_sentence_encoder(st_model, tmp_path / "embedding")
+        encoder = OnnxSentenceEncoder(tmp_path / "embedding")
+
+        texts = ["the earth orbits the sun", "paris", "water boils at 100 degrees"]
+        expected = st_model.encode(texts, normalize_embeddings=True, batch_size=2)
+        actual = encoder.encode(texts, normalize_embeddings=True, batch_size=2)
+
+        np.testing.assert_allclose(actual, expected, atol=1e-5)
+        assert encoder.encode("paris", normalize_embeddings=True).shape == (16,)
+
+
+class TestServiceIntegration:
+    """Test that the services pick the ONNX backend from the environment."""
+
+    def test_nli_service_uses_onnx_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test NLIService loads the ONNX classifier when NLI_BACKEND=onnx."""
+        from truthgraph.services.ml.nli_service import NLIService
+
+        monkeypatch.setenv("NLI_BACKEND", "onnx")
+        monkeypatch.setenv("ONNX_QUANTIZE", "int8")
+        NLIService._instance = None
+        onnx_model = MagicMock()
+
+        with patch(
+            "truthgraph.services.ml.nli_service.OnnxSequenceClassifier.from_pretrained",
+            return_value=onnx_model,
+        ) as mock_load:
+            service = NLIService.get_instance()
+            service._load_model()
+
+        mock_load.assert_called_once_with(NLIService._model_name, quantize=True)
+        assert service.tokenizer is onnx_model.tokenizer
+        assert service.get_model_info()["backend"] == "onnx"
+        NLIService._instance = None
+
+    def test_embedding_service_uses_onnx_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test EmbeddingService loads the ONNX encoder when EMBEDDING_BACKEND=onnx."""
+        from truthgraph.services.ml.embedding_service import EmbeddingService
+
+        monkeypatch.setenv("EMBEDDING_BACKEND", "onnx")
+        monkeypatch.delenv("ONNX_QUANTIZE", raising=False)
+        EmbeddingService._instance = None
+        onnx_model = MagicMock(device="cpu")
+        onnx_model.encode.return_value = np.ones(384, dtype=np.float32)
+
+        with patch(
+            "truthgraph.services.ml.embedding_service.OnnxSentenceEncoder.from_pretrained",
+            return_value=onnx_model,
+        ) as mock_load:
+            service = EmbeddingService.get_instance()
+            embedding = service.embed_text("The Earth orbits the Sun")
+
+        mock_load.assert_called_once_with(EmbeddingService.MODEL_NAME, quantize=False)
+        assert len(embedding) == 384
+        assert service.get_device() == "cpu"
+        EmbeddingService._instance = None
+        EmbeddingService._model = None
+        EmbeddingService._device = None
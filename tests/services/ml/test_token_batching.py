@@ -0,0 +1,121 @@
+"""Unit tests for length-aware, token-budget batching."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from truthgraph.services.ml.token_batching import (
+    estimate_token_lengths,
+    padded_token_count,
+    plan_token_batches,
+    run_token_batches,
+    token_lengths,
+)
+
+
+class TestPlanTokenBatches:
+    """Test cases for plan_token_batches."""
+
+    def test_batches_sorted_longest_first(self):
+        """Test that inputs are grouped by length, longest first."""
+        lengths = [5, 100, 6, 90, 4]
+
+        batches = plan_token_batches(lengths, max_batch_tokens=200)
+
+        assert batches == [[1, 3], [2, 0, 4]]
+
+    def test_budget_bounds_padded_tokens(self):
+        """Test that no batch pads more tokens than the budget."""
+        lengths = [512, 20, 30, 25, 22, 18, 510, 40]
+
+        batches = plan_token_batches(lengths, max_batch_tokens=1024)
+
+        for batch in batches:
+            assert len(batch) * max(lengths[i] for i in batch) <= 1024
+        assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+
+    def test_oversized_input_gets_own_batch(self):
+        """Test that an input longer than the budget is still processed alone."""
+        batches = plan_token_batches([600, 10, 10], max_batch_tokens=512)
+
+        assert batches == [[0], [1, 2]]
+
+    def test_max_batch_size_caps_items(self):
+        """Test that max_batch_size limits items per batch."""
+        batches = plan_token_batches([3] * 5, max_batch_tokens=10_000, max_batch_size=2)
+
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_equal_lengths_keep_input_order(self):
+        """Test that ties preserve the original relative order."""
+        assert plan_token_batches([7, 7, 7], max_batch_tokens=100) == [[0, 1, 2]]
+
+    def test_sorting_reduces_padding(self):
+        """Test that the plan pads fewer tokens than positional batching."""
+        lengths = [256, 8, 8, 8, 256, 8, 8, 8]
+        positional = padded_token_count(lengths, [[0, 1, 2, 3], [4, 5, 6, 7]])
+
+        planned = padded_token_count(lengths, plan_token_batches(lengths, 1024, 4))
+
+        assert planned < positional
+
+    def test_invalid_budget_raises(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="max_batch_tokens"):
+            plan_token_batches([1], max_batch_tokens=0)
+        with pytest.raises(ValueError, match="max_batch_size"):
+            plan_token_batches([1], max_batch_tokens=10, max_batch_size=0)
+
+
+class TestRunTokenBatches:
+    """Test cases for run_token_batches."""
+
+    def test_restores_original_order(self):
+        """Test that outputs line up with inputs regardless of batch order."""
+        items = ["a" * n for n in (3, 40, 1, 25, 2)]
+        calls: list[list[str]] = []
+
+        def fn(batch: list[str]) -> list[int]:
+            calls.append(batch)
+            return [len(s) for s in batch]
+
+        results = run_token_batches(items, [len(s) for s in items], fn, max_batch_tokens=50)
+
+        assert results == [3, 40, 1, 25, 2]
+        assert calls[0][0] == "a" * 40
+        assert len(calls) > 1
+
+    def test_length_mismatch_raises(self):
+        """Test that lengths must match items."""
+        with pytest.raises(ValueError, match="lengths"):
+            run_token_batches(["a", "b"], [1], lambda batch: batch, max_batch_tokens=10)
+
+
+class TestTokenLengths:
+    """Test cases for token length measurement."""
+
+    def test_uses_tokenizer_input_ids(self):
+        """Test that lengths come from the tokenizer when available."""
+        tokenizer = MagicMock(return_value={"input_ids": [[1, 2, 3], [1, 2]]})
+
+        lengths = token_lengths(tokenizer, ["abc", "ab"], max_length=128)
+
+        assert lengths == [3, 2]
+        assert tokenizer.call_args.kwargs["truncation"] is True
+        assert tokenizer.call_args.kwargs["max_length"] == 128
+
+    def test_falls_back_to_estimate(self):
+        """Test that a missing or failing tokenizer falls back to estimates."""
+        failing = MagicMock(side_effect=Exception("no vocab"))
+        texts = ["short", "a much longer piece of evidence text"]
+
+        assert token_lengths(None, texts) == estimate_token_lengths(texts)
+        assert token_lengths(failing, texts) == estimate_token_lengths(texts)
+
+    def test_estimate_respects_pairs_and_cap(self):
+        """Test that pair estimates include both segments and are truncated."""
+        single = estimate_token_lengths(["x" * 40])[0]
+        paired = estimate_token_lengths(["x" * 40], ["y" * 40])[0]
+
+        assert paired > single
+        assert estimate_token_lengths(["x" * 10_000], max_length=256) == [256]
@@ -0,0 +1,299 @@
+"""Unit tests for the ML API routes with mocked services and database."""
+
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from truthgraph.api import ml_routes
+from truthgraph.db import get_db
+from truthgraph.monitoring import metrics_collector as metrics_module
+from truthgraph.schemas import VerificationResult
+from truthgraph.services import verification_pipeline_service as pipeline_module
+from truthgraph.services.hybrid_search_service import HybridFusion, HybridSearchResult
+from truthgraph.services.ml.nli_scheduler import NLIBatchScheduler
+from truthgraph.services.ml.nli_service import NLILabel, NLIResult
+from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_cache import VerificationCache
+from truthgraph.services.verification_pipeline_service import (
+    VerdictLabel,
+    VerificationPipelineResult,
+    VerificationPipelineService,
+)
+
+
+@pytest.fixture
+def embedding(monkeypatch):
+    """Patch the micro-batcher so query embeddings need no model."""
+    batcher = Mock(embed=AsyncMock(return_value=[0.1] * 384))
+    monkeypatch.setattr(ml_routes, "get_embedding_batcher", lambda service: batcher)
+    return batcher
+
+
+@pytest.fixture
+def app(embedding):
+    """App with the ML router and a mocked database session."""
+    app = FastAPI()
+    app.include_router(ml_routes.router)
+    app.state.db = Mock()
+    app.dependency_overrides[get_db] = lambda: app.state.db
+    app.dependency_overrides[ml_routes.get_embedding_service_dep] = lambda: Mock()
+    # Routes share one in-memory limiter; start every test with a fresh window
+    ml_routes.limiter.reset()
+    return app
+
+
+class TestHybridSearch:
+    """Test cases for /search in hybrid mode."""
+
+    def _hybrid(self, app, fusion):
+        result = HybridSearchResult(
+            evidence_id=uuid4(),
+            content="Keyword-only match",
+            source_url=None,
+            rank_score=0.016,
+            keyword_rank=1,
+            matched_via="keyword",
+        )
+        hybrid = Mock(fusion=fusion)
+        stats = {"concurrent": True, "vector_ms": 0.4, "keyword_ms": 0.3}
+        hybrid.hybrid_search_concurrent = AsyncMock(return_value=([result], 1.0, stats))
+        hybrid.hybrid_search = Mock(return_value=([result], 1.0))
+        app.dependency_overrides[ml_routes.get_hybrid_search_service] = lambda: hybrid
+        return hybrid
+
+    def test_python_fusion_runs_branches_concurrently(self, app, embedding):
+        """Test that hybrid mode overlaps keyword search with the query embedding."""
+        hybrid = self._hybrid(app, HybridFusion.PYTHON)
+
+        response = TestClient(app).post(
+            "/api/v1/search", json={"query": "ice caps", "limit": 5, "tenant_id": "acme"}
+        )
+
+        assert response.status_code == 200
+        item = response.json()["results"][0]
+        assert (item["similarity"], item["rank_score"]) == (0.0, 0.016)
+        kwargs = hybrid.hybrid_search_concurrent.call_args.kwargs
+        assert (kwargs["top_k"], kwargs["tenant_id"]) == (5, "acme")
+        assert response.json()["search_stats"]["keyword_ms"] == 0.3
+        embedding.embed.assert_called_once_with("ice caps")
+        hybrid.hybrid_search.assert_not_called()
+
+    def test_sql_fusion_uses_request_session(self, app):
+        """Test that sql fusion runs the single fused statement on the request session."""
+        hybrid = self._hybrid(app, HybridFusion.SQL)
+
+        response = TestClient(app).post("/api/v1/search", json={"query": "ice caps"})
+
+        assert response.status_code == 200
+        assert hybrid.hybrid_search.call_args.kwargs["db"] is app.state.db
+        assert hybrid.hybrid_search.call_args.kwargs["query_embedding"] == [0.1] * 384
+        stats = response.json()["search_stats"]
+        assert (stats["concurrent"], stats["search_ms"]) == (False, 1.0)
+        hybrid.hybrid_search_concurrent.assert_not_called()
+
+
+class TestVectorSearch:
+    """Test cases for /search in vector mode."""
+
+    def test_search_runs_off_event_loop(self, app, embedding):
+        """Test that the blocking vector search does not run on the event loop thread."""
+        threads = {}
+
+        async def embed(text):
+            threads["loop"] = threading.get_ident()
+            return [0.1] * 384
+
+        def search(**kwargs):
+            threads["search"] = threading.get_ident()
+            return []
+
+        embedding.embed = AsyncMock(side_effect=embed)
+        vector = Mock(search_similar_evidence=Mock(side_effect=search))
+        app.dependency_overrides[ml_routes.get_vector_search_service] = lambda: vector
+
+        response = TestClient(app).post(
+            "/api/v1/search", json={"query": "ice caps", "mode": "vector"}
+        )
+
+        assert response.status_code == 200
+        assert threads["search"] != threads["loop"]
+        assert vector.search_similar_evidence.call_args.kwargs["db"] is app.state.db
+
+
+class TestVerifyBatch:
+    """Test cases for /verify/batch."""
+
+    def test_all_cache_hits_commit_claims(self, app, monkeypatch):
+        """Test that claims are committed even when every verdict comes from the cache."""
+        cached = VerificationPipelineResult(
+            claim_id=uuid4(),
+            claim_text="The Earth orbits the Sun",
+            verdict=VerdictLabel.SUPPORTED,
+            confidence=0.9,
+            support_score=0.9,
+            refute_score=0.05,
+            neutral_score=0.05,
+            evidence_items=[],
+            reasoning="Cached verdict",
+            pipeline_duration_ms=1.0,
+            retrieval_method="vector",
+            verification_result_id=uuid4(),
+        )
+        monkeypatch.setattr(
+            VerificationPipelineService, "_get_cached_result", lambda self, *args: cached
+        )
+        monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "false")
+        monkeypatch.setenv("VERIFICATION_WRITE_BEHIND", "false")
+        monkeypatch.setattr(pipeline_module, "get_nli_scheduler", lambda service: Mock())
+        factory = Mock(wraps=pipeline_module.get_verification_pipeline_service)
+        monkeypatch.setattr(ml_routes, "get_verification_pipeline_service", factory)
+        nli = Mock()
+        app.dependency_overrides[ml_routes.get_nli_service_dep] = lambda: nli
+        app.dependency_overrides[ml_routes.get_vector_search_service] = lambda: Mock()
+        db = app.state.db
+
+        def flush():
+            for claim in db.add_all.call_args.args[0]:
+                claim.id = uuid4()
+
+        db.flush.side_effect = flush
+
+        response = TestClient(app).post(
+            "/api/v1/verify/batch",
+            json={"claims": ["The Earth orbits the Sun", "The Sun is a star"]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        claim_ids = {item["claim_id"] for item in body["results"]}
+        assert len(claim_ids) == 2 and str(cached.claim_id) not in claim_ids
+        assert [item["verification_id"] for item in body["results"]] == [None, None]
+        assert body["stored_count"] == 0
+        assert factory.call_args.kwargs["nli_service"] is nli
+        db.commit.assert_called_once()
+        db.rollback.assert_not_called()
+
+
+class TestVerifyDeadline:
+    """Test cases for /verify with and without deadline_ms."""
+
+    @pytest.fixture
+    def services(self, app, monkeypatch):
+        evidence = [
+            SearchResult(
+                evidence_id=uuid4(), content=f"Evidence {i}", source_url=None, similarity=0.9
+            )
+            for i in range(6)
+        ]
+        embedding = Mock(embed_text=Mock(return_value=[0.1] * 384))
+        nli = Mock()
+        nli.verify_batch.side_effect = lambda pairs, batch_size: [
+            NLIResult(
+                label=NLILabel.ENTAILMENT,
+                confidence=0.75,
+                scores={"entailment": 0.75, "contradiction": 0.05, "neutral": 0.2},
+            )
+            for _ in pairs
+        ]
+        vector = Mock(search_similar_evidence=Mock(return_value=evidence))
+        hybrid = Mock()
+        hybrid.keyword_only_search.return_value = (
+            [
+                HybridSearchResult(
+                    evidence_id=evidence[0].evidence_id,
+                    content=evidence[0].content,
+                    source_url=None,
+                    rank_score=1 / 61,
+                    keyword_rank=1,
+                    matched_via="keyword",
+                )
+            ],
+            1.0,
+        )
+        metrics = Mock(
+            record_histogram=AsyncMock(), increment_counter=AsyncMock(), set_gauge=AsyncMock()
+        )
+        monkeypatch.setattr(metrics_module, "get_metrics_collector", lambda: metrics)
+        # A scheduler singleton bound to this test's NLI mock
+        monkeypatch.setattr(NLIBatchScheduler, "_instance", None)
+        monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "false")
+        monkeypatch.setenv("VERIFICATION_WRITE_BEHIND", "false")
+        VerificationCache.get_instance().clear()
+        app.state.db.refresh.side_effect = lambda claim: setattr(claim, "id", uuid4())
+        app.dependency_overrides.update(
+            {
+                ml_routes.get_embedding_service_dep: lambda: embedding,
+                ml_routes.get_nli_service_dep: lambda: nli,
+                ml_routes.get_vector_search_service: lambda: vector,
+                ml_routes.get_hybrid_search_service: lambda: hybrid,
+            }
+        )
+        return Mock(embedding=embedding, nli=nli, vector=vector, hybrid=hybrid, metrics=metrics)
+
+    def _verify(self, app, **params):
+        response = TestClient(app).post(
+            "/api/v1/verify", json={"claim": "The Earth orbits the Sun", **params}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    @pytest.mark.parametrize("threshold, verdict", [(0.7, "SUPPORTED"), (0.8, "INSUFFICIENT")])
+    def test_generous_deadline_keeps_verdict(self, app, services, threshold, verdict):
+        """Test that a budget that is not needed applies the same rule and parameters."""
+        params = {"confidence_threshold": threshold, "search_mode": "vector"}
+
+        full = self._verify(app, **params)
+        bounded = self._verify(app, deadline_ms=60_000, **params)
+
+        assert full["verdict"] == bounded["verdict"] == verdict
+        assert full["confidence"] == bounded["confidence"]
+        assert len(full["evidence"]) == len(bounded["evidence"]) == 6
+        assert not bounded["degraded"]
+        stages = {"embed", "retrieve", "nli", "aggregate", "persist"}
+        assert set(bounded["stage_timings_ms"]) == stages
+        assert full["stage_timings_ms"] is None
+        added = [c.args[0] for c in app.state.db.add.call_args_list]
+        stored = [row for row in added if isinstance(row, VerificationResult)]
+        assert [v.retrieval_method for v in stored] == ["vector", "vector"]
+        assert services.vector.search_similar_evidence.call_args.kwargs["min_similarity"] == 0.3
+
+    def test_deadline_serves_cached_verdict_first(self, app, services):
+        """Test that a repeated deadline-bound claim is answered without model calls."""
+        first = self._verify(app, deadline_ms=60_000, search_mode="vector")
+        services.embedding.embed_text.reset_mock()
+        services.nli.verify_batch.reset_mock()
+
+        second = self._verify(app, deadline_ms=60_000, search_mode="vector")
+        other_threshold = self._verify(
+            app, deadline_ms=60_000, search_mode="vector", confidence_threshold=0.8
+        )
+
+        assert second["verdict"] == first["verdict"] == "SUPPORTED"
+        assert second["verification_id"] is None
+        assert other_threshold["verdict"] == "INSUFFICIENT"
+        services.embedding.embed_text.assert_called_once()  # only the other threshold
+
+    def test_slow_embedding_falls_back_to_keyword_search(self, app, services):
+        """Test that keyword matches report a rank score rather than a similarity."""
+
+        def slow_embed(text):
+            time.sleep(0.5)
+            return [0.1] * 384
+
+        services.embedding.embed_text.side_effect = slow_embed
+
+        body = self._verify(app, deadline_ms=300)
+
+        assert body["degraded"]
+        assert body["degradations"][0] == "embed_timeout"
+        assert "keyword_retrieval" in body["degradations"]
+        services.vector.search_similar_evidence.assert_not_called()
+        (item,) = body["evidence"]
+        assert (item["similarity"], item["rank_score"]) == (0.0, pytest.approx(1 / 61))
+        assert "deadline" in body["explanation"]
+        services.metrics.increment_counter.assert_called()
@@ -0,0 +1 @@
+"""Unit tests for database query helpers."""
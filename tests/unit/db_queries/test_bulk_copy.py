@@ -0,0 +1,205 @@
+"""Unit tests for binary COPY bulk writes."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from truthgraph.db_queries import OptimizedQueries
+from truthgraph.db_queries.bulk_copy import BulkWriteResult, copy_rows
+
+
+class _FakeCopy:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_types(self, types):
+        self.cursor.types.append(list(types))
+
+    def write_row(self, row):
+        self.cursor.copied[-1].append(row)
+
+
+class _FakeCursor:
+    """Cursor recording statements, COPY rounds and copied rows."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.copied: list[list[tuple]] = []
+        self.types: list[list[str]] = []
+        self._returned: list[tuple] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+        if sql.startswith("INSERT"):
+            self._returned = [(uuid4(),) for _ in self.copied[-1]]
+
+    def copy(self, sql):
+        self.statements.append(sql)
+        self.copied.append([])
+        return _FakeCopy(self)
+
+    def fetchall(self):
+        return self._returned
+
+
+@pytest.fixture
+def cursor():
+    fake_cursor = _FakeCursor()
+    conn = MagicMock()
+    conn.cursor.return_value = fake_cursor
+    with patch("truthgraph.db_queries.bulk_copy.vector_connection", return_value=conn):
+        yield fake_cursor
+
+
+class TestCopyRows:
+    """Test cases for copy_rows."""
+
+    def test_rows_are_copied_in_chunks(self, cursor):
+        """Test that rows stream through the staging table one chunk at a time."""
+        consumed = []
+
+        def rows():
+            for i in range(5):
+                consumed.append(i)
+                yield (uuid4(), f"text {i}")
+
+        result = copy_rows(
+            MagicMock(),
+            table="evidence",
+            columns=[("id", "uuid"), ("content", "text")],
+            rows=rows(),
+            chunk_size=2,
+        )
+
+        assert [len(chunk) for chunk in cursor.copied] == [2, 2, 1]
+        assert cursor.types[0] == ["uuid", "text"]
+        assert sum(s.startswith("TRUNCATE") for s in cursor.statements) == 3
+        assert "CREATE TEMP TABLE _copy_evidence ON COMMIT DROP" in cursor.statements[1]
+        assert "FORMAT BINARY" in cursor.statements[3]
+        assert result.rows == 5
+        assert result.chunks == 3
+        assert len(result.ids) == 5
+        assert consumed == list(range(5))
+
+    def test_upsert_statement(self, cursor):
+        """Test the ON CONFLICT clause built from conflict and update columns."""
+        copy_rows(
+            MagicMock(),
+            table="embeddings",
+            columns=[("entity_type", "text"), ("entity_id", "uuid"), ("embedding", "vector")],
+            rows=[("evidence", uuid4(), np.zeros(3, dtype=np.float32))],
+            conflict_columns=["entity_type", "entity_id"],
+            extra_updates={"updated_at": "CURRENT_TIMESTAMP"},
+        )
+
+        upsert = next(s for s in cursor.statements if s.startswith("INSERT"))
+        assert upsert.startswith(
+            "INSERT INTO embeddings (entity_type, entity_id, embedding) "
+            "SELECT entity_type, entity_id, embedding FROM _copy_embeddings"
+        )
+        assert (
+            "ON CONFLICT (entity_type, entity_id) DO UPDATE SET "
+            "embedding = EXCLUDED.embedding, updated_at = CURRENT_TIMESTAMP"
+        ) in upsert
+        assert upsert.endswith("RETURNING id")
+
+    def test_do_nothing_without_returning(self, cursor):
+        """Test DO NOTHING upserts and writes without RETURNING."""
+        result = copy_rows(
+            MagicMock(),
+            table="evidence",
+            columns=[("id", "uuid")],
+            rows=[(uuid4(),)],
+            conflict_columns=["id"],
+            update_columns=[],
+            returning=None,
+        )
+
+        upsert = next(s for s in cursor.statements if s.startswith("INSERT"))
+        assert upsert.endswith("ON CONFLICT (id) DO NOTHING")
+        assert result.ids == []
+        assert result.rows == 1
+
+    def test_empty_input_writes_nothing(self, cursor):
+        """Test that an empty iterable makes no COPY round."""
+        result = copy_rows(MagicMock(), table="evidence", columns=[("id", "uuid")], rows=[])
+
+        assert cursor.copied == []
+        assert result.rows == 0
+        assert result.chunks == 0
+
+    def test_report(self):
+        """Test the rows-per-second report."""
+        result = BulkWriteResult(table="nli_results", rows=10_000, chunks=2, duration_seconds=0.5)
+
+        assert result.rows_per_second == 20_000
+        assert str(result) == "Copied 10000 rows into nli_results in 2 chunks (0.50s, 20000 rows/s)"
+        assert BulkWriteResult(table="t").rows_per_second == 0.0
+
+
+class TestOptimizedQueriesCopy:
+    """Test cases for the OptimizedQueries COPY writers."""
+
+    def test_copy_upsert_embeddings_streams_float32_views(self, cursor):
+        """Test that matrix rows are copied as float32 views and committed."""
+        session = MagicMock()
+        matrix = np.random.rand(3, 384).astype(np.float32)
+
+        result = OptimizedQueries().copy_upsert_embeddings(
+            session, [uuid4(), uuid4(), uuid4()], matrix, tenant_id="tenant-a"
+        )
+
+        (rows,) = cursor.copied
+        assert [row[5] for row in rows] == ["tenant-a"] * 3
+        assert np.shares_memory(rows[0][2], matrix)
+        assert cursor.types[0][2] == "vector"
+        assert len(result.ids) == 3
+        session.commit.assert_called_once()
+
+    def test_large_batches_use_copy(self, cursor, monkeypatch):
+        """Test that batch_create_nli_results switches to COPY at COPY_MIN_ROWS."""
+        monkeypatch.setattr(OptimizedQueries, "COPY_MIN_ROWS", 2)
+        session = MagicMock()
+        nli = {
+            "claim_id": uuid4(),
+            "evidence_id": uuid4(),
+            "label": "entailment",
+            "confidence": 0.9,
+            "entailment_score": 0.9,
+            "contradiction_score": 0.05,
+            "neutral_score": 0.05,
+            "premise_text": "Evidence",
+            "hypothesis_text": "Claim",
+        }
+
+        ids = OptimizedQueries().batch_create_nli_results(session, [nli, nli])
+
+        assert len(ids) == 2
+        session.execute.assert_not_called()
+        assert cursor.copied[0][0][7] == "microsoft/deberta-v3-base"
+        session.commit.assert_called_once()
+
+    def test_failure_rolls_back(self, cursor):
+        """Test that a COPY failure rolls back and re-raises."""
+        session = MagicMock()
+        cursor.copy = MagicMock(side_effect=RuntimeError("copy failed"))
+
+        with pytest.raises(RuntimeError, match="copy failed"):
+            OptimizedQueries().copy_create_evidence(session, [{"content": "Evidence"}])
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
@@ -0,0 +1,96 @@
+"""Unit tests for the vector distance metric layer."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from truthgraph.db_queries import QueryBuilder
+from truthgraph.db_queries.distance import DistanceMetric, get_distance_metric
+
+
+def _distance(metric: DistanceMetric, a: np.ndarray, b: np.ndarray) -> float:
+    """Python equivalent of the pgvector operator for each metric."""
+    if metric is DistanceMetric.COSINE:
+        return 1.0 - float(a @ b)
+    if metric is DistanceMetric.INNER_PRODUCT:
+        return -float(a @ b)
+    return float(np.linalg.norm(a - b))
+
+
+class TestDistanceMetric:
+    """Test cases for DistanceMetric."""
+
+    @pytest.mark.parametrize(
+        ("metric", "operator", "opclass"),
+        [
+            (DistanceMetric.COSINE, "<=>", "vector_cosine_ops"),
+            (DistanceMetric.INNER_PRODUCT, "<#>", "vector_ip_ops"),
+            (DistanceMetric.L2, "<->", "vector_l2_ops"),
+        ],
+    )
+    def test_operator_matches_opclass(self, metric, operator, opclass):
+        """Test that each metric pairs its operator with the matching index opclass."""
+        assert metric.operator == operator
+        assert metric.opclass == opclass
+        assert operator in metric.order_by_sql("emb.embedding", ":q")
+        assert opclass in metric.create_ivfflat_index_sql(lists=10)
+
+    @pytest.mark.parametrize("metric", list(DistanceMetric))
+    def test_threshold_matches_cosine_similarity(self, metric):
+        """Test that max_distance admits exactly the vectors above min_similarity."""
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=16)
+        query /= np.linalg.norm(query)
+        vectors = rng.normal(size=(200, 16))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        min_similarity = 0.1
+        max_distance = metric.max_distance(min_similarity)
+        admitted = [_distance(metric, v, query) <= max_distance for v in vectors]
+        expected = [float(v @ query) >= min_similarity for v in vectors]
+
+        assert admitted == expected
+
+    def test_parse_accepts_aliases(self):
+        """Test metric name parsing."""
+        assert DistanceMetric.parse("COSINE") is DistanceMetric.COSINE
+        assert DistanceMetric.parse("ip") is DistanceMetric.INNER_PRODUCT
+        assert DistanceMetric.parse("euclidean") is DistanceMetric.L2
+        with pytest.raises(ValueError, match="Unknown distance metric"):
+            DistanceMetric.parse("manhattan")
+
+    def test_env_configures_default(self, monkeypatch):
+        """Test that VECTOR_DISTANCE_METRIC selects the metric."""
+        monkeypatch.delenv("VECTOR_DISTANCE_METRIC", raising=False)
+        assert get_distance_metric() is DistanceMetric.COSINE
+
+        monkeypatch.setenv("VECTOR_DISTANCE_METRIC", "l2")
+        assert get_distance_metric() is DistanceMetric.L2
+
+
+class TestSimilarityQueryBuilder:
+    """Test cases for QueryBuilder.build_similarity_search_query."""
+
+    def test_defaults_to_cosine_operator(self, monkeypatch):
+        """Test that the built query orders by the cosine operator, not L2."""
+        monkeypatch.delenv("VECTOR_DISTANCE_METRIC", raising=False)
+        builder = QueryBuilder(MagicMock())
+
+        query, params = builder.build_similarity_search_query([0.1] * 384, min_similarity=0.5)
+
+        assert "ORDER BY (emb.embedding <=> :embedding_vec) ASC" in query
+        assert "<->" not in query
+        assert params["max_distance"] == pytest.approx(0.5)
+        assert params["embedding_vec"].dtype == np.float32
+
+    def test_explicit_metric(self):
+        """Test that an explicit metric changes operator and threshold."""
+        builder = QueryBuilder(MagicMock())
+
+        query, params = builder.build_similarity_search_query(
+            [0.1] * 384, min_similarity=0.5, metric="inner_product"
+        )
+
+        assert "ORDER BY (emb.embedding <#> :embedding_vec) ASC" in query
+        assert params["max_distance"] == pytest.approx(-0.5)
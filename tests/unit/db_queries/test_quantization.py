@@ -0,0 +1,112 @@
+"""Unit tests for quantized shadow columns and their backfill."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from truthgraph.db_queries.distance import DistanceMetric
+from truthgraph.db_queries.quantization import (
+    INSTALL_SQL,
+    VectorQuantization,
+    backfill_quantized_embeddings,
+    get_rerank_oversample,
+    get_vector_quantization,
+    install_quantized_columns,
+    quantized_columns_enabled,
+)
+from truthgraph.db_queries.vector_index import HNSWParams
+from truthgraph.schemas import Embedding
+
+
+class TestVectorQuantization:
+    """Test cases for VectorQuantization."""
+
+    def test_halfvec_index_keeps_metric(self):
+        """Test that the halfvec index uses the halfvec opclass of the metric."""
+        sql = VectorQuantization.HALFVEC.index_sql(
+            DistanceMetric.INNER_PRODUCT, HNSWParams(m=16, ef_construction=64)
+        )
+
+        assert sql.startswith("CREATE INDEX IF NOT EXISTS idx_embeddings_halfvec_hnsw_ip ")
+        assert "USING hnsw (embedding_half halfvec_ip_ops)" in sql
+
+    def test_binary_index_uses_hamming(self):
+        """Test that the bit column is indexed and ranked by Hamming distance."""
+        binary = VectorQuantization.BINARY
+
+        assert "(embedding_binary bit_hamming_ops)" in binary.index_sql(DistanceMetric.L2)
+        assert binary.index_name(DistanceMetric.COSINE) == binary.index_name(DistanceMetric.L2)
+        assert binary.order_by_sql(DistanceMetric.L2, "emb", ":q") == (
+            "(emb.embedding_binary <~> binary_quantize(:q))"
+        )
+
+    def test_halfvec_order_by_casts_query(self):
+        """Test that the full-precision query vector is cast to match the index."""
+        assert VectorQuantization.HALFVEC.order_by_sql(DistanceMetric.COSINE, "emb", ":q") == (
+            "(emb.embedding_half <=> :q::halfvec)"
+        )
+
+    def test_parse_and_env(self, monkeypatch):
+        """Test name parsing and the environment defaults."""
+        assert VectorQuantization.parse("BIT") is VectorQuantization.BINARY
+        with pytest.raises(ValueError, match="quantization"):
+            VectorQuantization.parse("int8")
+
+        monkeypatch.delenv("VECTOR_SEARCH_QUANTIZATION", raising=False)
+        monkeypatch.setenv("VECTOR_RERANK_OVERSAMPLE", "0")
+        assert get_vector_quantization() is VectorQuantization.NONE
+        with pytest.raises(ValueError, match="oversample"):
+            get_rerank_oversample()
+
+    def test_shadow_columns_are_opt_in(self, monkeypatch):
+        """Test that the shadow columns are unmapped and only installed when enabled."""
+        columns = Embedding.__table__.c
+        assert "embedding_half" not in columns and "embedding_binary" not in columns
+
+        monkeypatch.delenv("VECTOR_SEARCH_QUANTIZATION", raising=False)
+        assert not quantized_columns_enabled()
+        monkeypatch.setenv("VECTOR_SEARCH_QUANTIZATION", "halfvec")
+        assert quantized_columns_enabled()
+
+    def test_install_adds_columns_then_trigger(self):
+        """Test that install runs the idempotent DDL in one committed transaction."""
+        db = MagicMock()
+
+        install_quantized_columns(db)
+
+        statements = [str(c.args[0]) for c in db.execute.call_args_list]
+        assert statements == list(INSTALL_SQL)
+        assert "ADD COLUMN IF NOT EXISTS embedding_half halfvec(384)" in statements[0]
+        db.commit.assert_called_once()
+
+        db.execute.side_effect = Exception('type "halfvec" does not exist')
+        with pytest.raises(RuntimeError, match="Installing quantized"):
+            install_quantized_columns(db)
+        db.rollback.assert_called_once()
+
+
+class TestBackfill:
+    """Test cases for backfill_quantized_embeddings."""
+
+    def test_commits_batches_until_short_batch(self):
+        """Test that batches are committed until one updates fewer rows than the limit."""
+        db = MagicMock()
+        db.execute.side_effect = [MagicMock(rowcount=100), MagicMock(rowcount=40)]
+
+        total = backfill_quantized_embeddings(db, batch_size=100, tenant_id="acme")
+
+        assert total == 140
+        assert db.commit.call_count == 2
+        statement, params = db.execute.call_args.args
+        assert "binary_quantize(embedding)::bit(384)" in str(statement)
+        assert "SKIP LOCKED" in str(statement)
+        assert params == {"batch_size": 100, "tenant_id": "acme"}
+
+    def test_failure_rolls_back(self):
+        """Test that a failed batch is rolled back and reported."""
+        db = MagicMock()
+        db.execute.side_effect = Exception("function binary_quantize does not exist")
+
+        with pytest.raises(RuntimeError, match="backfill failed"):
+            backfill_quantized_embeddings(db)
+        db.rollback.assert_called_once()
@@ -0,0 +1,118 @@
+"""Unit tests for binary pgvector parameter helpers."""
+
+import struct
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import psycopg
+import pytest
+from pgvector.psycopg.vector import register_vector_info
+from psycopg.adapt import AdaptersMap, PyFormat
+from psycopg.types import TypeInfo
+
+from truthgraph.db_queries import OptimizedQueries
+from truthgraph.db_queries.vector_adapter import (
+    as_float32_matrix,
+    as_float32_vector,
+    register_vector_adapter,
+)
+
+
+def _fake_connection() -> SimpleNamespace:
+    return SimpleNamespace(adapters=AdaptersMap(psycopg.adapters))
+
+
+def _fake_register(conn: SimpleNamespace) -> None:
+    register_vector_info(conn, TypeInfo("vector", 90001, 0))
+
+
+class TestFloat32Conversion:
+    """Test cases for float32 conversion helpers."""
+
+    def test_float32_array_is_not_copied(self):
+        """Test that a contiguous float32 array is passed through unchanged."""
+        embedding = np.random.rand(384).astype(np.float32)
+
+        assert as_float32_vector(embedding) is embedding
+
+    def test_list_is_converted_once(self):
+        """Test that lists become float32 arrays."""
+        vector = as_float32_vector([0.5, 0.25], dimension=2)
+
+        assert vector.dtype == np.float32
+        assert vector.tolist() == [0.5, 0.25]
+
+    def test_dimension_mismatch_raises(self):
+        """Test that a wrong dimension is rejected."""
+        with pytest.raises(ValueError, match="384-dimensional"):
+            as_float32_vector([0.1] * 10, dimension=384)
+        with pytest.raises(ValueError, match="1-dimensional"):
+            as_float32_vector(np.zeros((2, 3)))
+
+    def test_matrix_rows_are_views(self):
+        """Test that matrix rows share memory with the matrix."""
+        matrix = as_float32_matrix(np.random.rand(4, 8))
+
+        assert matrix.dtype == np.float32
+        assert np.shares_memory(matrix[1], matrix)
+        with pytest.raises(ValueError, match="2-dimensional"):
+            as_float32_matrix(np.zeros(3))
+
+
+class TestRegisterVectorAdapter:
+    """Test cases for register_vector_adapter."""
+
+    def test_registers_binary_dumper_once(self):
+        """Test that registration happens only on first use of a connection."""
+        conn = _fake_connection()
+
+        with patch(
+            "truthgraph.db_queries.vector_adapter.register_vector", side_effect=_fake_register
+        ) as mock_register:
+            register_vector_adapter(conn)
+            register_vector_adapter(conn)
+
+        assert mock_register.call_count == 1
+
+    def test_ndarray_dumps_as_binary_vector(self):
+        """Test that float32 arrays are sent in pgvector's binary wire format."""
+        conn = _fake_connection()
+        with patch(
+            "truthgraph.db_queries.vector_adapter.register_vector", side_effect=_fake_register
+        ):
+            register_vector_adapter(conn)
+
+        dumper_cls = conn.adapters.get_dumper(np.ndarray, PyFormat.BINARY)
+        data = bytes(dumper_cls(np.ndarray).dump(np.array([1.0, 2.0], dtype=np.float32)))
+
+        assert data == struct.pack(">HH", 2, 0) + struct.pack(">ff", 1.0, 2.0)
+
+
+class TestBatchCreateEmbeddingsFromArray:
+    """Test cases for OptimizedQueries.batch_create_embeddings_from_array."""
+
+    def test_rows_bound_as_float32_views(self):
+        """Test that each row is bound as a float32 array instead of a literal."""
+        session = MagicMock()
+        session.execute.return_value.fetchall.return_value = [(uuid4(),), (uuid4(),)]
+        matrix = np.random.rand(2, 384).astype(np.float32)
+
+        ids = OptimizedQueries().batch_create_embeddings_from_array(
+            session, [uuid4(), uuid4()], matrix
+        )
+
+        assert len(ids) == 2
+        sql, params = session.execute.call_args.args
+        assert "::vector" not in str(sql)
+        assert np.shares_memory(params["embedding_0"], matrix)
+        assert params["embedding_1"].dtype == np.float32
+        session.commit.assert_called_once()
+
+    def test_row_count_mismatch_raises(self):
+        """Test that embeddings must match entity ids."""
+        with pytest.raises(ValueError, match="2 embeddings for 3 entity ids"):
+            OptimizedQueries().batch_create_embeddings_from_array(
+                MagicMock(), [uuid4(), uuid4(), uuid4()], np.zeros((2, 384))
+            )
@@ -0,0 +1,106 @@
+"""Unit tests for vector index types and HNSW parameters."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from truthgraph.db_queries import QueryBuilder
+from truthgraph.db_queries.distance import DistanceMetric
+from truthgraph.db_queries.vector_index import (
+    HNSWParams,
+    VectorIndexType,
+    get_default_ef_search,
+    get_vector_index_type,
+    set_local_ef_search,
+    validate_ef_search,
+)
+
+
+class TestHNSWParams:
+    """Test cases for HNSWParams."""
+
+    def test_index_sql_uses_metric_opclass(self):
+        """Test that the DDL builds an HNSW index for the metric's operator class."""
+        sql = HNSWParams(m=32, ef_construction=128).index_sql(DistanceMetric.INNER_PRODUCT)
+
+        assert sql.startswith("CREATE INDEX IF NOT EXISTS idx_embeddings_vector_hnsw_ip ")
+        assert "USING hnsw (embedding vector_ip_ops)" in sql
+        assert "WITH (m = 32, ef_construction = 128)" in sql
+
+    def test_invalid_parameters_raise(self):
+        """Test that parameters outside pgvector's limits are rejected."""
+        with pytest.raises(ValueError, match="m must be"):
+            HNSWParams(m=1)
+        with pytest.raises(ValueError, match=">= 2 \\* m"):
+            HNSWParams(m=32, ef_construction=40)
+
+    def test_from_env(self, monkeypatch):
+        """Test that build parameters come from HNSW_M and HNSW_EF_CONSTRUCTION."""
+        monkeypatch.setenv("HNSW_M", "24")
+        monkeypatch.setenv("HNSW_EF_CONSTRUCTION", "100")
+
+        assert HNSWParams.from_env() == HNSWParams(m=24, ef_construction=100)
+
+
+class TestIndexConfiguration:
+    """Test cases for index type and ef_search configuration."""
+
+    def test_index_type_defaults_to_ivfflat(self, monkeypatch):
+        """Test VECTOR_INDEX_TYPE parsing and default."""
+        monkeypatch.delenv("VECTOR_INDEX_TYPE", raising=False)
+        assert get_vector_index_type() is VectorIndexType.IVFFLAT
+
+        monkeypatch.setenv("VECTOR_INDEX_TYPE", "HNSW")
+        assert get_vector_index_type() is VectorIndexType.HNSW
+
+        with pytest.raises(ValueError, match="Unknown vector index type"):
+            VectorIndexType.parse("annoy")
+
+    def test_default_ef_search(self, monkeypatch):
+        """Test that HNSW_EF_SEARCH is optional and validated."""
+        monkeypatch.delenv("HNSW_EF_SEARCH", raising=False)
+        assert get_default_ef_search() is None
+
+        monkeypatch.setenv("HNSW_EF_SEARCH", "80")
+        assert get_default_ef_search() == 80
+
+        with pytest.raises(ValueError, match="ef_search"):
+            validate_ef_search(0)
+
+    def test_set_local_ef_search_is_transaction_scoped(self):
+        """Test that ef_search is set with set_config(..., true) as a bound parameter."""
+        cursor = MagicMock()
+
+        set_local_ef_search(cursor, 120)
+
+        sql, params = cursor.execute.call_args.args
+        assert "set_config('hnsw.ef_search', %(ef_search)s, true)" in sql
+        assert params == {"ef_search": "120"}
+
+
+class TestQueryBuilderHNSW:
+    """Test cases for HNSW support in QueryBuilder."""
+
+    def test_create_hnsw_index(self):
+        """Test that create_vector_index builds HNSW with the given parameters."""
+        session = MagicMock()
+
+        name = QueryBuilder(session).create_vector_index(
+            "cosine", index_type="hnsw", hnsw_params=HNSWParams(m=8, ef_construction=32)
+        )
+
+        assert name == "idx_embeddings_vector_hnsw_cosine"
+        ddl = str(session.execute.call_args.args[0])
+        assert "USING hnsw (embedding vector_cosine_ops)" in ddl
+        assert "m = 8, ef_construction = 32" in ddl
+
+    def test_set_hnsw_ef_search(self):
+        """Test that the session-level setter validates and applies ef_search."""
+        session = MagicMock()
+        builder = QueryBuilder(session)
+
+        builder.set_hnsw_ef_search(64)
+
+        assert str(session.execute.call_args.args[0]) == "SET hnsw.ef_search = 64"
+        with pytest.raises(ValueError, match="ef_search"):
+            builder.set_hnsw_ef_search(5000)
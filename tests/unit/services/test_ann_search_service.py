@@ -0,0 +1,186 @@
+"""Unit tests for the in-process ANN vector search backend.
+
+The graph itself is mocked here (see test_hnsw_evidence_index.py for hnswlib).
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from truthgraph.services.ann_search_service import ANNVectorSearchService, HNSWEvidenceIndex
+from truthgraph.services.vector_search_backends import get_vector_search_service
+from truthgraph.services.vector_search_service import VectorSearchService
+
+
+def _mock_db(content_rows=None, cursor_rows=None):
+    """Session whose execute() serves evidence content and whose cursor serves pgvector."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = cursor_rows or []
+    cursor.fetchmany.side_effect = [cursor_rows or [], []]
+    db = MagicMock()
+    db.connection.return_value.connection.cursor.return_value.__enter__.return_value = cursor
+    db.connection.return_value.connection.info = {}
+    db.execute.return_value.fetchall.return_value = content_rows or []
+    return db, cursor
+
+
+@pytest.fixture
+def service():
+    """Create an ANN service with no snapshots and no periodic sync."""
+    return ANNVectorSearchService(embedding_dimension=384, sync_interval_seconds=0)
+
+
+class TestANNVectorSearchService:
+    """Test cases for ANNVectorSearchService."""
+
+    def test_search_fetches_content_for_top_k_in_one_query(self, service):
+        """Test that neighbours come from the graph and content from one batched query."""
+        first, second = uuid4(), uuid4()
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.search.return_value = [(first, 0.95), (second, 0.80)]
+        service.attach_index("default", index)
+        db, cursor = _mock_db(
+            content_rows=[(second, "second", None), (first, "first", "https://a.test")]
+        )
+
+        results = service.search_similar_evidence(db=db, query_embedding=[0.1] * 384, top_k=2)
+
+        assert [r.evidence_id for r in results] == [first, second]
+        assert results[0].content == "first"
+        assert results[0].similarity == 0.95
+        db.execute.assert_called_once()
+        assert db.execute.call_args.args[1] == {"ids": [first, second]}
+        cursor.execute.assert_not_called()
+        assert service.get_stats()["ann_searches"] == 1
+
+    def test_min_similarity_filters_before_fetch(self, service):
+        """Test that below-threshold neighbours are dropped without a content query."""
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.search.return_value = [(uuid4(), 0.2)]
+        service.attach_index("default", index)
+        db, _ = _mock_db()
+
+        results = service.search_similar_evidence(
+            db=db, query_embedding=[0.1] * 384, min_similarity=0.5
+        )
+
+        assert results == []
+        db.execute.assert_not_called()
+
+    def test_tenant_ef_search_passed_to_graph(self, service):
+        """Test that the tenant ef_search override reaches the graph search."""
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.search.return_value = []
+        service.attach_index("premium", index)
+        service.set_tenant_ef_search("premium", 200)
+
+        service.search_similar_evidence(
+            db=_mock_db()[0], query_embedding=[0.1] * 384, tenant_id="premium"
+        )
+
+        assert index.search.call_args.kwargs["ef_search"] == 200
+
+    def test_stale_entries_removed_and_pgvector_answers(self, service):
+        """Test that evidence missing from the database is dropped and pgvector is used."""
+        kept, deleted = uuid4(), uuid4()
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.search.return_value = [(kept, 0.9), (deleted, 0.8)]
+        service.attach_index("default", index)
+        db, cursor = _mock_db(
+            content_rows=[(kept, "kept", None)], cursor_rows=[(kept, "kept", None, 0.9)]
+        )
+
+        results = service.search_similar_evidence(db=db, query_embedding=[0.1] * 384)
+
+        index.remove.assert_called_once_with([deleted])
+        cursor.execute.assert_called_once()
+        assert [r.evidence_id for r in results] == [kept]
+        assert service.get_stats()["stale_results"] == 1
+
+    def test_source_filter_and_index_errors_fall_back(self, service):
+        """Test that source-filtered searches and graph failures use pgvector."""
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.search.side_effect = RuntimeError("corrupt graph")
+        service.attach_index("default", index)
+
+        db, cursor = _mock_db()
+        service.search_similar_evidence(
+            db=db, query_embedding=[0.1] * 384, source_filter="https://a.test"
+        )
+        index.search.assert_not_called()
+        assert cursor.execute.call_count == 1
+
+        service.search_similar_evidence(db=db, query_embedding=[0.1] * 384)
+        assert cursor.execute.call_count == 2
+        assert service.get_stats()["fallbacks"] == 2
+
+    def test_batch_search_fetches_content_once(self, service):
+        """Test that a batch walks the graph per query and fetches content once."""
+        first, second = uuid4(), uuid4()
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.search.side_effect = [[(first, 0.9)], [(second, 0.8), (first, 0.7)]]
+        service.attach_index("default", index)
+        db, cursor = _mock_db(content_rows=[(first, "first", None), (second, "second", None)])
+
+        batch = service.search_similar_evidence_batch(db=db, query_embeddings=[[0.1] * 384] * 2)
+
+        assert [[r.evidence_id for r in results] for results in batch] == [
+            [first],
+            [second, first],
+        ]
+        db.execute.assert_called_once()
+        cursor.execute.assert_not_called()
+        assert service.get_stats()["ann_searches"] == 2
+
+    def test_first_search_loads_tenant_from_embeddings_table(self, service):
+        """Test lazy loading of a tenant's graph from the embeddings table."""
+        evidence_id = uuid4()
+        updated_at = datetime(2026, 10, 16, 12, 0)
+        db, cursor = _mock_db(
+            cursor_rows=[(evidence_id, np.ones(384, dtype=np.float32), updated_at)],
+            content_rows=[(evidence_id, "content", None)],
+        )
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        index.high_water_mark = None
+        index.search.return_value = [(evidence_id, 1.0)]
+
+        with patch("truthgraph.services.ann_search_service.HNSWEvidenceIndex", return_value=index):
+            results = service.search_similar_evidence(
+                db=db, query_embedding=[0.1] * 384, tenant_id="acme"
+            )
+
+        sql, params = cursor.execute.call_args.args
+        assert "updated_at >" in sql
+        assert params == {"tenant_id": "acme", "since": None}
+        assert index.add.call_args.args[0] == [evidence_id]
+        assert index.high_water_mark == updated_at
+        assert [r.evidence_id for r in results] == [evidence_id]
+
+    def test_add_evidence_updates_loaded_tenant_only(self, service):
+        """Test incremental inserts go to loaded graphs and are ignored otherwise."""
+        index = MagicMock(spec=HNSWEvidenceIndex)
+        service.attach_index("default", index)
+        ids, vectors = [uuid4()], np.zeros((1, 384), dtype=np.float32)
+
+        service.add_evidence("default", ids, vectors)
+        service.add_evidence("not-loaded", ids, vectors)
+
+        index.add.assert_called_once_with(ids, vectors)
+
+    def test_backend_selection(self, monkeypatch):
+        """Test that VECTOR_SEARCH_BACKEND picks the service implementation."""
+        monkeypatch.delenv("VECTOR_SEARCH_BACKEND", raising=False)
+        assert type(get_vector_search_service()) is VectorSearchService
+
+        monkeypatch.setenv("VECTOR_SEARCH_BACKEND", "ann")
+        monkeypatch.setattr(ANNVectorSearchService, "_instance", None)
+        ann = get_vector_search_service()
+        assert isinstance(ann, ANNVectorSearchService)
+        assert get_vector_search_service() is ann
+
+        monkeypatch.setenv("VECTOR_SEARCH_BACKEND", "faiss")
+        with pytest.raises(ValueError, match="VECTOR_SEARCH_BACKEND"):
+            get_vector_search_service()
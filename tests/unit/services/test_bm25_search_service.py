@@ -0,0 +1,251 @@
+"""Unit tests for the in-process BM25 keyword backend."""
+
+import math
+from collections import Counter
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from truthgraph.services.bm25_search_service import (
+    BM25Index,
+    BM25KeywordSearchService,
+    tokenize,
+)
+from truthgraph.services.hybrid_search_service import HybridSearchService
+
+UPDATED_AT = datetime(2026, 10, 16, 8, 0)
+
+DOCUMENTS = [
+    "Global temperatures rose sharply over the last century",
+    "Sea level rise threatens coastal cities and island nations",
+    "The vaccine trial reported strong immune responses",
+    "Arctic sea ice is shrinking as temperatures rise",
+    "Coastal flooding is driven by sea level rise and storm surge",
+    "Solar energy capacity doubled in the last five years",
+]
+
+
+def _reference_bm25(documents, query, k1=1.2, b=0.75):
+    """Textbook BM25 over token lists, for checking the index."""
+    tokenized = [tokenize(doc) for doc in documents]
+    avg_length = sum(len(tokens) for tokens in tokenized) / len(tokenized)
+    scores = []
+    for tokens in tokenized:
+        counts = Counter(tokens)
+        score = 0.0
+        for term in dict.fromkeys(tokenize(query)):
+            df = sum(term in doc for doc in tokenized)
+            if df == 0 or term not in counts:
+                continue
+            idf = math.log(1 + (len(tokenized) - df + 0.5) / (df + 0.5))
+            tf = counts[term]
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / avg_length))
+        scores.append(score)
+    return scores
+
+
+def _index(documents=DOCUMENTS):
+    ids = [uuid4() for _ in documents]
+    index = BM25Index()
+    index.add(ids, documents)
+    return index, ids
+
+
+class TestBM25Index:
+    """Test cases for BM25Index."""
+
+    @pytest.mark.parametrize("query", ["sea level rise", "temperatures", "coastal storm energy"])
+    def test_matches_reference_scores(self, query):
+        """Test that scores and order match a direct BM25 computation."""
+        index, ids = _index()
+        expected = _reference_bm25(DOCUMENTS, query)
+
+        results = index.search(query, top_k=10)
+
+        assert {eid for eid, _ in results} == {ids[i] for i, s in enumerate(expected) if s > 0}
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+        for eid, score in results:
+            assert score == pytest.approx(expected[ids.index(eid)], rel=1e-5)
+
+    def test_selective_and_dense_paths_agree(self):
+        """Test that merged postings and the dense accumulator give the same scores."""
+        rng = np.random.default_rng(0)
+        vocabulary = [f"term{i}" for i in range(400)]
+        documents = [" ".join(rng.choice(vocabulary, size=12)) for _ in range(2000)]
+        index, _ = _index(documents)
+
+        rare = dict(index.search("term7 term311", top_k=20))
+        common = dict(index.search(" ".join(vocabulary[:60]), top_k=20))
+        expected = _reference_bm25(documents, "term7 term311")
+
+        assert sorted(rare.values(), reverse=True) == pytest.approx(
+            sorted(expected, reverse=True)[:20], rel=1e-5
+        )
+        assert len(common) == 20
+
+    def test_postings_are_delta_encoded_narrow(self):
+        """Test that postings hold gaps in the smallest dtype."""
+        documents = ["filler"] * 1000
+        documents[3] = documents[900] = "needle"
+        index, _ = _index(documents)
+        index.search("needle", top_k=1)
+
+        needle = index._postings["needle"]
+        assert needle.gaps.tolist() == [3, 897]
+        assert needle.gaps.dtype == np.uint16
+        assert index._postings["filler"].gaps.dtype == np.uint8
+
+    def test_update_and_remove(self):
+        """Test that replaced and removed evidence drops out of results and stats."""
+        index, ids = _index()
+
+        index.add([ids[2]], ["Sea level rise in the Pacific"])
+        index.remove([ids[1]])
+
+        found = [eid for eid, _ in index.search("vaccine", top_k=10)]
+        assert found == []
+        sea = [eid for eid, _ in index.search("sea level", top_k=10)]
+        assert ids[1] not in sea and ids[2] in sea
+        assert len(index) == len(DOCUMENTS) - 1
+
+    def test_compact_matches_rebuilt_index(self):
+        """Test that compaction leaves the same scores as indexing only live documents."""
+        index, ids = _index()
+        index.remove(ids[:3])
+
+        index.compact()
+
+        query = "sea level rise temperatures"
+        expected = _reference_bm25(DOCUMENTS[3:], query)
+        assert index.dead_fraction == 0.0
+        for eid, score in index.search(query, top_k=10):
+            assert score == pytest.approx(expected[ids.index(eid) - 3], rel=1e-5)
+        assert "vaccine" not in index._postings
+
+    def test_snapshot_roundtrip(self, tmp_path):
+        """Test that a saved index loads with identical results and pending postings."""
+        index, ids = _index()
+        index.remove([ids[0]])
+        index.high_water_mark = UPDATED_AT
+        index.add([uuid4()], ["Late sea level measurements"])
+        path = tmp_path / "default.bm25.npz"
+
+        index.save(path)
+        loaded = BM25Index.load(path)
+
+        assert loaded.high_water_mark == UPDATED_AT
+        assert len(loaded) == len(index)
+        assert loaded.search("sea level rise", top_k=10) == pytest.approx(
+            index.search("sea level rise", top_k=10)
+        )
+
+
+def _mock_db(rows, content_ids=None):
+    """Session serving the incremental pull and the content lookup."""
+    db = MagicMock()
+
+    def execute(statement, params):
+        result = MagicMock()
+        result.partitions.return_value = [rows] if rows else []
+        wanted = [eid for eid in params.get("ids", []) if content_ids is None or eid in content_ids]
+        result.fetchall.return_value = [(eid, f"content {eid}", None) for eid in wanted]
+        return result
+
+    db.execute.side_effect = execute
+    return db
+
+
+class TestBM25KeywordSearchService:
+    """Test cases for BM25KeywordSearchService."""
+
+    def test_search_loads_tenant_and_returns_ranked_tuples(self):
+        """Test the first search builds the index from the database."""
+        ids = [uuid4() for _ in DOCUMENTS]
+        rows = [(eid, doc, UPDATED_AT) for eid, doc in zip(ids, DOCUMENTS, strict=True)]
+        db = _mock_db(rows)
+        service = BM25KeywordSearchService(sync_interval_seconds=0)
+
+        results = service.search(db, "sea level rise", top_k=2, tenant_id="acme")
+
+        assert [r[3] for r in results] == [1, 2]
+        assert {r[0] for r in results} <= {ids[1], ids[4]}
+        pull_params = db.execute.call_args_list[0].args[1]
+        assert pull_params == {"tenant_id": "acme", "since": None}
+        assert service.get_stats()["tenants"]["acme"]["documents"] == len(DOCUMENTS)
+
+    def test_stale_id_is_dropped(self):
+        """Test that evidence missing from the table is removed and reported as None."""
+        ids = [uuid4() for _ in DOCUMENTS]
+        index = BM25Index()
+        index.add(ids, DOCUMENTS)
+        service = BM25KeywordSearchService(sync_interval_seconds=0)
+        service.attach_index("default", index)
+        db = _mock_db([], content_ids=set(ids) - {ids[2]})
+
+        assert service.search(db, "vaccine trial") is None
+        assert ids[2] not in index
+        assert service.search(db, "vaccine trial") == []
+
+    def test_snapshot_then_sync(self, tmp_path):
+        """Test that a tenant is loaded from its snapshot plus newer rows."""
+        index = BM25Index()
+        index.add([uuid4()], [DOCUMENTS[0]])
+        index.high_water_mark = UPDATED_AT
+        service = BM25KeywordSearchService(snapshot_dir=tmp_path, sync_interval_seconds=0)
+        service.attach_index("default", index)
+        service.save_snapshot("default")
+
+        newer = uuid4()
+        db = _mock_db([(newer, DOCUMENTS[2], datetime(2026, 10, 16, 9, 0))])
+        fresh = BM25KeywordSearchService(snapshot_dir=tmp_path, sync_interval_seconds=0)
+
+        assert fresh.load_tenant(db, "default") == 2
+        assert db.execute.call_args.args[1]["since"] == UPDATED_AT
+
+
+class TestHybridKeywordBackend:
+    """Test keyword backend selection in HybridSearchService."""
+
+    def test_tenant_override_routes_to_bm25(self):
+        """Test that only bm25 tenants without filters use the BM25 service."""
+        bm25 = MagicMock()
+        bm25.search.return_value = [(uuid4(), "hit", None, 1)]
+        service = HybridSearchService(
+            embedding_dimension=384,
+            keyword_backend="postgres",
+            tenant_keyword_backends={"acme": "bm25"},
+            bm25_service=bm25,
+        )
+        db = MagicMock()
+        db.execute.return_value.fetchall.return_value = []
+
+        assert service._keyword_search(db, "sea level", tenant_id="acme") == (
+            bm25.search.return_value
+        )
+        service._keyword_search(db, "sea level", tenant_id="other")
+        service._keyword_search(db, "sea level", tenant_id="acme", source_filter="https://x")
+
+        bm25.search.assert_called_once_with(db, "sea level", 50, "acme")
+        assert db.execute.call_count == 2
+
+    def test_bm25_failure_falls_back_to_postgres(self):
+        """Test that a BM25 error or stale result is answered by Postgres."""
+        bm25 = MagicMock()
+        bm25.search.side_effect = [RuntimeError("load failed"), None]
+        service = HybridSearchService(
+            embedding_dimension=384, keyword_backend="bm25", bm25_service=bm25
+        )
+        db = MagicMock()
+        db.execute.return_value.fetchall.return_value = [(uuid4(), "pg", None, 0.5)]
+
+        for _ in range(2):
+            assert service._keyword_search(db, "sea level")[0][1] == "pg"
+
+    def test_unknown_backend(self):
+        """Test that backend names are validated."""
+        with pytest.raises(ValueError, match="Keyword search backend"):
+            HybridSearchService(embedding_dimension=384, keyword_backend="elastic")
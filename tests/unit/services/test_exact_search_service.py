@@ -0,0 +1,153 @@
+"""Unit tests for the memory-mapped exact-search backend."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from truthgraph.services.exact_search_service import ExactVectorSearchService, exact_top_k
+from truthgraph.services.vector_search_backends import get_vector_search_service
+
+DIMENSION = 384
+UPDATED_AT = datetime(2026, 10, 16, 8, 0)
+
+
+def _corpus(n: int, seed: int = 0) -> tuple[list, np.ndarray]:
+    vectors = np.random.default_rng(seed).standard_normal((n, DIMENSION)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [uuid4() for _ in range(n)], vectors
+
+
+def _mock_db(ids, vectors, missing=()):
+    """Session serving the embeddings table, evidence content and a pgvector cursor."""
+    db = MagicMock()
+    content = [(eid, f"evidence {i}", None) for i, eid in enumerate(ids) if eid not in missing]
+
+    def execute(statement, params):
+        sql = str(statement)
+        result = MagicMock()
+        result.one.return_value = (len(ids), UPDATED_AT)
+        result.scalar.return_value = len(ids)
+        wanted = set(params.get("ids", []))
+        result.fetchall.return_value = [row for row in content if row[0] in wanted]
+        if "FROM evidence" in sql:
+            db.content_queries += 1
+        return result
+
+    db.content_queries = 0
+    db.execute.side_effect = execute
+    cursor = MagicMock()
+    rows = [(eid, vectors[i] * 3.0, UPDATED_AT) for i, eid in enumerate(ids)]
+    cursor.fetchmany.side_effect = [rows[:7], rows[7:], []]
+    cursor.fetchall.return_value = []
+    db.connection.return_value.connection.cursor.return_value.__enter__.return_value = cursor
+    return db, cursor
+
+
+class TestExactTopK:
+    """Test cases for blocked exact top-k."""
+
+    def test_matches_full_sort_across_blocks(self):
+        """Test that blocked argpartition equals a full sort of all scores."""
+        _, vectors = _corpus(1000)
+        queries = vectors[[3, 500, 999]]
+
+        indices, scores = exact_top_k(vectors, queries, top_k=25, block_rows=64)
+
+        expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :25]
+        np.testing.assert_array_equal(indices, expected)
+        assert indices[:, 0].tolist() == [3, 500, 999]
+        assert np.all(np.diff(scores, axis=1) <= 0)
+
+    def test_top_k_larger_than_corpus(self):
+        """Test that at most n neighbours are returned."""
+        _, vectors = _corpus(5)
+
+        indices, _ = exact_top_k(vectors, vectors[:1], top_k=10, block_rows=2)
+
+        assert sorted(indices[0].tolist()) == [0, 1, 2, 3, 4]
+
+
+class TestExactVectorSearchService:
+    """Test cases for ExactVectorSearchService."""
+
+    def test_search_builds_snapshot_and_ranks_exactly(self, tmp_path):
+        """Test the first search builds a normalized snapshot and returns exact results."""
+        ids, vectors = _corpus(20)
+        db, cursor = _mock_db(ids, vectors)
+        service = ExactVectorSearchService(data_dir=tmp_path, block_rows=8)
+
+        results = service.search_similar_evidence(db=db, query_embedding=vectors[4], top_k=3)
+
+        assert results[0].evidence_id == ids[4]
+        assert results[0].similarity == pytest.approx(1.0, abs=1e-5)
+        assert results[0].content == "evidence 4"
+        assert db.content_queries == 1
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+        assert service.get_stats()["builds"] == 1
+        assert "LIMIT" in cursor.execute.call_args.args[0]
+
+    def test_second_worker_maps_published_snapshot(self, tmp_path):
+        """Test that another process maps the existing files instead of rebuilding."""
+        ids, vectors = _corpus(20)
+        db, _ = _mock_db(ids, vectors)
+        ExactVectorSearchService(data_dir=tmp_path).search_similar_evidence(
+            db=db, query_embedding=vectors[0]
+        )
+
+        other = ExactVectorSearchService(data_dir=tmp_path)
+        other.search_similar_evidence(db=db, query_embedding=vectors[0])
+
+        assert other.get_stats()["builds"] == 0
+        assert other.get_stats()["remaps"] == 1
+        assert isinstance(other._matrices["default"].vectors, np.memmap)
+
+    def test_batch_search_shares_matmul_and_content_query(self, tmp_path):
+        """Test that a batch is ranked together and fetched in one content query."""
+        ids, vectors = _corpus(20)
+        db, _ = _mock_db(ids, vectors)
+        service = ExactVectorSearchService(data_dir=tmp_path)
+
+        batch = service.search_similar_evidence_batch(
+            db=db, query_embeddings=vectors[[1, 2, 3]], top_k=2
+        )
+
+        assert [results[0].evidence_id for results in batch] == [ids[1], ids[2], ids[3]]
+        assert db.content_queries == 1
+
+    def test_large_tenant_uses_pgvector(self, tmp_path):
+        """Test that tenants above max_rows are served by the pgvector query."""
+        ids, vectors = _corpus(20)
+        db, cursor = _mock_db(ids, vectors)
+        service = ExactVectorSearchService(data_dir=tmp_path, max_rows=10)
+
+        service.search_similar_evidence(db=db, query_embedding=vectors[0])
+
+        assert "ORDER BY" in cursor.execute.call_args.args[0]
+        assert "%(query_vector)b" in cursor.execute.call_args.args[0]
+        assert service.get_stats()["oversized_tenants"] == ["default"]
+        assert not list(tmp_path.glob("*.npy"))
+
+    def test_deleted_evidence_falls_back_and_forces_rebuild(self, tmp_path):
+        """Test that ids missing from the evidence table are not returned."""
+        ids, vectors = _corpus(20)
+        db, cursor = _mock_db(ids, vectors, missing={ids[5]})
+        service = ExactVectorSearchService(data_dir=tmp_path)
+
+        service.search_similar_evidence(db=db, query_embedding=vectors[5])
+
+        assert "%(query_vector)b" in cursor.execute.call_args.args[0]
+        assert "default" not in service._matrices
+        assert service.get_stats()["fallbacks"] == 1
+
+    def test_backend_selection(self, monkeypatch):
+        """Test that VECTOR_SEARCH_BACKEND=exact selects the shared exact service."""
+        monkeypatch.setenv("VECTOR_SEARCH_BACKEND", "exact")
+        monkeypatch.setattr(ExactVectorSearchService, "_instance", None)
+
+        service = get_vector_search_service()
+
+        assert isinstance(service, ExactVectorSearchService)
+        assert get_vector_search_service() is service
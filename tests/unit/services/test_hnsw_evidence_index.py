@@ -0,0 +1,72 @@
+"""Unit tests for the hnswlib-backed evidence graph."""
+
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+pytest.importorskip("hnswlib")
+
+from truthgraph.db_queries.distance import DistanceMetric  # noqa: E402
+from truthgraph.db_queries.vector_index import HNSWParams  # noqa: E402
+from truthgraph.services.ann_search_service import HNSWEvidenceIndex  # noqa: E402
+
+DIMENSION = 32
+
+
+def _unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, DIMENSION)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("metric", list(DistanceMetric))
+def test_search_matches_exact_neighbours(metric):
+    """Test that the graph finds the exact nearest neighbour with cosine-scale scores."""
+    vectors = _unit_vectors(500)
+    ids = [uuid4() for _ in range(500)]
+    index = HNSWEvidenceIndex(DIMENSION, metric, HNSWParams(m=16, ef_construction=64), 16)
+
+    index.add(ids, vectors)
+    results = index.search(vectors[7], top_k=5, ef_search=100)
+
+    assert len(index) == 500
+    assert results[0][0] == ids[7]
+    assert results[0][1] == pytest.approx(1.0, abs=1e-4)
+    expected = sorted(float(vectors[7] @ v) for v in vectors)[-5:][::-1]
+    assert [s for _, s in results] == pytest.approx(expected, abs=1e-4)
+
+
+def test_update_and_remove():
+    """Test that re-adding an id replaces its vector and removed ids are not returned."""
+    vectors = _unit_vectors(20)
+    ids = [uuid4() for _ in range(20)]
+    index = HNSWEvidenceIndex(DIMENSION, params=HNSWParams(m=8, ef_construction=32))
+    index.add(ids, vectors)
+
+    index.add([ids[0]], vectors[1:2])
+    assert index.search(vectors[1], top_k=2)[1][1] == pytest.approx(1.0, abs=1e-4)
+
+    index.remove([ids[1], ids[0]])
+    found = {entity_id for entity_id, _ in index.search(vectors[1], top_k=18)}
+    assert ids[0] not in found and ids[1] not in found
+    assert len(index) == 18
+
+
+def test_snapshot_round_trip(tmp_path: Path):
+    """Test that a saved graph loads with the same ids, results and high-water mark."""
+    vectors = _unit_vectors(50)
+    ids = [uuid4() for _ in range(50)]
+    index = HNSWEvidenceIndex(DIMENSION, params=HNSWParams(m=8, ef_construction=32))
+    index.add(ids, vectors)
+    index.remove([ids[3]])
+    index.high_water_mark = datetime(2026, 10, 16, 9, 30)
+
+    index.save(tmp_path / "default")
+    loaded = HNSWEvidenceIndex.load(tmp_path / "default")
+
+    assert len(loaded) == 49
+    assert ids[3] not in loaded
+    assert loaded.high_water_mark == index.high_water_mark
+    assert loaded.search(vectors[10], top_k=3) == index.search(vectors[10], top_k=3)
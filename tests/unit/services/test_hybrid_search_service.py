@@ -10,13 +10,17 @@ Tests the hybrid search functionality including:
 Run with: pytest tests/unit/services/test_hybrid_search_service.py -v
 """
 
+import asyncio
+import threading
+import time
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
 
 from truthgraph.services.hybrid_search_service import (
+    HybridFusion,
     HybridSearchResult,
     HybridSearchService,
 )
@@ -328,6 +332,21 @@ class TestKeywordSearch:
         assert results[0][3] == 1  # First result has rank 1
         assert results[1][3] == 2  # Second result has rank 2
 
+    def test_keyword_search_uses_indexed_column_and_tenant(self):
+        """Test keyword search matches on content_tsv and is scoped to the tenant."""
+        mock_db = Mock()
+        mock_db.execute.return_value.fetchall.return_value = []
+
+        self.service._keyword_search(db=mock_db, query_text="solar system", tenant_id="acme")
+
+        statement, params = mock_db.execute.call_args[0]
+        sql = str(statement)
+        assert "e.content_tsv @@ query" in sql
+        assert "ts_rank(e.content_tsv, query)" in sql
+        assert "to_tsvector" not in sql
+        assert "emb.tenant_id = :tenant_id" in sql
+        assert params["tenant_id"] == "acme"
+
     def test_keyword_search_with_source_filter(self):
         """Test keyword search with source filter."""
         mock_db = Mock()
@@ -513,6 +532,151 @@ class TestHybridSearch:
                     assert len(results) == 5
 
 
+class TestSqlFusion:
+    """Test hybrid_search with fusion computed in SQL."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.service = HybridSearchService(embedding_dimension=384, fusion="sql")
+        self.cursor = MagicMock()
+        self.db = MagicMock()
+        self.db.connection.return_value.connection.cursor.return_value.__enter__.return_value = (
+            self.cursor
+        )
+        self.db.connection.return_value.connection.info = {}
+
+    def test_fusion_mode_from_env(self, monkeypatch):
+        """Test that the fusion mode defaults to python and is read from the environment."""
+        monkeypatch.delenv("HYBRID_SEARCH_FUSION", raising=False)
+        assert HybridSearchService(embedding_dimension=384).fusion is HybridFusion.PYTHON
+
+        monkeypatch.setenv("HYBRID_SEARCH_FUSION", "SQL")
+        assert HybridSearchService(embedding_dimension=384).fusion is HybridFusion.SQL
+
+        with pytest.raises(ValueError, match="fusion mode"):
+            HybridSearchService(embedding_dimension=384, fusion="numpy")
+
+    def test_single_statement_returns_final_rows(self):
+        """Test that one statement runs both rankings and only top_k rows come back."""
+        both_id, keyword_id = uuid4(), uuid4()
+        self.cursor.fetchall.return_value = [
+            (both_id, "Both", "https://a.test", 0.0164, 0.91, 1),
+            (keyword_id, "Keyword", None, 0.0081, None, 2),
+        ]
+
+        with patch.object(self.service, "_reciprocal_rank_fusion") as python_fusion:
+            results, _ = self.service.hybrid_search(
+                db=self.db,
+                query_text="climate",
+                query_embedding=[0.1] * 384,
+                top_k=5,
+                vector_weight=3.0,
+                keyword_weight=1.0,
+                source_filter="https://a.test",
+                date_from=datetime(2024, 1, 1),
+            )
+
+        python_fusion.assert_not_called()
+        self.cursor.execute.assert_called_once()
+        sql, params = self.cursor.execute.call_args.args
+        assert "WITH vector_ranked AS" in sql and "FULL OUTER JOIN keyword_ranked" in sql
+        assert "e.content_tsv @@ query" in sql
+        assert "e.source_url = %(source_filter)s" in sql
+        assert "e.created_at >= %(date_from)s" in sql
+        assert "e.created_at <= %(date_to)s" not in sql
+        assert params["top_k"] == 50 and params["result_k"] == 5
+        assert params["vector_weight"] == 0.75 and params["keyword_weight"] == 0.25
+        assert params["rrf_k"] == HybridSearchService.RRF_K
+
+        assert [r.matched_via for r in results] == ["both", "keyword"]
+        assert results[0].vector_similarity == 0.91 and results[0].keyword_rank == 1
+        assert results[1].vector_similarity is None and results[1].content == "Keyword"
+
+    def test_query_failure_raises_runtime_error(self):
+        """Test that a failing statement surfaces as RuntimeError."""
+        self.cursor.execute.side_effect = Exception("column content_tsv does not exist")
+
+        with pytest.raises(RuntimeError, match="Hybrid search failed"):
+            self.service.hybrid_search(
+                db=self.db, query_text="climate", query_embedding=[0.1] * 384
+            )
+
+
+class TestHybridSearchConcurrent:
+    """Test hybrid_search_concurrent."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.sessions = []
+
+        def session_factory():
+            session = Mock()
+            self.sessions.append(session)
+            return session
+
+        self.service = HybridSearchService(embedding_dimension=384, session_factory=session_factory)
+
+    async def test_branches_overlap_with_embedding(self):
+        """Test that keyword search runs while the embedding is computed."""
+        keyword_started = threading.Event()
+        evidence_id = uuid4()
+
+        def keyword_search(db, **kwargs):
+            keyword_started.set()
+            time.sleep(0.2)
+            return [(evidence_id, "Keyword hit", None, 0.8)]
+
+        def vector_search(db, **kwargs):
+            time.sleep(0.1)
+            return [SearchResult(evidence_id, "Keyword hit", None, 0.9)]
+
+        async def embed():
+            # Only resolves once the keyword branch is already running
+            assert await asyncio.to_thread(keyword_started.wait, 5)
+            return [0.1] * 384
+
+        with (
+            patch.object(self.service, "_keyword_search", side_effect=keyword_search),
+            patch.object(
+                self.service.vector_service, "search_similar_evidence", side_effect=vector_search
+            ),
+        ):
+            start = time.perf_counter()
+            results, query_time_ms, stats = await self.service.hybrid_search_concurrent(
+                query_text="climate", query_embedding=embed(), top_k=5
+            )
+            elapsed = time.perf_counter() - start
+
+        assert [r.evidence_id for r in results] == [evidence_id]
+        assert elapsed < 0.29
+        assert stats["concurrent"] is True
+        assert stats["keyword_ms"] >= 200 and stats["vector_ms"] >= 100
+        assert {"embedding_wait_ms", "fusion_ms", "vector_results", "keyword_results"} <= set(stats)
+        # One session per branch, both closed
+        assert len(self.sessions) == 2
+        for session in self.sessions:
+            session.close.assert_called_once()
+
+    async def test_dimension_mismatch(self):
+        """Test that a wrong-sized embedding is rejected."""
+        with patch.object(self.service, "_keyword_search", return_value=[]):
+            with pytest.raises(ValueError, match="384-dimensional"):
+                await self.service.hybrid_search_concurrent(
+                    query_text="climate", query_embedding=[0.1] * 10
+                )
+
+    async def test_branch_failure_raises_runtime_error(self):
+        """Test that a failing branch surfaces as RuntimeError."""
+        with (
+            patch.object(self.service, "_keyword_search", side_effect=Exception("db down")),
+            patch.object(self.service.vector_service, "search_similar_evidence", return_value=[]),
+        ):
+            with pytest.raises(RuntimeError, match="Hybrid search failed"):
+                await self.service.hybrid_search_concurrent(
+                    query_text="climate", query_embedding=[0.1] * 384
+                )
+
+
 class TestKeywordOnlySearch:
     """Test keyword-only search method."""
 
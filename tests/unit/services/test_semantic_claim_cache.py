@@ -0,0 +1,234 @@
+"""Unit tests for the semantic near-duplicate claim cache."""
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from truthgraph.services.ml.nli_service import NLILabel, NLIResult
+from truthgraph.services.semantic_claim_cache import (
+    SemanticClaimCache,
+    semantic_cache_enabled,
+)
+from truthgraph.services.staged_verification_pipeline import StagedVerificationPipeline
+from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_pipeline_service import (
+    VerdictLabel,
+    VerificationPipelineService,
+)
+
+
+def _vector(*head, dimension=8):
+    vector = np.zeros(dimension, dtype=np.float32)
+    vector[: len(head)] = head
+    return vector
+
+
+def _pipeline(embeddings):
+    """Pipeline with a real semantic cache; embeddings maps claim text to its vector."""
+    nli_results = [
+        NLIResult(
+            label=NLILabel.ENTAILMENT,
+            confidence=0.9,
+            scores={"entailment": 0.9, "contradiction": 0.05, "neutral": 0.05},
+        )
+    ]
+    search_results = [
+        SearchResult(evidence_id=uuid4(), content="Evidence", source_url=None, similarity=0.9)
+    ]
+    return VerificationPipelineService(
+        embedding_service=Mock(
+            embed_text=Mock(side_effect=lambda text: embeddings[text].tolist()),
+            embed_batch=Mock(
+                side_effect=lambda texts, **kwargs: [embeddings[t].tolist() for t in texts]
+            ),
+        ),
+        nli_service=Mock(verify_batch=Mock(side_effect=lambda pairs, batch_size: nli_results)),
+        vector_search_service=Mock(
+            search_similar_evidence=Mock(return_value=search_results),
+            search_similar_evidence_batch=Mock(
+                side_effect=lambda query_embeddings, **kwargs: [search_results]
+                * len(query_embeddings)
+            ),
+        ),
+        semantic_cache=SemanticClaimCache(threshold=0.95),
+    )
+
+
+def _db(corpus_version=(10, None)):
+    db = Mock()
+    db.execute.return_value.one.return_value = corpus_version
+    return db
+
+
+class TestSemanticClaimCache:
+    """Test cases for SemanticClaimCache."""
+
+    def test_hit_at_or_above_threshold(self):
+        """Test that a close embedding hits and a distant one misses."""
+        cache = SemanticClaimCache(threshold=0.95)
+        cache.add("default", _vector(1.0, 0.1), "supported", corpus_version=1)
+
+        hit = cache.lookup("default", _vector(1.0, 0.12), corpus_version=1)
+        assert hit is not None
+        assert hit.value == "supported"
+        assert hit.similarity > 0.99
+
+        assert cache.lookup("default", _vector(1.0, 1.0), corpus_version=1) is None
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_ratio"] == 0.5
+
+    def test_best_match_wins(self):
+        """Test that the most similar entry is returned."""
+        cache = SemanticClaimCache(threshold=0.9)
+        cache.add("default", _vector(1.0, 0.3), "farther", corpus_version=1)
+        cache.add("default", _vector(1.0, 0.05), "closer", corpus_version=1)
+
+        assert cache.lookup("default", _vector(1.0, 0.0), corpus_version=1).value == "closer"
+
+    def test_tenants_and_params_are_isolated(self):
+        """Test that entries are only served to their own tenant and parameters."""
+        cache = SemanticClaimCache()
+        cache.add("tenant-a", _vector(1.0), "a", corpus_version=1, params=(10, 0.5))
+
+        assert cache.lookup("tenant-b", _vector(1.0), corpus_version=1, params=(10, 0.5)) is None
+        assert cache.lookup("tenant-a", _vector(1.0), corpus_version=1, params=(5, 0.5)) is None
+        assert cache.lookup("tenant-a", _vector(1.0), corpus_version=1, params=(10, 0.5))
+
+    def test_expired_entries_are_skipped(self, monkeypatch):
+        """Test that entries are not served after their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            "truthgraph.services.semantic_claim_cache.time.monotonic", lambda: now[0]
+        )
+        cache = SemanticClaimCache(ttl_seconds=60)
+        cache.add("default", _vector(1.0), "old", corpus_version=1)
+
+        now[0] += 61
+        assert cache.lookup("default", _vector(1.0), corpus_version=1) is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_corpus_change_drops_scope(self):
+        """Test that verdicts computed against an older corpus are discarded."""
+        cache = SemanticClaimCache()
+        cache.add("default", _vector(1.0), "before", corpus_version=(10, None))
+
+        assert cache.lookup("default", _vector(1.0), corpus_version=(11, None)) is None
+        stats = cache.get_stats()
+        assert stats["stale"] == 1
+        assert stats["scopes"] == 0
+
+    def test_oldest_entry_is_overwritten_when_full(self):
+        """Test that the matrix grows to max_entries and then reuses the oldest row."""
+        cache = SemanticClaimCache(threshold=0.999, max_entries=100)
+        for i in range(101):
+            cache.add("default", _vector(1.0, 0.0, float(i)), i, corpus_version=1)
+
+        assert cache.get_stats()["entries"] == 100
+        assert cache.lookup("default", _vector(1.0, 0.0, 0.0), corpus_version=1) is None
+        assert cache.lookup("default", _vector(1.0, 0.0, 100.0), corpus_version=1).value == 100
+        assert cache.lookup("default", _vector(1.0, 0.0, 1.0), corpus_version=1).value == 1
+
+    def test_corpus_version_is_cached(self):
+        """Test that the corpus version query runs once per check interval."""
+        cache = SemanticClaimCache(corpus_check_seconds=60)
+        db = _db((42, None))
+
+        assert cache.corpus_version(db, "default") == (42, None)
+        assert cache.corpus_version(db, "default") == (42, None)
+        db.execute.assert_called_once()
+
+        cache.invalidate("default")
+        cache.corpus_version(db, "default")
+        assert db.execute.call_count == 2
+
+    def test_configuration(self, monkeypatch):
+        """Test validation and the SEMANTIC_CACHE_ENABLED switch."""
+        with pytest.raises(ValueError, match="threshold"):
+            SemanticClaimCache(threshold=1.5)
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            SemanticClaimCache(ttl_seconds=0)
+
+        monkeypatch.delenv("SEMANTIC_CACHE_ENABLED", raising=False)
+        assert not semantic_cache_enabled()
+        monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "true")
+        assert semantic_cache_enabled()
+
+
+class TestPipelineSemanticCache:
+    """Test cases for the pipeline's use of the semantic cache."""
+
+    async def test_paraphrase_skips_search_and_nli(self):
+        """Test that a near-duplicate claim reuses the verdict after embedding."""
+        pipeline = _pipeline(
+            {
+                "5G towers spread the virus": _vector(1.0, 0.1),
+                "The virus is spread by 5G towers": _vector(1.0, 0.11),
+            }
+        )
+        db = _db()
+
+        first = await pipeline.verify_claim(
+            db=db, claim_id=uuid4(), claim_text="5G towers spread the virus", store_result=False
+        )
+        claim_id = uuid4()
+        second = await pipeline.verify_claim(
+            db=db,
+            claim_id=claim_id,
+            claim_text="The virus is spread by 5G towers",
+            store_result=False,
+        )
+
+        assert second.verdict == first.verdict == VerdictLabel.SUPPORTED
+        assert second.claim_id == claim_id
+        assert second.claim_text == "The virus is spread by 5G towers"
+        pipeline.vector_search_service.search_similar_evidence.assert_called_once()
+        pipeline.nli_service.verify_batch.assert_called_once()
+        assert pipeline.semantic_cache.get_stats()["hits"] == 1
+
+    async def test_batch_mixes_hits_and_misses(self):
+        """Test that verify_claims only retrieves evidence for claims without a hit."""
+        pipeline = _pipeline(
+            {
+                "Claim A": _vector(1.0),
+                "Claim A, reworded": _vector(1.0, 0.05),
+                "Claim B": _vector(0.0, 1.0),
+            }
+        )
+        db = _db()
+        await pipeline.verify_claim(
+            db=db, claim_id=uuid4(), claim_text="Claim A", store_result=False
+        )
+
+        results = await pipeline.verify_claims(
+            db=db,
+            claims=[(uuid4(), "Claim A, reworded"), (uuid4(), "Claim B")],
+            store_result=False,
+        )
+
+        assert [r.claim_text for r in results] == ["Claim A, reworded", "Claim B"]
+        search_batch = pipeline.vector_search_service.search_similar_evidence_batch
+        assert len(search_batch.call_args.kwargs["query_embeddings"]) == 1
+        assert pipeline.semantic_cache.lookup("default", _vector(0.0, 1.0), (10, None), (10, 0.5))
+
+    async def test_staged_hit_finishes_in_retrieve(self):
+        """Test that the staged pipeline answers a near-duplicate without NLI."""
+        pipeline = _pipeline({"Claim A": _vector(1.0), "Claim A, reworded": _vector(1.0, 0.05)})
+        db = _db()
+        await pipeline.verify_claim(
+            db=db, claim_id=uuid4(), claim_text="Claim A", store_result=False
+        )
+        staged = StagedVerificationPipeline(pipeline=pipeline)
+
+        try:
+            result = await staged.verify_claim(
+                db=db, claim_id=uuid4(), claim_text="Claim A, reworded", store_result=False
+            )
+        finally:
+            await staged.stop()
+
+        assert result.claim_text == "Claim A, reworded"
+        pipeline.nli_service.verify_batch.assert_called_once()
+        assert staged.get_stats()["stages"]["nli"]["processed"] == 0
@@ -0,0 +1,196 @@
+"""Unit tests for the staged (SEDA-style) verification pipeline."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from truthgraph.services.ml.nli_service import NLILabel, NLIResult
+from truthgraph.services.staged_verification_pipeline import (
+    StagedVerificationPipeline,
+    staged_pipeline_enabled,
+)
+from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_pipeline_service import (
+    VerdictLabel,
+    VerificationPipelineService,
+)
+
+
+def _pipeline(stage_seconds=0.0, search_results=None):
+    """Pipeline service whose embed, search and NLI calls each block for stage_seconds."""
+
+    def embed_text(text):
+        time.sleep(stage_seconds)
+        return [0.1] * 384
+
+    def search_similar_evidence(**kwargs):
+        time.sleep(stage_seconds)
+        if search_results is not None:
+            return search_results
+        return [
+            SearchResult(evidence_id=uuid4(), content="Evidence", source_url=None, similarity=0.9)
+        ]
+
+    def verify_batch(pairs, batch_size):
+        time.sleep(stage_seconds)
+        return [
+            NLIResult(
+                label=NLILabel.ENTAILMENT,
+                confidence=0.9,
+                scores={"entailment": 0.9, "contradiction": 0.05, "neutral": 0.05},
+            )
+            for _ in pairs
+        ]
+
+    return VerificationPipelineService(
+        embedding_service=Mock(embed_text=Mock(side_effect=embed_text)),
+        nli_service=Mock(verify_batch=Mock(side_effect=verify_batch)),
+        vector_search_service=Mock(
+            search_similar_evidence=Mock(side_effect=search_similar_evidence)
+        ),
+    )
+
+
+class TestStagedVerificationPipeline:
+    """Test cases for StagedVerificationPipeline."""
+
+    async def test_result_matches_serial_mode(self):
+        """Test that a claim gets the same verdict as with verify_claim."""
+        pipeline = _pipeline()
+        staged = StagedVerificationPipeline(pipeline=pipeline)
+        claim_id = uuid4()
+
+        try:
+            result = await staged.verify_claim(
+                db=Mock(), claim_id=claim_id, claim_text="Claim", use_cache=False
+            )
+            serial = await pipeline.verify_claim(
+                db=Mock(), claim_id=claim_id, claim_text="Claim", use_cache=False
+            )
+        finally:
+            await staged.stop()
+
+        assert result.claim_id == claim_id
+        assert result.verdict == serial.verdict == VerdictLabel.SUPPORTED
+        assert result.confidence == serial.confidence
+        assert result.reasoning == serial.reasoning
+
+    async def test_no_evidence_gives_insufficient(self):
+        """Test that an empty search result flows through to INSUFFICIENT."""
+        staged = StagedVerificationPipeline(pipeline=_pipeline(search_results=[]))
+
+        try:
+            result = await staged.verify_claim(
+                db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False
+            )
+        finally:
+            await staged.stop()
+
+        assert result.verdict == VerdictLabel.INSUFFICIENT
+        assert result.evidence_items == []
+
+    async def test_stages_overlap(self):
+        """Test that claims are processed in different stages at the same time."""
+        stage_seconds = 0.1
+        staged = StagedVerificationPipeline(pipeline=_pipeline(stage_seconds=stage_seconds))
+        claims = 4
+
+        start = time.perf_counter()
+        try:
+            results = await asyncio.gather(
+                *(
+                    staged.verify_claim(
+                        db=Mock(), claim_id=uuid4(), claim_text=f"Claim {i}", use_cache=False
+                    )
+                    for i in range(claims)
+                )
+            )
+        finally:
+            await staged.stop()
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == claims
+        # Serial execution takes claims x 3 blocking stages
+        assert elapsed < claims * 3 * stage_seconds * 0.75
+
+    async def test_stage_failure_fails_only_that_claim(self):
+        """Test that an exception in a stage is raised to its caller and counted."""
+        pipeline = _pipeline()
+        pipeline.embedding_service.embed_text.side_effect = [ValueError("bad input"), [0.1] * 384]
+        staged = StagedVerificationPipeline(pipeline=pipeline)
+
+        try:
+            with pytest.raises(RuntimeError, match="Verification pipeline failed"):
+                await staged.verify_claim(
+                    db=Mock(), claim_id=uuid4(), claim_text="First", use_cache=False
+                )
+            result = await staged.verify_claim(
+                db=Mock(), claim_id=uuid4(), claim_text="Second", use_cache=False
+            )
+        finally:
+            await staged.stop()
+
+        assert result.verdict == VerdictLabel.SUPPORTED
+        stats = staged.get_stats()["stages"]
+        assert stats["embed"]["failed"] == 1
+        assert stats["embed"]["processed"] == 1
+        assert stats["persist"]["processed"] == 1
+
+    async def test_stats_and_bottleneck(self):
+        """Test per-stage statistics and bottleneck detection."""
+        staged = StagedVerificationPipeline(
+            pipeline=_pipeline(), concurrency={"nli": 1, "retrieve": 1}
+        )
+        slow_nli = staged.pipeline.nli_service.verify_batch.side_effect
+
+        def slower_nli(**kwargs):
+            time.sleep(0.05)
+            return slow_nli(**kwargs)
+
+        staged.pipeline.nli_service.verify_batch.side_effect = slower_nli
+        try:
+            await staged.verify_claim(db=Mock(), claim_id=uuid4(), claim_text="Claim")
+        finally:
+            await staged.stop()
+
+        stats = staged.get_stats()
+        assert set(stats["stages"]) == {"embed", "retrieve", "nli", "aggregate", "persist"}
+        assert stats["stages"]["nli"]["avg_service_ms"] >= 50
+        assert stats["stages"]["nli"]["queue_depth"] == 0
+        assert stats["bottleneck"] == "nli"
+        assert stats["running"] is False
+
+    async def test_cache_hit_skips_stages(self):
+        """Test that cached claims are answered without entering the stages."""
+        pipeline = _pipeline()
+        staged = StagedVerificationPipeline(pipeline=pipeline)
+        cached = pipeline._create_insufficient_verdict(uuid4(), "Claim", 1.0)
+        pipeline._cache_result("Claim", cached)
+
+        result = await staged.verify_claim(db=Mock(), claim_id=uuid4(), claim_text="Claim")
+
+        assert result.verdict == VerdictLabel.INSUFFICIENT
+        pipeline.embedding_service.embed_text.assert_not_called()
+        assert staged.get_stats()["bottleneck"] is None
+
+    def test_invalid_configuration(self, monkeypatch):
+        """Test validation of concurrency, queue size and mode."""
+        with pytest.raises(ValueError, match="Unknown pipeline stage"):
+            StagedVerificationPipeline(pipeline=Mock(), concurrency={"rerank": 2})
+        with pytest.raises(ValueError, match=">= 1"):
+            StagedVerificationPipeline(pipeline=Mock(), concurrency={"nli": 0})
+
+        monkeypatch.setenv("STAGED_PIPELINE_CONCURRENCY", "nli=4, persist=1")
+        staged = StagedVerificationPipeline(pipeline=Mock())
+        assert staged.concurrency["nli"] == 4
+        assert staged.concurrency["persist"] == 1
+        assert staged.concurrency["embed"] == 1
+
+        monkeypatch.setenv("VERIFICATION_PIPELINE_MODE", "staged")
+        assert staged_pipeline_enabled()
+        monkeypatch.setenv("VERIFICATION_PIPELINE_MODE", "parallel")
+        with pytest.raises(ValueError, match="VERIFICATION_PIPELINE_MODE"):
+            staged_pipeline_enabled()
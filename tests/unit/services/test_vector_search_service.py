@@ -6,6 +6,7 @@ These tests use mocks to avoid requiring a real database connection.
 from unittest.mock import MagicMock, Mock
 from uuid import UUID, uuid4
 
+import numpy as np
 import pytest
 
 from truthgraph.services.vector_search_service import (
@@ -34,6 +35,7 @@ class TestVectorSearchService:
             mock_conn = MagicMock()
             mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
             mock_conn.cursor.return_value.__exit__.return_value = None
+            mock_conn.info = {}
 
             mock_connection = MagicMock()
             mock_connection.connection = mock_conn
@@ -95,6 +97,7 @@ class TestVectorSearchService:
 
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_conn.info = {}
 
         mock_connection = MagicMock()
         mock_connection.connection = mock_conn
@@ -121,6 +124,100 @@ class TestVectorSearchService:
         # Verify cursor was used
         mock_cursor.execute.assert_called_once()
 
+    def test_search_binds_float32_vector_in_binary(self, mock_db_with_cursor):
+        """Test that the query vector is a binary float32 parameter, not an SQL literal."""
+        service = VectorSearchService(embedding_dimension=384)
+        db_mock, mock_cursor = mock_db_with_cursor(fetchall_return=[])
+        query_embedding = np.random.rand(384).astype(np.float32)
+
+        service.search_similar_evidence(db=db_mock, query_embedding=query_embedding)
+
+        sql, params = mock_cursor.execute.call_args.args
+        assert "%(query_vector)b" in sql
+        assert "::vector" not in sql
+        assert params["query_vector"] is query_embedding
+
+    def test_ef_search_applied_per_transaction(self, mock_db_with_cursor):
+        """Test that ef_search is set locally on the search cursor before the query."""
+        service = VectorSearchService(embedding_dimension=384)
+        db_mock, mock_cursor = mock_db_with_cursor(fetchall_return=[])
+
+        service.search_similar_evidence(db=db_mock, query_embedding=[0.1] * 384, ef_search=100)
+
+        first_sql, first_params = mock_cursor.execute.call_args_list[0].args
+        assert "set_config('hnsw.ef_search'" in first_sql
+        assert first_params == {"ef_search": "100"}
+        assert "ORDER BY" in mock_cursor.execute.call_args_list[1].args[0]
+
+    def test_ef_search_reset_for_later_default_search(self, mock_db_with_cursor):
+        """Test that a later search without ef_search does not inherit the local value."""
+        service = VectorSearchService(embedding_dimension=384)
+        db_mock, mock_cursor = mock_db_with_cursor(fetchall_return=[])
+
+        service.search_similar_evidence(db=db_mock, query_embedding=[0.1] * 384, ef_search=100)
+        service.search_similar_evidence(db=db_mock, query_embedding=[0.1] * 384)
+        service.search_similar_evidence(db=db_mock, query_embedding=[0.1] * 384)
+
+        statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert statements[2] == "SET LOCAL hnsw.ef_search TO DEFAULT"
+        assert len(statements) == 5  # the reset is only issued once
+
+    def test_ef_search_precedence(self, monkeypatch):
+        """Test request > tenant > service default, raised to at least top_k."""
+        monkeypatch.delenv("HNSW_EF_SEARCH", raising=False)
+        service = VectorSearchService(
+            embedding_dimension=384, ef_search=40, tenant_ef_search={"premium": 200}
+        )
+
+        assert service.resolve_ef_search("default", top_k=10) == 40
+        assert service.resolve_ef_search("premium", top_k=10) == 200
+        assert service.resolve_ef_search("premium", top_k=10, ef_search=80) == 80
+        assert service.resolve_ef_search("default", top_k=64) == 64
+
+        service.set_tenant_ef_search("premium", None)
+        assert service.resolve_ef_search("premium", top_k=10) == 40
+        assert VectorSearchService(embedding_dimension=384).resolve_ef_search("x", 10) is None
+
+    def test_two_stage_search_reranks_at_full_precision(self, mock_db_with_cursor):
+        """Test that candidates come from the shadow column and are ranked by embedding."""
+        service = VectorSearchService(
+            embedding_dimension=384, quantization="binary", rerank_oversample=10
+        )
+        db_mock, mock_cursor = mock_db_with_cursor(fetchall_return=[(uuid4(), "a", None, 0.9)])
+
+        results = service.search_similar_evidence(db=db_mock, query_embedding=[0.1] * 384, top_k=5)
+
+        (ef_sql, ef_params), (sql, params) = [c.args for c in mock_cursor.execute.call_args_list]
+        assert "set_config('hnsw.ef_search'" in ef_sql
+        assert ef_params == {"ef_search": "50"}
+        stage_one, stage_two = sql.split(") c\n")
+        assert "ORDER BY (emb.embedding_binary <~> binary_quantize(%(query_vector)b))" in stage_one
+        assert "ORDER BY (c.embedding <=> %(query_vector)b)" in stage_two
+        assert params["candidate_k"] == 50 and params["top_k"] == 5
+        assert results[0].similarity == 0.9
+
+    def test_two_stage_keeps_server_ef_search_for_small_candidate_sets(
+        self, mock_db_with_cursor, monkeypatch
+    ):
+        """Test that ef_search is only raised when candidates exceed the server default."""
+        monkeypatch.delenv("HNSW_EF_SEARCH", raising=False)
+        service = VectorSearchService(
+            embedding_dimension=384, quantization="halfvec", rerank_oversample=2
+        )
+        db_mock, mock_cursor = mock_db_with_cursor(fetchall_return=[])
+
+        service.search_similar_evidence(db=db_mock, query_embedding=[0.1] * 384, top_k=10)
+
+        sql, params = mock_cursor.execute.call_args.args
+        mock_cursor.execute.assert_called_once()
+        assert "(emb.embedding_half <=> %(query_vector)b::halfvec)" in sql
+        assert params["candidate_k"] == 20
+
+    def test_invalid_ef_search_raises(self):
+        """Test that out-of-range ef_search values are rejected."""
+        with pytest.raises(ValueError, match="ef_search"):
+            VectorSearchService(embedding_dimension=384, tenant_ef_search={"t": 0})
+
     def test_search_similar_evidence_empty_results(self):
         """Test vector search with no matching results."""
         service = VectorSearchService(embedding_dimension=1536)
@@ -131,6 +228,7 @@ class TestVectorSearchService:
 
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_conn.info = {}
 
         mock_connection = MagicMock()
         mock_connection.connection = mock_conn
@@ -215,69 +313,59 @@ class TestVectorSearchService:
         params = call_args[0][1]
         assert params.get("tenant_id") == "tenant_123"
 
-    def test_search_similar_evidence_batch_success(self):
-        """Test batch vector search returns results for all queries."""
-        service = VectorSearchService(embedding_dimension=384)
-        db_mock = Mock()
-
-        # Mock database connection and cursor
-        mock_cursor = MagicMock()
-        mock_cursor.__enter__ = Mock(return_value=mock_cursor)
-        mock_cursor.__exit__ = Mock(return_value=False)
-
-        # Mock database responses for two queries
-        mock_cursor.fetchall.side_effect = [
-            [(uuid4(), "Evidence 1", None, 0.9)],
-            [(uuid4(), "Evidence 2", None, 0.85)],
-        ]
-
-        mock_connection = MagicMock()
-        mock_connection.cursor.return_value = mock_cursor
-        db_mock.connection.return_value.connection = mock_connection
+    def test_search_similar_evidence_batch_success(self, mock_db_with_cursor):
+        """Test batch search sends all queries in one statement and splits rows per query."""
+        service = VectorSearchService(embedding_dimension=384, quantization="none")
+        first, second = uuid4(), uuid4()
+        db_mock, mock_cursor = mock_db_with_cursor(
+            fetchall_return=[
+                (0, first, "Evidence 1", None, 0.9),
+                (2, second, "Evidence 2", None, 0.85),
+            ]
+        )
 
-        # Execute batch search
-        query_embeddings = [[0.1] * 384, [0.2] * 384]
+        query_embeddings = np.random.rand(3, 384).astype(np.float32)
         batch_results = service.search_similar_evidence_batch(
-            db=db_mock, query_embeddings=query_embeddings
+            db=db_mock, query_embeddings=query_embeddings, min_similarity=0.5, tenant_id="acme"
         )
 
-        # Verify results
-        assert len(batch_results) == 2
-        assert len(batch_results[0]) == 1
-        assert len(batch_results[1]) == 1
-        assert batch_results[0][0].content == "Evidence 1"
-        assert batch_results[1][0].content == "Evidence 2"
-
-    def test_search_similar_evidence_batch_handles_errors(self):
-        """Test batch search handles individual query failures."""
-        service = VectorSearchService(embedding_dimension=384)
-        db_mock = Mock()
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args.args
+        assert "unnest(%(query_vectors)b::vector[]) WITH ORDINALITY" in sql
+        assert "CROSS JOIN LATERAL" in sql
+        assert "(emb.embedding <=> q.vec) <= %(max_distance)s" in sql
+        assert len(params["query_vectors"]) == 3
+        assert np.shares_memory(params["query_vectors"][1], query_embeddings)
+        assert params["tenant_id"] == "acme"
+        assert abs(params["max_distance"] - 0.5) < 1e-6
+        assert [[r.evidence_id for r in results] for results in batch_results] == [
+            [first],
+            [],
+            [second],
+        ]
+        assert batch_results[2][0].content == "Evidence 2"
 
-        # Mock database connection and cursor
-        mock_cursor = MagicMock()
-        mock_cursor.__enter__ = Mock(return_value=mock_cursor)
-        mock_cursor.__exit__ = Mock(return_value=False)
+    def test_search_similar_evidence_batch_two_stage(self, mock_db_with_cursor):
+        """Test that the per-query LATERAL search uses the quantized candidates."""
+        service = VectorSearchService(embedding_dimension=384, quantization="halfvec")
+        db_mock, mock_cursor = mock_db_with_cursor(fetchall_return=[])
 
-        # First query succeeds, second query fails
-        mock_cursor.fetchall.side_effect = [
-            [(uuid4(), "Evidence 1", None, 0.9)],
-            Exception("Query failed"),
-        ]
+        service.search_similar_evidence_batch(db=db_mock, query_embeddings=[[0.1] * 384], top_k=5)
 
-        mock_connection = MagicMock()
-        mock_connection.cursor.return_value = mock_cursor
-        db_mock.connection.return_value.connection = mock_connection
+        sql, params = mock_cursor.execute.call_args.args
+        assert "(emb.embedding_half <=> q.vec::halfvec)" in sql
+        assert params["candidate_k"] == 20
 
-        # Execute batch search
-        query_embeddings = [[0.1] * 384, [0.2] * 384]
-        batch_results = service.search_similar_evidence_batch(
-            db=db_mock, query_embeddings=query_embeddings
-        )
+    def test_search_similar_evidence_batch_handles_errors(self, mock_db_with_cursor):
+        """Test batch search validates input and reports database failures."""
+        service = VectorSearchService(embedding_dimension=384)
+        db_mock, _ = mock_db_with_cursor(execute_side_effect=Exception("Query failed"))
 
-        # Verify first succeeded, second returned empty
-        assert len(batch_results) == 2
-        assert len(batch_results[0]) == 1
-        assert len(batch_results[1]) == 0  # Failed query returns empty list
+        assert service.search_similar_evidence_batch(db=db_mock, query_embeddings=[]) == []
+        with pytest.raises(ValueError, match="384-dimensional"):
+            service.search_similar_evidence_batch(db=db_mock, query_embeddings=[[0.1] * 100])
+        with pytest.raises(RuntimeError, match="Batch vector search query failed"):
+            service.search_similar_evidence_batch(db=db_mock, query_embeddings=[[0.1] * 384])
 
     def test_get_embedding_stats_success(self):
         """Test getting embedding statistics."""
@@ -0,0 +1,216 @@
+"""Unit tests for the process-wide verification result cache."""
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from truthgraph.services.ml.nli_service import NLILabel
+from truthgraph.services.verification_cache import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    VerificationCache,
+    get_verification_cache_backend,
+)
+from truthgraph.services.verification_pipeline_service import (
+    EvidenceItem,
+    VerdictLabel,
+    VerificationPipelineResult,
+    decode_cached_result,
+    encode_cached_result,
+)
+
+
+def _result(evidence_count=3):
+    return VerificationPipelineResult(
+        claim_id=uuid4(),
+        claim_text="The Eiffel Tower is in Paris",
+        verdict=VerdictLabel.SUPPORTED,
+        confidence=0.91,
+        support_score=0.91,
+        refute_score=0.04,
+        neutral_score=0.05,
+        evidence_items=[
+            EvidenceItem(
+                evidence_id=uuid4(),
+                content=f"The Eiffel Tower stands in Paris, France. ({i})",
+                source_url=None if i % 2 else f"https://example.org/{i}",
+                similarity=0.8 - i * 0.01,
+                nli_label=NLILabel.ENTAILMENT,
+                nli_confidence=0.9,
+                nli_scores={"entailment": 0.9, "contradiction": 0.03, "neutral": 0.07},
+            )
+            for i in range(evidence_count)
+        ],
+        reasoning="Strong support from 3 evidence items",
+        pipeline_duration_ms=412.5,
+        retrieval_method="vector",
+        verification_result_id=uuid4(),
+    )
+
+
+class TestResultCodec:
+    """Test the binary encoding of cached pipeline results."""
+
+    @pytest.mark.parametrize("evidence_count", [0, 3, 50])
+    def test_roundtrip(self, evidence_count):
+        """Test that encoding and decoding returns an equal result."""
+        result = _result(evidence_count)
+
+        assert decode_cached_result(encode_cached_result(result)) == result
+
+    def test_large_results_are_compressed(self):
+        """Test that repetitive results are stored compressed and smaller than JSON."""
+        result = _result(50)
+        data = encode_cached_result(result)
+
+        assert data[1] & 1
+        assert len(data) < len(repr(result)) // 4
+
+    def test_rejects_other_versions_and_corrupt_data(self):
+        """Test that unknown or truncated entries raise ValueError."""
+        data = encode_cached_result(_result(0))
+
+        with pytest.raises(ValueError, match="version"):
+            decode_cached_result(b"\x99" + data[1:])
+        with pytest.raises(ValueError, match="Truncated|Corrupt"):
+            decode_cached_result(data[:20])
+
+
+class TestMemoryCacheBackend:
+    """Test cases for MemoryCacheBackend."""
+
+    def test_lru_eviction_within_budget(self):
+        """Test that the least recently used entry is evicted when over budget."""
+        backend = MemoryCacheBackend(max_bytes=3 * (128 + 1 + 100))
+        for key in "abc":
+            backend.set(key, b"x" * 100, ttl_seconds=60)
+
+        backend.get("a")
+        backend.set("d", b"x" * 100, ttl_seconds=60)
+
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        stats = backend.stats()
+        assert stats["entries"] == 3
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert stats["capacity_evictions"] == 1
+
+    def test_expired_entries_are_purged_on_write(self, monkeypatch):
+        """Test that entries past their TTL are dropped without being read."""
+        backend = MemoryCacheBackend()
+        backend.set("short", b"1", ttl_seconds=1)
+        backend.set("long", b"2", ttl_seconds=60)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+
+        backend.set("new", b"3", ttl_seconds=60)
+
+        stats = backend.stats()
+        assert stats["entries"] == 2
+        assert stats["expired_evictions"] == 1
+        assert backend.get("long") == b"2"
+
+    def test_overwrite_updates_size(self):
+        """Test that replacing an entry does not double-count its bytes."""
+        backend = MemoryCacheBackend()
+        backend.set("k", b"x" * 10, ttl_seconds=60)
+        backend.set("k", b"x" * 20, ttl_seconds=60)
+
+        assert backend.stats()["bytes"] == 1 + 20 + 128
+        assert backend.clear() == 1
+
+    def test_oversized_value_is_not_stored(self):
+        """Test that a value larger than the whole budget is skipped."""
+        backend = MemoryCacheBackend(max_bytes=256)
+        backend.set("k", b"x" * 1024, ttl_seconds=60)
+
+        assert backend.get("k") is None
+
+
+class TestDiskCacheBackend:
+    """Test cases for DiskCacheBackend."""
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test that two backends on one file (as in two workers) see each other's entries."""
+        path = tmp_path / "cache.sqlite3"
+        writer = DiskCacheBackend(path)
+        reader = DiskCacheBackend(path)
+
+        writer.set("k", b"payload", ttl_seconds=60)
+
+        assert reader.get("k") == b"payload"
+        assert reader.clear() == 1
+        assert writer.get("k") is None
+
+    def test_ttl_and_lru_budget(self, tmp_path, monkeypatch):
+        """Test expiry and least-recently-used eviction."""
+        backend = DiskCacheBackend(tmp_path / "cache.sqlite3", max_bytes=3 * 101)
+        clock = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        for key in "abc":
+            clock[0] += 1
+            backend.set(key, b"x" * 100, ttl_seconds=60)
+
+        clock[0] += 1
+        backend.get("a")
+        clock[0] += 1
+        backend.set("d", b"x" * 100, ttl_seconds=60)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == b"x" * 100
+        assert backend.stats()["capacity_evictions"] == 1
+
+        clock[0] += 120
+        assert backend.get("a") is None
+        assert backend.stats()["expired_evictions"] == 1
+
+
+class TestVerificationCache:
+    """Test cases for the VerificationCache facade."""
+
+    def test_hit_ratio_and_evictions(self):
+        """Test that lookups and evictions are counted."""
+        cache = VerificationCache(MemoryCacheBackend(max_bytes=2 * (128 + 1 + 10)))
+        cache.set("a", b"x" * 10, ttl_seconds=60)
+        cache.set("b", b"x" * 10, ttl_seconds=60)
+        cache.set("c", b"x" * 10, ttl_seconds=60)
+
+        cache.get("c")
+        cache.get("a")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["evictions"] == 1
+
+    def test_backend_errors_are_misses(self):
+        """Test that a failing backend never fails the caller."""
+
+        class BrokenBackend(MemoryCacheBackend):
+            def get(self, key):
+                raise OSError("disk full")
+
+            def set(self, key, value, ttl_seconds):
+                raise OSError("disk full")
+
+        cache = VerificationCache(BrokenBackend())
+        cache.set("k", b"v", ttl_seconds=60)
+
+        assert cache.get("k") is None
+        assert cache.get_stats()["errors"] == 2
+
+    def test_backend_from_environment(self, monkeypatch, tmp_path):
+        """Test VERIFICATION_CACHE_BACKEND selection and validation."""
+        monkeypatch.setenv("VERIFICATION_CACHE_BACKEND", "disk")
+        monkeypatch.setenv("VERIFICATION_CACHE_PATH", str(tmp_path / "c.sqlite3"))
+        assert isinstance(get_verification_cache_backend(), DiskCacheBackend)
+
+        monkeypatch.setenv("VERIFICATION_CACHE_BACKEND", "redis")
+        with pytest.raises(ValueError, match="VERIFICATION_CACHE_BACKEND"):
+            get_verification_cache_backend()
+
+    def test_singleton(self):
+        """Test that get_instance returns one cache per process."""
+        assert VerificationCache.get_instance() is VerificationCache.get_instance()
@@ -0,0 +1,317 @@
+"""Unit tests for deadline-aware verification."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from truthgraph.monitoring import metrics_collector as metrics_module
+from truthgraph.services.hybrid_search_service import HybridSearchResult
+from truthgraph.services.ml.nli_scheduler import NLIBatchScheduler
+from truthgraph.services.ml.nli_service import NLILabel, NLIResult
+from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_deadline import (
+    DeadlinePolicy,
+    NLICostEstimator,
+    VerificationDeadline,
+)
+from truthgraph.services.verification_pipeline_service import (
+    VerdictLabel,
+    VerificationPipelineService,
+)
+
+POLICY = DeadlinePolicy(
+    retrieval_reserve_ms=10,
+    persist_reserve_ms=10,
+    nli_pair_ms=10,
+    nli_step_size=2,
+    premise_max_words=3,
+)
+
+
+def _pipeline(embed_seconds=0.0, nli_seconds=0.0, evidence_count=6):
+    def embed_text(text):
+        time.sleep(embed_seconds)
+        return [0.1] * 384
+
+    def verify_batch(pairs, batch_size):
+        time.sleep(nli_seconds * len(pairs))
+        return [
+            NLIResult(
+                label=NLILabel.ENTAILMENT,
+                confidence=0.9,
+                scores={"entailment": 0.9, "contradiction": 0.05, "neutral": 0.05},
+            )
+            for _ in pairs
+        ]
+
+    evidence = [
+        SearchResult(
+            evidence_id=uuid4(),
+            content=f"Evidence number {i} with a long premise",
+            source_url=None,
+            similarity=0.9 - i * 0.01,
+        )
+        for i in range(evidence_count)
+    ]
+    keyword_search = Mock(RRF_K=60)
+    keyword_search.keyword_only_search.side_effect = lambda db, query_text, top_k, tenant_id: (
+        [
+            HybridSearchResult(
+                evidence_id=e.evidence_id,
+                content=e.content,
+                source_url=None,
+                rank_score=1.0 / (60 + rank),
+                keyword_rank=rank,
+                matched_via="keyword",
+            )
+            for rank, e in enumerate(evidence[:top_k], start=1)
+        ],
+        1.0,
+    )
+    return VerificationPipelineService(
+        embedding_service=Mock(embed_text=Mock(side_effect=embed_text)),
+        nli_service=Mock(verify_batch=Mock(side_effect=verify_batch)),
+        vector_search_service=Mock(
+            search_similar_evidence=Mock(side_effect=lambda top_k, **kwargs: evidence[:top_k])
+        ),
+        deadline_policy=POLICY,
+        keyword_search_service=keyword_search,
+        metrics_collector=Mock(record_histogram=AsyncMock(), increment_counter=AsyncMock()),
+    )
+
+
+class TestVerificationDeadline:
+    """Test cases for VerificationDeadline."""
+
+    def test_plan_top_k_shrinks_and_caps_premises(self):
+        """Test that a short budget cuts top_k to affordable NLI pairs."""
+        deadline = VerificationDeadline(70, POLICY)
+
+        assert deadline.plan_top_k(10) == 4  # (70 - 10 - 10) // 10, minus elapsed time
+        assert deadline.degradations == ["top_k_reduced"]
+        assert deadline.premise("one two three") == "one two three"
+        assert deadline.degradations == ["top_k_reduced"]
+        assert deadline.premise("one two three four five") == "one two three"
+        assert deadline.degradations == ["top_k_reduced", "premise_truncated"]
+
+        roomy = VerificationDeadline(10_000, POLICY)
+        assert roomy.plan_top_k(10) == 10
+        assert not roomy.degraded
+        assert roomy.premise("one two three four five") == "one two three four five"
+
+    async def test_run_times_out_and_records_stage(self):
+        """Test that a slow call is abandoned once the budget is spent."""
+        deadline = VerificationDeadline(50, POLICY)
+
+        result = await deadline.run("nli", asyncio.sleep(1, result="late"))
+
+        assert result is None
+        assert deadline.degradations == ["nli_timeout"]
+        assert 40 <= deadline.stage_ms["nli"] < 500
+
+    async def test_run_skips_when_reserve_exceeds_budget(self):
+        """Test that a call is not started when only the reserve is left."""
+        deadline = VerificationDeadline(50, POLICY)
+        call = asyncio.sleep(0, result="done")
+
+        assert await deadline.run("embed", call, reserve_ms=100) is None
+        assert deadline.degradations == ["embed_skipped"]
+        assert await VerificationDeadline(50, POLICY).run("embed", asyncio.sleep(0, "ok")) == "ok"
+
+    def test_nli_cost_estimate_is_smoothed(self):
+        """Test that observed NLI rounds refine the per-pair estimate they share."""
+        nli_cost = NLICostEstimator(POLICY.nli_pair_ms)
+        assert VerificationDeadline(100, POLICY, nli_cost).nli_pair_ms == 10
+
+        VerificationDeadline(100, POLICY, nli_cost).observe_nli(pairs=4, elapsed_ms=200)
+        VerificationDeadline(100, POLICY, nli_cost).observe_nli(pairs=2, elapsed_ms=20)
+
+        expected = 50 + 0.2 * (10 - 50)
+        assert VerificationDeadline(100, POLICY, nli_cost).nli_pair_ms == pytest.approx(expected)
+        assert VerificationDeadline(100, POLICY).nli_pair_ms == 10
+
+    def test_invalid_configuration(self):
+        """Test validation of the budget and policy."""
+        with pytest.raises(ValueError, match="deadline_ms"):
+            VerificationDeadline(0)
+        with pytest.raises(ValueError, match="nli_step_size"):
+            DeadlinePolicy(nli_step_size=0)
+
+
+class TestDeadlineAwarePipeline:
+    """Test cases for verify_claim(deadline_ms=...)."""
+
+    @pytest.fixture(autouse=True)
+    async def scheduler(self, monkeypatch):
+        """Bind a fresh scheduler singleton to each test's NLI mock."""
+        monkeypatch.setattr(NLIBatchScheduler, "_instance", None)
+        monkeypatch.setattr(
+            metrics_module,
+            "get_metrics_collector",
+            lambda: Mock(record_histogram=AsyncMock(), increment_counter=AsyncMock()),
+        )
+        yield
+        if NLIBatchScheduler._instance is not None:
+            await NLIBatchScheduler._instance.stop()
+
+    async def test_generous_deadline_is_not_degraded(self):
+        """Test that a budget that is not needed changes nothing but adds stage timings."""
+        pipeline = _pipeline()
+
+        result = await pipeline.verify_claim(
+            db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False, deadline_ms=10_000
+        )
+
+        assert not result.degraded
+        assert len(result.evidence_items) == 6
+        assert set(result.stage_timings_ms) == {"embed", "retrieve", "nli", "aggregate"}
+        assert pipeline._get_cached_result("Claim") is not None
+
+    async def test_slow_embedding_falls_back_to_keyword_search(self):
+        """Test keyword-only retrieval when the embedding does not finish in time."""
+        pipeline = _pipeline(embed_seconds=0.5)
+
+        result = await pipeline.verify_claim(
+            db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False, deadline_ms=300
+        )
+
+        assert result.degraded
+        assert result.degradations[0] == "embed_timeout"
+        assert {"keyword_retrieval", "premise_truncated"} <= set(result.degradations)
+        assert result.retrieval_method == "keyword"
+        pipeline.vector_search_service.search_similar_evidence.assert_not_called()
+        assert result.verdict == VerdictLabel.SUPPORTED
+        item = result.evidence_items[0]
+        assert (item.similarity, item.rank_score) == (0.0, pytest.approx(1 / 61))
+        assert "deadline" in result.reasoning
+        assert pipeline._get_cached_result("Claim") is None
+
+    async def test_slow_nli_returns_partial_verdict(self):
+        """Test that NLI stops when the budget runs out and the verdict is flagged."""
+        pipeline = _pipeline(nli_seconds=0.05)
+
+        result = await pipeline.verify_claim(
+            db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False, deadline_ms=250
+        )
+
+        assert result.verdict == VerdictLabel.SUPPORTED
+        assert 0 < len(result.evidence_items) < 6
+        assert "nli_partial" in result.degradations
+        assert result.stage_timings_ms["nli"] < 250
+        similarities = [item.similarity for item in result.evidence_items]
+        assert similarities == sorted(similarities, reverse=True)
+
+        metrics = pipeline.metrics_collector
+        stages = {
+            c.kwargs["labels"]["stage"]
+            for c in metrics.record_histogram.call_args_list
+            if c.args[0] == "verification.stage_ms"
+        }
+        assert {"embed", "retrieve", "nli", "aggregate"} <= stages
+        reasons = {c.kwargs["labels"]["reason"] for c in metrics.increment_counter.call_args_list}
+        assert "nli_partial" in reasons
+
+    async def test_nli_rounds_go_through_scheduler(self):
+        """Test that deadline-bound NLI is submitted to the shared scheduler."""
+        pipeline = _pipeline()
+
+        await pipeline.verify_claim(
+            db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False, deadline_ms=10_000
+        )
+
+        scheduler = NLIBatchScheduler._instance
+        assert scheduler.nli_service is pipeline.nli_service
+        assert scheduler.get_stats()["submitted_pairs"] == 6
+
+    async def test_cached_verdict_is_served_before_retrieval(self):
+        """Test that a deadline request reuses a cached verdict for the same options."""
+        pipeline = _pipeline()
+        first = await pipeline.verify_claim(
+            db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False, deadline_ms=10_000
+        )
+        pipeline.embedding_service.embed_text.reset_mock()
+
+        cached = await pipeline.verify_claim(
+            db=Mock(), claim_id=uuid4(), claim_text="Claim", store_result=False, deadline_ms=50
+        )
+        strict = await pipeline.verify_claim(
+            db=Mock(),
+            claim_id=uuid4(),
+            claim_text="Claim",
+            store_result=False,
+            deadline_ms=10_000,
+            confidence_threshold=0.95,
+        )
+
+        assert cached.verdict == first.verdict == VerdictLabel.SUPPORTED
+        assert not cached.degraded
+        assert strict.verdict == VerdictLabel.INSUFFICIENT
+        pipeline.embedding_service.embed_text.assert_called_once()
+
+    async def test_keyword_search_mode(self):
+        """Test that keyword mode skips the embedding without a degradation."""
+        pipeline = _pipeline()
+
+        result = await pipeline.verify_claim(
+            db=Mock(),
+            claim_id=uuid4(),
+            claim_text="Claim",
+            store_result=False,
+            deadline_ms=10_000,
+            search_mode="keyword",
+        )
+
+        assert result.retrieval_method == "keyword"
+        assert not result.degraded
+        pipeline.embedding_service.embed_text.assert_not_called()
+        pipeline.vector_search_service.search_similar_evidence.assert_not_called()
+
+    async def test_hybrid_search_mode(self):
+        """Test that hybrid mode keeps vector similarity and ranks keyword-only matches."""
+        pipeline = _pipeline()
+        pipeline.keyword_search_service.hybrid_search.return_value = (
+            [
+                HybridSearchResult(
+                    evidence_id=uuid4(),
+                    content="Found by both searches",
+                    source_url=None,
+                    rank_score=2 / 61,
+                    vector_similarity=0.8,
+                    keyword_rank=1,
+                    matched_via="both",
+                ),
+                HybridSearchResult(
+                    evidence_id=uuid4(),
+                    content="Found by keyword search",
+                    source_url=None,
+                    rank_score=1 / 62,
+                    keyword_rank=2,
+                    matched_via="keyword",
+                ),
+            ],
+            1.0,
+        )
+
+        result = await pipeline.verify_claim(
+            db=Mock(),
+            claim_id=uuid4(),
+            claim_text="Claim",
+            store_result=False,
+            deadline_ms=10_000,
+            search_mode="hybrid",
+        )
+
+        assert result.retrieval_method == "hybrid"
+        pipeline.vector_search_service.search_similar_evidence.assert_not_called()
+        scores = [(item.similarity, item.rank_score) for item in result.evidence_items]
+        assert scores == [(0.8, None), (0.0, pytest.approx(1 / 62))]
+
+    async def test_unknown_search_mode(self):
+        """Test that an unknown search mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown search mode"):
+            await _pipeline().verify_claim(
+                db=Mock(), claim_id=uuid4(), claim_text="Claim", search_mode="fuzzy"
+            )
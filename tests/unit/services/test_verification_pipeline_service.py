@@ -3,7 +3,8 @@
 These tests verify the pipeline orchestration logic using mocked dependencies.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import time
 from unittest.mock import Mock
 from uuid import uuid4
 
@@ -11,8 +12,10 @@ import pytest
 
 from truthgraph.services.ml.nli_service import NLILabel
 from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_cache import MemoryCacheBackend, VerificationCache
 from truthgraph.services.verification_pipeline_service import (
     EvidenceItem,
+    NLIEarlyStopping,
     VerdictLabel,
     VerificationPipelineResult,
     VerificationPipelineService,
@@ -69,6 +72,21 @@ class TestRetryDecorator:
 
         assert mock_func.call_count == 1  # No retries for ValueError
 
+    async def test_async_retry_sleeps_without_blocking(self, monkeypatch):
+        """Test that coroutine functions are retried with asyncio.sleep, not time.sleep."""
+        monkeypatch.setattr(time, "sleep", Mock(side_effect=AssertionError("blocking sleep")))
+        calls = []
+
+        @retry_on_failure(max_attempts=3, initial_delay=0.01, exceptions=(RuntimeError,))
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("fail")
+            return "success"
+
+        assert await flaky() == "success"
+        assert len(calls) == 3
+
 
 class TestVerificationPipelineService:
     """Test VerificationPipelineService initialization and configuration."""
@@ -82,7 +100,7 @@ class TestVerificationPipelineService:
         assert service.embedding_service is not None
         assert service.nli_service is not None
         assert service.vector_search_service is not None
-        assert len(service._verification_cache) == 0
+        assert service.cache is VerificationCache.get_instance()
 
     def test_initialization_custom_params(self):
         """Test service initialization with custom parameters."""
@@ -161,7 +179,7 @@ class TestCachingMechanism:
         assert cached.claim_text == claim_text
         assert cached.verdict == VerdictLabel.SUPPORTED
 
-    def test_cache_expiration(self):
+    def test_cache_expiration(self, monkeypatch):
         """Test that expired cache entries are not returned."""
         service = VerificationPipelineService(cache_ttl_seconds=1)
         claim_text = "Test claim"
@@ -179,16 +197,16 @@ class TestCachingMechanism:
             pipeline_duration_ms=100.0,
             retrieval_method="vector",
         )
+        service._cache_result(claim_text, result)
 
-        # Manually insert expired entry
-        claim_hash = service._compute_claim_hash(claim_text)
-        expired_time = datetime.now(tz=timezone.utc) - timedelta(seconds=10)
-        service._verification_cache[claim_hash] = (result, expired_time)
+        # Jump past the TTL
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 10)
 
         cached = service._get_cached_result(claim_text)
 
         assert cached is None
-        assert claim_hash not in service._verification_cache
+        assert service.cache.get_stats()["entries"] == 0
 
     def test_cache_miss(self):
         """Test cache miss for uncached claim."""
@@ -197,6 +215,83 @@ class TestCachingMechanism:
 
         assert cached is None
 
+    def test_cache_key_includes_retrieval_parameters(self):
+        """Test that a result is only reused for the same tenant and retrieval settings."""
+        service = VerificationPipelineService()
+        claim_text = "Test claim"
+        result = VerificationPipelineResult(
+            claim_id=uuid4(),
+            claim_text=claim_text,
+            verdict=VerdictLabel.REFUTED,
+            confidence=0.8,
+            support_score=0.1,
+            refute_score=0.8,
+            neutral_score=0.1,
+            evidence_items=[],
+            reasoning="Test",
+            pipeline_duration_ms=100.0,
+            retrieval_method="vector",
+        )
+
+        service._cache_result(claim_text, result, tenant_id="acme", top_k_evidence=5)
+
+        assert service._get_cached_result(claim_text, tenant_id="acme", top_k_evidence=5)
+        assert service._get_cached_result(claim_text, tenant_id="acme") is None
+        assert service._get_cached_result(claim_text, top_k_evidence=5) is None
+
+    def test_cache_shared_between_instances(self):
+        """Test that a result cached by one pipeline instance is served to another."""
+        cache = VerificationCache(MemoryCacheBackend())
+        first = VerificationPipelineService(cache=cache)
+        second = VerificationPipelineService(cache=cache)
+        result = VerificationPipelineResult(
+            claim_id=uuid4(),
+            claim_text="Shared claim",
+            verdict=VerdictLabel.SUPPORTED,
+            confidence=0.9,
+            support_score=0.9,
+            refute_score=0.05,
+            neutral_score=0.05,
+            evidence_items=[],
+            reasoning="Test",
+            pipeline_duration_ms=100.0,
+            retrieval_method="vector",
+        )
+
+        first._cache_result("Shared claim", result)
+
+        assert second._get_cached_result("Shared claim") == result
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_verify_claim_cache_hit_for_other_claim_id(self):
+        """Test that a hit for the same text is returned under the requesting claim's id."""
+        service = VerificationPipelineService(
+            embedding_service=Mock(), nli_service=Mock(), vector_search_service=Mock()
+        )
+        result = VerificationPipelineResult(
+            claim_id=uuid4(),
+            claim_text="Test claim",
+            verdict=VerdictLabel.SUPPORTED,
+            confidence=0.9,
+            support_score=0.9,
+            refute_score=0.05,
+            neutral_score=0.05,
+            evidence_items=[],
+            reasoning="Test",
+            pipeline_duration_ms=100.0,
+            retrieval_method="vector",
+            verification_result_id=uuid4(),
+        )
+        service._cache_result("Test claim", result)
+        claim_id = uuid4()
+
+        cached = await service.verify_claim(db=Mock(), claim_id=claim_id, claim_text="Test claim")
+
+        assert cached.claim_id == claim_id
+        assert cached.verification_result_id is None
+        assert cached.verdict == VerdictLabel.SUPPORTED
+        service.embedding_service.embed_text.assert_not_called()
+
     def test_clear_cache(self):
         """Test clearing all cache entries."""
         service = VerificationPipelineService()
@@ -219,11 +314,11 @@ class TestCachingMechanism:
             )
             service._cache_result(claim_text, result)
 
-        assert len(service._verification_cache) == 5
+        assert service.cache.get_stats()["entries"] == 5
 
         service.clear_cache()
 
-        assert len(service._verification_cache) == 0
+        assert service.cache.get_stats()["entries"] == 0
 
 
 class TestVerdictAggregation:
@@ -528,19 +623,19 @@ class TestReasoningGeneration:
 class TestRetryWrapperMethods:
     """Test retry wrapper methods."""
 
-    def test_generate_embedding_with_retry_success(self):
+    async def test_generate_embedding_with_retry_success(self):
         """Test embedding generation with retry succeeds."""
         mock_embedding_service = Mock()
         mock_embedding_service.embed_text.return_value = [0.1] * 384
 
         service = VerificationPipelineService(embedding_service=mock_embedding_service)
 
-        embedding = service._generate_embedding_with_retry("Test claim")
+        embedding = await service._generate_embedding_with_retry("Test claim")
 
         assert len(embedding) == 384
         assert mock_embedding_service.embed_text.call_count == 1
 
-    def test_search_evidence_with_retry_success(self):
+    async def test_search_evidence_with_retry_success(self):
         """Test evidence search with retry succeeds."""
         mock_vector_search = Mock()
         mock_results = [
@@ -556,7 +651,7 @@ class TestRetryWrapperMethods:
         service = VerificationPipelineService(vector_search_service=mock_vector_search)
 
         mock_db = Mock()
-        results = service._search_evidence_with_retry(
+        results = await service._search_evidence_with_retry(
             db=mock_db,
             query_embedding=[0.1] * 384,
             top_k=10,
@@ -566,3 +661,363 @@ class TestRetryWrapperMethods:
 
         assert len(results) == 1
         assert mock_vector_search.search_similar_evidence.call_count == 1
+
+
+class TestNLIScheduling:
+    """Test routing of evidence NLI through the shared scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_verify_evidence_batch_uses_scheduler(self):
+        """Test that evidence pairs are submitted to the scheduler when configured."""
+        from unittest.mock import AsyncMock
+
+        from truthgraph.services.ml.nli_service import NLIResult
+
+        mock_nli = Mock()
+        mock_scheduler = Mock()
+        mock_scheduler.verify = AsyncMock(
+            return_value=[
+                NLIResult(
+                    label=NLILabel.ENTAILMENT,
+                    confidence=0.9,
+                    scores={"entailment": 0.9, "neutral": 0.05, "contradiction": 0.05},
+                )
+            ]
+        )
+        service = VerificationPipelineService(nli_service=mock_nli, nli_scheduler=mock_scheduler)
+        search_results = [
+            SearchResult(
+                evidence_id=uuid4(),
+                content="Evidence text",
+                source_url=None,
+                similarity=0.8,
+            )
+        ]
+
+        items = await service._verify_evidence_batch("Claim text", search_results)
+
+        mock_scheduler.verify.assert_awaited_once_with([("Evidence text", "Claim text")])
+        mock_nli.verify_batch.assert_not_called()
+        assert items[0].nli_label == NLILabel.ENTAILMENT
+
+
+class TestBatchedVerification:
+    """Test cross-claim batched verification (verify_claims)."""
+
+    @staticmethod
+    def _nli(label, score):
+        from truthgraph.services.ml.nli_service import NLIResult
+
+        other = (1.0 - score) / 2
+        scores = {"entailment": other, "contradiction": other, "neutral": other}
+        scores[label.value] = score
+        return NLIResult(label=label, confidence=score, scores=scores)
+
+    def _service(self, search_results, nli_results):
+        embedding = Mock()
+        embedding.embed_batch.side_effect = lambda texts: [[0.1] * 384 for _ in texts]
+        vector_search = Mock()
+        vector_search.search_similar_evidence_batch.return_value = search_results
+        nli = Mock()
+        nli.verify_batch.return_value = nli_results
+        return VerificationPipelineService(
+            embedding_service=embedding, nli_service=nli, vector_search_service=vector_search
+        )
+
+    @pytest.mark.asyncio
+    async def test_each_stage_runs_once_for_the_batch(self):
+        """Test one embed, one search and one NLI call, with results split per claim."""
+        evidence = [
+            SearchResult(
+                evidence_id=uuid4(), content=f"Evidence {i}", source_url=None, similarity=0.9
+            )
+            for i in range(3)
+        ]
+        service = self._service(
+            search_results=[evidence[:2], [], evidence[2:]],
+            nli_results=[
+                self._nli(NLILabel.ENTAILMENT, 0.9),
+                self._nli(NLILabel.ENTAILMENT, 0.9),
+                self._nli(NLILabel.CONTRADICTION, 0.95),
+            ],
+        )
+        claims = [(uuid4(), "Claim A"), (uuid4(), "Claim B"), (uuid4(), "Claim C")]
+
+        results = await service.verify_claims(db=Mock(), claims=claims, store_result=False)
+
+        service.embedding_service.embed_batch.assert_called_once_with(
+            ["Claim A", "Claim B", "Claim C"]
+        )
+        service.vector_search_service.search_similar_evidence_batch.assert_called_once()
+        service.nli_service.verify_batch.assert_called_once()
+        assert service.nli_service.verify_batch.call_args.kwargs["pairs"] == [
+            ("Evidence 0", "Claim A"),
+            ("Evidence 1", "Claim A"),
+            ("Evidence 2", "Claim C"),
+        ]
+        assert [r.claim_id for r in results] == [claim_id for claim_id, _ in claims]
+        assert [r.verdict for r in results] == [
+            VerdictLabel.SUPPORTED,
+            VerdictLabel.INSUFFICIENT,
+            VerdictLabel.REFUTED,
+        ]
+        assert len(results[0].evidence_items) == 2
+        assert results[2].evidence_items[0].evidence_id == evidence[2].evidence_id
+
+    @pytest.mark.asyncio
+    async def test_cached_claims_are_not_recomputed(self):
+        """Test that cache hits are returned in place and only misses are embedded."""
+        service = self._service(search_results=[[]], nli_results=[])
+        cached = service._create_insufficient_verdict(uuid4(), "Cached claim", 1.0)
+        service._cache_result("Cached claim", cached)
+        claims = [(uuid4(), "Cached claim"), (uuid4(), "New claim")]
+
+        results = await service.verify_claims(db=Mock(), claims=claims, store_result=False)
+
+        service.embedding_service.embed_batch.assert_called_once_with(["New claim"])
+        service.nli_service.verify_batch.assert_not_called()
+        assert results[0].claim_id == claims[0][0]
+        assert results[1].claim_id == claims[1][0]
+
+    @pytest.mark.asyncio
+    async def test_results_stored_in_one_transaction(self):
+        """Test that all results are committed once."""
+        service = self._service(search_results=[[], []], nli_results=[])
+        db = Mock()
+
+        await service.verify_claims(
+            db=db, claims=[(uuid4(), "Claim A"), (uuid4(), "Claim B")], use_cache=False
+        )
+
+        assert db.add.call_count == 2
+        db.commit.assert_called_once()
+        db.rollback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_claim_rejected(self):
+        """Test that an empty claim text fails the whole batch up front."""
+        service = self._service(search_results=[], nli_results=[])
+
+        with pytest.raises(ValueError, match="empty"):
+            await service.verify_claims(db=Mock(), claims=[(uuid4(), "Claim"), (uuid4(), " ")])
+
+        service.embedding_service.embed_batch.assert_not_called()
+
+
+class TestEarlyStopping:
+    """Test adaptive early-stopping NLI over ranked evidence."""
+
+    @staticmethod
+    def _nli_for(scores_by_content):
+        """NLI mock classifying each premise with its scores from scores_by_content."""
+        from truthgraph.services.ml.nli_service import NLIResult
+
+        def verify_batch(pairs, batch_size):
+            results = []
+            for premise, _ in pairs:
+                scores = scores_by_content[premise]
+                label = NLILabel(max(scores, key=scores.get))
+                results.append(
+                    NLIResult(label=label, confidence=scores[label.value], scores=scores)
+                )
+            return results
+
+        return Mock(verify_batch=Mock(side_effect=verify_batch))
+
+    @staticmethod
+    def _evidence(similarities):
+        return [
+            SearchResult(
+                evidence_id=uuid4(), content=f"Evidence {i}", source_url=None, similarity=sim
+            )
+            for i, sim in enumerate(similarities)
+        ]
+
+    def _verdict(self, service, evidence, items):
+        skipped, below_floor = service._unanalyzed_evidence(evidence, items)
+        return service._aggregate_verdict(
+            claim_id=uuid4(),
+            claim_text="Claim",
+            evidence_items=items,
+            pipeline_duration_ms=1.0,
+            skipped_evidence=skipped,
+            below_floor_evidence=below_floor,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stops_once_verdict_is_decided(self):
+        """Test that strong top-ranked support skips the lower-ranked evidence."""
+        evidence = self._evidence([0.95, 0.93, 0.9, 0.55, 0.5])
+        strong = {"entailment": 0.97, "contradiction": 0.01, "neutral": 0.02}
+        weak = {"entailment": 0.1, "contradiction": 0.1, "neutral": 0.8}
+        scores = {e.content: strong if e.similarity > 0.8 else weak for e in evidence}
+        service = VerificationPipelineService(
+            nli_service=self._nli_for(scores), early_stopping=NLIEarlyStopping(step_size=3)
+        )
+
+        items = await service._verify_evidence_batch("Claim", evidence)
+        result = self._verdict(service, evidence, items)
+
+        assert [item.content for item in items] == ["Evidence 0", "Evidence 1", "Evidence 2"]
+        service.nli_service.verify_batch.assert_called_once()
+        assert (service.nli_pairs_evaluated, service.nli_pairs_saved) == (3, 2)
+        assert result.verdict == VerdictLabel.SUPPORTED
+        assert "2 lower-ranked evidence items were not analyzed" in result.reasoning
+
+    @pytest.mark.asyncio
+    async def test_verdict_matches_full_evaluation(self):
+        """Test verdict parity with classifying every item on random evidence."""
+        import random
+
+        rng = random.Random(7)
+        for _ in range(200):
+            evidence = self._evidence([rng.uniform(0.5, 1.0) for _ in range(rng.randint(1, 10))])
+            scores = {}
+            for e in evidence:
+                raw = [rng.random() ** 3 for _ in range(3)]
+                scores[e.content] = dict(
+                    zip(("entailment", "contradiction", "neutral"), (r / sum(raw) for r in raw))
+                )
+            full = VerificationPipelineService(nli_service=self._nli_for(scores))
+            adaptive = VerificationPipelineService(
+                nli_service=self._nli_for(scores),
+                early_stopping=NLIEarlyStopping(step_size=rng.randint(1, 3)),
+            )
+
+            expected = self._verdict(
+                full, evidence, await full._verify_evidence_batch("Claim", evidence)
+            )
+            actual = self._verdict(
+                adaptive, evidence, await adaptive._verify_evidence_batch("Claim", evidence)
+            )
+
+            assert actual.verdict == expected.verdict
+
+    @pytest.mark.asyncio
+    async def test_items_below_similarity_floor_are_skipped(self):
+        """Test that evidence under min_similarity is never classified."""
+        evidence = self._evidence([0.9, 0.4, 0.8])
+        neutral = {"entailment": 0.2, "contradiction": 0.2, "neutral": 0.6}
+        scores = {e.content: neutral for e in evidence}
+        service = VerificationPipelineService(
+            nli_service=self._nli_for(scores),
+            early_stopping=NLIEarlyStopping(step_size=5, min_similarity=0.5),
+        )
+
+        items = await service._verify_evidence_batch("Claim", evidence)
+        result = self._verdict(service, evidence, items)
+
+        assert [item.content for item in items] == ["Evidence 0", "Evidence 2"]
+        assert service.nli_pairs_saved == 1
+        assert "1 evidence items were not analyzed because their similarity" in result.reasoning
+        assert "lower-ranked" not in result.reasoning
+
+    @pytest.mark.asyncio
+    async def test_batched_rounds_only_include_undecided_claims(self):
+        """Test that verify_claims keeps sharing NLI calls between undecided claims."""
+        decided = self._evidence([0.9, 0.9, 0.3, 0.3])
+        mixed = [
+            SearchResult(evidence_id=uuid4(), content=f"Mixed {i}", source_url=None, similarity=0.9)
+            for i in range(4)
+        ]
+        strong = {"entailment": 0.98, "contradiction": 0.01, "neutral": 0.01}
+        scores = {e.content: strong for e in decided}
+        for i, e in enumerate(mixed):
+            label = "entailment" if i % 2 else "contradiction"
+            scores[e.content] = {"entailment": 0.05, "contradiction": 0.05, "neutral": 0.05}
+            scores[e.content][label] = 0.9
+        embedding = Mock(embed_batch=Mock(side_effect=lambda texts: [[0.1] * 384 for _ in texts]))
+        service = VerificationPipelineService(
+            embedding_service=embedding,
+            nli_service=self._nli_for(scores),
+            vector_search_service=Mock(
+                search_similar_evidence_batch=Mock(return_value=[decided, mixed])
+            ),
+            early_stopping=NLIEarlyStopping(step_size=2),
+        )
+
+        results = await service.verify_claims(
+            db=Mock(), claims=[(uuid4(), "Claim A"), (uuid4(), "Claim B")], store_result=False
+        )
+
+        rounds = [c.kwargs["pairs"] for c in service.nli_service.verify_batch.call_args_list]
+        assert [len(pairs) for pairs in rounds] == [4, 2]
+        assert all(claim == "Claim B" for _, claim in rounds[1])
+        assert [r.verdict for r in results] == [VerdictLabel.SUPPORTED, VerdictLabel.INSUFFICIENT]
+        assert service.nli_pairs_saved == 2
+
+    def test_invalid_step_size(self):
+        """Test that a step size below one is rejected."""
+        with pytest.raises(ValueError, match="step_size"):
+            NLIEarlyStopping(step_size=0)
+
+
+class TestEventLoopResponsiveness:
+    """Test that running verifications do not stall the event loop."""
+
+    async def test_event_loop_lag_during_verifications(self):
+        """Test that the loop keeps ticking while blocking model and DB calls run."""
+        from truthgraph.services.ml.nli_service import NLIResult
+
+        blocking_seconds = 0.2
+
+        def embed_text(text):
+            time.sleep(blocking_seconds)
+            return [0.1] * 384
+
+        def search_similar_evidence(**kwargs):
+            time.sleep(blocking_seconds)
+            return [
+                SearchResult(
+                    evidence_id=uuid4(), content="Evidence", source_url=None, similarity=0.9
+                )
+            ]
+
+        def verify_batch(pairs, batch_size):
+            time.sleep(blocking_seconds)
+            return [
+                NLIResult(
+                    label=NLILabel.ENTAILMENT,
+                    confidence=0.9,
+                    scores={"entailment": 0.9, "contradiction": 0.05, "neutral": 0.05},
+                )
+                for _ in pairs
+            ]
+
+        embedding = Mock(embed_text=Mock(side_effect=embed_text))
+        vector_search = Mock(search_similar_evidence=Mock(side_effect=search_similar_evidence))
+        nli = Mock(verify_batch=Mock(side_effect=verify_batch))
+        service = VerificationPipelineService(
+            embedding_service=embedding, nli_service=nli, vector_search_service=vector_search
+        )
+
+        max_lag = 0.0
+        done = asyncio.Event()
+
+        async def measure_lag():
+            nonlocal max_lag
+            interval = 0.01
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(interval)
+                max_lag = max(max_lag, time.perf_counter() - start - interval)
+
+        monitor = asyncio.create_task(measure_lag())
+        results = await asyncio.gather(
+            *(
+                service.verify_claim(
+                    db=Mock(),
+                    claim_id=uuid4(),
+                    claim_text=f"Claim {i}",
+                    use_cache=False,
+                    store_result=True,
+                )
+                for i in range(3)
+            )
+        )
+        done.set()
+        await monitor
+
+        assert all(r.verdict == VerdictLabel.SUPPORTED for r in results)
+        # Each verification blocks for 3 x 200ms; none of it may land on the loop
+        assert max_lag < blocking_seconds / 2
@@ -0,0 +1,212 @@
+"""Unit tests for the write-behind verification result persister."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from truthgraph.services.ml.nli_service import NLILabel
+from truthgraph.services.verification_pipeline_service import (
+    EvidenceItem,
+    VerdictLabel,
+    VerificationPipelineResult,
+    VerificationPipelineService,
+)
+from truthgraph.services.verification_result_persister import (
+    VerificationResultPersister,
+    write_behind_enabled,
+)
+
+
+class _FakeDatabase:
+    """Session factory recording committed rows per table."""
+
+    def __init__(self, fail_claim_ids=(), write_delay=0.0):
+        self.fail_claim_ids = set(fail_claim_ids)
+        self.write_delay = write_delay
+        self.commits: list[dict[str, list[dict]]] = []
+
+    def __call__(self):
+        pending: dict[str, list[dict]] = {}
+        session = Mock()
+
+        def execute(statement, rows):
+            if any(row["claim_id"] in self.fail_claim_ids for row in rows):
+                raise RuntimeError("foreign key violation")
+            pending.setdefault(statement.table.name, []).extend(rows)
+
+        def commit():
+            threading.Event().wait(self.write_delay)
+            self.commits.append(pending)
+
+        session.execute.side_effect = execute
+        session.commit.side_effect = commit
+        return session
+
+    def rows(self, table):
+        return [row for commit in self.commits for row in commit.get(table, [])]
+
+
+def _rows(claim_id=None, nli_count=2):
+    claim_id = claim_id or uuid4()
+    verification_row = {"claim_id": claim_id, "verdict": "SUPPORTED"}
+    nli_rows = [{"claim_id": claim_id, "evidence_id": uuid4()} for _ in range(nli_count)]
+    return verification_row, nli_rows
+
+
+class TestVerificationResultPersister:
+    """Test cases for VerificationResultPersister."""
+
+    async def test_concurrent_results_share_one_transaction(self):
+        """Test that results queued together are written in one multi-row flush."""
+        db = _FakeDatabase()
+        persister = VerificationResultPersister(session_factory=db, flush_interval_ms=20)
+
+        try:
+            record_ids = await asyncio.gather(*(persister.submit(*_rows()) for _ in range(5)))
+            await asyncio.gather(*(persister.wait_persisted(rid) for rid in record_ids))
+        finally:
+            await persister.stop()
+
+        assert len(db.commits) == 1
+        assert [row["id"] for row in db.rows("verification_results")] == record_ids
+        assert len(db.rows("nli_results")) == 10
+        assert all(row["id"] is not None for row in db.rows("nli_results"))
+        stats = persister.get_stats()
+        assert stats["written"] == 5
+        assert stats["avg_batch_size"] == 5
+
+    async def test_stop_flushes_queued_results(self):
+        """Test that stop() writes results that were still waiting in the queue."""
+        db = _FakeDatabase()
+        persister = VerificationResultPersister(
+            session_factory=db, max_batch_size=2, flush_interval_ms=10_000
+        )
+
+        record_ids = [await persister.submit(*_rows()) for _ in range(5)]
+        assert db.commits == []
+
+        await persister.stop()
+
+        assert {row["id"] for row in db.rows("verification_results")} == set(record_ids)
+        assert persister.get_stats()["pending"] == 0
+        assert await persister.wait_persisted(record_ids[0]) == record_ids[0]
+
+    async def test_stop_waits_for_write_in_progress(self):
+        """Test that stop() lets a started flush finish instead of abandoning it."""
+        db = _FakeDatabase(write_delay=0.1)
+        persister = VerificationResultPersister(session_factory=db, flush_interval_ms=0)
+
+        record_id = await persister.submit(*_rows())
+        await asyncio.sleep(0.02)
+        await persister.stop()
+
+        assert [row["id"] for row in db.rows("verification_results")] == [record_id]
+        assert persister.get_stats()["failed"] == 0
+
+    async def test_failed_batch_retries_results_individually(self):
+        """Test that one bad result does not drop the rest of its batch."""
+        bad_claim = uuid4()
+        db = _FakeDatabase(fail_claim_ids={bad_claim})
+        persister = VerificationResultPersister(session_factory=db, flush_interval_ms=20)
+
+        try:
+            good_id, bad_id = await asyncio.gather(
+                persister.submit(*_rows()), persister.submit(*_rows(claim_id=bad_claim))
+            )
+            assert await persister.wait_persisted(good_id) == good_id
+            with pytest.raises(RuntimeError, match="was not stored"):
+                await persister.wait_persisted(bad_id)
+        finally:
+            await persister.stop()
+
+        assert [row["id"] for row in db.rows("verification_results")] == [good_id]
+        # A later wait for the failed ID still reports the failure
+        with pytest.raises(RuntimeError, match="foreign key violation"):
+            await persister.wait_persisted(bad_id)
+        assert persister.get_stats()["failed"] == 1
+
+    async def test_full_queue_applies_backpressure(self):
+        """Test that submit() waits while the queue is full."""
+        db = _FakeDatabase(write_delay=0.1)
+        persister = VerificationResultPersister(
+            session_factory=db, max_queue_size=1, max_batch_size=1, flush_interval_ms=0
+        )
+
+        try:
+            await persister.submit(*_rows())
+            await asyncio.sleep(0.01)  # first result is being written
+            await persister.submit(*_rows())  # fills the queue
+            blocked = asyncio.create_task(persister.submit(*_rows()))
+            await asyncio.sleep(0.05)
+            assert not blocked.done()
+            await asyncio.wait_for(blocked, timeout=1.0)
+        finally:
+            await persister.stop()
+
+        assert len(db.rows("verification_results")) == 3
+
+    async def test_pipeline_queues_results_instead_of_committing(self):
+        """Test that a pipeline with a persister returns without touching its session."""
+        db = _FakeDatabase()
+        persister = VerificationResultPersister(session_factory=db, flush_interval_ms=0)
+        pipeline = VerificationPipelineService(
+            embedding_service=Mock(),
+            nli_service=Mock(),
+            vector_search_service=Mock(),
+            persister=persister,
+        )
+        claim_id = uuid4()
+        result = VerificationPipelineResult(
+            claim_id=claim_id,
+            claim_text="The Earth orbits the Sun",
+            verdict=VerdictLabel.SUPPORTED,
+            confidence=0.9,
+            support_score=0.9,
+            refute_score=0.05,
+            neutral_score=0.05,
+            evidence_items=[
+                EvidenceItem(
+                    evidence_id=uuid4(),
+                    content="Evidence",
+                    source_url=None,
+                    similarity=0.9,
+                    nli_label=NLILabel.ENTAILMENT,
+                    nli_confidence=0.9,
+                    nli_scores={"entailment": 0.9, "contradiction": 0.05, "neutral": 0.05},
+                )
+            ],
+            reasoning="Supported",
+            pipeline_duration_ms=1.0,
+            retrieval_method="vector",
+        )
+        session = Mock()
+
+        try:
+            stored = await pipeline._store_verification_result(db=session, result=result)
+            await persister.wait_persisted(stored.verification_result_id)
+        finally:
+            await persister.stop()
+
+        session.add.assert_not_called()
+        session.commit.assert_not_called()
+        (verification_row,) = db.rows("verification_results")
+        assert verification_row["id"] == stored.verification_result_id
+        assert verification_row["supporting_evidence_count"] == 1
+        (nli_row,) = db.rows("nli_results")
+        assert nli_row["label"] == NLILabel.ENTAILMENT.value
+        assert nli_row["hypothesis_text"] == "The Earth orbits the Sun"
+
+    def test_configuration(self, monkeypatch):
+        """Test validation and the VERIFICATION_WRITE_BEHIND switch."""
+        with pytest.raises(ValueError, match="max_batch_size"):
+            VerificationResultPersister(session_factory=Mock(), max_batch_size=-1)
+        with pytest.raises(ValueError, match="flush_interval_ms"):
+            VerificationResultPersister(session_factory=Mock(), flush_interval_ms=-5)
+
+        monkeypatch.delenv("VERIFICATION_WRITE_BEHIND", raising=False)
+        assert not write_behind_enabled()
+        monkeypatch.setenv("VERIFICATION_WRITE_BEHIND", "true")
+        assert write_behind_enabled()
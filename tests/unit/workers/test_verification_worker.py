@@ -0,0 +1,168 @@
+"""Unit tests for the verification worker retry logic."""
+
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from truthgraph.services.staged_verification_pipeline import StagedVerificationPipeline
+from truthgraph.services.verification_pipeline_service import (
+    VerdictLabel,
+    VerificationPipelineResult,
+)
+from truthgraph.workers import verification_worker
+from truthgraph.workers.task_status import TaskMetadata
+from truthgraph.workers.verification_worker import (
+    PermanentError,
+    TemporaryError,
+    VerificationWorker,
+)
+
+
+def _result(claim_id, claim_text, verdict=VerdictLabel.SUPPORTED):
+    """Pipeline result without evidence."""
+    return VerificationPipelineResult(
+        claim_id=claim_id,
+        claim_text=claim_text,
+        verdict=verdict,
+        confidence=0.9,
+        support_score=0.9,
+        refute_score=0.05,
+        neutral_score=0.05,
+        evidence_items=[],
+        reasoning="Test verdict",
+        pipeline_duration_ms=1.0,
+        retrieval_method="vector",
+    )
+
+
+@pytest.fixture
+def sleep(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(verification_worker.asyncio, "sleep", sleep)
+    return sleep
+
+
+@pytest.fixture
+def claims():
+    """Two (claim_id, claim_uuid, claim_text) tuples."""
+    return [
+        ("claim-1", uuid4(), "The Earth orbits the Sun"),
+        ("claim-2", uuid4(), "The Moon is made of cheese"),
+    ]
+
+
+def _pipeline_results(claims):
+    return [
+        _result(claims[0][1], claims[0][2], VerdictLabel.SUPPORTED),
+        _result(claims[1][1], claims[1][2], VerdictLabel.REFUTED),
+    ]
+
+
+class TestProcessVerification:
+    """Test cases for VerificationWorker.process_verification."""
+
+    async def test_retries_then_succeeds(self, sleep):
+        """Test that a failed attempt is retried after the initial backoff."""
+        claim_uuid = uuid4()
+        pipeline = Mock()
+        pipeline.verify_claim = AsyncMock(
+            side_effect=[RuntimeError("db down"), _result(claim_uuid, "Claim")]
+        )
+        worker = VerificationWorker(pipeline_service=pipeline, initial_backoff=2.0)
+        task = TaskMetadata(task_id="task_1", claim_id="claim-1", claim_text="Claim")
+
+        result = await worker.process_verification(
+            db=Mock(),
+            claim_id="claim-1",
+            claim_uuid=claim_uuid,
+            claim_text="Claim",
+            task_metadata=task,
+        )
+
+        assert result.verdict == "SUPPORTED"
+        assert task.retry_count == 1
+        sleep.assert_awaited_once_with(2.0)
+
+
+class TestProcessVerificationBatch:
+    """Test cases for VerificationWorker.process_verification_batch."""
+
+    async def test_results_follow_input_order(self, sleep, claims):
+        """Test that one batched pipeline call yields one API result per claim."""
+        pipeline = Mock()
+        pipeline.verify_claims = AsyncMock(return_value=_pipeline_results(claims))
+        worker = VerificationWorker(pipeline_service=pipeline)
+
+        results = await worker.process_verification_batch(
+            db=Mock(), claims=claims, top_k_evidence=5, tenant_id="acme", corpus_ids=["c1"]
+        )
+
+        kwargs = pipeline.verify_claims.call_args.kwargs
+        assert kwargs["claims"] == [(uuid, text) for _, uuid, text in claims]
+        assert (kwargs["top_k_evidence"], kwargs["tenant_id"]) == (5, "acme")
+        assert [r.claim_id for r in results] == ["claim-1", "claim-2"]
+        assert [r.verdict for r in results] == ["SUPPORTED", "REFUTED"]
+        assert results[0].corpus_ids_searched == ["c1"]
+        sleep.assert_not_awaited()
+
+    async def test_backoff_doubles_up_to_max(self, sleep, claims):
+        """Test exponential backoff between retries, capped at max_backoff."""
+        pipeline = Mock()
+        pipeline.verify_claims = AsyncMock(
+            side_effect=[
+                RuntimeError("timeout"),
+                RuntimeError("timeout"),
+                RuntimeError("timeout"),
+                _pipeline_results(claims),
+            ]
+        )
+        worker = VerificationWorker(
+            pipeline_service=pipeline, max_retries=3, initial_backoff=2.0, max_backoff=5.0
+        )
+
+        results = await worker.process_verification_batch(db=Mock(), claims=claims)
+
+        assert len(results) == 2
+        assert [c.args[0] for c in sleep.await_args_list] == [2.0, 4.0, 5.0]
+
+    async def test_gives_up_after_max_retries(self, sleep, claims):
+        """Test that TemporaryError is raised once retries are exhausted."""
+        pipeline = Mock()
+        pipeline.verify_claims = AsyncMock(side_effect=RuntimeError("timeout"))
+        worker = VerificationWorker(pipeline_service=pipeline, max_retries=2)
+
+        with pytest.raises(TemporaryError, match="after 2 attempts"):
+            await worker.process_verification_batch(db=Mock(), claims=claims)
+
+        assert pipeline.verify_claims.await_count == 3
+        assert sleep.await_count == 2
+
+    async def test_permanent_error_is_not_retried(self, sleep, claims):
+        """Test that PermanentError propagates on the first attempt."""
+        pipeline = Mock()
+        pipeline.verify_claims = AsyncMock(side_effect=PermanentError("bad claim"))
+        worker = VerificationWorker(pipeline_service=pipeline)
+
+        with pytest.raises(PermanentError):
+            await worker.process_verification_batch(db=Mock(), claims=claims)
+
+        pipeline.verify_claims.assert_awaited_once()
+        sleep.assert_not_awaited()
+
+    async def test_staged_pipeline_delegates_to_batched_service(self, sleep, claims):
+        """Test that a staged pipeline runs the batch through verify_claims, not its stages."""
+        service = Mock()
+        service.verify_claims = AsyncMock(return_value=_pipeline_results(claims))
+        staged = StagedVerificationPipeline(pipeline=service)
+        worker = VerificationWorker(pipeline_service=staged)
+        db = Mock()
+
+        results = await worker.process_verification_batch(db=db, claims=claims, min_similarity=0.4)
+
+        kwargs = service.verify_claims.call_args.kwargs
+        assert kwargs["db"] is db
+        assert kwargs["min_similarity"] == 0.4
+        assert [r.verdict for r in results] == ["SUPPORTED", "REFUTED"]
+        assert staged._loop is None
@@ -53,6 +53,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # ML endpoints that need stricter limits
         self.ml_endpoints = {
             "/api/v1/verify",
+            "/api/v1/verify/batch",
             "/api/v1/embed",
             "/api/v1/nli",
             "/api/v1/nli/batch",
@@ -2,6 +2,7 @@
 
 This module implements REST endpoints for ML functionality:
 - /verify: Full claim verification pipeline
+- /verify/batch: Verification pipeline for many claims in one pass
 - /embed: Generate embeddings
 - /search: Hybrid/vector/keyword search
 - /nli: Natural Language Inference
@@ -13,7 +14,7 @@ All endpoints have rate limiting applied based on computational cost.
 import asyncio
 import logging
 import time
-from typing import Annotated
+from typing import Annotated, Any, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
@@ -21,9 +22,17 @@ from sqlalchemy.orm import Session
 
 from ..db import get_db
 from ..schemas import Claim, VerificationResult
+from ..services.hybrid_search_service import HybridFusion, HybridSearchService
+from ..services.ml.embedding_batcher import get_embedding_batcher
 from ..services.ml.embedding_service import get_embedding_service
-from ..services.ml.nli_service import NLILabel, get_nli_service
-from ..services.vector_search_service import VectorSearchService
+from ..services.ml.inference_executor import run_inference
+from ..services.ml.nli_scheduler import get_nli_scheduler
+from ..services.ml.nli_service import get_nli_service
+from ..services.vector_search_backends import get_vector_search_service as get_search_backend
+from ..services.verification_pipeline_service import (
+    VerificationPipelineResult,
+    get_verification_pipeline_service,
+)
 from .models import (
     EmbedRequest,
     EmbedResponse,
@@ -38,6 +47,8 @@ from .models import (
     SearchResponse,
     SearchResultItem,
     VerdictResponse,
+    VerifyBatchRequest,
+    VerifyBatchResponse,
     VerifyRequest,
     VerifyResponse,
 )
@@ -64,8 +75,13 @@ def get_nli_service_dep():
 
 
 def get_vector_search_service():
-    """Dependency to get vector search service instance."""
-    return VectorSearchService(embedding_dimension=384)
+    """Dependency to get vector search service instance (VECTOR_SEARCH_BACKEND)."""
+    return get_search_backend(embedding_dimension=384)
+
+
+def get_hybrid_search_service():
+    """Dependency to get hybrid search service instance (HYBRID_SEARCH_FUSION)."""
+    return HybridSearchService(embedding_dimension=384)
 
 
 # ===== Embedding Endpoint =====
@@ -113,13 +129,12 @@ async def embed_texts(
     start_time = time.time()
 
     try:
-        # Use run_in_executor to avoid blocking the event loop
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None,
-            lambda: embedding_service.embed_batch(
-                texts=embed_request.texts, batch_size=embed_request.batch_size, show_progress=False
-            ),
+        # Run on the inference executor to avoid blocking the event loop
+        embeddings = await run_inference(
+            embedding_service.embed_batch,
+            texts=embed_request.texts,
+            batch_size=embed_request.batch_size,
+            show_progress=False,
         )
 
         processing_time = (time.time() - start_time) * 1000
@@ -160,7 +175,10 @@ async def embed_texts(
     description="""
     Search evidence database using hybrid, vector, or keyword search modes.
 
-    - **hybrid**: Combines semantic and keyword search (recommended)
+    - **hybrid**: Combines semantic and keyword search (recommended). With
+      HYBRID_SEARCH_FUSION=python the keyword branch runs while the query is
+      being embedded and alongside the vector branch; with sql both rankings
+      are fused in one statement.
     - **vector**: Pure semantic similarity search
     - **keyword**: Traditional text-based search
 
@@ -177,6 +195,7 @@ async def search_evidence(
     db: Annotated[Session, Depends(get_db)],
     embedding_service=Depends(get_embedding_service_dep),
     vector_search_service=Depends(get_vector_search_service),
+    hybrid_search_service=Depends(get_hybrid_search_service),
 ) -> SearchResponse:
     """Search for evidence using specified mode.
 
@@ -186,6 +205,7 @@ async def search_evidence(
         db: Database session
         embedding_service: Injected embedding service
         vector_search_service: Injected vector search service
+        hybrid_search_service: Injected hybrid search service
 
     Returns:
         SearchResponse with results and metadata
@@ -194,17 +214,22 @@ async def search_evidence(
         HTTPException: 400 for invalid input, 429 for rate limit, 500 for search errors
     """
     start_time = time.time()
+    search_stats: Optional[dict[str, Any]] = None
 
     try:
-        # Generate query embedding for vector/hybrid modes
-        if search_request.mode in ["vector", "hybrid"]:
-            loop = asyncio.get_event_loop()
-            query_embedding = await loop.run_in_executor(
-                None, embedding_service.embed_text, search_request.query
+        if search_request.mode == "hybrid":
+            result_items, search_stats = await _hybrid_search(
+                db, search_request, embedding_service, hybrid_search_service
+            )
+        elif search_request.mode == "vector":
+            # Coalesced with concurrent requests into one encode call
+            query_embedding = await get_embedding_batcher(embedding_service).embed(
+                search_request.query
             )
 
-            # Perform vector search
-            search_results = vector_search_service.search_similar_evidence(
+            # Perform vector search (blocking database call, off the event loop)
+            search_results = await asyncio.to_thread(
+                vector_search_service.search_similar_evidence,
                 db=db,
                 query_embedding=query_embedding,
                 top_k=search_request.limit,
@@ -212,6 +237,18 @@ async def search_evidence(
                 tenant_id=search_request.tenant_id,
                 source_filter=search_request.source_filter,
             )
+
+            # Convert to response format
+            result_items = [
+                SearchResultItem(
+                    evidence_id=result.evidence_id,
+                    content=result.content,
+                    source_url=result.source_url,
+                    similarity=result.similarity,
+                    rank=i + 1,
+                )
+                for i, result in enumerate(search_results)
+            ]
         else:
             # Keyword search not implemented yet
             logger.warning("Keyword search mode not yet implemented, falling back to vector")
@@ -222,18 +259,6 @@ async def search_evidence(
 
         query_time = (time.time() - start_time) * 1000
 
-        # Convert to response format
-        result_items = [
-            SearchResultItem(
-                evidence_id=result.evidence_id,
-                content=result.content,
-                source_url=result.source_url,
-                similarity=result.similarity,
-                rank=i + 1,
-            )
-            for i, result in enumerate(search_results)
-        ]
-
         logger.info(
             f"Search returned {len(result_items)} results in {query_time:.2f}ms "
             f"(mode={search_request.mode}, tenant={search_request.tenant_id})"
@@ -245,6 +270,7 @@ async def search_evidence(
             query=search_request.query,
             mode=search_request.mode,
             query_time_ms=query_time,
+            search_stats=search_stats,
         )
 
     except HTTPException as exc:
@@ -256,6 +282,69 @@ async def search_evidence(
         ) from e
 
 
+async def _hybrid_search(
+    db: Session,
+    search_request: SearchRequest,
+    embedding_service,
+    hybrid_search_service: HybridSearchService,
+) -> tuple[list[SearchResultItem], dict[str, Any]]:
+    """Run a hybrid search for the /search endpoint.
+
+    With python fusion the keyword branch starts while the query is still
+    being embedded and runs alongside the vector branch, each on its own
+    pooled session. With sql fusion one statement computes both rankings and
+    their fusion on the request session, off the event loop.
+
+    Returns:
+        Tuple of (result items, search_stats). Python fusion reports per-branch
+        timings and counts; sql fusion runs one statement, so it reports the
+        embedding wait and the search call as a whole.
+    """
+    query_embedding = get_embedding_batcher(embedding_service).embed(search_request.query)
+    if hybrid_search_service.fusion is HybridFusion.PYTHON:
+        results, _, search_stats = await hybrid_search_service.hybrid_search_concurrent(
+            query_text=search_request.query,
+            query_embedding=query_embedding,
+            top_k=search_request.limit,
+            min_vector_similarity=search_request.min_similarity,
+            tenant_id=search_request.tenant_id,
+            source_filter=search_request.source_filter,
+        )
+    else:
+        embed_start = time.perf_counter()
+        embedding = await query_embedding
+        embedding_wait_ms = (time.perf_counter() - embed_start) * 1000
+        results, search_ms = await asyncio.to_thread(
+            hybrid_search_service.hybrid_search,
+            db=db,
+            query_text=search_request.query,
+            query_embedding=embedding,
+            top_k=search_request.limit,
+            min_vector_similarity=search_request.min_similarity,
+            tenant_id=search_request.tenant_id,
+            source_filter=search_request.source_filter,
+        )
+        search_stats = {
+            "concurrent": False,
+            "embedding_wait_ms": embedding_wait_ms,
+            "search_ms": search_ms,
+        }
+
+    logger.debug(f"Hybrid search stats ({hybrid_search_service.fusion.value}): {search_stats}")
+    items = [
+        SearchResultItem(
+            evidence_id=result.evidence_id,
+            content=result.content,
+            source_url=result.source_url,
+            similarity=min(1.0, max(0.0, result.vector_similarity or 0.0)),
+            rank=i + 1,
+            rank_score=result.rank_score,
+        )
+        for i, result in enumerate(results)
+    ]
+    return items, search_stats
+
+
 # ===== NLI Endpoint =====
 
 
@@ -305,10 +394,9 @@ async def run_nli(
     start_time = time.time()
 
     try:
-        # Run NLI inference in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, nli_service.verify_single, nli_request.premise, nli_request.hypothesis
+        # Run NLI inference on the inference executor to avoid blocking
+        result = await run_inference(
+            nli_service.verify_single, nli_request.premise, nli_request.hypothesis
         )
 
         processing_time = (time.time() - start_time) * 1000
@@ -380,12 +468,9 @@ async def run_nli_batch(
     start_time = time.time()
 
     try:
-        # Run batch NLI inference
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(
-            None,
-            lambda: nli_service.verify_batch(pairs=nli_batch_request.pairs, batch_size=nli_batch_request.batch_size),
-        )
+        # Run batch NLI inference through the shared scheduler so pairs from
+        # concurrent requests and background verifications fill model batches
+        results = await get_nli_scheduler(nli_service).verify(nli_batch_request.pairs)
 
         processing_time = (time.time() - start_time) * 1000
 
@@ -424,6 +509,42 @@ async def run_nli_batch(
 # ===== Verification Endpoint =====
 
 
+def _to_verify_response(
+    result: VerificationPipelineResult, processing_time_ms: Optional[float] = None
+) -> VerifyResponse:
+    """Convert a pipeline result into the /verify response model.
+
+    Args:
+        result: Pipeline result
+        processing_time_ms: Request processing time (default: the pipeline duration)
+    """
+    return VerifyResponse(
+        verdict=result.verdict.value,
+        confidence=float(result.confidence),
+        evidence=[
+            EvidenceItem(
+                evidence_id=item.evidence_id,
+                content=item.content,
+                source_url=item.source_url,
+                nli_label=item.nli_label.value,
+                nli_confidence=item.nli_confidence,
+                similarity=item.similarity,
+                rank_score=item.rank_score,
+            )
+            for item in result.evidence_items
+        ],
+        explanation=result.reasoning,
+        claim_id=result.claim_id,
+        verification_id=result.verification_result_id,
+        processing_time_ms=(
+            result.pipeline_duration_ms if processing_time_ms is None else processing_time_ms
+        ),
+        degraded=result.degraded,
+        degradations=result.degradations,
+        stage_timings_ms=result.stage_timings_ms or None,
+    )
+
+
 @router.post(
     "/verify",
     response_model=VerifyResponse,
@@ -444,6 +565,13 @@ async def run_nli_batch(
 
     Returns verdict (SUPPORTED/REFUTED/INSUFFICIENT) with evidence and explanation.
 
+    With `deadline_ms`, every stage works within the time budget: cached
+    verdicts are served first, retrieval falls back to keyword search, fewer
+    evidence items and shorter premises are analyzed, and NLI stops when the
+    budget is spent. A verdict computed with less work is returned with
+    `degraded: true`, the reasons, and the time spent per stage. A cached
+    verdict is not stored again, so its `verification_id` is null.
+
     **Rate Limit:** 5 requests/minute (most expensive operation)
     """,
 )
@@ -456,6 +584,7 @@ async def verify_claim(
     embedding_service=Depends(get_embedding_service_dep),
     nli_service=Depends(get_nli_service_dep),
     vector_search_service=Depends(get_vector_search_service),
+    hybrid_search_service=Depends(get_hybrid_search_service),
 ) -> VerifyResponse:
     """Execute full verification pipeline for a claim.
 
@@ -466,6 +595,8 @@ async def verify_claim(
         embedding_service: Injected embedding service
         nli_service: Injected NLI service
         vector_search_service: Injected vector search service
+        hybrid_search_service: Injected hybrid search service (hybrid, keyword
+            and deadline fallback retrieval)
 
     Returns:
         VerifyResponse with verdict, evidence, and explanation
@@ -484,149 +615,158 @@ async def verify_claim(
 
         logger.info(f"Created claim: {claim.id}")
 
-        # Step 2: Generate claim embedding and search for evidence
-        loop = asyncio.get_event_loop()
-        claim_embedding = await loop.run_in_executor(
-            None, embedding_service.embed_text, verify_request.claim
+        # Steps 2-5: retrieve, classify, aggregate and store, within the budget if any
+        pipeline = get_verification_pipeline_service(
+            embedding_service=embedding_service,
+            nli_service=nli_service,
+            vector_search_service=vector_search_service,
+            keyword_search_service=hybrid_search_service,
         )
-
-        search_results = vector_search_service.search_similar_evidence(
+        result = await pipeline.verify_claim(
             db=db,
-            query_embedding=claim_embedding,
-            top_k=verify_request.max_evidence,
+            claim_id=claim.id,
+            claim_text=verify_request.claim,
+            top_k_evidence=verify_request.max_evidence,
             min_similarity=0.3,  # Lower threshold to find diverse evidence
             tenant_id=verify_request.tenant_id,
+            # A deadline-bound request takes a cached verdict before any model call
+            use_cache=verify_request.deadline_ms is not None,
+            store_result=True,
+            deadline_ms=verify_request.deadline_ms,
+            confidence_threshold=verify_request.confidence_threshold,
+            search_mode=verify_request.search_mode,
         )
 
-        if not search_results:
-            # No evidence found
-            logger.warning(f"No evidence found for claim: {claim.id}")
-
-            verification = VerificationResult(
-                claim_id=claim.id,
-                verdict="INSUFFICIENT",
-                confidence=0.0,
-                support_score=0.0,
-                refute_score=0.0,
-                neutral_score=0.0,
-                evidence_count=0,
-                supporting_evidence_count=0,
-                refuting_evidence_count=0,
-                neutral_evidence_count=0,
-                reasoning="No relevant evidence found in database",
-                retrieval_method=verify_request.search_mode,
-            )
-            db.add(verification)
-            db.commit()
-            db.refresh(verification)
-
-            processing_time = (time.time() - start_time) * 1000
-
-            return VerifyResponse(
-                verdict="INSUFFICIENT",
-                confidence=0.0,
-                evidence=[],
-                explanation="No relevant evidence found in the database to verify this claim.",
-                claim_id=claim.id,
-                verification_id=verification.id,
-                processing_time_ms=processing_time,
-            )
+        processing_time = (time.time() - start_time) * 1000
+        logger.info(
+            f"Verification complete: {result.verdict.value} "
+            f"(confidence={result.confidence:.3f}, evidence={len(result.evidence_items)}, "
+            f"time={processing_time:.2f}ms)"
+        )
 
-        # Step 3: Run NLI on claim-evidence pairs
-        nli_pairs = [(result.content, verify_request.claim) for result in search_results]
+        return _to_verify_response(result, processing_time)
 
-        nli_results = await loop.run_in_executor(
-            None, lambda: nli_service.verify_batch(pairs=nli_pairs, batch_size=8)
-        )
+    except ValueError as e:
+        db.rollback()
+        logger.error(f"Verification validation error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except HTTPException as exc:
+        raise exc
+    except Exception as e:
+        logger.error(f"Verification pipeline failed: {e}", exc_info=True)
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Verification pipeline failed"
+        ) from e
 
-        # Step 4: Aggregate results and compute verdict
-        entailment_count = sum(1 for r in nli_results if r.label == NLILabel.ENTAILMENT)
-        contradiction_count = sum(1 for r in nli_results if r.label == NLILabel.CONTRADICTION)
-        neutral_count = sum(1 for r in nli_results if r.label == NLILabel.NEUTRAL)
 
-        # Compute weighted scores
-        support_score = sum(
-            r.confidence for r in nli_results if r.label == NLILabel.ENTAILMENT
-        ) / len(nli_results)
+@router.post(
+    "/verify/batch",
+    response_model=VerifyBatchResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid request"},
+        429: {"description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Server error"},
+    },
+    summary="Verify many claims (batched pipeline)",
+    description="""
+    Run the verification pipeline for up to 100 claims in one pass:
 
-        refute_score = sum(
-            r.confidence for r in nli_results if r.label == NLILabel.CONTRADICTION
-        ) / len(nli_results)
+    1. **Embed**: All claims in one embedding call
+    2. **Search**: Evidence for every claim in one batched vector search
+    3. **NLI**: All claim-evidence pairs packed into shared model batches
+    4. **Aggregate**: Verdict and confidence per claim
+    5. **Persist**: Claims are saved first, then all new results in one transaction
 
-        neutral_score = sum(r.confidence for r in nli_results if r.label == NLILabel.NEUTRAL) / len(
-            nli_results
-        )
+    Cached verdicts are reused without storing a new result, and a failed
+    result write does not fail the request; such results have a null
+    `verification_id`, and `stored_count` counts the ones that were saved.
 
-        # Determine verdict
-        if support_score > refute_score and support_score >= verify_request.confidence_threshold:
-            verdict = "SUPPORTED"
-            confidence = support_score
-            explanation = f"The claim is supported by {entailment_count} evidence items with {confidence:.1%} confidence."
-        elif refute_score > support_score and refute_score >= verify_request.confidence_threshold:
-            verdict = "REFUTED"
-            confidence = refute_score
-            explanation = f"The claim is refuted by {contradiction_count} evidence items with {confidence:.1%} confidence."
-        else:
-            verdict = "INSUFFICIENT"
-            confidence = max(support_score, refute_score)
-            explanation = f"Insufficient evidence to determine verdict (support: {support_score:.1%}, refute: {refute_score:.1%})."
+    Intended for backfills; throughput is several times that of calling
+    /verify once per claim. Results are returned in request order.
 
-        # Step 5: Save verification result
-        verification = VerificationResult(
-            claim_id=claim.id,
-            verdict=verdict,
-            confidence=float(confidence),
-            support_score=float(support_score),
-            refute_score=float(refute_score),
-            neutral_score=float(neutral_score),
-            evidence_count=len(search_results),
-            supporting_evidence_count=entailment_count,
-            refuting_evidence_count=contradiction_count,
-            neutral_evidence_count=neutral_count,
-            reasoning=explanation,
-            retrieval_method=verify_request.search_mode,
-        )
-        db.add(verification)
+    **Rate Limit:** 2 requests/minute
+    """,
+)
+@limiter.limit(rate_config.get_limit("/api/v1/verify/batch"))
+async def verify_claims_batch(
+    request: Request,
+    response: Response,
+    verify_batch_request: VerifyBatchRequest,
+    db: Annotated[Session, Depends(get_db)],
+    embedding_service=Depends(get_embedding_service_dep),
+    nli_service=Depends(get_nli_service_dep),
+    vector_search_service=Depends(get_vector_search_service),
+) -> VerifyBatchResponse:
+    """Execute the batched verification pipeline for many claims.
+
+    Args:
+        request: FastAPI request (for rate limiting)
+        verify_batch_request: Batch verification request with claims and parameters
+        db: Database session
+        embedding_service: Injected embedding service
+        nli_service: Injected NLI service
+        vector_search_service: Injected vector search service
+
+    Returns:
+        VerifyBatchResponse with one result per claim
+
+    Raises:
+        HTTPException: 400 for invalid input, 429 for rate limit, 500 for pipeline errors
+    """
+    start_time = time.time()
+
+    try:
+        # Step 1: Create claim records (committed even if no result is stored)
+        claims = [Claim(text=text) for text in verify_batch_request.claims]
+        db.add_all(claims)
+        db.flush()
+        claim_inputs = [(claim.id, claim.text) for claim in claims]
         db.commit()
-        db.refresh(verification)
 
-        # Build evidence items for response
-        evidence_items = [
-            EvidenceItem(
-                evidence_id=search_results[i].evidence_id,
-                content=search_results[i].content,
-                source_url=search_results[i].source_url,
-                nli_label=nli_results[i].label.value,
-                nli_confidence=nli_results[i].confidence,
-                similarity=search_results[i].similarity,
-            )
-            for i in range(len(search_results))
-        ]
+        pipeline = get_verification_pipeline_service(
+            embedding_service=embedding_service,
+            nli_service=nli_service,
+            vector_search_service=vector_search_service,
+        )
+        pipeline_results = await pipeline.verify_claims(
+            db=db,
+            claims=claim_inputs,
+            top_k_evidence=verify_batch_request.max_evidence,
+            min_similarity=0.3,  # Same threshold as /verify
+            tenant_id=verify_batch_request.tenant_id,
+        )
 
-        processing_time = (time.time() - start_time) * 1000
+        results = [_to_verify_response(result) for result in pipeline_results]
+        # Cache hits are not stored, and the pipeline logs rather than raises
+        # a failed write; either way the result has no verification_id. With
+        # VERIFICATION_WRITE_BEHIND the count includes rows still queued.
+        stored_count = sum(1 for result in results if result.verification_id is not None)
 
+        processing_time = (time.time() - start_time) * 1000
         logger.info(
-            f"Verification complete: {verdict} (confidence={confidence:.3f}, "
-            f"evidence={len(search_results)}, time={processing_time:.2f}ms)"
+            f"Batch verification: {len(results)} claims ({stored_count} stored) "
+            f"in {processing_time:.2f}ms"
         )
 
-        return VerifyResponse(
-            verdict=verdict,
-            confidence=float(confidence),
-            evidence=evidence_items,
-            explanation=explanation,
-            claim_id=claim.id,
-            verification_id=verification.id,
-            processing_time_ms=processing_time,
+        return VerifyBatchResponse(
+            results=results,
+            count=len(results),
+            stored_count=stored_count,
+            total_processing_time_ms=processing_time,
         )
 
-    except HTTPException as exc:
-        raise exc
+    except ValueError as e:
+        db.rollback()
+        logger.error(f"Batch verification validation error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
-        logger.error(f"Verification pipeline failed: {e}", exc_info=True)
+        logger.error(f"Batch verification pipeline failed: {e}", exc_info=True)
         db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Verification pipeline failed"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Batch verification pipeline failed",
         ) from e
 
 
@@ -5,7 +5,7 @@ using Pydantic v2 with modern validation and serialization features.
 """
 
 from datetime import datetime
-from typing import Annotated, Literal, Optional
+from typing import Annotated, Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -124,8 +124,18 @@ class SearchResultItem(BaseResponseModel):
     evidence_id: UUID
     content: Annotated[str, Field(description="Evidence content text")]
     source_url: Annotated[Optional[str], Field(description="Source URL of the evidence")] = None
-    similarity: Annotated[float, Field(ge=0.0, le=1.0, description="Similarity score (0.0-1.0)")]
+    similarity: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=1.0,
+            description="Similarity score (0.0-1.0; 0.0 for hybrid keyword-only matches)",
+        ),
+    ]
     rank: Annotated[int, Field(ge=1, description="Result rank (1-based)")]
+    rank_score: Annotated[
+        Optional[float], Field(description="Reciprocal Rank Fusion score (hybrid mode only)")
+    ] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -152,6 +162,10 @@ class SearchResponse(BaseResponseModel):
     query_time_ms: Annotated[
         Optional[float], Field(description="Query execution time in milliseconds")
     ] = None
+    search_stats: Annotated[
+        Optional[dict[str, Any]],
+        Field(description="Per-branch timings (ms) and result counts for hybrid mode"),
+    ] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -207,7 +221,16 @@ class NLIBatchRequest(BaseModel):
         ),
     ]
     batch_size: Annotated[
-        int, Field(default=8, ge=1, le=32, description="Batch size for processing (1-32)")
+        int,
+        Field(
+            default=8,
+            ge=1,
+            le=32,
+            description=(
+                "Batch size hint (1-32). Pairs are packed into model batches by the "
+                "shared NLI scheduler together with other in-flight requests."
+            ),
+        ),
     ] = 8
 
     model_config = ConfigDict(
@@ -284,6 +307,19 @@ class VerifyRequest(BaseModel):
     search_mode: Annotated[
         Literal["hybrid", "vector", "keyword"], Field(description="Evidence search mode")
     ] = "hybrid"
+    deadline_ms: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            ge=50,
+            le=120_000,
+            description=(
+                "Time budget in milliseconds. When set, the verification pipeline degrades "
+                "(fewer evidence items, keyword-only retrieval, shorter premises, partial NLI) "
+                "to answer within the budget instead of timing out"
+            ),
+        ),
+    ] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -293,6 +329,7 @@ class VerifyRequest(BaseModel):
                 "max_evidence": 10,
                 "confidence_threshold": 0.7,
                 "search_mode": "hybrid",
+                "deadline_ms": 2000,
             }
         }
     )
@@ -310,6 +347,10 @@ class EvidenceItem(BaseResponseModel):
     ]
     nli_confidence: Annotated[float, Field(ge=0.0, le=1.0, description="NLI confidence score")]
     similarity: Annotated[float, Field(ge=0.0, le=1.0, description="Semantic similarity to claim")]
+    rank_score: Annotated[
+        Optional[float],
+        Field(description="Keyword rank score of a keyword-only match (similarity is then 0)"),
+    ] = None
 
 
 class VerifyResponse(BaseResponseModel):
@@ -329,6 +370,16 @@ class VerifyResponse(BaseResponseModel):
     processing_time_ms: Annotated[
         Optional[float], Field(description="Total processing time in milliseconds")
     ] = None
+    degraded: Annotated[
+        bool, Field(description="Verdict computed with reduced work to meet deadline_ms")
+    ] = False
+    degradations: Annotated[
+        list[str], Field(description="Why the verification was degraded, in order")
+    ] = []
+    stage_timings_ms: Annotated[
+        Optional[dict[str, float]],
+        Field(description="Milliseconds spent per pipeline stage (requests with deadline_ms)"),
+    ] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -354,6 +405,56 @@ class VerifyResponse(BaseResponseModel):
     )
 
 
+class VerifyBatchRequest(BaseModel):
+    """Request model for verifying many claims in one pipeline run."""
+
+    claims: Annotated[
+        list[Annotated[str, Field(min_length=1, max_length=2000)]],
+        Field(min_length=1, max_length=100, description="Claim texts to verify (max 100)"),
+    ]
+    tenant_id: Annotated[
+        str, Field(default="default", max_length=255, description="Tenant identifier")
+    ] = "default"
+    max_evidence: Annotated[
+        int,
+        Field(default=10, ge=1, le=50, description="Maximum evidence items per claim (1-50)"),
+    ] = 10
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "claims": [
+                    "The Earth is approximately 4.54 billion years old",
+                    "Water boils at 100 degrees Celsius at sea level",
+                ],
+                "tenant_id": "default",
+                "max_evidence": 10,
+            }
+        }
+    )
+
+
+class VerifyBatchResponse(BaseResponseModel):
+    """Response model for batch claim verification."""
+
+    results: Annotated[
+        list[VerifyResponse], Field(description="Verification results, in request order")
+    ]
+    count: Annotated[int, Field(description="Number of results")]
+    stored_count: Annotated[
+        int,
+        Field(
+            description=(
+                "Number of results saved to the database; the others (cache hits, failed "
+                "writes) have no verification_id"
+            )
+        ),
+    ] = 0
+    total_processing_time_ms: Annotated[
+        Optional[float], Field(description="Total processing time in milliseconds")
+    ] = None
+
+
 # ===== Verdict Retrieval Models =====
 
 
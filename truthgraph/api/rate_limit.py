@@ -64,6 +64,7 @@ class RateLimitConfig:
             'default': '60/minute',
             'endpoints': {
                 '/api/v1/verify': '5/minute',
+                '/api/v1/verify/batch': '2/minute',
                 '/api/v1/embed': '10/minute',
                 '/api/v1/search': '20/minute',
                 '/api/v1/nli': '10/minute',
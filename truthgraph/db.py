@@ -1,8 +1,9 @@
 """Database connection and session management."""
 
+import logging
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 # Get database URL from environment
@@ -15,9 +16,26 @@ DATABASE_URL = os.getenv(
 if DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
 
+logger = logging.getLogger(__name__)
+
 # Create engine
 engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
 
+
+@event.listens_for(engine, "connect")
+def _register_vector_types(dbapi_connection, connection_record):
+    """Let new connections bind float32 ndarrays as binary pgvector parameters."""
+    from truthgraph.db_queries.vector_adapter import register_vector_adapter
+
+    try:
+        register_vector_adapter(dbapi_connection)
+        dbapi_connection.commit()
+    except Exception as e:
+        # e.g. the vector extension is not created yet; queries register lazily later
+        logger.warning(f"pgvector adapter registration skipped: {e}")
+        dbapi_connection.rollback()
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
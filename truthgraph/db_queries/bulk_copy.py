@@ -0,0 +1,177 @@
+"""Streaming bulk writes with binary COPY.
+
+A multi-row ``INSERT ... VALUES`` binds a uniquely named parameter per
+column per row. At 10k+ rows that hits the protocol's 65535-parameter
+limit, makes the server parse a huge statement, and allocates a dict entry
+per value on the client. ``COPY ... FROM STDIN (FORMAT BINARY)`` streams rows
+instead: each value is sent once in its binary wire format (float32 vectors
+through pgvector's binary dumper) and there is nothing to parse.
+
+COPY cannot express ON CONFLICT or RETURNING, so rows are copied into a
+temporary staging table and moved into the target with a single
+``INSERT ... SELECT ... ON CONFLICT ... RETURNING``. RETURNING has no
+order guarantee for ``INSERT ... SELECT`` and skips rows dropped by DO
+NOTHING, so the returned IDs cannot be matched to input rows by position;
+callers that need that mapping generate the IDs themselves. Rows are
+consumed lazily in chunks of chunk_size, so memory stays bounded however
+many rows the iterable yields. Nothing is committed; the caller owns the
+transaction.
+
+Configuration (environment):
+    BULK_COPY_CHUNK_SIZE: Rows per staging round (default 5000)
+
+Usage:
+    result = copy_rows(
+        session,
+        table="embeddings",
+        columns=[("entity_type", "text"), ("entity_id", "uuid"), ("embedding", "vector")],
+        rows=((t, i, v) for t, i, v in ...),
+        conflict_columns=["entity_type", "entity_id"],
+    )
+    session.commit()
+    logger.info(str(result))  # rows, chunks, rows/s
+"""
+
+import itertools
+import logging
+import os
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from .vector_adapter import vector_connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COPY_CHUNK_SIZE = int(os.getenv("BULK_COPY_CHUNK_SIZE", "5000"))
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk COPY write.
+
+    Attributes:
+        table: Target table
+        ids: Values of the RETURNING column, in no particular order; rows
+            skipped by ON CONFLICT DO NOTHING are absent
+        rows: Rows written
+        chunks: Staging rounds used
+        duration_seconds: Wall time spent copying and upserting
+    """
+
+    table: str
+    ids: list[Any] = field(default_factory=list)
+    rows: int = 0
+    chunks: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Write throughput."""
+        return self.rows / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Copied {self.rows} rows into {self.table} in {self.chunks} chunks "
+            f"({self.duration_seconds:.2f}s, {self.rows_per_second:.0f} rows/s)"
+        )
+
+
+def copy_rows(
+    session: Session,
+    table: str,
+    columns: Sequence[tuple[str, str]],
+    rows: Iterable[Sequence[Any]],
+    conflict_columns: Optional[Sequence[str]] = None,
+    update_columns: Optional[Sequence[str]] = None,
+    extra_updates: Optional[Mapping[str, str]] = None,
+    returning: Optional[str] = "id",
+    chunk_size: Optional[int] = None,
+) -> BulkWriteResult:
+    """Write rows into a table through a binary-COPY staging table.
+
+    Args:
+        session: SQLAlchemy session bound to a psycopg engine
+        table: Target table name
+        columns: (column name, PostgreSQL type name) pairs, in row order.
+            Type names select the binary dumper (e.g. "uuid", "text",
+            "float8", "int4", "vector"); omitted columns get their defaults.
+        rows: Row tuples; consumed lazily, one chunk at a time
+        conflict_columns: Conflict target. When set, conflicting rows update
+            update_columns (default: all non-conflict columns); when None,
+            rows are plain inserts.
+        update_columns: Columns to overwrite on conflict; an empty sequence
+            (and no extra_updates) means DO NOTHING
+        extra_updates: Additional "column: SQL expression" assignments on
+            conflict, e.g. {"updated_at": "CURRENT_TIMESTAMP"}
+        returning: Column to return per written row (unordered), or None
+        chunk_size: Rows per staging round (default: BULK_COPY_CHUNK_SIZE)
+
+    Returns:
+        BulkWriteResult with the returned IDs (unordered) and throughput
+
+    Raises:
+        ValueError: If columns is empty or chunk_size < 1
+        psycopg.Error: On database errors (the caller rolls back)
+    """
+    chunk_size = chunk_size or DEFAULT_COPY_CHUNK_SIZE
+    if not columns:
+        raise ValueError("columns must not be empty")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    names = [name for name, _ in columns]
+    types = [type_name for _, type_name in columns]
+    column_list = ", ".join(names)
+    staging = f"_copy_{table}"
+
+    upsert = f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging}"
+    if conflict_columns:
+        if update_columns is None:
+            update_columns = [name for name in names if name not in conflict_columns]
+        upsert += f" ON CONFLICT ({', '.join(conflict_columns)})"
+        assignments = [f"{name} = EXCLUDED.{name}" for name in update_columns]
+        assignments += [f"{name} = {expr}" for name, expr in (extra_updates or {}).items()]
+        if assignments:
+            upsert += f" DO UPDATE SET {', '.join(assignments)}"
+        else:
+            upsert += " DO NOTHING"
+    if returning:
+        upsert += f" RETURNING {returning}"
+
+    result = BulkWriteResult(table=table)
+    start = time.perf_counter()
+    conn = vector_connection(session)
+
+    copy_sql = f"COPY {staging} ({column_list}) FROM STDIN (FORMAT BINARY)"
+
+    with conn.cursor() as cursor:
+        # Only the listed columns, without constraints or defaults; dropped at commit.
+        # Recreated per call because an earlier call in the transaction may have
+        # staged a different column list.
+        cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+
+        iterator = iter(rows)
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            cursor.execute(f"TRUNCATE {staging}")
+            with cursor.copy(copy_sql) as copy:
+                copy.set_types(types)
+                for row in chunk:
+                    copy.write_row(row)
+
+            cursor.execute(upsert)
+            if returning:
+                result.ids.extend(row[0] for row in cursor.fetchall())
+            result.rows += len(chunk)
+            result.chunks += 1
+
+    result.duration_seconds = time.perf_counter() - start
+    logger.info(str(result))
+    return result
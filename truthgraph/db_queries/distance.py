@@ -0,0 +1,161 @@
+"""Vector distance metrics shared by search queries and index DDL.
+
+pgvector can only use an ANN index when the ORDER BY operator matches the
+index operator class: ``<=>`` needs ``vector_cosine_ops``, ``<#>`` needs
+``vector_ip_ops`` and ``<->`` needs ``vector_l2_ops``. DistanceMetric keeps
+the operator, operator class, index name, similarity expression and
+threshold conversion together so every query and migration agrees.
+
+Similarity scores are reported on the cosine scale for all metrics. Stored
+embeddings are unit-normalized, so inner product equals cosine similarity and
+L2 distance d maps to cosine similarity as 1 - d^2 / 2.
+
+Configuration (environment):
+    VECTOR_DISTANCE_METRIC: cosine (default), inner_product, or l2
+
+Example:
+    >>> metric = DistanceMetric.COSINE
+    >>> metric.order_by_sql("emb.embedding", ":q")
+    '(emb.embedding <=> :q)'
+    >>> round(metric.max_distance(0.7), 2)
+    0.3
+"""
+
+import math
+import os
+from enum import Enum
+
+
+class DistanceMetric(str, Enum):
+    """Distance metric for pgvector similarity search."""
+
+    COSINE = "cosine"
+    INNER_PRODUCT = "inner_product"
+    L2 = "l2"
+
+    @property
+    def operator(self) -> str:
+        """pgvector distance operator (smaller is closer for all metrics)."""
+        return {
+            DistanceMetric.COSINE: "<=>",
+            DistanceMetric.INNER_PRODUCT: "<#>",
+            DistanceMetric.L2: "<->",
+        }[self]
+
+    @property
+    def opclass(self) -> str:
+        """Index operator class that supports this metric's operator."""
+        return {
+            DistanceMetric.COSINE: "vector_cosine_ops",
+            DistanceMetric.INNER_PRODUCT: "vector_ip_ops",
+            DistanceMetric.L2: "vector_l2_ops",
+        }[self]
+
+    @property
+    def index_suffix(self) -> str:
+        """Short name used in index names."""
+        return {
+            DistanceMetric.COSINE: "cosine",
+            DistanceMetric.INNER_PRODUCT: "ip",
+            DistanceMetric.L2: "l2",
+        }[self]
+
+    def distance_sql(self, column: str, query: str) -> str:
+        """SQL expression for the distance between column and query vector.
+
+        Args:
+            column: Vector column expression (e.g. "emb.embedding")
+            query: Query vector placeholder (e.g. ":embedding_vec" or "%(q)b")
+
+        Returns:
+            Parenthesized distance expression
+        """
+        return f"({column} {self.operator} {query})"
+
+    def order_by_sql(self, column: str, query: str) -> str:
+        """ORDER BY expression (ascending) that can be served by the index."""
+        return self.distance_sql(column, query)
+
+    def similarity_sql(self, column: str, query: str) -> str:
+        """SQL expression for cosine-scale similarity (1 = identical)."""
+        distance = self.distance_sql(column, query)
+        if self is DistanceMetric.COSINE:
+            return f"1 - {distance}"
+        if self is DistanceMetric.INNER_PRODUCT:
+            # <#> returns the negative inner product
+            return f"-1 * {distance}"
+        return f"1 - ({distance} * {distance}) / 2"
+
+    def max_distance(self, min_similarity: float) -> float:
+        """Convert a minimum similarity to the matching maximum distance.
+
+        Args:
+            min_similarity: Minimum cosine-scale similarity
+
+        Returns:
+            Distance threshold such that distance <= threshold
+            iff similarity >= min_similarity
+        """
+        if self is DistanceMetric.COSINE:
+            return 1.0 - min_similarity
+        if self is DistanceMetric.INNER_PRODUCT:
+            return -min_similarity
+        return math.sqrt(max(0.0, 2.0 * (1.0 - min_similarity)))
+
+    def index_name(self, table: str = "embeddings", method: str = "") -> str:
+        """Conventional vector index name for this metric.
+
+        Args:
+            table: Indexed table
+            method: Optional index method prefix (e.g. "hnsw")
+
+        Returns:
+            Index name such as idx_embeddings_vector_cosine
+        """
+        prefix = f"{method}_" if method else ""
+        return f"idx_{table}_vector_{prefix}{self.index_suffix}"
+
+    def create_ivfflat_index_sql(
+        self,
+        table: str = "embeddings",
+        column: str = "embedding",
+        lists: int = 100,
+        name: str | None = None,
+    ) -> str:
+        """DDL for an IVFFlat index that serves this metric.
+
+        Args:
+            table: Indexed table
+            column: Vector column
+            lists: Number of IVF lists (~sqrt(rows) is a good start)
+            name: Index name (defaults to index_name(table))
+
+        Returns:
+            CREATE INDEX IF NOT EXISTS statement
+        """
+        return (
+            f"CREATE INDEX IF NOT EXISTS {name or self.index_name(table)} "
+            f"ON {table} USING ivfflat ({column} {self.opclass}) WITH (lists = {lists})"
+        )
+
+    @classmethod
+    def parse(cls, value: "DistanceMetric | str") -> "DistanceMetric":
+        """Parse a metric name (case-insensitive; "ip" and "euclidean" accepted).
+
+        Raises:
+            ValueError: If the name is not a known metric
+        """
+        if isinstance(value, DistanceMetric):
+            return value
+        normalized = value.strip().lower()
+        aliases = {"ip": "inner_product", "dot": "inner_product", "euclidean": "l2"}
+        try:
+            return cls(aliases.get(normalized, normalized))
+        except ValueError as e:
+            valid = ", ".join(m.value for m in cls)
+            raise ValueError(f"Unknown distance metric '{value}' (expected one of: {valid})") from e
+
+
+def get_distance_metric() -> DistanceMetric:
+    """Get the configured distance metric (VECTOR_DISTANCE_METRIC, default cosine)."""
+    return DistanceMetric.parse(os.getenv("VECTOR_DISTANCE_METRIC", "cosine"))
@@ -40,9 +40,11 @@ WHERE credibility_score IS NOT NULL;
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_created_at
 ON evidence(created_at DESC);
 
--- Full-text search index for keyword search (if needed)
--- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_content_fts
--- ON evidence USING gin(to_tsvector('english', content));
+-- Full-text search index for keyword search on the generated content_tsv
+-- column (added by the evidence_content_tsv migration; queries must match on
+-- content_tsv, not on to_tsvector(content), to use it)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_content_tsv
+ON evidence USING gin(content_tsv);
 
 -- ============================================================================
 -- EMBEDDINGS TABLE INDEXES
@@ -60,6 +62,9 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_embeddings_tenant_entity_type
 ON embeddings(tenant_id, entity_type);
 
 -- IVFFlat vector index (created by migration, but including for reference)
+-- The operator class must match the query operator (see db_queries/distance.py):
+-- vector_cosine_ops <=>, vector_ip_ops <#>, vector_l2_ops <->.
+-- Otherwise the planner cannot use the index and falls back to a full scan.
 -- Optimal configuration from Feature 2.3:
 -- - lists = 50 for 10K corpus
 -- - probes = 10 for balanced accuracy/speed
@@ -73,6 +78,16 @@ ON embeddings(tenant_id, entity_type);
 --
 -- Set probes at session level:
 -- SET ivfflat.probes = 10;
+--
+-- HNSW alternative (VECTOR_INDEX_TYPE=hnsw, see db_queries/vector_index.py):
+-- no rebuild as the corpus grows; recall is tuned per query with ef_search.
+-- CREATE INDEX idx_embeddings_vector_hnsw_cosine
+-- ON embeddings
+-- USING hnsw (embedding vector_cosine_ops)
+-- WITH (m = 16, ef_construction = 64);
+--
+-- Set ef_search per transaction (must be >= LIMIT):
+-- SET LOCAL hnsw.ef_search = 100;
 
 -- Index for updated_at (monitoring and cleanup)
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_embeddings_updated_at
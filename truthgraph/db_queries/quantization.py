@@ -0,0 +1,307 @@
+"""Quantized shadow columns for two-stage vector search.
+
+A full ``vector(384)`` is 1.5 KB per row, so the ANN index and the buffer cache
+it needs grow quickly with the corpus. The embeddings table therefore carries
+two compact copies of every embedding:
+
+    embedding_half    halfvec(384): 16-bit floats, half the size, near-identical
+                      ranking
+    embedding_binary  bit(384): one sign bit per dimension (48 bytes), ranked by
+                      Hamming distance
+
+Each has its own HNSW index. A quantized search over-fetches
+``top_k * oversample`` candidates from the compact index (stage one) and
+re-ranks only those by the exact float32 distance on ``embedding`` (stage two),
+so the large column is read for a few dozen rows instead of being indexed.
+
+The columns and the BEFORE INSERT/UPDATE trigger that fills them are opt-in:
+the quantized_embeddings migration installs them only when
+VECTOR_SEARCH_QUANTIZATION is halfvec or binary, and
+install_quantized_columns() (``backfill_quantized_embeddings.py --install``)
+adds them to a database migrated without it. With the default (none) the
+schema has no shadow columns and embedding writes pay nothing extra. Existing
+rows are filled by backfill_quantized_embeddings(); rows that are not yet
+backfilled are invisible to quantized searches.
+
+Requires pgvector >= 0.7 on the server (halfvec, bit HNSW indexes and
+binary_quantize) once quantization is enabled.
+
+Configuration (environment):
+    VECTOR_SEARCH_QUANTIZATION: none (default), halfvec, or binary
+    VECTOR_RERANK_OVERSAMPLE: Stage-one candidates per requested result (default: 4)
+
+Example:
+    >>> VectorQuantization.BINARY.order_by_sql(DistanceMetric.COSINE, "emb", "%(q)b")
+    '(emb.embedding_binary <~> binary_quantize(%(q)b))'
+"""
+
+import logging
+import os
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .distance import DistanceMetric
+from .vector_index import HNSWParams
+
+logger = logging.getLogger(__name__)
+
+# Must match the Embedding.embedding column in truthgraph/schemas.py
+SHADOW_DIMENSION = 384
+
+SYNC_FUNCTION_NAME = "embeddings_sync_quantized"
+SYNC_TRIGGER_NAME = "trg_embeddings_sync_quantized"
+
+SYNC_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION {SYNC_FUNCTION_NAME}() RETURNS trigger AS $$
+BEGIN
+    NEW.embedding_half := NEW.embedding::halfvec({SHADOW_DIMENSION});
+    NEW.embedding_binary := binary_quantize(NEW.embedding)::bit({SHADOW_DIMENSION});
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SYNC_TRIGGER_SQL = (
+    f"CREATE TRIGGER {SYNC_TRIGGER_NAME} "
+    "BEFORE INSERT OR UPDATE OF embedding ON embeddings "
+    f"FOR EACH ROW EXECUTE FUNCTION {SYNC_FUNCTION_NAME}()"
+)
+
+ADD_COLUMNS_SQL = (
+    "ALTER TABLE embeddings "
+    f"ADD COLUMN IF NOT EXISTS embedding_half halfvec({SHADOW_DIMENSION}), "
+    f"ADD COLUMN IF NOT EXISTS embedding_binary bit({SHADOW_DIMENSION})"
+)
+
+# Statements that add the shadow columns and their sync trigger, in order
+INSTALL_SQL: tuple[str, ...] = (
+    ADD_COLUMNS_SQL,
+    SYNC_FUNCTION_SQL,
+    f"DROP TRIGGER IF EXISTS {SYNC_TRIGGER_NAME} ON embeddings",
+    SYNC_TRIGGER_SQL,
+)
+
+# Statements that remove them again (indexes on the columns go with them)
+UNINSTALL_SQL: tuple[str, ...] = (
+    f"DROP TRIGGER IF EXISTS {SYNC_TRIGGER_NAME} ON embeddings",
+    f"DROP FUNCTION IF EXISTS {SYNC_FUNCTION_NAME}()",
+    "ALTER TABLE embeddings DROP COLUMN IF EXISTS embedding_binary, "
+    "DROP COLUMN IF EXISTS embedding_half",
+)
+
+DEFAULT_RERANK_OVERSAMPLE = 4
+
+
+class VectorQuantization(str, Enum):
+    """Which embedding representation stage one of a search ranks by."""
+
+    NONE = "none"
+    HALFVEC = "halfvec"
+    BINARY = "binary"
+
+    @property
+    def column(self) -> str:
+        """Embeddings column holding this representation."""
+        return {
+            VectorQuantization.NONE: "embedding",
+            VectorQuantization.HALFVEC: "embedding_half",
+            VectorQuantization.BINARY: "embedding_binary",
+        }[self]
+
+    def opclass(self, metric: DistanceMetric) -> str:
+        """Index operator class for this representation.
+
+        halfvec keeps the metric (halfvec_cosine_ops, ...); bit vectors are
+        always compared by Hamming distance.
+        """
+        if self is VectorQuantization.BINARY:
+            return "bit_hamming_ops"
+        if self is VectorQuantization.HALFVEC:
+            return metric.opclass.replace("vector_", "halfvec_")
+        return metric.opclass
+
+    def index_name(self, metric: DistanceMetric, table: str = "embeddings") -> str:
+        """Name of the HNSW index on this representation.
+
+        Args:
+            metric: Distance metric (ignored for binary, which uses Hamming)
+            table: Indexed table
+
+        Returns:
+            Index name such as idx_embeddings_halfvec_hnsw_cosine
+        """
+        if self is VectorQuantization.NONE:
+            return metric.index_name(table, "hnsw")
+        suffix = "hamming" if self is VectorQuantization.BINARY else metric.index_suffix
+        return f"idx_{table}_{self.value}_hnsw_{suffix}"
+
+    def index_sql(
+        self,
+        metric: DistanceMetric,
+        params: Optional[HNSWParams] = None,
+        table: str = "embeddings",
+    ) -> str:
+        """DDL for the HNSW index that serves stage one.
+
+        Args:
+            metric: Distance metric of the service
+            params: HNSW build parameters (default: HNSW_M / HNSW_EF_CONSTRUCTION)
+            table: Indexed table
+
+        Returns:
+            CREATE INDEX IF NOT EXISTS statement
+        """
+        return (params or HNSWParams.from_env()).index_sql(
+            metric,
+            table=table,
+            column=self.column,
+            name=self.index_name(metric, table),
+            opclass=self.opclass(metric),
+        )
+
+    def order_by_sql(self, metric: DistanceMetric, alias: str, query: str) -> str:
+        """Stage-one ORDER BY expression that the compact index can serve.
+
+        Args:
+            metric: Distance metric of the service
+            alias: Embeddings table alias (e.g. "emb")
+            query: Full-precision query vector placeholder (e.g. "%(query_vector)b")
+
+        Returns:
+            Parenthesized distance expression on the compact column
+        """
+        column = f"{alias}.{self.column}"
+        if self is VectorQuantization.BINARY:
+            return f"({column} <~> binary_quantize({query}))"
+        if self is VectorQuantization.HALFVEC:
+            return metric.order_by_sql(column, f"{query}::halfvec")
+        return metric.order_by_sql(column, query)
+
+    @classmethod
+    def parse(cls, value: "VectorQuantization | str") -> "VectorQuantization":
+        """Parse a quantization name (case-insensitive; "half" and "bit" accepted).
+
+        Raises:
+            ValueError: If the name is not a known quantization
+        """
+        if isinstance(value, VectorQuantization):
+            return value
+        normalized = value.strip().lower()
+        aliases = {"": "none", "full": "none", "half": "halfvec", "bit": "binary"}
+        try:
+            return cls(aliases.get(normalized, normalized))
+        except ValueError as e:
+            valid = ", ".join(q.value for q in cls)
+            raise ValueError(
+                f"Unknown vector quantization '{value}' (expected one of: {valid})"
+            ) from e
+
+
+def get_vector_quantization() -> VectorQuantization:
+    """Get the configured search quantization (VECTOR_SEARCH_QUANTIZATION, default none)."""
+    return VectorQuantization.parse(os.getenv("VECTOR_SEARCH_QUANTIZATION", "none"))
+
+
+def quantized_columns_enabled() -> bool:
+    """Whether the configured quantization needs the shadow columns and trigger."""
+    return get_vector_quantization() is not VectorQuantization.NONE
+
+
+def install_quantized_columns(db: Session) -> None:
+    """Add the shadow columns and their sync trigger to the embeddings table.
+
+    Idempotent. Adding nullable columns does not rewrite the table; run
+    backfill_quantized_embeddings() afterwards for the existing rows.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Raises:
+        RuntimeError: If the DDL fails (e.g. pgvector older than 0.7)
+    """
+    try:
+        for statement in INSTALL_SQL:
+            db.execute(text(statement))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise RuntimeError(f"Installing quantized embedding columns failed: {e}") from e
+    logger.info("Installed quantized embedding columns and sync trigger")
+
+
+def validate_rerank_oversample(oversample: int) -> int:
+    """Check a stage-one oversampling factor.
+
+    Raises:
+        ValueError: If the factor is below 1
+    """
+    if oversample < 1:
+        raise ValueError(f"Re-rank oversample must be >= 1, got {oversample}")
+    return oversample
+
+
+def get_rerank_oversample() -> int:
+    """Get the stage-one oversampling factor (VECTOR_RERANK_OVERSAMPLE, default 4)."""
+    return validate_rerank_oversample(
+        int(os.getenv("VECTOR_RERANK_OVERSAMPLE", str(DEFAULT_RERANK_OVERSAMPLE)))
+    )
+
+
+def backfill_quantized_embeddings(
+    db: Session,
+    batch_size: int = 5000,
+    tenant_id: Optional[str] = None,
+) -> int:
+    """Fill the shadow columns of rows written before the sync trigger existed.
+
+    Works in committed batches so it can run against a live table; rows locked
+    by concurrent writers are skipped and picked up by a later batch (or by the
+    trigger, if the writer changes the embedding).
+
+    Args:
+        db: SQLAlchemy database session
+        batch_size: Rows updated per transaction
+        tenant_id: Only backfill this tenant (default: all tenants)
+
+    Returns:
+        Number of rows updated
+
+    Raises:
+        ValueError: If batch_size is not positive
+        RuntimeError: If an update fails
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    tenant_clause = "AND tenant_id = :tenant_id" if tenant_id is not None else ""
+    statement = text(
+        f"""
+        UPDATE embeddings
+        SET embedding_half = embedding::halfvec({SHADOW_DIMENSION}),
+            embedding_binary = binary_quantize(embedding)::bit({SHADOW_DIMENSION})
+        WHERE id IN (
+            SELECT id FROM embeddings
+            WHERE (embedding_half IS NULL OR embedding_binary IS NULL) {tenant_clause}
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        """
+    )
+    params = {"batch_size": batch_size, "tenant_id": tenant_id}
+
+    total = 0
+    while True:
+        try:
+            updated = db.execute(statement, params).rowcount
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise RuntimeError(f"Quantized embedding backfill failed: {e}") from e
+        total += updated
+        if updated:
+            logger.info(f"Backfilled quantized embeddings for {total} rows")
+        if updated < batch_size:
+            return total
@@ -24,11 +24,16 @@ Usage:
 import logging
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from .distance import DistanceMetric, get_distance_metric
+from .vector_adapter import as_float32_vector, register_vector_adapter
+from .vector_index import HNSWParams, VectorIndexType, get_vector_index_type, validate_ef_search
+
 logger = logging.getLogger(__name__)
 
 
@@ -316,17 +321,20 @@ class QueryBuilder:
 
     def build_similarity_search_query(
         self,
-        embedding: List[float],
+        embedding: Union[List[float], np.ndarray],
         entity_type: str = "evidence",
         tenant_id: str = "default",
         top_k: int = 20,
         min_similarity: float = 0.0,
         filters: Optional[Dict[str, Any]] = None,
+        metric: Optional[Union[DistanceMetric, str]] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """Build optimized similarity search query.
 
         Constructs a parameterized query for vector similarity search
-        with optional filters.
+        with optional filters. The ORDER BY uses the metric's operator so it
+        can be served by an index built with the matching operator class.
+        The embedding is bound as a float32 array (binary pgvector parameter).
 
         Args:
             embedding: Query embedding vector
@@ -335,6 +343,7 @@ class QueryBuilder:
             top_k: Maximum results
             min_similarity: Minimum similarity threshold
             filters: Additional filters (e.g., source_url)
+            metric: Distance metric (defaults to VECTOR_DISTANCE_METRIC, cosine)
 
         Returns:
             Tuple of (query_string, parameters)
@@ -347,16 +356,17 @@ class QueryBuilder:
             >>> results = session.execute(text(query), params).fetchall()
         """
         filters = filters or {}
-        embedding_array = "[" + ",".join(str(x) for x in embedding) + "]"
+        metric = get_distance_metric() if metric is None else DistanceMetric.parse(metric)
+        register_vector_adapter(self.session.connection().connection.dbapi_connection)
 
         # Base query
         query_parts = [
-            """
+            f"""
             SELECT
                 e.id,
                 e.content,
                 e.source_url,
-                1 - (emb.embedding <-> :embedding_vec::vector) AS similarity
+                {metric.similarity_sql("emb.embedding", ":embedding_vec")} AS similarity
             FROM evidence e
             JOIN embeddings emb
                 ON e.id = emb.entity_id
@@ -366,7 +376,7 @@ class QueryBuilder:
         ]
 
         params: Dict[str, Any] = {
-            "embedding_vec": embedding_array,
+            "embedding_vec": as_float32_vector(embedding),
             "entity_type": entity_type,
             "tenant_id": tenant_id,
             "min_similarity": min_similarity,
@@ -375,9 +385,9 @@ class QueryBuilder:
 
         # Add similarity filter
         if min_similarity > 0:
-            max_distance = 1.0 - min_similarity
+            max_distance = metric.max_distance(min_similarity)
             query_parts.append(
-                "    AND (emb.embedding <-> :embedding_vec::vector) <= :max_distance"
+                f"    AND {metric.distance_sql('emb.embedding', ':embedding_vec')} <= :max_distance"
             )
             params["max_distance"] = max_distance
 
@@ -391,8 +401,8 @@ class QueryBuilder:
                 params[f"filter_{key}"] = value
 
         # Add ordering and limit
-        query_parts.append("""
-            ORDER BY emb.embedding <-> :embedding_vec::vector ASC
+        query_parts.append(f"""
+            ORDER BY {metric.order_by_sql("emb.embedding", ":embedding_vec")} ASC
             LIMIT :top_k
         """)
 
@@ -418,6 +428,80 @@ class QueryBuilder:
         except Exception as e:
             logger.error(f"Failed to set ivfflat.probes: {e}")
 
+    def set_hnsw_ef_search(self, ef_search: int) -> None:
+        """Set HNSW ef_search parameter for session.
+
+        Higher ef_search = better recall but slower. Must be >= the LIMIT of
+        the search. For per-transaction settings use the ef_search argument of
+        VectorSearchService.search_similar_evidence instead.
+
+        Args:
+            ef_search: Candidate list size (1-1000)
+
+        Raises:
+            ValueError: If ef_search is out of range
+
+        Example:
+            >>> builder.set_hnsw_ef_search(100)
+            >>> # Subsequent vector searches keep 100 candidates
+        """
+        validate_ef_search(ef_search)
+        try:
+            self.session.execute(text(f"SET hnsw.ef_search = {ef_search}"))
+            logger.info(f"Set hnsw.ef_search to {ef_search}")
+        except Exception as e:
+            logger.error(f"Failed to set hnsw.ef_search: {e}")
+
+    def create_vector_index(
+        self,
+        metric: Optional[Union[DistanceMetric, str]] = None,
+        lists: int = 100,
+        table: str = "embeddings",
+        index_type: Optional[Union[VectorIndexType, str]] = None,
+        hnsw_params: Optional[HNSWParams] = None,
+    ) -> str:
+        """Create the vector index that serves a distance metric.
+
+        Vector search only uses an index whose operator class matches the
+        query operator, so the index must be rebuilt when
+        VECTOR_DISTANCE_METRIC changes.
+
+        Args:
+            metric: Distance metric (defaults to VECTOR_DISTANCE_METRIC, cosine)
+            lists: Number of IVF lists (~sqrt(rows)); IVFFlat only
+            table: Table holding the embedding column
+            index_type: ivfflat or hnsw (defaults to VECTOR_INDEX_TYPE, ivfflat)
+            hnsw_params: HNSW build parameters (defaults to HNSW_M and
+                HNSW_EF_CONSTRUCTION); HNSW only
+
+        Returns:
+            Name of the index
+
+        Example:
+            >>> builder.create_vector_index("cosine", lists=50)
+            'idx_embeddings_vector_cosine'
+            >>> builder.create_vector_index("cosine", index_type="hnsw")
+            'idx_embeddings_vector_hnsw_cosine'
+        """
+        metric = get_distance_metric() if metric is None else DistanceMetric.parse(metric)
+        index_type = (
+            get_vector_index_type() if index_type is None else VectorIndexType.parse(index_type)
+        )
+
+        if index_type is VectorIndexType.HNSW:
+            params = hnsw_params or HNSWParams.from_env()
+            index_name = metric.index_name(table, "hnsw")
+            self.session.execute(text(params.index_sql(metric, table=table)))
+            logger.info(
+                f"Ensured {metric.opclass} HNSW index {index_name} "
+                f"(m={params.m}, ef_construction={params.ef_construction})"
+            )
+            return index_name
+
+        self.session.execute(text(metric.create_ivfflat_index_sql(table=table, lists=lists)))
+        logger.info(f"Ensured {metric.opclass} IVFFlat index {metric.index_name(table)}")
+        return metric.index_name(table)
+
     def get_connection_pool_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics.
 
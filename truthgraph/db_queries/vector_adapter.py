@@ -0,0 +1,118 @@
+"""Binary pgvector parameters for float32 embeddings.
+
+Embeddings leave the model as float32 numpy arrays. Formatting them into a
+``'[0.1,0.2,...]'::vector`` literal costs a Python float per element, a string
+per vector, and a text parse on the server. This module keeps them as float32
+buffers and binds them as query parameters using pgvector's binary psycopg
+adapter, so a vector crosses the wire as 4 bytes per dimension.
+
+Usage:
+    conn = vector_connection(session)          # raw psycopg connection
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT id FROM embeddings ORDER BY embedding <-> %(q)b LIMIT 10",
+            {"q": as_float32_vector(query_embedding)},
+        )
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import psycopg
+from pgvector.psycopg import register_vector
+from psycopg.adapt import PyFormat
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def as_float32_vector(
+    embedding: Sequence[float] | np.ndarray,
+    dimension: int | None = None,
+) -> np.ndarray:
+    """Return an embedding as a contiguous 1-D float32 array.
+
+    Float32 contiguous arrays are returned as-is (no copy); lists and other
+    dtypes are converted once.
+
+    Args:
+        embedding: Embedding vector (list of floats or numpy array)
+        dimension: Expected number of dimensions, if it should be checked
+
+    Returns:
+        1-D float32 C-contiguous array
+
+    Raises:
+        ValueError: If the embedding is not 1-D or has the wrong dimension
+    """
+    array = np.ascontiguousarray(embedding, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Embedding must be 1-dimensional, got shape {array.shape}")
+    if dimension is not None and array.shape[0] != dimension:
+        raise ValueError(f"Embedding must be {dimension}-dimensional, got {array.shape[0]}")
+    return array
+
+
+def as_float32_matrix(
+    embeddings: Sequence[Sequence[float]] | np.ndarray,
+    dimension: int | None = None,
+) -> np.ndarray:
+    """Return a batch of embeddings as a contiguous 2-D float32 array.
+
+    Rows of the result are views, so binding ``matrix[i]`` as a parameter
+    does not copy the row.
+
+    Args:
+        embeddings: Embeddings (list of vectors or 2-D numpy array)
+        dimension: Expected number of dimensions, if it should be checked
+
+    Returns:
+        2-D float32 C-contiguous array of shape (n, dimension)
+
+    Raises:
+        ValueError: If the input is not 2-D or has the wrong dimension
+    """
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"Embeddings must be 2-dimensional, got shape {matrix.shape}")
+    if dimension is not None and matrix.shape[1] != dimension:
+        raise ValueError(f"Embeddings must be {dimension}-dimensional, got {matrix.shape[1]}")
+    return matrix
+
+
+def register_vector_adapter(dbapi_connection: Any) -> None:
+    """Register pgvector's psycopg adapters on a connection if needed.
+
+    Safe to call repeatedly: registration (which looks up the vector type
+    OIDs) only happens the first time for a given connection.
+
+    Args:
+        dbapi_connection: Raw psycopg connection
+
+    Raises:
+        psycopg.ProgrammingError: If the vector extension is not installed
+    """
+    try:
+        dbapi_connection.adapters.get_dumper(np.ndarray, PyFormat.BINARY)
+        return
+    except psycopg.ProgrammingError:
+        pass
+
+    register_vector(dbapi_connection)
+    logger.debug("Registered pgvector binary adapters on connection")
+
+
+def vector_connection(session: Session) -> Any:
+    """Get the session's raw psycopg connection with vector adapters registered.
+
+    Args:
+        session: SQLAlchemy session bound to a psycopg engine
+
+    Returns:
+        The underlying DBAPI connection, ready to bind float32 ndarrays
+    """
+    fairy = session.connection().connection
+    register_vector_adapter(fairy.dbapi_connection)
+    return fairy
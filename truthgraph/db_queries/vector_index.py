@@ -0,0 +1,195 @@
+"""Vector index types (IVFFlat, HNSW) and their build and search parameters.
+
+IVFFlat partitions vectors into ``lists`` clusters at build time and scans
+``ivfflat.probes`` of them per query. Its recall depends on the clusters
+staying representative, so it needs rebuilding as the corpus grows, and recall
+drops sharply at low probe counts.
+
+HNSW builds a layered proximity graph (``m`` links per node, ``ef_construction``
+candidates while inserting). It has no training step, so it can be built on an
+empty table and stays accurate as rows are added. The recall/latency tradeoff
+is made per query with ``hnsw.ef_search``, the size of the candidate list kept
+while walking the graph. VectorSearchService applies it per transaction with
+``set_config(..., is_local => true)``, so one tenant or request can ask for
+higher recall without affecting other sessions on the pooled connection.
+
+Configuration (environment):
+    VECTOR_INDEX_TYPE: ivfflat (default) or hnsw
+    HNSW_M: Links per graph node (default: 16)
+    HNSW_EF_CONSTRUCTION: Build-time candidate list size (default: 64)
+    HNSW_EF_SEARCH: Default query-time candidate list size (unset: server default, 40)
+
+Example:
+    >>> params = HNSWParams(m=16, ef_construction=64)
+    >>> params.index_sql(DistanceMetric.COSINE)  # doctest: +ELLIPSIS
+    'CREATE INDEX IF NOT EXISTS idx_embeddings_vector_hnsw_cosine ON embeddings USING hnsw ...'
+"""
+
+import os
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+from .distance import DistanceMetric
+
+# pgvector limits for HNSW parameters
+HNSW_M_RANGE = (2, 100)
+HNSW_EF_CONSTRUCTION_RANGE = (4, 1000)
+HNSW_EF_SEARCH_RANGE = (1, 1000)
+
+
+class VectorIndexType(str, Enum):
+    """Approximate nearest neighbor index method."""
+
+    IVFFLAT = "ivfflat"
+    HNSW = "hnsw"
+
+    @classmethod
+    def parse(cls, value: "VectorIndexType | str") -> "VectorIndexType":
+        """Parse an index type name (case-insensitive).
+
+        Raises:
+            ValueError: If the name is not a known index type
+        """
+        if isinstance(value, VectorIndexType):
+            return value
+        try:
+            return cls(value.strip().lower())
+        except ValueError as e:
+            valid = ", ".join(t.value for t in cls)
+            raise ValueError(
+                f"Unknown vector index type '{value}' (expected one of: {valid})"
+            ) from e
+
+
+@dataclass(frozen=True)
+class HNSWParams:
+    """HNSW build parameters.
+
+    Attributes:
+        m: Max links per node per layer; higher improves recall and memory use
+        ef_construction: Candidate list size while building; higher improves
+            graph quality and build time (must be >= 2 * m)
+    """
+
+    m: int = 16
+    ef_construction: int = 64
+
+    def __post_init__(self) -> None:
+        """Validate against pgvector's limits."""
+        if not HNSW_M_RANGE[0] <= self.m <= HNSW_M_RANGE[1]:
+            raise ValueError(f"HNSW m must be between {HNSW_M_RANGE[0]} and {HNSW_M_RANGE[1]}")
+        low, high = HNSW_EF_CONSTRUCTION_RANGE
+        if not low <= self.ef_construction <= high:
+            raise ValueError(f"HNSW ef_construction must be between {low} and {high}")
+        if self.ef_construction < 2 * self.m:
+            raise ValueError(
+                f"HNSW ef_construction ({self.ef_construction}) must be >= 2 * m ({2 * self.m})"
+            )
+
+    @classmethod
+    def from_env(cls) -> "HNSWParams":
+        """Build parameters from HNSW_M and HNSW_EF_CONSTRUCTION."""
+        return cls(
+            m=int(os.getenv("HNSW_M", "16")),
+            ef_construction=int(os.getenv("HNSW_EF_CONSTRUCTION", "64")),
+        )
+
+    def index_sql(
+        self,
+        metric: DistanceMetric,
+        table: str = "embeddings",
+        column: str = "embedding",
+        name: Optional[str] = None,
+        opclass: Optional[str] = None,
+    ) -> str:
+        """DDL for an HNSW index that serves a distance metric.
+
+        Args:
+            metric: Distance metric the index must serve
+            table: Indexed table
+            column: Vector column
+            name: Index name (defaults to metric.index_name(table, "hnsw"))
+            opclass: Operator class (defaults to metric.opclass; halfvec and
+                bit columns need their own, see db_queries.quantization)
+
+        Returns:
+            CREATE INDEX IF NOT EXISTS statement
+        """
+        return (
+            f"CREATE INDEX IF NOT EXISTS {name or metric.index_name(table, 'hnsw')} "
+            f"ON {table} USING hnsw ({column} {opclass or metric.opclass}) "
+            f"WITH (m = {self.m}, ef_construction = {self.ef_construction})"
+        )
+
+
+def get_vector_index_type() -> VectorIndexType:
+    """Get the configured index type (VECTOR_INDEX_TYPE, default ivfflat)."""
+    return VectorIndexType.parse(os.getenv("VECTOR_INDEX_TYPE", "ivfflat"))
+
+
+def validate_ef_search(ef_search: int) -> int:
+    """Check an hnsw.ef_search value against pgvector's limits.
+
+    Args:
+        ef_search: Candidate list size
+
+    Returns:
+        The value, unchanged
+
+    Raises:
+        ValueError: If the value is out of range
+    """
+    low, high = HNSW_EF_SEARCH_RANGE
+    if not low <= ef_search <= high:
+        raise ValueError(f"hnsw.ef_search must be between {low} and {high}, got {ef_search}")
+    return ef_search
+
+
+def get_default_ef_search() -> Optional[int]:
+    """Get HNSW_EF_SEARCH, or None to keep the server setting."""
+    value = os.getenv("HNSW_EF_SEARCH")
+    return validate_ef_search(int(value)) if value else None
+
+
+def set_local_ef_search(cursor: Any, ef_search: int) -> None:
+    """Set hnsw.ef_search for the current transaction only.
+
+    Uses set_config(..., true), the parameterizable form of SET LOCAL, so the
+    value reverts at commit/rollback and never leaks to other users of a
+    pooled connection.
+
+    Args:
+        cursor: psycopg cursor inside the search transaction
+        ef_search: Candidate list size
+    """
+    cursor.execute(
+        "SELECT set_config('hnsw.ef_search', %(ef_search)s, true)",
+        {"ef_search": str(validate_ef_search(ef_search))},
+    )
+
+
+# Connection.info flag: hnsw.ef_search may still hold a transaction-local value
+_LOCAL_EF_SEARCH_FLAG = "truthgraph.local_ef_search"
+
+
+def apply_local_ef_search(connection: Any, cursor: Any, ef_search: Optional[int]) -> None:
+    """Apply a search's hnsw.ef_search, restoring the default when it has none.
+
+    A value set with set_local_ef_search lasts until the transaction ends, so a
+    later search in the same transaction that wants the server setting would
+    otherwise inherit it. When ef_search is None and this connection may carry
+    a local value, it is reset with SET LOCAL ... TO DEFAULT; connections that
+    never had one set pay no extra round trip.
+
+    Args:
+        connection: Pooled connection (SQLAlchemy connection fairy) whose
+            ``info`` dict outlives the cursor
+        cursor: psycopg cursor inside the search transaction
+        ef_search: Candidate list size, or None for the server setting
+    """
+    if ef_search is not None:
+        set_local_ef_search(cursor, ef_search)
+        connection.info[_LOCAL_EF_SEARCH_FLAG] = True
+    elif connection.info.pop(_LOCAL_EF_SEARCH_FLAG, False):
+        cursor.execute("SET LOCAL hnsw.ef_search TO DEFAULT")
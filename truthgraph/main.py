@@ -61,6 +61,7 @@ async def lifespan(app: FastAPI):
         from truthgraph.monitoring.collectors.docker_stats import DockerStatsCollector
         from truthgraph.monitoring.collectors.worker_stats import WorkerStatsCollector
         from truthgraph.monitoring.collectors.process_stats import ProcessStatsCollector
+        from truthgraph.monitoring.collectors.cache_stats import CacheStatsCollector
 
         # Initialize metrics collector
         collector = get_metrics_collector()
@@ -71,6 +72,7 @@ async def lifespan(app: FastAPI):
         docker_collector = DockerStatsCollector(collector)
         worker_collector = WorkerStatsCollector(collector)
         process_collector = ProcessStatsCollector(collector)
+        cache_collector = CacheStatsCollector(collector)
 
         # Create background task for specialized metrics collection
         async def collect_specialized_metrics():
@@ -81,6 +83,7 @@ async def lifespan(app: FastAPI):
                     await docker_collector.collect_stats()
                     await worker_collector.collect_stats()
                     await process_collector.collect_stats()
+                    await cache_collector.collect_stats()
                 except Exception as e:
                     logger.error(f"Error in specialized metrics collection: {e}", exc_info=True)
 
@@ -120,6 +123,34 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping metrics collection: {e}", exc_info=True)
 
+    # Stop the staged verification pipeline before the NLI scheduler its stages use
+    # (fails any still-queued claims)
+    try:
+        from truthgraph.services.staged_verification_pipeline import StagedVerificationPipeline
+
+        if StagedVerificationPipeline._instance is not None:
+            await StagedVerificationPipeline._instance.stop()
+    except Exception as e:
+        logger.error(f"Error stopping staged verification pipeline: {e}", exc_info=True)
+
+    # Stop the embedding micro-batcher (fails any still-queued requests)
+    try:
+        from truthgraph.services.ml.embedding_batcher import EmbeddingMicroBatcher
+
+        if EmbeddingMicroBatcher._instance is not None:
+            await EmbeddingMicroBatcher._instance.stop()
+    except Exception as e:
+        logger.error(f"Error stopping embedding micro-batcher: {e}", exc_info=True)
+
+    # Stop the shared NLI scheduler
+    try:
+        from truthgraph.services.ml.nli_scheduler import NLIBatchScheduler
+
+        if NLIBatchScheduler._instance is not None:
+            await NLIBatchScheduler._instance.stop()
+    except Exception as e:
+        logger.error(f"Error stopping NLI scheduler: {e}", exc_info=True)
+
     # Stop background workers gracefully
     try:
         from truthgraph.workers.task_queue import get_task_queue
@@ -130,6 +161,25 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping background workers: {e}", exc_info=True)
 
+    # Write queued verification results once nothing can submit more
+    try:
+        from truthgraph.services.verification_result_persister import (
+            VerificationResultPersister,
+        )
+
+        if VerificationResultPersister._instance is not None:
+            await VerificationResultPersister._instance.stop()
+    except Exception as e:
+        logger.error(f"Error flushing verification result persister: {e}", exc_info=True)
+
+    # Shut down the model inference thread pool once nothing can submit to it
+    try:
+        from truthgraph.services.ml.inference_executor import shutdown_inference_executor
+
+        shutdown_inference_executor(wait=False)
+    except Exception as e:
+        logger.error(f"Error shutting down inference executor: {e}", exc_info=True)
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -161,6 +211,7 @@ app = FastAPI(
 
     **Endpoint Limits:**
     - `/api/v1/verify`: 5 requests/minute (full verification pipeline)
+    - `/api/v1/verify/batch`: 2 requests/minute (batched verification, up to 100 claims)
     - `/api/v1/embed`: 10 requests/minute (embedding generation)
     - `/api/v1/search`: 20 requests/minute (search operations)
     - `/api/v1/nli`: 10 requests/minute (NLI inference)
@@ -382,6 +433,7 @@ def root():
         "rate_limits": "/rate-limit-stats",
         "endpoints": {
             "verify": "/api/v1/verify",
+            "verify_batch": "/api/v1/verify/batch",
             "embed": "/api/v1/embed",
             "search": "/api/v1/search",
             "nli": "/api/v1/nli",
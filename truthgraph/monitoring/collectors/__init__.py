@@ -5,11 +5,13 @@ various system components:
 - docker_stats: Docker container resource monitoring
 - worker_stats: Worker pool and task queue metrics
 - process_stats: Database, CPU, memory, and event loop health
+- cache_stats: Verification result and semantic claim cache hit ratio, size, and evictions
 
 All collectors use asyncio.to_thread() for blocking operations to avoid
 blocking the FastAPI event loop.
 """
 
+from truthgraph.monitoring.collectors.cache_stats import CacheStatsCollector
 from truthgraph.monitoring.collectors.docker_stats import DockerStatsCollector
 from truthgraph.monitoring.collectors.process_stats import ProcessStatsCollector
 from truthgraph.monitoring.collectors.worker_stats import WorkerStatsCollector
@@ -18,4 +20,5 @@ __all__ = [
     "DockerStatsCollector",
     "WorkerStatsCollector",
     "ProcessStatsCollector",
+    "CacheStatsCollector",
 ]
@@ -0,0 +1,126 @@
+"""Verification result cache statistics collector.
+
+Exports hit ratio, size and evictions of the process-wide VerificationCache,
+and hit ratio and size of the SemanticClaimCache when it is in use.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStatsCollector:
+    """Collects metrics from the verification result cache.
+
+    Metrics collected:
+    - cache.verification.hit_ratio (gauge): Hits / lookups since startup
+    - cache.verification.entries (gauge): Entries currently cached
+    - cache.verification.bytes (gauge): Bytes counted against the budget
+    - cache.verification.max_bytes (gauge): Configured byte budget
+    - cache.verification.hits (counter): Lookups answered from the cache
+    - cache.verification.misses (counter): Lookups not in the cache
+    - cache.verification.evictions (counter): Entries dropped for TTL or budget
+    - cache.semantic.hit_ratio (gauge): Near-duplicate hits / lookups since startup
+    - cache.semantic.entries (gauge): Live near-duplicate entries
+    - cache.semantic.hits / misses (counter): Near-duplicate lookups answered / not
+    - cache.semantic.stale (counter): Lookups that found the evidence corpus changed
+
+    Attributes:
+        metrics_collector: MetricsCollector instance for recording metrics
+        cache: VerificationCache to monitor (optional, lazy-loaded)
+
+    Example:
+        >>> collector = CacheStatsCollector(metrics_collector)
+        >>> await collector.collect_stats()
+    """
+
+    def __init__(self, metrics_collector: Any, cache: Any | None = None):
+        """Initialize cache stats collector.
+
+        Args:
+            metrics_collector: MetricsCollector instance for recording metrics
+            cache: Optional VerificationCache (defaults to the process-wide instance)
+        """
+        self.metrics_collector = metrics_collector
+        self._cache = cache
+        self._last_counts = {"hits": 0, "misses": 0, "evictions": 0}
+        self._last_semantic_counts = {"hits": 0, "misses": 0, "stale": 0}
+
+    def _get_cache(self) -> Any | None:
+        """Get or lazy-load the VerificationCache instance.
+
+        Returns:
+            VerificationCache instance or None if not available.
+        """
+        if self._cache is None:
+            try:
+                from truthgraph.services.verification_cache import VerificationCache
+
+                self._cache = VerificationCache.get_instance()
+            except Exception as e:
+                logger.warning(f"Verification cache not available: {e}")
+                return None
+
+        return self._cache
+
+    async def collect_stats(self) -> None:
+        """Collect verification cache statistics.
+
+        Counters are advanced by the change since the previous collection.
+        """
+        cache = self._get_cache()
+        if cache is None:
+            return
+
+        try:
+            # The disk backend queries SQLite for its size
+            stats = await asyncio.to_thread(cache.get_stats)
+
+            await self.metrics_collector.set_gauge(
+                "cache.verification.hit_ratio", round(stats["hit_ratio"], 4)
+            )
+            await self.metrics_collector.set_gauge("cache.verification.entries", stats["entries"])
+            await self.metrics_collector.set_gauge("cache.verification.bytes", stats["bytes"])
+            await self.metrics_collector.set_gauge(
+                "cache.verification.max_bytes", stats["max_bytes"]
+            )
+
+            for name, last in self._last_counts.items():
+                delta = stats[name] - last
+                if delta > 0:
+                    await self.metrics_collector.increment_counter(
+                        f"cache.verification.{name}", delta
+                    )
+                self._last_counts[name] = stats[name]
+
+        except Exception as e:
+            logger.error(f"Error collecting verification cache stats: {e}", exc_info=True)
+
+        await self._collect_semantic_stats()
+
+    async def _collect_semantic_stats(self) -> None:
+        """Collect SemanticClaimCache statistics, if the cache has been created."""
+        from truthgraph.services.semantic_claim_cache import SemanticClaimCache
+
+        semantic_cache = SemanticClaimCache._instance
+        if semantic_cache is None:
+            return
+
+        try:
+            stats = semantic_cache.get_stats()
+
+            await self.metrics_collector.set_gauge(
+                "cache.semantic.hit_ratio", round(stats["hit_ratio"], 4)
+            )
+            await self.metrics_collector.set_gauge("cache.semantic.entries", stats["entries"])
+
+            for name, last in self._last_semantic_counts.items():
+                delta = stats[name] - last
+                if delta > 0:
+                    await self.metrics_collector.increment_counter(f"cache.semantic.{name}", delta)
+                self._last_semantic_counts[name] = stats[name]
+
+        except Exception as e:
+            logger.error(f"Error collecting semantic cache stats: {e}", exc_info=True)
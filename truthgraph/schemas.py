@@ -6,7 +6,9 @@ from datetime import UTC, datetime
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    DDL,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -15,11 +17,13 @@ from sqlalchemy import (
     String,
     Text,
     TypeDecorator,
+    event,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from .db import Base
+from .db_queries.quantization import INSTALL_SQL, quantized_columns_enabled
 
 
 def utc_now():
@@ -94,7 +98,16 @@ class Evidence(Base):
     source_type = Column(String(50), nullable=True)
     created_at = Column(DateTime, default=utc_now, nullable=False)
 
-    __table_args__ = (Index("idx_evidence_created_at", created_at.desc()),)
+    # Full-text search vector, maintained by Postgres (keyword branch of hybrid search).
+    # Deferred so ORM loads of evidence do not carry it.
+    content_tsv = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+    )
+
+    __table_args__ = (
+        Index("idx_evidence_created_at", created_at.desc()),
+        Index("idx_evidence_content_tsv", "content_tsv", postgresql_using="gin"),
+    )
 
 
 class Verdict(Base):
@@ -165,6 +178,10 @@ class Embedding(Base):
     # the schema and migration to match the model's embedding dimension.
     embedding = Column(Vector(384), nullable=False)
 
+    # Quantized shadow copies for two-stage search (embedding_half, embedding_binary)
+    # are not mapped: they exist only when VECTOR_SEARCH_QUANTIZATION is enabled, are
+    # kept in sync by a trigger and are read by raw SQL (see db_queries.quantization).
+
     # Model metadata
     model_name = Column(
         String(100), nullable=False, default="sentence-transformers/all-MiniLM-L6-v2"
@@ -191,6 +208,18 @@ class Embedding(Base):
     )
 
 
+# Add the quantized shadow columns and their sync trigger with the table, but only
+# when quantized search is enabled (the quantized_embeddings migration does the same)
+for _statement in INSTALL_SQL:
+    event.listen(
+        Embedding.__table__,
+        "after_create",
+        DDL(_statement).execute_if(
+            dialect="postgresql", callable_=lambda *_args, **_kwargs: quantized_columns_enabled()
+        ),
+    )
+
+
 class NLIResult(Base):
     """NLI Results table - stores Natural Language Inference verification pairs.
 
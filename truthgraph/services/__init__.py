@@ -1,11 +1,20 @@
 """Service layer for TruthGraph."""
 
+from .ann_search_service import ANNVectorSearchService
+from .bm25_search_service import BM25Index, BM25KeywordSearchService
+from .exact_search_service import ExactVectorSearchService
 from .hybrid_search_service import HybridSearchResult, HybridSearchService
+from .vector_search_backends import get_vector_search_service
 from .vector_search_service import SearchResult, VectorSearchService
 
 __all__ = [
     "VectorSearchService",
+    "ANNVectorSearchService",
+    "ExactVectorSearchService",
+    "get_vector_search_service",
     "SearchResult",
     "HybridSearchService",
     "HybridSearchResult",
+    "BM25Index",
+    "BM25KeywordSearchService",
 ]
@@ -0,0 +1,620 @@
+"""In-process HNSW backend for evidence vector search.
+
+Once the models are warm, the Postgres round-trip for the nearest-neighbour
+query dominates verification latency. ANNVectorSearchService keeps an
+in-memory HNSW graph (hnswlib) of evidence embeddings per tenant and answers
+the nearest-neighbour part of a search in-process. Postgres is then only asked
+for the content of the final top-k, in one batched query.
+
+pgvector stays the source of truth and the fallback:
+    - A tenant's graph is loaded from a snapshot file (ANN_SNAPSHOT_DIR) or,
+      failing that, from the embeddings table on first use.
+    - Rows written since the last load are pulled incrementally (by
+      embeddings.updated_at) every ANN_SYNC_INTERVAL_SECONDS; writers in the
+      same process can push them immediately with add_evidence().
+    - If a top-k id no longer exists in the evidence table, it is dropped
+      from the graph and that search is answered by pgvector.
+    - Source-filtered searches, missing hnswlib and any index error also go
+      to pgvector.
+
+Configuration (environment):
+    VECTOR_SEARCH_BACKEND: ann selects this backend (see vector_search_backends)
+    ANN_SNAPSHOT_DIR: Directory for per-tenant snapshot files (default: none)
+    ANN_SYNC_INTERVAL_SECONDS: Incremental sync interval (default: 30; 0 disables)
+    HNSW_M / HNSW_EF_CONSTRUCTION / HNSW_EF_SEARCH: Graph parameters, shared
+        with the pgvector HNSW index (see db_queries.vector_index)
+
+Requires the optional ``ann`` extra (hnswlib).
+
+Example:
+    >>> service = ANNVectorSearchService.get_instance()
+    >>> results = service.search_similar_evidence(db, query_embedding, top_k=5)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from truthgraph.db_queries.distance import DistanceMetric
+from truthgraph.db_queries.vector_adapter import (
+    as_float32_matrix,
+    as_float32_vector,
+    vector_connection,
+)
+from truthgraph.db_queries.vector_index import HNSWParams
+from truthgraph.services.vector_search_service import SearchResult, VectorSearchService
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILE_SUFFIX = ".hnsw"
+_META_FILE_SUFFIX = ".meta.json"
+
+# hnswlib space for each metric; distances are converted back to cosine scale
+_HNSW_SPACES = {
+    DistanceMetric.COSINE: "cosine",
+    DistanceMetric.INNER_PRODUCT: "ip",
+    DistanceMetric.L2: "l2",
+}
+
+
+def _require_hnswlib() -> Any:
+    try:
+        import hnswlib
+    except ImportError as e:
+        raise RuntimeError(
+            "ANN search backend requires hnswlib. Install with: pip install -e '.[ann]'"
+        ) from e
+    return hnswlib
+
+
+class HNSWEvidenceIndex:
+    """In-memory HNSW graph of one tenant's evidence embeddings.
+
+    Maps evidence UUIDs to hnswlib integer labels, grows capacity as needed,
+    and reports cosine-scale similarities like VectorSearchService. All
+    operations are serialized with a lock, so one instance can be shared by
+    request threads.
+
+    Attributes:
+        dimension: Embedding dimension
+        metric: Distance metric of the graph
+        high_water_mark: Latest embeddings.updated_at included in the graph
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        metric: DistanceMetric = DistanceMetric.COSINE,
+        params: Optional[HNSWParams] = None,
+        capacity: int = 1024,
+    ) -> None:
+        """Create an empty graph.
+
+        Args:
+            dimension: Embedding dimension
+            metric: Distance metric
+            params: Build parameters (default: HNSW_M / HNSW_EF_CONSTRUCTION)
+            capacity: Initial number of elements to allocate
+        """
+        hnswlib = _require_hnswlib()
+        self.dimension = dimension
+        self.metric = metric
+        self.params = params or HNSWParams.from_env()
+        self.high_water_mark: Optional[datetime] = None
+
+        self._index = hnswlib.Index(space=_HNSW_SPACES[metric], dim=dimension)
+        self._index.init_index(
+            max_elements=max(capacity, 1),
+            M=self.params.m,
+            ef_construction=self.params.ef_construction,
+        )
+        self._ids: list[UUID] = []  # label -> evidence id
+        self._labels: dict[UUID, int] = {}  # evidence id -> label (live only)
+        self._deleted: set[int] = set()  # labels of removed (or re-added) evidence
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of live (not deleted) elements."""
+        return len(self._labels)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Whether an evidence id is in the graph."""
+        return entity_id in self._labels
+
+    def add(
+        self,
+        entity_ids: Sequence[UUID],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+    ) -> None:
+        """Insert or update evidence embeddings.
+
+        Args:
+            entity_ids: Evidence ids
+            embeddings: One embedding per id
+
+        Raises:
+            ValueError: If ids and embeddings do not line up or have the wrong dimension
+        """
+        if len(entity_ids) == 0:
+            return
+        matrix = as_float32_matrix(embeddings, self.dimension)
+        if matrix.shape[0] != len(entity_ids):
+            raise ValueError(f"Got {matrix.shape[0]} embeddings for {len(entity_ids)} ids")
+
+        with self._lock:
+            labels = np.empty(len(entity_ids), dtype=np.int64)
+            for i, entity_id in enumerate(entity_ids):
+                label = self._labels.get(entity_id)
+                if label is None:
+                    label = len(self._ids)
+                    self._ids.append(entity_id)
+                    self._labels[entity_id] = label
+                labels[i] = label
+
+            needed = len(self._ids)
+            if needed > self._index.get_max_elements():
+                self._index.resize_index(max(needed, 2 * self._index.get_max_elements()))
+            self._index.add_items(matrix, labels)
+
+    def remove(self, entity_ids: Sequence[UUID]) -> None:
+        """Remove evidence ids from search results (unknown ids are ignored)."""
+        with self._lock:
+            for entity_id in entity_ids:
+                label = self._labels.pop(entity_id, None)
+                if label is not None:
+                    self._index.mark_deleted(label)
+                    self._deleted.add(label)
+
+    def search(
+        self,
+        query_embedding: Sequence[float] | np.ndarray,
+        top_k: int,
+        ef_search: Optional[int] = None,
+    ) -> list[tuple[UUID, float]]:
+        """Find the nearest evidence to a query embedding.
+
+        Args:
+            query_embedding: Query vector
+            top_k: Number of neighbours to return
+            ef_search: Candidate list size (default: max(top_k, 40), raised to top_k)
+
+        Returns:
+            (evidence id, cosine-scale similarity) pairs, most similar first
+        """
+        query = as_float32_vector(query_embedding, self.dimension)
+        with self._lock:
+            k = min(top_k, len(self._labels))
+            if k <= 0:
+                return []
+            self._index.set_ef(max(ef_search or 40, k))
+            labels, distances = self._index.knn_query(query, k=k)
+
+        return [
+            (self._ids[int(label)], self._similarity(float(distance)))
+            for label, distance in zip(labels[0], distances[0], strict=True)
+        ]
+
+    def _similarity(self, distance: float) -> float:
+        if self.metric is DistanceMetric.L2:
+            # hnswlib reports squared L2 distance; unit vectors: cos = 1 - d^2 / 2
+            return 1.0 - distance / 2.0
+        # cosine and ip spaces report 1 - cos / 1 - dot
+        return 1.0 - distance
+
+    def save(self, path: Path) -> None:
+        """Write the graph and its id mapping to a snapshot.
+
+        Args:
+            path: Snapshot path without suffix; writes <path>.hnsw and <path>.meta.json
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._index.save_index(str(path.with_suffix(_INDEX_FILE_SUFFIX)))
+            meta = {
+                "dimension": self.dimension,
+                "metric": self.metric.value,
+                "m": self.params.m,
+                "ef_construction": self.params.ef_construction,
+                "ids": [str(entity_id) for entity_id in self._ids],
+                "deleted": sorted(self._deleted),
+                "high_water_mark": (
+                    self.high_water_mark.isoformat() if self.high_water_mark else None
+                ),
+            }
+        path.with_suffix(_META_FILE_SUFFIX).write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, path: Path) -> "HNSWEvidenceIndex":
+        """Load a graph written by save().
+
+        Args:
+            path: Snapshot path without suffix
+
+        Returns:
+            The loaded graph
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist
+        """
+        meta = json.loads(path.with_suffix(_META_FILE_SUFFIX).read_text())
+        index = cls(
+            dimension=meta["dimension"],
+            metric=DistanceMetric.parse(meta["metric"]),
+            params=HNSWParams(m=meta["m"], ef_construction=meta["ef_construction"]),
+        )
+        index._index.load_index(str(path.with_suffix(_INDEX_FILE_SUFFIX)))
+        index._ids = [UUID(entity_id) for entity_id in meta["ids"]]
+        index._deleted = set(meta["deleted"])
+        index._labels = {
+            entity_id: label
+            for label, entity_id in enumerate(index._ids)
+            if label not in index._deleted
+        }
+        if meta["high_water_mark"]:
+            index.high_water_mark = datetime.fromisoformat(meta["high_water_mark"])
+        return index
+
+
+class ANNVectorSearchService(VectorSearchService):
+    """VectorSearchService that answers nearest-neighbour queries in-process.
+
+    Drop-in replacement for VectorSearchService: same search API and results,
+    with pgvector used for loading, content lookup and fallback.
+
+    Example:
+        >>> service = ANNVectorSearchService.get_instance()
+        >>> service.load_tenant(db, "default")
+        12000
+        >>> results = service.search_similar_evidence(db, query_embedding, top_k=10)
+    """
+
+    _instance: ClassVar[Optional["ANNVectorSearchService"]] = None
+
+    # Rows fetched per round-trip while loading from the embeddings table
+    LOAD_CHUNK_SIZE: ClassVar[int] = 5000
+
+    def __init__(
+        self,
+        embedding_dimension: int = 384,
+        metric: DistanceMetric | str | None = None,
+        ef_search: Optional[int] = None,
+        tenant_ef_search: Optional[Mapping[str, int]] = None,
+        snapshot_dir: Optional[Path | str] = None,
+        sync_interval_seconds: Optional[float] = None,
+        hnsw_params: Optional[HNSWParams] = None,
+    ) -> None:
+        """Initialize the service (graphs are loaded lazily per tenant).
+
+        Args:
+            embedding_dimension: Dimension of embeddings (384 or 1536, default: 384)
+            metric: Distance metric (defaults to VECTOR_DISTANCE_METRIC, cosine)
+            ef_search: Default ef_search (defaults to HNSW_EF_SEARCH)
+            tenant_ef_search: Per-tenant ef_search overrides
+            snapshot_dir: Snapshot directory (defaults to ANN_SNAPSHOT_DIR)
+            sync_interval_seconds: Seconds between incremental syncs with the
+                embeddings table (defaults to ANN_SYNC_INTERVAL_SECONDS, 30; 0 disables)
+            hnsw_params: Graph build parameters (default: HNSW_M / HNSW_EF_CONSTRUCTION)
+        """
+        super().__init__(
+            embedding_dimension=embedding_dimension,
+            metric=metric,
+            ef_search=ef_search,
+            tenant_ef_search=tenant_ef_search,
+        )
+        if snapshot_dir is None:
+            snapshot_dir = os.getenv("ANN_SNAPSHOT_DIR") or None
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        if sync_interval_seconds is None:
+            sync_interval_seconds = float(os.getenv("ANN_SYNC_INTERVAL_SECONDS", "30"))
+        self.sync_interval_seconds = sync_interval_seconds
+        self.hnsw_params = hnsw_params or HNSWParams.from_env()
+
+        self._indexes: dict[str, HNSWEvidenceIndex] = {}
+        self._last_sync: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"ann_searches": 0, "fallbacks": 0, "stale_results": 0}
+
+    # ===== Index lifecycle =====
+
+    def attach_index(self, tenant_id: str, index: HNSWEvidenceIndex) -> None:
+        """Use an already built graph for a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+            index: Graph holding the tenant's evidence embeddings
+        """
+        with self._lock:
+            self._indexes[tenant_id] = index
+            self._last_sync[tenant_id] = time.monotonic()
+
+    def load_tenant(self, db: Session, tenant_id: str = "default") -> int:
+        """Build a tenant's graph from its snapshot, or from the embeddings table.
+
+        A snapshot is brought up to date with rows written after it was saved.
+
+        Args:
+            db: SQLAlchemy database session
+            tenant_id: Tenant identifier
+
+        Returns:
+            Number of evidence embeddings in the graph
+        """
+        index = self._load_snapshot(tenant_id)
+        if index is None:
+            index = HNSWEvidenceIndex(self.embedding_dimension, self.metric, self.hnsw_params)
+        self._pull_embeddings(db, tenant_id, index)
+        self.attach_index(tenant_id, index)
+        logger.info(f"Loaded ANN index for tenant '{tenant_id}': {len(index)} evidence vectors")
+        return len(index)
+
+    def sync_tenant(self, db: Session, tenant_id: str = "default") -> int:
+        """Pull embeddings written since the last sync into a loaded graph.
+
+        Args:
+            db: SQLAlchemy database session
+            tenant_id: Tenant identifier
+
+        Returns:
+            Number of embeddings added or updated (0 if the tenant is not loaded)
+        """
+        index = self._indexes.get(tenant_id)
+        if index is None:
+            return 0
+        pulled = self._pull_embeddings(db, tenant_id, index)
+        self._last_sync[tenant_id] = time.monotonic()
+        return pulled
+
+    def add_evidence(
+        self,
+        tenant_id: str,
+        entity_ids: Sequence[UUID],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+    ) -> None:
+        """Add newly stored evidence embeddings to a loaded graph.
+
+        Call after the embeddings are committed to the database. Tenants
+        whose graph is not loaded are skipped; they see the rows when loaded.
+
+        Args:
+            tenant_id: Tenant identifier
+            entity_ids: Evidence ids
+            embeddings: One embedding per id
+        """
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            index.add(entity_ids, embeddings)
+
+    def remove_evidence(self, tenant_id: str, entity_ids: Sequence[UUID]) -> None:
+        """Remove deleted evidence from a loaded graph."""
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            index.remove(entity_ids)
+
+    def save_snapshot(self, tenant_id: str = "default") -> Optional[Path]:
+        """Write a tenant's graph to ANN_SNAPSHOT_DIR.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            Snapshot path, or None if there is no snapshot dir or loaded graph
+        """
+        index = self._indexes.get(tenant_id)
+        path = self._snapshot_path(tenant_id)
+        if index is None or path is None:
+            return None
+        index.save(path)
+        logger.info(f"Saved ANN snapshot for tenant '{tenant_id}' to {path}")
+        return path
+
+    def _snapshot_path(self, tenant_id: str) -> Optional[Path]:
+        if self.snapshot_dir is None:
+            return None
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", tenant_id)
+        return self.snapshot_dir / f"{slug}.{self.metric.index_suffix}.{self.embedding_dimension}"
+
+    def _load_snapshot(self, tenant_id: str) -> Optional[HNSWEvidenceIndex]:
+        path = self._snapshot_path(tenant_id)
+        if path is None or not path.with_suffix(_META_FILE_SUFFIX).exists():
+            return None
+        try:
+            return HNSWEvidenceIndex.load(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ANN snapshot {path}: {e}")
+            return None
+
+    def _pull_embeddings(self, db: Session, tenant_id: str, index: HNSWEvidenceIndex) -> int:
+        """Add embeddings newer than the graph's high-water mark."""
+        sql_query = """
+        SELECT entity_id, embedding, updated_at
+        FROM embeddings
+        WHERE entity_type = 'evidence'
+            AND tenant_id = %(tenant_id)s
+            AND (%(since)s::timestamp IS NULL OR updated_at > %(since)s::timestamp)
+        ORDER BY updated_at
+        """
+        params = {"tenant_id": tenant_id, "since": index.high_water_mark}
+
+        pulled = 0
+        with vector_connection(db).cursor() as cursor:
+            cursor.execute(sql_query, params)
+            while rows := cursor.fetchmany(self.LOAD_CHUNK_SIZE):
+                index.add([row[0] for row in rows], np.stack([np.asarray(row[1]) for row in rows]))
+                index.high_water_mark = rows[-1][2]
+                pulled += len(rows)
+        return pulled
+
+    def _get_index(self, db: Session, tenant_id: str) -> HNSWEvidenceIndex:
+        index = self._indexes.get(tenant_id)
+        if index is None:
+            self.load_tenant(db, tenant_id)
+            return self._indexes[tenant_id]
+
+        last_sync = self._last_sync.get(tenant_id, 0.0)
+        if self.sync_interval_seconds > 0 and (
+            time.monotonic() - last_sync >= self.sync_interval_seconds
+        ):
+            self.sync_tenant(db, tenant_id)
+        return index
+
+    # ===== Search =====
+
+    def search_similar_evidence(
+        self,
+        db: Session,
+        query_embedding: list[float] | np.ndarray,
+        top_k: int = 10,
+        min_similarity: float = 0.0,
+        tenant_id: str = "default",
+        source_filter: Optional[str] = None,
+        ef_search: Optional[int] = None,
+    ) -> list[SearchResult]:
+        """Search for evidence similar to a query embedding.
+
+        Same contract as VectorSearchService.search_similar_evidence. Nearest
+        neighbours come from the tenant's in-memory graph; content is fetched
+        for the final top-k only. Falls back to pgvector for source-filtered
+        searches, stale graph entries and index errors.
+
+        Raises:
+            ValueError: If query_embedding dimension doesn't match expected dimension
+            RuntimeError: If the fallback database query fails
+        """
+        if len(query_embedding) != self.embedding_dimension:
+            raise ValueError(
+                f"Query embedding must be {self.embedding_dimension}-dimensional, "
+                f"got {len(query_embedding)}"
+            )
+        if source_filter is None:
+            try:
+                results = self._search_ann(
+                    db, [query_embedding], top_k, min_similarity, tenant_id, ef_search
+                )
+                if results is not None:
+                    return results[0]
+            except Exception as e:
+                logger.warning(
+                    f"ANN search failed for tenant '{tenant_id}', falling back to pgvector: {e}"
+                )
+
+        self._stats["fallbacks"] += 1
+        return super().search_similar_evidence(
+            db=db,
+            query_embedding=query_embedding,
+            top_k=top_k,
+            min_similarity=min_similarity,
+            tenant_id=tenant_id,
+            source_filter=source_filter,
+            ef_search=ef_search,
+        )
+
+    def search_similar_evidence_batch(
+        self,
+        db: Session,
+        query_embeddings: list[list[float]] | np.ndarray,
+        top_k: int = 10,
+        min_similarity: float = 0.0,
+        tenant_id: str = "default",
+        ef_search: Optional[int] = None,
+    ) -> list[list[SearchResult]]:
+        """Search for evidence similar to multiple query embeddings.
+
+        Every query walks the tenant's graph and the content for all of them is
+        fetched in one query. Falls back to the single-statement pgvector batch
+        on stale graph entries and index errors.
+
+        Returns:
+            List of result lists, one per query embedding
+        """
+        if len(query_embeddings) > 0:
+            try:
+                results = self._search_ann(
+                    db, query_embeddings, top_k, min_similarity, tenant_id, ef_search
+                )
+                if results is not None:
+                    return results
+            except Exception as e:
+                logger.warning(
+                    f"ANN batch search failed for tenant '{tenant_id}', "
+                    f"falling back to pgvector: {e}"
+                )
+
+        self._stats["fallbacks"] += 1
+        return super().search_similar_evidence_batch(
+            db=db,
+            query_embeddings=query_embeddings,
+            top_k=top_k,
+            min_similarity=min_similarity,
+            tenant_id=tenant_id,
+            ef_search=ef_search,
+        )
+
+    def _search_ann(
+        self,
+        db: Session,
+        query_embeddings: Sequence[list[float] | np.ndarray] | np.ndarray,
+        top_k: int,
+        min_similarity: float,
+        tenant_id: str,
+        ef_search: Optional[int],
+    ) -> Optional[list[list[SearchResult]]]:
+        """ANN search per query; returns None when pgvector should answer instead."""
+        index = self._get_index(db, tenant_id)
+        effective_ef_search = self.resolve_ef_search(tenant_id, top_k, ef_search)
+        candidate_lists = []
+        for query_embedding in query_embeddings:
+            candidates = index.search(query_embedding, top_k, ef_search=effective_ef_search)
+            candidate_lists.append([(eid, sim) for eid, sim in candidates if sim >= min_similarity])
+        self._stats["ann_searches"] += len(candidate_lists)
+
+        # One round-trip for the content of every query's final top-k
+        search_results, stale = self._results_for_candidates(db, candidate_lists)
+        if stale:
+            # Evidence deleted in the source of truth
+            index.remove(stale)
+            self._stats["stale_results"] += 1
+            logger.info(f"Dropped {len(stale)} stale ANN entries for tenant '{tenant_id}'")
+            return None
+
+        logger.debug(
+            f"ANN search returned {sum(len(r) for r in search_results)} results for "
+            f"{len(search_results)} queries "
+            f"(top_k={top_k}, min_similarity={min_similarity:.2f}, tenant={tenant_id})"
+        )
+        return search_results
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get ANN backend statistics.
+
+        Returns:
+            Dictionary with search/fallback counters and per-tenant graph sizes
+        """
+        return {
+            **self._stats,
+            "tenants": {tenant_id: len(index) for tenant_id, index in self._indexes.items()},
+        }
+
+    @classmethod
+    def get_instance(cls, embedding_dimension: int = 384) -> "ANNVectorSearchService":
+        """Get the process-wide instance (graphs are shared by all requests).
+
+        Args:
+            embedding_dimension: Embedding dimension, used on first call only
+
+        Returns:
+            ANNVectorSearchService singleton
+        """
+        if cls._instance is None:
+            cls._instance = cls(embedding_dimension=embedding_dimension)
+        return cls._instance
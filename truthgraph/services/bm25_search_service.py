@@ -0,0 +1,712 @@
+"""In-process BM25 keyword backend for hybrid search.
+
+The keyword branch of hybrid search normally asks Postgres to match and rank
+with ts_rank, which scores every matching row and is a weak ranking function.
+BM25KeywordSearchService keeps a BM25 inverted index of each tenant's evidence
+in memory and answers the ranking in-process. Postgres is then only asked for
+the content of the final top-k, in one batched query.
+
+Index layout (BM25Index):
+    - Evidence gets a dense document number; lengths and liveness are numpy
+      arrays indexed by it.
+    - Each term's postings are two numpy arrays: delta-encoded document
+      numbers and term frequencies, each stored in the narrowest unsigned
+      dtype that holds its values. Documents are only ever appended, so new
+      postings are buffered per term and folded into the arrays before the
+      term is next scored.
+    - Updated or removed evidence is tombstoned; compact() drops tombstoned
+      documents and renumbers the rest once they pile up.
+
+Postgres stays the source of truth and the fallback:
+    - A tenant's index is loaded from a snapshot file (BM25_SNAPSHOT_DIR) or,
+      failing that, from the evidence table on first use. Like keyword
+      search in Postgres, a tenant's corpus is the evidence with an
+      embedding in that tenant.
+    - Rows written since the last load are pulled incrementally (by
+      embeddings.updated_at) every BM25_SYNC_INTERVAL_SECONDS; writers in the
+      same process can push them immediately with add_evidence().
+    - If a top-k id no longer exists in the evidence table, it is dropped
+      from the index and that search is answered by Postgres.
+
+Tokens are lowercased runs of letters and digits minus a short stopword list;
+there is no stemming, so matching is stricter than Postgres' english
+configuration.
+
+Configuration (environment):
+    KEYWORD_SEARCH_BACKEND: bm25 selects this backend for hybrid search
+        (see HybridSearchService; can also be set per tenant)
+    BM25_SNAPSHOT_DIR: Directory for per-tenant snapshot files (default: none)
+    BM25_SYNC_INTERVAL_SECONDS: Incremental sync interval (default: 30; 0 disables)
+
+Example:
+    >>> service = BM25KeywordSearchService.get_instance()
+    >>> results = service.search(db, "sea level rise", top_k=50, tenant_id="default")
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_SUFFIX = ".bm25.npz"
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from has have he in is it its of on or
+    she that the their there they this to was were which will with
+    """.split()
+)
+
+
+def tokenize(content: str) -> list[str]:
+    """Split text into lowercase index terms (letters and digits, no stopwords)."""
+    return [token for token in _TOKEN_RE.findall(content.lower()) if token not in STOPWORDS]
+
+
+def _narrow(values: np.ndarray) -> np.ndarray:
+    """Store non-negative integers in the smallest unsigned dtype that holds them."""
+    top = int(values.max()) if len(values) else 0
+    for dtype in (np.uint8, np.uint16):
+        if top <= np.iinfo(dtype).max:
+            return values.astype(dtype)
+    return values.astype(np.uint32)
+
+
+class _Postings:
+    """Postings list of one term: delta-encoded document numbers and frequencies."""
+
+    __slots__ = ("gaps", "tfs", "last_doc", "pending_docs", "pending_tfs")
+
+    def __init__(self) -> None:
+        self.gaps = np.empty(0, dtype=np.uint8)
+        self.tfs = np.empty(0, dtype=np.uint8)
+        self.last_doc = 0
+        self.pending_docs: list[int] = []
+        self.pending_tfs: list[int] = []
+
+    def set(self, docs: np.ndarray, tfs: np.ndarray) -> None:
+        """Replace the postings with ascending document numbers and their frequencies."""
+        self.gaps = _narrow(np.diff(docs, prepend=0))
+        self.tfs = _narrow(tfs)
+        self.last_doc = int(docs[-1]) if len(docs) else 0
+        self.pending_docs = []
+        self.pending_tfs = []
+
+    def flush(self) -> None:
+        """Fold buffered postings into the arrays."""
+        if not self.pending_docs:
+            return
+        docs = np.asarray(self.pending_docs, dtype=np.int64)
+        self.gaps = _narrow(np.concatenate([self.gaps, np.diff(docs, prepend=self.last_doc)]))
+        self.tfs = _narrow(np.concatenate([self.tfs, self.pending_tfs]))
+        self.last_doc = int(docs[-1])
+        self.pending_docs = []
+        self.pending_tfs = []
+
+    def doc_numbers(self) -> np.ndarray:
+        """Decoded document numbers (flushed postings only)."""
+        return np.cumsum(self.gaps, dtype=np.int64)
+
+
+class BM25Index:
+    """In-memory BM25 inverted index of one tenant's evidence.
+
+    Maps evidence UUIDs to dense document numbers and scores queries with
+    Okapi BM25. All operations are serialized with a lock, so one instance
+    can be shared by request threads.
+
+    Attributes:
+        k1: Term frequency saturation
+        b: Document length normalization
+        high_water_mark: Latest embeddings.updated_at included in the index
+    """
+
+    # compact() runs when this fraction of document numbers is tombstoned
+    COMPACT_DEAD_FRACTION: ClassVar[float] = 0.25
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        """Create an empty index.
+
+        Args:
+            k1: Term frequency saturation (default: 1.2)
+            b: Document length normalization (default: 0.75)
+        """
+        self.k1 = k1
+        self.b = b
+        self.high_water_mark: Optional[datetime] = None
+
+        self._postings: dict[str, _Postings] = {}
+        self._dirty: set[str] = set()  # terms with buffered postings
+        self._ids: list[UUID] = []  # document number -> evidence id
+        self._doc_numbers: dict[UUID, int] = {}  # evidence id -> document number (live only)
+        self._lengths = np.zeros(1024, dtype=np.uint32)
+        self._live = np.zeros(1024, dtype=bool)
+        self._total_length = 0  # over live documents
+        self._norms: Optional[np.ndarray] = None  # see _doc_norms
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of live (not removed) documents."""
+        return len(self._doc_numbers)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Whether an evidence id is in the index."""
+        return entity_id in self._doc_numbers
+
+    @property
+    def dead_fraction(self) -> float:
+        """Fraction of document numbers that belong to removed or replaced evidence."""
+        if not self._ids:
+            return 0.0
+        return 1.0 - len(self._doc_numbers) / len(self._ids)
+
+    @property
+    def num_terms(self) -> int:
+        """Number of distinct terms."""
+        return len(self._postings)
+
+    def add(self, entity_ids: Sequence[UUID], contents: Sequence[str]) -> None:
+        """Insert or replace evidence documents.
+
+        Args:
+            entity_ids: Evidence ids
+            contents: One text per id
+
+        Raises:
+            ValueError: If ids and contents do not line up
+        """
+        if len(entity_ids) != len(contents):
+            raise ValueError(f"Got {len(contents)} texts for {len(entity_ids)} ids")
+
+        with self._lock:
+            self._norms = None
+            self._reserve(len(self._ids) + len(entity_ids))
+            for entity_id, content in zip(entity_ids, contents, strict=True):
+                old = self._doc_numbers.pop(entity_id, None)
+                if old is not None:
+                    self._retire(old)
+
+                doc = len(self._ids)
+                self._ids.append(entity_id)
+                self._doc_numbers[entity_id] = doc
+                counts = Counter(tokenize(content))
+                length = sum(counts.values())
+                self._lengths[doc] = length
+                self._live[doc] = True
+                self._total_length += length
+
+                for term, tf in counts.items():
+                    postings = self._postings.get(term)
+                    if postings is None:
+                        postings = self._postings[term] = _Postings()
+                    postings.pending_docs.append(doc)
+                    postings.pending_tfs.append(tf)
+                    self._dirty.add(term)
+
+    def remove(self, entity_ids: Sequence[UUID]) -> None:
+        """Remove evidence ids from search results (unknown ids are ignored)."""
+        with self._lock:
+            for entity_id in entity_ids:
+                doc = self._doc_numbers.pop(entity_id, None)
+                if doc is not None:
+                    self._retire(doc)
+                    self._norms = None
+
+    def _retire(self, doc: int) -> None:
+        self._live[doc] = False
+        self._total_length -= int(self._lengths[doc])
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._lengths):
+            return
+        capacity = max(size, 2 * len(self._lengths))
+        self._lengths = np.resize(self._lengths, capacity)
+        live = np.zeros(capacity, dtype=bool)
+        live[: len(self._live)] = self._live
+        self._live = live
+
+    def _flush(self) -> None:
+        for term in self._dirty:
+            self._postings[term].flush()
+        self._dirty.clear()
+
+    def compact(self) -> None:
+        """Drop tombstoned documents from the postings and renumber the rest."""
+        with self._lock:
+            self._flush()
+            n = len(self._ids)
+            live = self._live[:n]
+            renumber = np.cumsum(live, dtype=np.int64) - 1
+            for term in list(self._postings):
+                postings = self._postings[term]
+                docs = postings.doc_numbers()
+                keep = live[docs]
+                if keep.any():
+                    postings.set(renumber[docs[keep]], postings.tfs[keep])
+                else:
+                    del self._postings[term]
+
+            self._ids = [
+                entity_id for entity_id, alive in zip(self._ids, live, strict=True) if alive
+            ]
+            self._doc_numbers = {entity_id: doc for doc, entity_id in enumerate(self._ids)}
+            lengths = self._lengths[:n][live]
+            self._lengths = np.zeros(max(len(lengths), 1024), dtype=np.uint32)
+            self._lengths[: len(lengths)] = lengths
+            self._live = np.zeros(len(self._lengths), dtype=bool)
+            self._live[: len(lengths)] = True
+            self._norms = None
+
+    def search(self, query_text: str, top_k: int) -> list[tuple[UUID, float]]:
+        """Rank documents for a query with BM25.
+
+        Args:
+            query_text: Natural language query
+            top_k: Number of documents to return
+
+        Returns:
+            (evidence id, BM25 score) pairs, best first; documents matching no
+            query term are not returned
+        """
+        terms = dict.fromkeys(tokenize(query_text))
+        with self._lock:
+            num_docs = len(self._doc_numbers)
+            if num_docs == 0 or top_k <= 0 or not terms:
+                return []
+            norms = self._doc_norms()
+            k1 = np.float32(self.k1)
+
+            doc_lists = []
+            score_lists = []
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                if term in self._dirty:
+                    postings.flush()
+                    self._dirty.discard(term)
+                docs = postings.doc_numbers()
+                # Tombstoned postings still count towards df until compaction
+                df = min(len(docs), num_docs)
+                idf = np.float32(math.log(1.0 + (num_docs - df + 0.5) / (df + 0.5)))
+                tf = postings.tfs.astype(np.float32)
+                doc_lists.append(docs)
+                score_lists.append(idf * (k1 + 1) * tf / (tf + norms[docs]))
+            if not doc_lists:
+                return []
+
+            if len(doc_lists) == 1:
+                candidates, candidate_scores = doc_lists[0], score_lists[0]
+            elif sum(len(docs) for docs in doc_lists) * 8 < len(self._ids):
+                # Selective query: merge the postings instead of touching every document
+                candidates, inverse = np.unique(np.concatenate(doc_lists), return_inverse=True)
+                candidate_scores = np.bincount(inverse, weights=np.concatenate(score_lists))
+            else:
+                scores = np.zeros(len(self._ids), dtype=np.float32)
+                for docs, term_scores in zip(doc_lists, score_lists, strict=True):
+                    scores[docs] += term_scores
+                candidates = np.flatnonzero(scores)
+                candidate_scores = scores[candidates]
+
+            # Tombstoned documents score 0 (infinite norm)
+            k = min(top_k, int(np.count_nonzero(candidate_scores)))
+            if k == 0:
+                return []
+            if len(candidates) > k:
+                top = np.argpartition(-candidate_scores, k - 1)[:k]
+                candidates, candidate_scores = candidates[top], candidate_scores[top]
+            order = np.argsort(-candidate_scores, kind="stable")
+            return [(self._ids[int(candidates[i])], float(candidate_scores[i])) for i in order]
+
+    def _doc_norms(self) -> np.ndarray:
+        """Per-document BM25 length normalization, k1 * (1 - b + b * length / avg_length).
+
+        Cached until documents are added or removed; tombstoned documents get
+        an infinite norm so their postings contribute nothing.
+        """
+        if self._norms is None:
+            n = len(self._ids)
+            avg_length = max(self._total_length / max(len(self._doc_numbers), 1), 1.0)
+            lengths = self._lengths[:n].astype(np.float32)
+            norms = self.k1 * (1.0 - self.b + self.b * lengths / np.float32(avg_length))
+            norms[~self._live[:n]] = np.inf
+            self._norms = norms.astype(np.float32)
+        return self._norms
+
+    def save(self, path: Path) -> None:
+        """Write the index to a snapshot file.
+
+        Postings are stored back to back with per-term offsets. The file is
+        written under a temporary name and moved into place, so readers never
+        see a partial snapshot.
+
+        Args:
+            path: Snapshot file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._flush()
+            terms = list(self._postings)
+            postings = [self._postings[term] for term in terms]
+            offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+            np.cumsum([len(p.gaps) for p in postings], out=offsets[1:])
+            n = len(self._ids)
+            arrays = {
+                # Tokens never contain newlines
+                "terms": np.frombuffer("\n".join(terms).encode(), dtype=np.uint8),
+                "offsets": offsets,
+                "gaps": np.concatenate([p.gaps for p in postings] or [[]]).astype(np.uint32),
+                "tfs": np.concatenate([p.tfs for p in postings] or [[]]).astype(np.uint32),
+                "ids": np.frombuffer(
+                    b"".join(entity_id.bytes for entity_id in self._ids), dtype=np.uint8
+                ).reshape(n, 16),
+                "lengths": self._lengths[:n].copy(),
+                "live": self._live[:n].copy(),
+                "meta": np.frombuffer(
+                    json.dumps(
+                        {
+                            "k1": self.k1,
+                            "b": self.b,
+                            "high_water_mark": (
+                                self.high_water_mark.isoformat() if self.high_water_mark else None
+                            ),
+                        }
+                    ).encode(),
+                    dtype=np.uint8,
+                ),
+            }
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BM25Index":
+        """Load an index written by save().
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            The loaded index
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(data["meta"].tobytes())
+            index = cls(k1=meta["k1"], b=meta["b"])
+            if meta["high_water_mark"]:
+                index.high_water_mark = datetime.fromisoformat(meta["high_water_mark"])
+
+            raw_terms = data["terms"].tobytes().decode()
+            terms = raw_terms.split("\n") if raw_terms else []
+            offsets, gaps, tfs = data["offsets"], data["gaps"], data["tfs"]
+            for i, term in enumerate(terms):
+                postings = _Postings()
+                start, end = offsets[i], offsets[i + 1]
+                postings.set(np.cumsum(gaps[start:end], dtype=np.int64), tfs[start:end])
+                index._postings[term] = postings
+
+            index._ids = [UUID(bytes=row.tobytes()) for row in data["ids"]]
+            live = data["live"]
+            index._reserve(len(index._ids))
+            index._lengths[: len(index._ids)] = data["lengths"]
+            index._live[: len(index._ids)] = live
+            index._doc_numbers = {
+                entity_id: doc for doc, entity_id in enumerate(index._ids) if live[doc]
+            }
+            index._total_length = int(data["lengths"][live].sum())
+        return index
+
+
+class BM25KeywordSearchService:
+    """Keyword search over per-tenant in-memory BM25 indexes.
+
+    Results have the shape of HybridSearchService._keyword_search, so the
+    service can stand in for the Postgres keyword branch.
+
+    Example:
+        >>> service = BM25KeywordSearchService.get_instance()
+        >>> service.load_tenant(db, "default")
+        12000
+        >>> ranked = service.search(db, "glacier retreat", top_k=50)
+    """
+
+    _instance: ClassVar[Optional["BM25KeywordSearchService"]] = None
+
+    # Rows fetched per round-trip while loading from the evidence table
+    LOAD_CHUNK_SIZE: ClassVar[int] = 5000
+
+    def __init__(
+        self,
+        snapshot_dir: Optional[Path | str] = None,
+        sync_interval_seconds: Optional[float] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        """Initialize the service (indexes are loaded lazily per tenant).
+
+        Args:
+            snapshot_dir: Snapshot directory (defaults to BM25_SNAPSHOT_DIR)
+            sync_interval_seconds: Seconds between incremental syncs with the
+                database (defaults to BM25_SYNC_INTERVAL_SECONDS, 30; 0 disables)
+            k1: BM25 term frequency saturation for new indexes (default: 1.2)
+            b: BM25 length normalization for new indexes (default: 0.75)
+        """
+        if snapshot_dir is None:
+            snapshot_dir = os.getenv("BM25_SNAPSHOT_DIR") or None
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        if sync_interval_seconds is None:
+            sync_interval_seconds = float(os.getenv("BM25_SYNC_INTERVAL_SECONDS", "30"))
+        self.sync_interval_seconds = sync_interval_seconds
+        self.k1 = k1
+        self.b = b
+
+        self._indexes: dict[str, BM25Index] = {}
+        self._last_sync: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"bm25_searches": 0, "stale_results": 0, "compactions": 0}
+
+    # ===== Index lifecycle =====
+
+    def attach_index(self, tenant_id: str, index: BM25Index) -> None:
+        """Use an already built index for a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+            index: Index holding the tenant's evidence
+        """
+        with self._lock:
+            self._indexes[tenant_id] = index
+            self._last_sync[tenant_id] = time.monotonic()
+
+    def load_tenant(self, db: Session, tenant_id: str = "default") -> int:
+        """Build a tenant's index from its snapshot, or from the evidence table.
+
+        A snapshot is brought up to date with rows written after it was saved.
+
+        Args:
+            db: SQLAlchemy database session
+            tenant_id: Tenant identifier
+
+        Returns:
+            Number of evidence documents in the index
+        """
+        index = self._load_snapshot(tenant_id)
+        if index is None:
+            index = BM25Index(k1=self.k1, b=self.b)
+        self._pull_evidence(db, tenant_id, index)
+        self.attach_index(tenant_id, index)
+        logger.info(
+            f"Loaded BM25 index for tenant '{tenant_id}': {len(index)} documents, "
+            f"{index.num_terms} terms"
+        )
+        return len(index)
+
+    def sync_tenant(self, db: Session, tenant_id: str = "default") -> int:
+        """Pull evidence written since the last sync into a loaded index.
+
+        Compacts the index when too many documents have been replaced or removed.
+
+        Args:
+            db: SQLAlchemy database session
+            tenant_id: Tenant identifier
+
+        Returns:
+            Number of documents added or updated (0 if the tenant is not loaded)
+        """
+        index = self._indexes.get(tenant_id)
+        if index is None:
+            return 0
+        pulled = self._pull_evidence(db, tenant_id, index)
+        if index.dead_fraction > BM25Index.COMPACT_DEAD_FRACTION:
+            index.compact()
+            self._stats["compactions"] += 1
+        self._last_sync[tenant_id] = time.monotonic()
+        return pulled
+
+    def add_evidence(
+        self,
+        tenant_id: str,
+        entity_ids: Sequence[UUID],
+        contents: Sequence[str],
+    ) -> None:
+        """Add newly stored evidence to a loaded index.
+
+        Call after the evidence and its embeddings are committed. Tenants
+        whose index is not loaded are skipped; they see the rows when loaded.
+
+        Args:
+            tenant_id: Tenant identifier
+            entity_ids: Evidence ids
+            contents: One text per id
+        """
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            index.add(entity_ids, contents)
+
+    def remove_evidence(self, tenant_id: str, entity_ids: Sequence[UUID]) -> None:
+        """Remove deleted evidence from a loaded index."""
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            index.remove(entity_ids)
+
+    def save_snapshot(self, tenant_id: str = "default") -> Optional[Path]:
+        """Write a tenant's index to BM25_SNAPSHOT_DIR.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            Snapshot path, or None if there is no snapshot dir or loaded index
+        """
+        index = self._indexes.get(tenant_id)
+        path = self._snapshot_path(tenant_id)
+        if index is None or path is None:
+            return None
+        index.save(path)
+        logger.info(f"Saved BM25 snapshot for tenant '{tenant_id}' to {path}")
+        return path
+
+    def _snapshot_path(self, tenant_id: str) -> Optional[Path]:
+        if self.snapshot_dir is None:
+            return None
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", tenant_id)
+        return self.snapshot_dir / f"{slug}{_SNAPSHOT_SUFFIX}"
+
+    def _load_snapshot(self, tenant_id: str) -> Optional[BM25Index]:
+        path = self._snapshot_path(tenant_id)
+        if path is None or not path.exists():
+            return None
+        try:
+            return BM25Index.load(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable BM25 snapshot {path}: {e}")
+            return None
+
+    def _pull_evidence(self, db: Session, tenant_id: str, index: BM25Index) -> int:
+        """Add evidence whose embedding is newer than the index's high-water mark."""
+        sql_query = text(
+            """
+            SELECT e.id, e.content, emb.updated_at
+            FROM embeddings emb
+            JOIN evidence e ON e.id = emb.entity_id
+            WHERE emb.entity_type = 'evidence'
+                AND emb.tenant_id = :tenant_id
+                AND (CAST(:since AS timestamp) IS NULL OR emb.updated_at > :since)
+            ORDER BY emb.updated_at
+            """
+        ).execution_options(stream_results=True, yield_per=self.LOAD_CHUNK_SIZE)
+        params = {"tenant_id": tenant_id, "since": index.high_water_mark}
+
+        pulled = 0
+        for rows in db.execute(sql_query, params).partitions():
+            index.add([row[0] for row in rows], [row[1] for row in rows])
+            index.high_water_mark = rows[-1][2]
+            pulled += len(rows)
+        return pulled
+
+    def _get_index(self, db: Session, tenant_id: str) -> BM25Index:
+        index = self._indexes.get(tenant_id)
+        if index is None:
+            self.load_tenant(db, tenant_id)
+            return self._indexes[tenant_id]
+
+        last_sync = self._last_sync.get(tenant_id, 0.0)
+        if self.sync_interval_seconds > 0 and (
+            time.monotonic() - last_sync >= self.sync_interval_seconds
+        ):
+            self.sync_tenant(db, tenant_id)
+        return index
+
+    # ===== Search =====
+
+    def search(
+        self,
+        db: Session,
+        query_text: str,
+        top_k: int = 50,
+        tenant_id: str = "default",
+    ) -> Optional[list[tuple[UUID, str, Optional[str], int]]]:
+        """Rank a tenant's evidence for a keyword query.
+
+        Args:
+            db: SQLAlchemy database session
+            query_text: Search query text
+            top_k: Maximum number of results (default: 50)
+            tenant_id: Tenant identifier (default: 'default')
+
+        Returns:
+            List of tuples (evidence_id, content, source_url, rank_position),
+            rank position 1 = most relevant; or None if a ranked id no longer
+            exists and Postgres should answer instead (the id is dropped from
+            the index)
+        """
+        index = self._get_index(db, tenant_id)
+        ranked = index.search(query_text, top_k)
+        if not ranked:
+            self._stats["bm25_searches"] += 1
+            return []
+
+        ids = [entity_id for entity_id, _ in ranked]
+        rows = db.execute(
+            text("SELECT id, content, source_url FROM evidence WHERE id = ANY(:ids)"),
+            {"ids": ids},
+        ).fetchall()
+        content = {row[0]: (row[1], row[2]) for row in rows}
+
+        missing = [entity_id for entity_id in ids if entity_id not in content]
+        if missing:
+            index.remove(missing)
+            self._stats["stale_results"] += 1
+            return None
+
+        self._stats["bm25_searches"] += 1
+        return [
+            (entity_id, content[entity_id][0], content[entity_id][1], rank)
+            for rank, entity_id in enumerate(ids, start=1)
+        ]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get BM25 backend statistics.
+
+        Returns:
+            Dictionary with search counters and per-tenant index sizes
+        """
+        return {
+            **self._stats,
+            "tenants": {
+                tenant_id: {"documents": len(index), "terms": index.num_terms}
+                for tenant_id, index in self._indexes.items()
+            },
+        }
+
+    @classmethod
+    def get_instance(cls) -> "BM25KeywordSearchService":
+        """Get the process-wide instance (indexes are shared by all requests).
+
+        Returns:
+            BM25KeywordSearchService singleton
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
@@ -0,0 +1,517 @@
+"""Memory-mapped exact vector search for small and medium tenants.
+
+Below a few hundred thousand rows, a brute-force float32 matmul over the
+whole tenant is exact and faster than an IVFFlat query plus a network hop.
+ExactVectorSearchService keeps each tenant's unit-normalized embedding matrix
+in a ``.npy`` file with an id array beside it, maps both read-only, and ranks
+with a blocked matmul plus ``argpartition``. Because the files are mapped,
+all Uvicorn workers on a host share one copy of the pages in the page cache.
+
+Freshness and fallback:
+    - Every EXACT_SEARCH_CHECK_INTERVAL_SECONDS a tenant's (count,
+      max(updated_at)) is compared with the mapped snapshot. On a mismatch the
+      snapshot is rebuilt from the embeddings table, or re-mapped if another
+      worker already rebuilt it.
+    - Snapshots are written under a fresh name and published by atomically
+      replacing the small meta file, so readers never see a partial matrix.
+    - Tenants above EXACT_SEARCH_MAX_ROWS, source-filtered searches, stale
+      ids and any error are answered by pgvector.
+
+Similarity is cosine on normalized vectors. For unit-normalized embeddings
+this gives the same ranking as the inner product and L2 metrics.
+
+Configuration (environment):
+    VECTOR_SEARCH_BACKEND: exact selects this backend (see vector_search_backends)
+    EXACT_SEARCH_DIR: Snapshot directory (default: ~/.cache/truthgraph/exact_search)
+    EXACT_SEARCH_MAX_ROWS: Largest tenant served in-process (default: 300000)
+    EXACT_SEARCH_BLOCK_ROWS: Rows per matmul block (default: 65536)
+    EXACT_SEARCH_CHECK_INTERVAL_SECONDS: Freshness check interval (default: 30)
+
+Example:
+    >>> service = ExactVectorSearchService.get_instance()
+    >>> results = service.search_similar_evidence(db, query_embedding, top_k=10)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+from uuid import UUID, uuid4
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from truthgraph.db_queries.distance import DistanceMetric
+from truthgraph.db_queries.vector_adapter import as_float32_matrix, vector_connection
+from truthgraph.services.vector_search_service import SearchResult, VectorSearchService
+
+logger = logging.getLogger(__name__)
+
+
+def exact_top_k(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    top_k: int,
+    block_rows: int = 65536,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Exact top-k by inner product, computed in row blocks.
+
+    Each block contributes its own top-k (argpartition, no full sort), which
+    is merged with the running top-k, so peak memory is
+    queries x block_rows scores regardless of corpus size.
+
+    Args:
+        vectors: (n, d) matrix, possibly memory-mapped
+        queries: (m, d) query matrix
+        top_k: Neighbours per query
+        block_rows: Rows of vectors scored per matmul
+
+    Returns:
+        (indices, scores), each (m, min(top_k, n)), best first
+    """
+    n = vectors.shape[0]
+    m = queries.shape[0]
+    k = min(top_k, n)
+    best_idx = np.empty((m, 0), dtype=np.int64)
+    best_scores = np.empty((m, 0), dtype=np.float32)
+    if k <= 0:
+        return best_idx, best_scores
+
+    for start in range(0, n, block_rows):
+        scores = queries @ vectors[start : start + block_rows].T
+        kb = min(k, scores.shape[1])
+        part = np.argpartition(-scores, kb - 1, axis=1)[:, :kb]
+        best_idx = np.concatenate([best_idx, part + start], axis=1)
+        best_scores = np.concatenate([best_scores, np.take_along_axis(scores, part, 1)], axis=1)
+        if best_idx.shape[1] > k:
+            keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+            best_idx = np.take_along_axis(best_idx, keep, 1)
+            best_scores = np.take_along_axis(best_scores, keep, 1)
+
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    return np.take_along_axis(best_idx, order, 1), np.take_along_axis(best_scores, order, 1)
+
+
+@dataclass
+class TenantMatrix:
+    """A tenant's mapped embedding snapshot.
+
+    Attributes:
+        vectors: (n, d) float32 unit-normalized embeddings (read-only memmap)
+        ids: (n, 16) uint8 evidence UUID bytes (read-only memmap)
+        count: Rows in the snapshot
+        high_water_mark: Latest embeddings.updated_at in the snapshot
+        build_id: Snapshot file name component
+    """
+
+    vectors: np.ndarray
+    ids: np.ndarray
+    count: int
+    high_water_mark: Optional[datetime]
+    build_id: str
+
+    def evidence_id(self, row: int) -> UUID:
+        """Evidence id of a matrix row."""
+        return UUID(bytes=self.ids[row].tobytes())
+
+
+class ExactVectorSearchService(VectorSearchService):
+    """VectorSearchService that ranks small tenants by exact in-process search.
+
+    Drop-in replacement for VectorSearchService; tenants above max_rows are
+    served by pgvector unchanged.
+    """
+
+    _instance: ClassVar[Optional["ExactVectorSearchService"]] = None
+
+    MAX_ROWS: ClassVar[int] = int(os.getenv("EXACT_SEARCH_MAX_ROWS", "300000"))
+    BLOCK_ROWS: ClassVar[int] = int(os.getenv("EXACT_SEARCH_BLOCK_ROWS", "65536"))
+
+    # Rows fetched per round-trip while building a snapshot
+    LOAD_CHUNK_SIZE: ClassVar[int] = 5000
+
+    def __init__(
+        self,
+        embedding_dimension: int = 384,
+        metric: DistanceMetric | str | None = None,
+        data_dir: Optional[Path | str] = None,
+        max_rows: Optional[int] = None,
+        block_rows: Optional[int] = None,
+        check_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the service (snapshots are built or mapped lazily).
+
+        Args:
+            embedding_dimension: Dimension of embeddings (384 or 1536, default: 384)
+            metric: Distance metric used for pgvector fallback queries
+            data_dir: Snapshot directory (defaults to EXACT_SEARCH_DIR)
+            max_rows: Largest tenant served in-process (defaults to EXACT_SEARCH_MAX_ROWS)
+            block_rows: Rows per matmul block (defaults to EXACT_SEARCH_BLOCK_ROWS)
+            check_interval_seconds: Seconds between freshness checks against the
+                embeddings table (defaults to EXACT_SEARCH_CHECK_INTERVAL_SECONDS, 30)
+        """
+        super().__init__(embedding_dimension=embedding_dimension, metric=metric)
+        if data_dir is None:
+            configured = os.getenv("EXACT_SEARCH_DIR")
+            data_dir = (
+                Path(configured)
+                if configured
+                else Path.home() / ".cache" / "truthgraph" / "exact_search"
+            )
+        self.data_dir = Path(data_dir)
+        self.max_rows = self.MAX_ROWS if max_rows is None else max_rows
+        self.block_rows = block_rows or self.BLOCK_ROWS
+        if check_interval_seconds is None:
+            check_interval_seconds = float(os.getenv("EXACT_SEARCH_CHECK_INTERVAL_SECONDS", "30"))
+        self.check_interval_seconds = check_interval_seconds
+
+        self._matrices: dict[str, TenantMatrix] = {}
+        self._oversized: set[str] = set()
+        self._last_check: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"exact_searches": 0, "fallbacks": 0, "builds": 0, "remaps": 0}
+
+    # ===== Snapshots =====
+
+    def _prefix(self, tenant_id: str) -> str:
+        # Dot-free slug plus a hash: distinct tenants never share a file prefix
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", tenant_id)
+        digest = hashlib.sha1(tenant_id.encode()).hexdigest()[:8]
+        return f"{slug}-{digest}.{self.embedding_dimension}"
+
+    def _meta_path(self, tenant_id: str) -> Path:
+        return self.data_dir / f"{self._prefix(tenant_id)}.meta.json"
+
+    def _array_paths(self, tenant_id: str, build_id: str) -> tuple[Path, Path]:
+        base = self.data_dir / f"{self._prefix(tenant_id)}.{build_id}"
+        return base.with_name(base.name + ".vectors.npy"), base.with_name(base.name + ".ids.npy")
+
+    def _map_snapshot(self, tenant_id: str) -> Optional[TenantMatrix]:
+        """Map the published snapshot for a tenant, if there is a readable one."""
+        try:
+            meta = json.loads(self._meta_path(tenant_id).read_text())
+            vectors_path, ids_path = self._array_paths(tenant_id, meta["build_id"])
+            vectors = np.load(vectors_path, mmap_mode="r")
+            ids = np.load(ids_path, mmap_mode="r")
+        except (OSError, ValueError, KeyError):
+            return None
+        if vectors.shape != (meta["count"], self.embedding_dimension) or len(ids) != len(vectors):
+            return None
+        high_water_mark = meta["high_water_mark"]
+        return TenantMatrix(
+            vectors=vectors,
+            ids=ids,
+            count=meta["count"],
+            high_water_mark=datetime.fromisoformat(high_water_mark) if high_water_mark else None,
+            build_id=meta["build_id"],
+        )
+
+    def build_snapshot(self, db: Session, tenant_id: str = "default") -> TenantMatrix:
+        """Write a tenant's embeddings to a new snapshot and publish it.
+
+        Args:
+            db: SQLAlchemy database session
+            tenant_id: Tenant identifier
+
+        Returns:
+            The newly mapped snapshot
+        """
+        count = db.execute(
+            text(
+                "SELECT count(*) FROM embeddings "
+                "WHERE entity_type = 'evidence' AND tenant_id = :tenant_id"
+            ),
+            {"tenant_id": tenant_id},
+        ).scalar()
+
+        if count == 0:
+            return self._empty_matrix()
+
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        build_id = uuid4().hex[:12]
+        vectors_path, ids_path = self._array_paths(tenant_id, build_id)
+        vectors = np.lib.format.open_memmap(
+            vectors_path, mode="w+", dtype=np.float32, shape=(count, self.embedding_dimension)
+        )
+        ids = np.lib.format.open_memmap(ids_path, mode="w+", dtype=np.uint8, shape=(count, 16))
+
+        written = 0
+        high_water_mark = None
+        with vector_connection(db).cursor() as cursor:
+            # LIMIT keeps rows inserted since the count for the next refresh
+            cursor.execute(
+                """
+                SELECT entity_id, embedding, updated_at
+                FROM embeddings
+                WHERE entity_type = 'evidence' AND tenant_id = %(tenant_id)s
+                ORDER BY updated_at
+                LIMIT %(count)s
+                """,
+                {"tenant_id": tenant_id, "count": count},
+            )
+            while rows := cursor.fetchmany(self.LOAD_CHUNK_SIZE):
+                chunk = as_float32_matrix([np.asarray(row[1]) for row in rows])
+                norms = np.linalg.norm(chunk, axis=1, keepdims=True)
+                vectors[written : written + len(rows)] = chunk / np.maximum(norms, 1e-12)
+                ids[written : written + len(rows)] = np.frombuffer(
+                    b"".join(row[0].bytes for row in rows), dtype=np.uint8
+                ).reshape(-1, 16)
+                written += len(rows)
+                high_water_mark = rows[-1][2]
+        vectors.flush()
+        ids.flush()
+        del vectors, ids
+
+        if written == 0:
+            vectors_path.unlink(missing_ok=True)
+            ids_path.unlink(missing_ok=True)
+            return self._empty_matrix()
+        if written != count:
+            # Rows deleted between the count and the scan
+            self._truncate(vectors_path, written)
+            self._truncate(ids_path, written)
+
+        self._publish(tenant_id, build_id, written, high_water_mark)
+        self._stats["builds"] += 1
+        logger.info(f"Built exact-search snapshot for tenant '{tenant_id}': {written} vectors")
+        matrix = self._map_snapshot(tenant_id)
+        if matrix is None:
+            raise RuntimeError(f"Exact-search snapshot for tenant '{tenant_id}' is unreadable")
+        return matrix
+
+    def _empty_matrix(self) -> TenantMatrix:
+        """Snapshot for a tenant without evidence (numpy cannot map zero rows)."""
+        return TenantMatrix(
+            vectors=np.empty((0, self.embedding_dimension), dtype=np.float32),
+            ids=np.empty((0, 16), dtype=np.uint8),
+            count=0,
+            high_water_mark=None,
+            build_id="",
+        )
+
+    @staticmethod
+    def _truncate(path: Path, rows: int) -> None:
+        array = np.load(path, mmap_mode="r")
+        truncated = np.array(array[:rows])
+        del array
+        np.save(path, truncated)
+
+    def _publish(
+        self, tenant_id: str, build_id: str, count: int, high_water_mark: Optional[datetime]
+    ) -> None:
+        """Atomically point the tenant's meta file at a new build and prune old builds."""
+        meta_path = self._meta_path(tenant_id)
+        tmp_path = meta_path.with_name(f"{meta_path.name}.{build_id}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "build_id": build_id,
+                    "count": count,
+                    "dimension": self.embedding_dimension,
+                    "high_water_mark": high_water_mark.isoformat() if high_water_mark else None,
+                }
+            )
+        )
+        os.replace(tmp_path, meta_path)
+
+        # Mapped pages of pruned builds stay valid for readers until they remap
+        current = set(self._array_paths(tenant_id, build_id))
+        for path in self.data_dir.glob(f"{self._prefix(tenant_id)}.*.npy"):
+            if path not in current:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.debug(f"Could not remove old snapshot {path}: {e}")
+
+    def _get_matrix(self, db: Session, tenant_id: str) -> Optional[TenantMatrix]:
+        """Current snapshot for a tenant, or None if pgvector should serve it."""
+        now = time.monotonic()
+        if now - self._last_check.get(tenant_id, float("-inf")) < self.check_interval_seconds:
+            if tenant_id in self._oversized:
+                return None
+            if tenant_id in self._matrices:
+                return self._matrices[tenant_id]
+
+        with self._lock:
+            count, high_water_mark = db.execute(
+                text(
+                    "SELECT count(*), max(updated_at) FROM embeddings "
+                    "WHERE entity_type = 'evidence' AND tenant_id = :tenant_id"
+                ),
+                {"tenant_id": tenant_id},
+            ).one()
+            self._last_check[tenant_id] = now
+
+            if count > self.max_rows:
+                self._oversized.add(tenant_id)
+                self._matrices.pop(tenant_id, None)
+                return None
+            self._oversized.discard(tenant_id)
+
+            def fresh(matrix: Optional[TenantMatrix]) -> bool:
+                return (
+                    matrix is not None
+                    and matrix.count == count
+                    and matrix.high_water_mark == high_water_mark
+                )
+
+            matrix = self._matrices.get(tenant_id)
+            if not fresh(matrix):
+                matrix = self._map_snapshot(tenant_id)
+                if fresh(matrix):
+                    self._stats["remaps"] += 1
+                else:
+                    matrix = self.build_snapshot(db, tenant_id)
+                self._matrices[tenant_id] = matrix
+            return matrix
+
+    # ===== Search =====
+
+    def search_similar_evidence(
+        self,
+        db: Session,
+        query_embedding: list[float] | np.ndarray,
+        top_k: int = 10,
+        min_similarity: float = 0.0,
+        tenant_id: str = "default",
+        source_filter: Optional[str] = None,
+        ef_search: Optional[int] = None,
+    ) -> list[SearchResult]:
+        """Search for evidence similar to a query embedding.
+
+        Same contract as VectorSearchService.search_similar_evidence, with exact
+        results for tenants up to max_rows.
+
+        Raises:
+            ValueError: If query_embedding dimension doesn't match expected dimension
+            RuntimeError: If the fallback database query fails
+        """
+        if len(query_embedding) != self.embedding_dimension:
+            raise ValueError(
+                f"Query embedding must be {self.embedding_dimension}-dimensional, "
+                f"got {len(query_embedding)}"
+            )
+        if source_filter is None:
+            results = self._search_exact(db, [query_embedding], top_k, min_similarity, tenant_id)
+            if results is not None:
+                return results[0]
+
+        self._stats["fallbacks"] += 1
+        return super().search_similar_evidence(
+            db=db,
+            query_embedding=query_embedding,
+            top_k=top_k,
+            min_similarity=min_similarity,
+            tenant_id=tenant_id,
+            source_filter=source_filter,
+            ef_search=ef_search,
+        )
+
+    def search_similar_evidence_batch(
+        self,
+        db: Session,
+        query_embeddings: list[list[float]] | np.ndarray,
+        top_k: int = 10,
+        min_similarity: float = 0.0,
+        tenant_id: str = "default",
+        ef_search: Optional[int] = None,
+    ) -> list[list[SearchResult]]:
+        """Search for evidence similar to multiple query embeddings.
+
+        All queries are scored in the same blocked matmul and their content is
+        fetched in one query.
+
+        Returns:
+            List of result lists, one per query embedding
+        """
+        if len(query_embeddings) > 0:
+            results = self._search_exact(db, query_embeddings, top_k, min_similarity, tenant_id)
+            if results is not None:
+                return results
+
+        self._stats["fallbacks"] += 1
+        return super().search_similar_evidence_batch(
+            db=db,
+            query_embeddings=query_embeddings,
+            top_k=top_k,
+            min_similarity=min_similarity,
+            tenant_id=tenant_id,
+            ef_search=ef_search,
+        )
+
+    def _search_exact(
+        self,
+        db: Session,
+        query_embeddings: list[list[float]] | np.ndarray,
+        top_k: int,
+        min_similarity: float,
+        tenant_id: str,
+    ) -> Optional[list[list[SearchResult]]]:
+        """Exact search; returns None when pgvector should answer instead."""
+        try:
+            matrix = self._get_matrix(db, tenant_id)
+            if matrix is None:
+                return None
+
+            queries = as_float32_matrix(query_embeddings, self.embedding_dimension)
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.maximum(norms, 1e-12)
+            indices, scores = exact_top_k(matrix.vectors, queries, top_k, self.block_rows)
+
+            candidate_lists = [
+                [
+                    (matrix.evidence_id(int(row)), float(score))
+                    for row, score in zip(row_indices, row_scores, strict=True)
+                    if score >= min_similarity
+                ]
+                for row_indices, row_scores in zip(indices, scores, strict=True)
+            ]
+            results, stale = self._results_for_candidates(db, candidate_lists)
+        except Exception as e:
+            logger.warning(
+                f"Exact search failed for tenant '{tenant_id}', falling back to pgvector: {e}"
+            )
+            return None
+
+        if stale:
+            # Deleted evidence; force a rebuild on the next search
+            self._last_check.pop(tenant_id, None)
+            self._matrices.pop(tenant_id, None)
+            return None
+
+        self._stats["exact_searches"] += len(candidate_lists)
+        return results
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get exact-search backend statistics.
+
+        Returns:
+            Dictionary with search/fallback/build counters and per-tenant sizes
+        """
+        return {
+            **self._stats,
+            "tenants": {tenant_id: matrix.count for tenant_id, matrix in self._matrices.items()},
+            "oversized_tenants": sorted(self._oversized),
+        }
+
+    @classmethod
+    def get_instance(cls, embedding_dimension: int = 384) -> "ExactVectorSearchService":
+        """Get the process-wide instance (mappings are shared by all requests).
+
+        Args:
+            embedding_dimension: Embedding dimension, used on first call only
+
+        Returns:
+            ExactVectorSearchService singleton
+        """
+        if cls._instance is None:
+            cls._instance = cls(embedding_dimension=embedding_dimension)
+        return cls._instance
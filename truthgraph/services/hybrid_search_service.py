@@ -2,7 +2,8 @@
 
 This module provides hybrid search functionality that combines:
 1. Vector similarity search using pgvector (semantic search)
-2. PostgreSQL full-text search (keyword search)
+2. PostgreSQL full-text search (keyword search) on the GIN-indexed
+   evidence.content_tsv generated column
 3. Reciprocal Rank Fusion (RRF) for result merging
 
 The hybrid approach leverages the strengths of both methods:
@@ -10,23 +11,106 @@ The hybrid approach leverages the strengths of both methods:
 - Keyword search: Exact term matching and traditional IR
 - RRF: Robust rank aggregation without score normalization
 
+hybrid_search runs the two branches one after the other on the caller's
+session. hybrid_search_concurrent runs them at the same time, each on its own
+pooled session, and starts the keyword branch while the query embedding is
+still being computed, so latency is max(embedding + vector, keyword) rather
+than the sum. POST /api/v1/search in hybrid mode uses it with python fusion.
+
+With fusion mode "sql" (HYBRID_SEARCH_FUSION=sql) hybrid_search instead runs
+both rankings as CTEs of one statement and computes the RRF score in
+PostgreSQL, so only the final top_k rows (with content) leave the database.
+
+The keyword branch is answered by Postgres full-text search or, per tenant,
+by the in-process BM25 index (KEYWORD_SEARCH_BACKEND=bm25, see
+bm25_search_service). BM25 tenants always fuse in Python, and filtered
+keyword searches and BM25 failures go to Postgres.
+
 Performance target: <150ms for hybrid queries
 """
 
+import asyncio
+import inspect
 import logging
+import os
 import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from functools import partial
+from typing import Any, Optional, TypeVar
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from ..db import SessionLocal
+from ..db_queries.vector_adapter import as_float32_vector, vector_connection
+from ..db_queries.vector_index import apply_local_ef_search
+from .bm25_search_service import BM25KeywordSearchService
 from .vector_search_service import VectorSearchService
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class HybridFusion(str, Enum):
+    """Where hybrid_search merges the vector and keyword rankings.
+
+    PYTHON fetches both candidate lists and fuses them with
+    _reciprocal_rank_fusion; SQL computes the same RRF score inside one
+    statement and returns only the final rows.
+    """
+
+    PYTHON = "python"
+    SQL = "sql"
+
+    @classmethod
+    def parse(cls, value: str) -> "HybridFusion":
+        """Parse a fusion mode name (case-insensitive).
+
+        Raises:
+            ValueError: If the name is not a known fusion mode
+        """
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            valid = ", ".join(mode.value for mode in cls)
+            raise ValueError(
+                f"Unknown hybrid search fusion mode '{value}' (expected one of: {valid})"
+            ) from None
+
+
+def get_hybrid_fusion() -> HybridFusion:
+    """Read the fusion mode from HYBRID_SEARCH_FUSION (default: python)."""
+    return HybridFusion.parse(os.getenv("HYBRID_SEARCH_FUSION", HybridFusion.PYTHON.value))
+
+
+KEYWORD_SEARCH_BACKENDS = ("postgres", "bm25")
+
+
+def validate_keyword_backend(backend: str) -> str:
+    """Normalize a keyword search backend name.
+
+    Raises:
+        ValueError: If the name is not a known backend
+    """
+    normalized = backend.strip().lower()
+    if normalized not in KEYWORD_SEARCH_BACKENDS:
+        raise ValueError(
+            f"Keyword search backend must be one of {', '.join(KEYWORD_SEARCH_BACKENDS)}, "
+            f"got '{backend}'"
+        )
+    return normalized
+
+
+def get_keyword_search_backend() -> str:
+    """Read the default keyword search backend (KEYWORD_SEARCH_BACKEND, default: postgres)."""
+    return validate_keyword_backend(os.getenv("KEYWORD_SEARCH_BACKEND", "postgres"))
+
 
 @dataclass
 class HybridSearchResult:
@@ -80,7 +164,8 @@ class HybridSearchService:
 
     Performance characteristics:
         - Target: <150ms for hybrid queries
-        - Parallel execution of vector + keyword search
+        - Concurrent execution of vector + keyword search on separate pooled
+          connections (hybrid_search_concurrent)
         - Efficient RRF implementation with dict lookups
         - Minimal memory overhead
 
@@ -102,16 +187,75 @@ class HybridSearchService:
     # Standard value is 60 based on IR research
     RRF_K: int = 60
 
-    def __init__(self, embedding_dimension: int = 1536) -> None:
+    def __init__(
+        self,
+        embedding_dimension: int = 1536,
+        session_factory: Optional[Callable[[], Session]] = None,
+        fusion: Optional[HybridFusion | str] = None,
+        keyword_backend: Optional[str] = None,
+        tenant_keyword_backends: Optional[Mapping[str, str]] = None,
+        bm25_service: Optional[BM25KeywordSearchService] = None,
+    ) -> None:
         """Initialize the hybrid search service.
 
         Args:
             embedding_dimension: Dimension of embeddings (384 or 1536, default: 1536)
+            session_factory: Creates the per-branch sessions used by
+                hybrid_search_concurrent (default: truthgraph.db.SessionLocal)
+            fusion: Where hybrid_search fuses the rankings, 'python' or 'sql'
+                (default: HYBRID_SEARCH_FUSION, else 'python')
+            keyword_backend: Default keyword backend, 'postgres' or 'bm25'
+                (default: KEYWORD_SEARCH_BACKEND, else 'postgres')
+            tenant_keyword_backends: Per-tenant keyword backend overrides
+            bm25_service: BM25 backend (default: the process-wide
+                BM25KeywordSearchService, created on first use)
         """
         self.vector_service = VectorSearchService(embedding_dimension=embedding_dimension)
         self.embedding_dimension = embedding_dimension
+        self.session_factory = session_factory or SessionLocal
+        if fusion is None:
+            self.fusion = get_hybrid_fusion()
+        elif isinstance(fusion, HybridFusion):
+            self.fusion = fusion
+        else:
+            self.fusion = HybridFusion.parse(fusion)
+        self.keyword_backend = (
+            get_keyword_search_backend()
+            if keyword_backend is None
+            else validate_keyword_backend(keyword_backend)
+        )
+        self.tenant_keyword_backends: dict[str, str] = {}
+        for tenant_id, backend in (tenant_keyword_backends or {}).items():
+            self.set_tenant_keyword_backend(tenant_id, backend)
+        self._bm25_service = bm25_service
         logger.info(f"HybridSearchService initialized with {embedding_dimension}-dim embeddings")
 
+    @property
+    def bm25_service(self) -> BM25KeywordSearchService:
+        """BM25 backend used by tenants whose keyword backend is 'bm25'."""
+        if self._bm25_service is None:
+            self._bm25_service = BM25KeywordSearchService.get_instance()
+        return self._bm25_service
+
+    def set_tenant_keyword_backend(self, tenant_id: str, backend: Optional[str]) -> None:
+        """Set (or with None, clear) a tenant's keyword backend override.
+
+        Args:
+            tenant_id: Tenant identifier
+            backend: 'postgres' or 'bm25'
+
+        Raises:
+            ValueError: If backend is unknown
+        """
+        if backend is None:
+            self.tenant_keyword_backends.pop(tenant_id, None)
+        else:
+            self.tenant_keyword_backends[tenant_id] = validate_keyword_backend(backend)
+
+    def keyword_backend_for(self, tenant_id: str) -> str:
+        """Keyword backend serving a tenant (override, else the service default)."""
+        return self.tenant_keyword_backends.get(tenant_id, self.keyword_backend)
+
     def _keyword_search(
         self,
         db: Session,
@@ -125,10 +269,17 @@ class HybridSearchService:
         """Perform PostgreSQL full-text search on evidence content.
 
         Uses PostgreSQL's built-in full-text search with:
-        - to_tsvector for document indexing
-        - to_tsquery for query parsing
+        - the stored evidence.content_tsv column (GIN index) for matching
+        - plainto_tsquery for query parsing
         - ts_rank for relevance scoring
 
+        Results are scoped to the tenant the same way as vector search: only
+        evidence with an embedding in tenant_id is returned.
+
+        Tenants on the 'bm25' backend are ranked by the in-process BM25 index
+        instead, unless a source or date filter is given or the index cannot
+        answer, in which case Postgres does.
+
         Args:
             db: SQLAlchemy database session
             query_text: Search query text
@@ -146,42 +297,53 @@ class HybridSearchService:
             RuntimeError: If keyword search fails
         """
         # Build the full-text search query
-        # Use plainto_tsquery for natural language queries (handles special chars)
-        sql_query = """
+        # Use plainto_tsquery for natural language queries (handles special chars).
+        # Matching on content_tsv lets the GIN index find candidates; ranking reads
+        # the stored vector instead of re-tokenizing content.
+        if self.keyword_backend_for(tenant_id) == "bm25" and not (
+            source_filter or date_from or date_to
+        ):
+            try:
+                ranked = self.bm25_service.search(db, query_text, top_k, tenant_id)
+            except Exception as e:
+                logger.warning(
+                    f"BM25 keyword search failed for tenant '{tenant_id}', "
+                    f"falling back to Postgres: {e}"
+                )
+                ranked = None
+            if ranked is not None:
+                return ranked
+
+        match_sql = self._keyword_match_sql(":{}", bool(source_filter), date_from, date_to)
+        sql_query = f"""
         SELECT
             e.id,
             e.content,
             e.source_url,
-            ts_rank(to_tsvector('english', e.content), query) as rank_score
+            ts_rank(e.content_tsv, query) as rank_score
         FROM evidence e,
              plainto_tsquery('english', :query_text) query
-        WHERE to_tsvector('english', e.content) @@ query
+        WHERE {match_sql}
+        ORDER BY rank_score DESC
+        LIMIT :top_k
         """
 
         params = {
             "query_text": query_text,
+            "tenant_id": tenant_id,
             "top_k": top_k,
         }
 
         # Add optional filters
         if source_filter:
-            sql_query += "    AND e.source_url = :source_filter\n"
             params["source_filter"] = source_filter
 
         if date_from:
-            sql_query += "    AND e.created_at >= :date_from\n"
             params["date_from"] = date_from
 
         if date_to:
-            sql_query += "    AND e.created_at <= :date_to\n"
             params["date_to"] = date_to
 
-        # Order by relevance and limit
-        sql_query += """
-        ORDER BY rank_score DESC
-        LIMIT :top_k
-        """
-
         try:
             result = db.execute(text(sql_query), params)
             rows = result.fetchall()
@@ -200,6 +362,170 @@ class HybridSearchService:
             logger.error(f"Keyword search failed: {e}", exc_info=True)
             raise RuntimeError(f"Keyword search query failed: {e}") from e
 
+    @staticmethod
+    def _keyword_match_sql(
+        placeholder: str,
+        source_filter: bool,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ) -> str:
+        """WHERE conditions of the keyword branch (evidence e, tsquery query).
+
+        Args:
+            placeholder: Format string for a bind parameter name (":{}" for
+                SQLAlchemy text(), "%({})s" for a psycopg cursor)
+            source_filter: Whether to filter on source_filter
+            date_from: Filter on date_from if set
+            date_to: Filter on date_to if set
+
+        Returns:
+            SQL condition matching on content_tsv, scoped to tenant_id
+        """
+        param = placeholder.format
+        sql = f"""e.content_tsv @@ query
+            AND EXISTS (
+                SELECT 1 FROM embeddings emb
+                WHERE emb.entity_type = 'evidence'
+                    AND emb.entity_id = e.id
+                    AND emb.tenant_id = {param("tenant_id")}
+            )"""
+        if source_filter:
+            sql += f"\n            AND e.source_url = {param('source_filter')}"
+        if date_from:
+            sql += f"\n            AND e.created_at >= {param('date_from')}"
+        if date_to:
+            sql += f"\n            AND e.created_at <= {param('date_to')}"
+        return sql
+
+    def _fused_search_sql(
+        self,
+        source_filter: bool,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ) -> str:
+        """Single statement running both rankings and their RRF fusion.
+
+        vector_ranked and keyword_ranked number the %(top_k)s best hits of each
+        branch (the same queries as the Python path); fused full-joins them on
+        evidence id, scores each with the weighted RRF formula and keeps the
+        best %(result_k)s. Content is joined in only for those final rows.
+
+        Returns:
+            SQL for a psycopg cursor (pyformat placeholders, binary query vector)
+        """
+        vector_sql = self.vector_service.top_k_sql("%(query_vector)b", source_filter)
+        match_sql = self._keyword_match_sql("%({})s", source_filter, date_from, date_to)
+        return f"""
+        WITH vector_ranked AS (
+            SELECT
+                v.id,
+                v.similarity,
+                ROW_NUMBER() OVER (ORDER BY v.similarity DESC) AS rank
+            FROM ({vector_sql}) v
+        ),
+        keyword_ranked AS (
+            SELECT
+                e.id,
+                ROW_NUMBER() OVER (ORDER BY ts_rank(e.content_tsv, query) DESC) AS rank
+            FROM evidence e,
+                 plainto_tsquery('english', %(query_text)s) query
+            WHERE {match_sql}
+            ORDER BY rank
+            LIMIT %(top_k)s
+        ),
+        fused AS (
+            SELECT
+                COALESCE(v.id, k.id) AS id,
+                COALESCE(%(vector_weight)s::float8 / (%(rrf_k)s + v.rank), 0)
+                    + COALESCE(%(keyword_weight)s::float8 / (%(rrf_k)s + k.rank), 0)
+                    AS rank_score,
+                v.similarity,
+                k.rank AS keyword_rank
+            FROM vector_ranked v
+            FULL OUTER JOIN keyword_ranked k ON k.id = v.id
+            ORDER BY rank_score DESC
+            LIMIT %(result_k)s
+        )
+        SELECT f.id, e.content, e.source_url, f.rank_score, f.similarity, f.keyword_rank
+        FROM fused f
+        JOIN evidence e ON e.id = f.id
+        ORDER BY f.rank_score DESC
+        """
+
+    def _fused_search(
+        self,
+        db: Session,
+        query_text: str,
+        query_embedding: list[float],
+        top_k: int,
+        retrieval_k: int,
+        vector_weight: float,
+        keyword_weight: float,
+        min_vector_similarity: float,
+        tenant_id: str,
+        source_filter: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ) -> list[HybridSearchResult]:
+        """Hybrid search with RRF computed in PostgreSQL (fusion mode 'sql').
+
+        Returns the same results as the Python path: weights are normalized,
+        each branch contributes its retrieval_k best hits, and ties in the
+        fused score fall in no particular order.
+        """
+        total_weight = vector_weight + keyword_weight
+        vector_service = self.vector_service
+        candidate_k, effective_ef_search = vector_service.search_limits(
+            tenant_id, retrieval_k, None
+        )
+
+        params = {
+            "query_vector": as_float32_vector(query_embedding),
+            "query_text": query_text,
+            "tenant_id": tenant_id,
+            "max_distance": vector_service.metric.max_distance(min_vector_similarity),
+            # top_k limits each branch; result_k limits the fused rows
+            "top_k": retrieval_k,
+            "result_k": top_k,
+            "vector_weight": vector_weight / total_weight,
+            "keyword_weight": keyword_weight / total_weight,
+            "rrf_k": self.RRF_K,
+        }
+        if candidate_k is not None:
+            params["candidate_k"] = candidate_k
+        if source_filter:
+            params["source_filter"] = source_filter
+        if date_from:
+            params["date_from"] = date_from
+        if date_to:
+            params["date_to"] = date_to
+
+        sql_query = self._fused_search_sql(bool(source_filter), date_from, date_to)
+        connection = vector_connection(db)
+        with connection.cursor() as cursor:
+            apply_local_ef_search(connection, cursor, effective_ef_search)
+            cursor.execute(sql_query, params)
+            rows = cursor.fetchall()
+
+        results = []
+        for evidence_id, content, source_url, rank_score, similarity, keyword_rank in rows:
+            if similarity is not None and keyword_rank is not None:
+                matched_via = "both"
+            else:
+                matched_via = "vector" if similarity is not None else "keyword"
+            results.append(
+                HybridSearchResult(
+                    evidence_id=evidence_id,
+                    content=content,
+                    source_url=source_url,
+                    rank_score=float(rank_score),
+                    vector_similarity=float(similarity) if similarity is not None else None,
+                    keyword_rank=keyword_rank,
+                    matched_via=matched_via,
+                )
+            )
+        return results
+
     def _reciprocal_rank_fusion(
         self,
         vector_results: list[tuple[UUID, str, Optional[str], float]],
@@ -326,6 +652,9 @@ class HybridSearchService:
         3. Merges results using Reciprocal Rank Fusion
         4. Returns top-k ranked results
 
+        With fusion mode 'sql' all four steps run as one statement and only the
+        top-k rows are transferred.
+
         Args:
             db: SQLAlchemy database session
             query_text: Natural language query text (for keyword search)
@@ -382,6 +711,32 @@ class HybridSearchService:
             # This ensures we have enough candidates after deduplication
             retrieval_k = max(top_k * 3, 50)
 
+            if (
+                self.fusion is HybridFusion.SQL
+                and self.keyword_backend_for(tenant_id) == "postgres"
+            ):
+                final_results = self._fused_search(
+                    db=db,
+                    query_text=query_text,
+                    query_embedding=query_embedding,
+                    top_k=top_k,
+                    retrieval_k=retrieval_k,
+                    vector_weight=vector_weight,
+                    keyword_weight=keyword_weight,
+                    min_vector_similarity=min_vector_similarity,
+                    tenant_id=tenant_id,
+                    source_filter=source_filter,
+                    date_from=date_from,
+                    date_to=date_to,
+                )
+                query_time_ms = (time.time() - start_time) * 1000
+                logger.info(
+                    f"Hybrid search (sql fusion) completed in {query_time_ms:.1f}ms: "
+                    f"{len(final_results)} results (weights: {vector_weight:.2f}/"
+                    f"{keyword_weight:.2f})"
+                )
+                return final_results, query_time_ms
+
             # 1. Vector similarity search
             vector_results_objs = self.vector_service.search_similar_evidence(
                 db=db,
@@ -436,6 +791,157 @@ class HybridSearchService:
             logger.error(f"Hybrid search failed: {e}", exc_info=True)
             raise RuntimeError(f"Hybrid search failed: {e}") from e
 
+    async def hybrid_search_concurrent(
+        self,
+        query_text: str,
+        query_embedding: Sequence[float] | np.ndarray | Awaitable[Sequence[float] | np.ndarray],
+        top_k: int = 10,
+        vector_weight: float = 0.5,
+        keyword_weight: float = 0.5,
+        min_vector_similarity: float = 0.0,
+        tenant_id: str = "default",
+        source_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> tuple[list[HybridSearchResult], float, dict[str, Any]]:
+        """Hybrid search with the vector and keyword branches running concurrently.
+
+        Same ranking as hybrid_search. The keyword branch starts immediately in
+        a worker thread on its own session; the vector branch starts in another
+        as soon as query_embedding is available. query_embedding may be an
+        awaitable (e.g. EmbeddingBatcher.embed(...)) so keyword search overlaps
+        with computing the embedding. Each search uses two pooled connections
+        while it runs.
+
+        Args:
+            query_text: Natural language query text (for keyword search)
+            query_embedding: Query embedding, or an awaitable producing it
+            top_k: Maximum number of results to return (default: 10)
+            vector_weight: Weight for vector search (default: 0.5)
+            keyword_weight: Weight for keyword search (default: 0.5)
+            min_vector_similarity: Minimum similarity for vector search (default: 0.0)
+            tenant_id: Tenant identifier (default: 'default')
+            source_filter: Optional source URL filter
+            date_from: Optional minimum creation date
+            date_to: Optional maximum creation date
+
+        Returns:
+            Tuple of (results, query_time_ms, search_stats), where search_stats
+            holds per-branch timings in milliseconds (embedding_wait_ms,
+            vector_ms, keyword_ms, fusion_ms) and per-branch result counts
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If search fails
+        """
+        start_time = time.perf_counter()
+
+        if not query_text:
+            raise ValueError("Query text cannot be empty")
+
+        if vector_weight < 0 or keyword_weight < 0:
+            raise ValueError("Weights must be non-negative")
+
+        if vector_weight + keyword_weight == 0:
+            raise ValueError("At least one weight must be positive")
+
+        retrieval_k = max(top_k * 3, 50)
+        keyword_task = asyncio.create_task(
+            asyncio.to_thread(
+                self._run_in_session,
+                partial(
+                    self._keyword_search,
+                    query_text=query_text,
+                    top_k=retrieval_k,
+                    tenant_id=tenant_id,
+                    source_filter=source_filter,
+                    date_from=date_from,
+                    date_to=date_to,
+                ),
+            )
+        )
+
+        try:
+            if inspect.isawaitable(query_embedding):
+                query_embedding = await query_embedding
+            embedding_wait_ms = (time.perf_counter() - start_time) * 1000
+
+            if len(query_embedding) != self.embedding_dimension:
+                raise ValueError(
+                    f"Query embedding must be {self.embedding_dimension}-dimensional, "
+                    f"got {len(query_embedding)}"
+                )
+
+            vector_task = asyncio.to_thread(
+                self._run_in_session,
+                partial(
+                    self.vector_service.search_similar_evidence,
+                    query_embedding=query_embedding,
+                    top_k=retrieval_k,
+                    min_similarity=min_vector_similarity,
+                    tenant_id=tenant_id,
+                    source_filter=source_filter,
+                ),
+            )
+            (vector_objs, vector_ms), (keyword_results, keyword_ms) = await asyncio.gather(
+                vector_task, keyword_task
+            )
+        except ValueError:
+            keyword_task.cancel()
+            raise
+        except Exception as e:
+            keyword_task.cancel()
+            logger.error(f"Concurrent hybrid search failed: {e}", exc_info=True)
+            raise RuntimeError(f"Hybrid search failed: {e}") from e
+
+        fusion_start = time.perf_counter()
+        vector_results = [
+            (r.evidence_id, r.content, r.source_url, r.similarity) for r in vector_objs
+        ]
+        final_results = self._reciprocal_rank_fusion(
+            vector_results=vector_results,
+            keyword_results=keyword_results,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
+            k=self.RRF_K,
+        )[:top_k]
+        fusion_ms = (time.perf_counter() - fusion_start) * 1000
+
+        query_time_ms = (time.perf_counter() - start_time) * 1000
+        search_stats = {
+            "concurrent": True,
+            "embedding_wait_ms": embedding_wait_ms,
+            "vector_ms": vector_ms,
+            "keyword_ms": keyword_ms,
+            "fusion_ms": fusion_ms,
+            "vector_results": len(vector_results),
+            "keyword_results": len(keyword_results),
+        }
+
+        logger.info(
+            f"Concurrent hybrid search completed in {query_time_ms:.1f}ms: "
+            f"{len(final_results)} results (embedding wait: {embedding_wait_ms:.1f}ms, "
+            f"vector: {vector_ms:.1f}ms, keyword: {keyword_ms:.1f}ms)"
+        )
+
+        return final_results, query_time_ms, search_stats
+
+    def _run_in_session(self, branch: Callable[[Session], T]) -> tuple[T, float]:
+        """Run a search branch on its own session from session_factory.
+
+        Args:
+            branch: Callable taking the session as its first argument
+
+        Returns:
+            Tuple of (branch result, elapsed milliseconds)
+        """
+        start = time.perf_counter()
+        db = self.session_factory()
+        try:
+            return branch(db), (time.perf_counter() - start) * 1000
+        finally:
+            db.close()
+
     def keyword_only_search(
         self,
         db: Session,
@@ -1,6 +1,9 @@
 """Machine learning services for TruthGraph."""
 
+from .embedding_batcher import EmbeddingMicroBatcher, get_embedding_batcher
 from .embedding_service import EmbeddingService, get_embedding_service
+from .inference_executor import get_inference_executor, run_inference
+from .nli_scheduler import NLIBatchScheduler, NLIDeadlineExceeded, get_nli_scheduler
 from .nli_service import NLILabel, NLIResult, NLIService, get_nli_service
 from .verdict_aggregation_service import (
     AggregationStrategy,
@@ -13,10 +16,17 @@ from .verdict_aggregation_service import (
 __all__ = [
     "EmbeddingService",
     "get_embedding_service",
+    "EmbeddingMicroBatcher",
+    "get_embedding_batcher",
+    "get_inference_executor",
+    "run_inference",
     "NLILabel",
     "NLIResult",
     "NLIService",
     "get_nli_service",
+    "NLIBatchScheduler",
+    "NLIDeadlineExceeded",
+    "get_nli_scheduler",
     "AggregationStrategy",
     "VerdictAggregationService",
     "VerdictLabel",
@@ -0,0 +1,314 @@
+"""Async micro-batching front end for single-text embedding requests.
+
+Concurrent request handlers each need one embedding (a search query, a claim
+to verify). Encoding them one by one wastes most of the model's throughput,
+so EmbeddingMicroBatcher queues individual texts, waits a short window (or
+until max_batch_size texts are waiting), and runs a single embed_batch call
+on the inference executor for the whole group.
+
+Metrics (when a MetricsCollector is attached):
+    - embedding.batcher.queue_depth (gauge): texts waiting when a batch starts
+    - embedding.batcher.batch_size (histogram): texts per encode call
+    - embedding.batcher.wait_ms (histogram): time the oldest text waited
+
+Configuration (environment):
+    EMBEDDING_BATCH_WINDOW_MS: Collection window in milliseconds (default 5)
+    EMBEDDING_MAX_BATCH_SIZE: Maximum texts per encode call (default 64)
+
+Example:
+    >>> batcher = get_embedding_batcher()
+    >>> embedding = await batcher.embed("The Earth orbits the Sun")
+    >>> len(embedding)
+    384
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, ClassVar
+
+from truthgraph.services.ml.inference_executor import get_inference_executor
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingMicroBatcher:
+    """Coalesces concurrent embed requests into batched encode calls.
+
+    The batcher is bound to the event loop it is first used on. A background
+    task owns the queue; it starts lazily on the first embed() call and is
+    stopped with stop().
+
+    Attributes:
+        embedding_service: Service providing embed_batch()
+        max_batch_size: Maximum texts per encode call
+        max_wait_ms: How long to wait for more texts after the first arrives
+    """
+
+    _instance: ClassVar["EmbeddingMicroBatcher | None"] = None
+
+    DEFAULT_WINDOW_MS: ClassVar[float] = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+    DEFAULT_MAX_BATCH_SIZE: ClassVar[int] = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "64"))
+
+    # Upper bounds of the batch-size distribution buckets
+    BATCH_SIZE_BUCKETS: ClassVar[tuple[int, ...]] = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+    def __init__(
+        self,
+        embedding_service: Any = None,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+        metrics_collector: Any = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embedding_service: Service with embed_batch(); defaults to the
+                EmbeddingService singleton
+            max_batch_size: Maximum texts per encode call
+            max_wait_ms: Collection window after the first queued text
+            metrics_collector: Optional MetricsCollector for exported metrics
+
+        Raises:
+            ValueError: If max_batch_size < 1 or max_wait_ms < 0
+        """
+        if embedding_service is None:
+            from truthgraph.services.ml.embedding_service import get_embedding_service
+
+            embedding_service = get_embedding_service()
+
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size or self.DEFAULT_MAX_BATCH_SIZE
+        self.max_wait_ms = self.DEFAULT_WINDOW_MS if max_wait_ms is None else max_wait_ms
+        self.metrics_collector = metrics_collector
+
+        if self.max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {self.max_batch_size}")
+        if self.max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {self.max_wait_ms}")
+
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]], float]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Statistics
+        self._requests = 0
+        self._batched_texts = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._max_queue_depth = 0
+        self._batch_size_counts: dict[str, int] = {}
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a single text, sharing an encode call with concurrent callers.
+
+        Args:
+            text: Input text. Must be a non-empty string.
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            ValueError: If text is empty or invalid
+            RuntimeError: If the batched encode call fails
+        """
+        if not text or not isinstance(text, str):
+            raise ValueError("Text must be a non-empty string")
+
+        self._ensure_running()
+        assert self._queue is not None
+
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future, time.perf_counter()))
+        self._requests += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return await future
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous loop was closed (e.g. between tests)
+            self._loop = loop
+            self._queue = None
+            self._task = None
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="embedding-micro-batcher")
+            logger.info(
+                f"Embedding micro-batcher started (window={self.max_wait_ms}ms, "
+                f"max_batch_size={self.max_batch_size})"
+            )
+
+    async def _collect_batch(self) -> list[tuple[str, asyncio.Future[list[float]], float]]:
+        """Wait for one request, then gather more until the window closes or batch is full."""
+        assert self._queue is not None
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            # Drain whatever is already queued without yielding
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Background loop: collect a batch, encode it off-loop, resolve futures."""
+        assert self._queue is not None
+
+        while True:
+            batch = await self._collect_batch()
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                # Never let one bad batch kill the loop and strand later callers
+                self._failed_batches += 1
+                logger.error(f"Micro-batcher failed to process {len(batch)} texts: {e}")
+                self._fail(batch, e)
+
+    async def _process_batch(
+        self, batch: list[tuple[str, asyncio.Future[list[float]], float]]
+    ) -> None:
+        """Encode one collected batch and resolve its futures."""
+        assert self._queue is not None
+        queue_depth = self._queue.qsize() + len(batch)
+
+        # Callers that were cancelled while waiting don't need an embedding
+        live = [item for item in batch if not item[1].done()]
+        if not live:
+            return
+
+        texts = [text for text, _, _ in live]
+        wait_ms = (time.perf_counter() - live[0][2]) * 1000
+
+        try:
+            embeddings = await asyncio.get_running_loop().run_in_executor(
+                get_inference_executor(), self.embedding_service.embed_batch, texts
+            )
+            if len(embeddings) != len(texts):
+                raise RuntimeError(f"expected {len(texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            self._failed_batches += 1
+            logger.error(f"Micro-batched embedding failed for {len(texts)} texts: {e}")
+            self._fail(live, e)
+        else:
+            for (_, future, _), embedding in zip(live, embeddings, strict=True):
+                if not future.done():
+                    future.set_result(embedding)
+
+        self._record_batch(len(texts))
+        await self._export_metrics(len(texts), queue_depth, wait_ms)
+
+    @staticmethod
+    def _fail(
+        batch: list[tuple[str, asyncio.Future[list[float]], float]], error: Exception
+    ) -> None:
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(RuntimeError(f"Failed to generate embedding: {error}"))
+
+    def _record_batch(self, size: int) -> None:
+        self._batches += 1
+        self._batched_texts += size
+        bucket = next((b for b in self.BATCH_SIZE_BUCKETS if size <= b), None)
+        label = f"<={bucket}" if bucket is not None else f">{self.BATCH_SIZE_BUCKETS[-1]}"
+        self._batch_size_counts[label] = self._batch_size_counts.get(label, 0) + 1
+
+    async def _export_metrics(self, batch_size: int, queue_depth: int, wait_ms: float) -> None:
+        if self.metrics_collector is None:
+            return
+        try:
+            await self.metrics_collector.set_gauge("embedding.batcher.queue_depth", queue_depth)
+            await self.metrics_collector.record_histogram(
+                "embedding.batcher.batch_size", batch_size
+            )
+            await self.metrics_collector.record_histogram("embedding.batcher.wait_ms", wait_ms)
+        except Exception as e:
+            logger.warning(f"Failed to export micro-batcher metrics: {e}")
+
+    async def stop(self) -> None:
+        """Stop the background task and fail any requests still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Embedding micro-batcher stopped"))
+            self._queue = None
+        self._loop = None
+
+        logger.info("Embedding micro-batcher stopped")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Dictionary with queue depth, request/batch counts, average batch
+            size, and the batch-size distribution keyed by bucket label
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self._max_queue_depth,
+            "requests": self._requests,
+            "batches": self._batches,
+            "failed_batches": self._failed_batches,
+            "avg_batch_size": round(self._batched_texts / self._batches, 2)
+            if self._batches
+            else 0.0,
+            "batch_size_distribution": dict(self._batch_size_counts),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    @classmethod
+    def get_instance(cls, embedding_service: Any = None) -> "EmbeddingMicroBatcher":
+        """Get or create the process-wide batcher.
+
+        Args:
+            embedding_service: Service used if the batcher is created by this
+                call; ignored afterwards
+
+        Returns:
+            The singleton EmbeddingMicroBatcher instance
+        """
+        if cls._instance is None:
+            from truthgraph.monitoring.metrics_collector import get_metrics_collector
+
+            cls._instance = cls(
+                embedding_service=embedding_service,
+                metrics_collector=get_metrics_collector(),
+            )
+        return cls._instance
+
+
+def get_embedding_batcher(embedding_service: Any = None) -> EmbeddingMicroBatcher:
+    """Get the singleton EmbeddingMicroBatcher instance.
+
+    Args:
+        embedding_service: Service to bind when the batcher is first created
+
+    Returns:
+        The singleton EmbeddingMicroBatcher instance
+    """
+    return EmbeddingMicroBatcher.get_instance(embedding_service)
@@ -0,0 +1,434 @@
+"""Content-addressed embedding cache for EmbeddingService.
+
+This module provides a two-level cache for text embeddings:
+
+1. An in-process LRU holding the most recently used vectors.
+2. An optional on-disk store backed by a memory-mapped float32 matrix, so
+   embeddings survive process restarts and can be shared by workers that
+   point at the same directory.
+
+Entries are keyed by the model name plus a SHA-256 digest of the normalized
+text (Unicode NFC, surrounding whitespace stripped, inner whitespace runs
+collapsed). Normalization only removes differences the tokenizer ignores, so a
+cached vector is identical to what the model would produce for the raw text.
+
+Disk layout (one directory per model):
+    <cache_dir>/<model_slug>/vectors.f32  - row-major float32 matrix
+    <cache_dir>/<model_slug>/keys.txt     - one hex digest per row, append-only
+
+Example:
+    >>> cache = EmbeddingCache("sentence-transformers/all-MiniLM-L6-v2", 384)
+    >>> cache.put("The Earth orbits the Sun", [0.1] * 384)
+    >>> cache.get("The Earth  orbits the Sun ") is not None
+    True
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before hashing it into a cache key.
+
+    Args:
+        text: Raw input text
+
+    Returns:
+        NFC-normalized text with whitespace runs collapsed and ends stripped
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(model_name: str, text: str) -> str:
+    """Build the content-addressed key for a (model, text) pair.
+
+    Args:
+        model_name: Name of the embedding model
+        text: Raw input text
+
+    Returns:
+        Hex SHA-256 digest of the model name and normalized text
+    """
+    payload = f"{model_name}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class DiskEmbeddingStore:
+    """Append-only, memory-mapped float32 embedding store.
+
+    Vectors are appended to a flat float32 file and read back through a
+    numpy memmap. The row index lives in a sidecar text file with one digest
+    per line. Appends take an exclusive file lock (where available) so
+    several processes can share one directory; readers pick up rows written
+    by other processes the next time they miss in their local index.
+    """
+
+    def __init__(self, directory: str | Path, dimension: int) -> None:
+        """Open (or create) a store in the given directory.
+
+        Args:
+            directory: Directory holding vectors.f32 and keys.txt
+            dimension: Embedding dimension; every row has this many floats
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dimension = dimension
+        self._row_bytes = dimension * np.dtype(np.float32).itemsize
+        self._vectors_path = self.directory / "vectors.f32"
+        self._keys_path = self.directory / "keys.txt"
+        self._lock_path = self.directory / ".lock"
+        self._vectors_path.touch(exist_ok=True)
+        self._keys_path.touch(exist_ok=True)
+
+        self._index: dict[str, int] = {}
+        self._rows = 0
+        self._keys_offset = 0
+        self._mmap: np.memmap | None = None
+        self._lock = threading.Lock()
+        self._refresh_index()
+
+    def __len__(self) -> int:
+        """Return the number of rows currently indexed."""
+        return len(self._index)
+
+    def _refresh_index(self) -> None:
+        """Read any key lines appended since the last refresh."""
+        with open(self._keys_path, "rb") as f:
+            f.seek(self._keys_offset)
+            data = f.read()
+
+        # Only consume complete lines; a concurrent writer may be mid-append
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return
+
+        for line in data[:end].splitlines():
+            digest = line.decode("ascii").strip()
+            if digest:
+                self._index.setdefault(digest, self._rows)
+            self._rows += 1
+        self._keys_offset += end
+
+    def _row_view(self, row: int) -> np.ndarray | None:
+        """Return a read-only view of a row, remapping the file if it grew."""
+        if self._mmap is None or row >= self._mmap.shape[0]:
+            rows = self._vectors_path.stat().st_size // self._row_bytes
+            if row >= rows:
+                return None
+            self._mmap = np.memmap(
+                self._vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dimension)
+            )
+        return self._mmap[row]
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Look up a vector by key.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            A float32 copy of the stored vector, or None if absent
+        """
+        with self._lock:
+            row = self._index.get(key)
+            if row is None:
+                self._refresh_index()
+                row = self._index.get(key)
+                if row is None:
+                    return None
+            view = self._row_view(row)
+            return None if view is None else np.array(view, dtype=np.float32)
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        """Append a vector unless the key is already stored.
+
+        Args:
+            key: Cache key from make_cache_key()
+            vector: Embedding with shape (dimension,)
+
+        Raises:
+            ValueError: If the vector has the wrong dimension
+        """
+        data = np.ascontiguousarray(vector, dtype=np.float32)
+        if data.shape != (self.dimension,):
+            raise ValueError(f"Expected vector of shape ({self.dimension},), got {data.shape}")
+
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                self._refresh_index()
+                if key in self._index:
+                    return
+                # The key file is authoritative: write the vector at the row
+                # it will occupy, overwriting any orphaned bytes left by a
+                # writer that died between the two appends.
+                row = self._rows
+                with open(self._vectors_path, "r+b") as vf:
+                    vf.seek(row * self._row_bytes)
+                    vf.write(data.tobytes())
+                with open(self._keys_path, "ab") as kf:
+                    kf.write(f"{key}\n".encode("ascii"))
+                self._keys_offset += len(key) + 1
+                self._index[key] = row
+                self._rows += 1
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class EmbeddingCache:
+    """Two-level (memory LRU + optional disk) cache for text embeddings.
+
+    The cache is safe to use from multiple threads. Hit and miss counters are
+    kept per tier and exposed through get_stats().
+
+    Attributes:
+        model_name: Model the cached vectors belong to
+        dimension: Embedding dimension
+        max_entries: Capacity of the in-memory LRU (0 disables it)
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        dimension: int,
+        max_entries: int = 10000,
+        cache_dir: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            model_name: Name of the embedding model (part of every key)
+            dimension: Embedding dimension
+            max_entries: Maximum vectors held in the in-memory LRU
+            cache_dir: Root directory for the on-disk store. If None, only the
+                in-memory tier is used.
+
+        Raises:
+            ValueError: If max_entries is negative
+        """
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be non-negative, got {max_entries}")
+
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_entries = max_entries
+
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: DiskEmbeddingStore | None = None
+
+        if cache_dir:
+            model_slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+            try:
+                self._disk = DiskEmbeddingStore(Path(cache_dir) / model_slug, dimension)
+                logger.info(
+                    f"Embedding disk cache enabled at {self._disk.directory} "
+                    f"({len(self._disk)} entries)"
+                )
+            except OSError as e:
+                logger.warning(f"Embedding disk cache disabled: {e}")
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def key_for(self, text: str) -> str:
+        """Return the cache key for text under this cache's model."""
+        return make_cache_key(self.model_name, text)
+
+    def get(self, text: str) -> list[float] | None:
+        """Look up the embedding for a text.
+
+        Args:
+            text: Raw input text
+
+        Returns:
+            The cached embedding as a list of floats, or None on a miss
+        """
+        vector = self.get_array(text)
+        return None if vector is None else vector.tolist()
+
+    def get_array(self, text: str) -> np.ndarray | None:
+        """Look up the embedding for a text as a float32 array.
+
+        The returned array is the cached buffer itself and is read-only.
+
+        Args:
+            text: Raw input text
+
+        Returns:
+            The cached embedding, or None on a miss
+        """
+        return self._get_by_key(self.key_for(text))
+
+    def put(self, text: str, embedding: list[float] | np.ndarray) -> None:
+        """Store the embedding for a text in both tiers.
+
+        Args:
+            text: Raw input text
+            embedding: Embedding vector for the text
+        """
+        self._put_by_key(self.key_for(text), np.asarray(embedding, dtype=np.float32))
+
+    def get_many(self, texts: list[str]) -> tuple[list[list[float] | None], list[str]]:
+        """Look up embeddings for several texts at once.
+
+        Args:
+            texts: Raw input texts
+
+        Returns:
+            Tuple of (results aligned with texts, None for misses; keys aligned
+            with texts for use with put_many())
+        """
+        vectors, keys = self.get_many_arrays(texts)
+        return [None if v is None else v.tolist() for v in vectors], keys
+
+    def get_many_arrays(self, texts: list[str]) -> tuple[list[np.ndarray | None], list[str]]:
+        """Look up embeddings for several texts as float32 arrays.
+
+        The returned arrays are the cached buffers themselves and are read-only.
+
+        Args:
+            texts: Raw input texts
+
+        Returns:
+            Tuple of (arrays aligned with texts, None for misses; keys aligned
+            with texts for use with put_many())
+        """
+        keys = [self.key_for(t) for t in texts]
+        return [self._get_by_key(key) for key in keys], keys
+
+    def put_many(self, keys: list[str], embeddings: np.ndarray) -> None:
+        """Store several embeddings under precomputed keys.
+
+        Args:
+            keys: Keys from get_many() or key_for()
+            embeddings: Array of shape (len(keys), dimension)
+        """
+        array = np.asarray(embeddings, dtype=np.float32)
+        for key, vector in zip(keys, array, strict=True):
+            self._put_by_key(key, vector)
+
+    def _get_by_key(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return vector
+
+        if self._disk is not None:
+            try:
+                vector = self._disk.get(key)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Embedding disk cache read failed: {e}")
+                vector = None
+            if vector is not None:
+                with self._lock:
+                    self._disk_hits += 1
+                    self._remember(key, vector)
+                return vector
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def _put_by_key(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._remember(key, vector)
+
+        if self._disk is not None:
+            try:
+                self._disk.put(key, vector)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Embedding disk cache write failed: {e}")
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Insert into the memory LRU. Caller must hold self._lock.
+
+        The vector is marked read-only: hits hand out this same buffer, so an
+        in-place write by one caller would corrupt every later lookup.
+        """
+        if self.max_entries == 0:
+            return
+        vector.setflags(write=False)
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset counters (disk entries are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics.
+
+        Returns:
+            Dictionary with per-tier hits, misses, hit rate, and sizes
+        """
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                "model_name": self.model_name,
+                "memory_entries": len(self._memory),
+                "memory_capacity": self.max_entries,
+                "disk_enabled": self._disk is not None,
+                "disk_entries": len(self._disk) if self._disk is not None else 0,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "hits": hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def embedding_cache_from_env(model_name: str, dimension: int) -> EmbeddingCache:
+    """Create an EmbeddingCache configured from environment variables.
+
+    Environment:
+        EMBEDDING_CACHE_SIZE: In-memory LRU capacity (default 10000, 0 disables)
+        EMBEDDING_CACHE_DIR: Directory for the on-disk tier (unset disables)
+
+    Args:
+        model_name: Name of the embedding model
+        dimension: Embedding dimension
+
+    Returns:
+        Configured EmbeddingCache instance
+    """
+    return EmbeddingCache(
+        model_name=model_name,
+        dimension=dimension,
+        max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", "10000")),
+        cache_dir=os.getenv("EMBEDDING_CACHE_DIR") or None,
+    )
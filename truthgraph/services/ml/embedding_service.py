@@ -3,7 +3,12 @@
 This module provides a singleton service for generating semantic embeddings
 from text using the sentence-transformers library with the all-MiniLM-L6-v2 model.
 The service supports GPU/CPU/MPS device detection, batch processing, and efficient
-model caching.
+model caching. Embeddings are memoized in a content-addressed two-level cache
+(in-process LRU plus an optional memory-mapped disk store), so repeated texts
+never reach the model. Setting EMBEDDING_BACKEND=onnx serves inference through
+ONNX Runtime instead of PyTorch (see onnx_backend). Batch inputs are sorted by
+token length and grouped under a padded-token budget (EMBEDDING_MAX_BATCH_TOKENS,
+see token_batching) so short texts are not padded up to long neighbours.
 
 Performance targets:
     - >500 texts/second throughput (batch processing on CPU)
@@ -23,11 +28,21 @@ Example:
 
 import gc
 import logging
-from typing import ClassVar
+import os
+from typing import Any, ClassVar
 
+import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
+from truthgraph.services.ml.embedding_cache import EmbeddingCache, embedding_cache_from_env
+from truthgraph.services.ml.onnx_backend import (
+    OnnxSentenceEncoder,
+    get_backend,
+    quantization_enabled,
+)
+from truthgraph.services.ml.token_batching import run_token_batches, token_lengths
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +60,7 @@ class EmbeddingService:
         _instance: Class variable storing the singleton instance
         _model: The loaded SentenceTransformer model
         _device: The device being used (cuda, mps, or cpu)
+        _cache: Content-addressed embedding cache (see embedding_cache module)
 
     Thread Safety:
         This implementation is NOT thread-safe. For multi-threaded applications,
@@ -52,13 +68,16 @@ class EmbeddingService:
     """
 
     _instance: ClassVar["EmbeddingService | None"] = None
-    _model: SentenceTransformer | None = None
+    _model: "SentenceTransformer | OnnxSentenceEncoder | None" = None
     _device: str | None = None
 
     # Model configuration
     MODEL_NAME: ClassVar[str] = "sentence-transformers/all-MiniLM-L6-v2"
     EMBEDDING_DIMENSION: ClassVar[int] = 384
     DEFAULT_BATCH_SIZE: ClassVar[int] = 32
+    MAX_SEQ_LENGTH: ClassVar[int] = 256
+    # Padded-token budget per encode call on CPU (scaled like batch_size on GPU)
+    MAX_BATCH_TOKENS: ClassVar[int] = int(os.getenv("EMBEDDING_MAX_BATCH_TOKENS", "8192"))
 
     def __init__(self) -> None:
         """Initialize the embedding service.
@@ -74,6 +93,25 @@ class EmbeddingService:
         # Model will be lazy-loaded on first use
         self._model = None
         self._device = None
+        self._cache: EmbeddingCache = embedding_cache_from_env(
+            self.cache_namespace(), self.EMBEDDING_DIMENSION
+        )
+
+    @classmethod
+    def cache_namespace(cls) -> str:
+        """Name the embedding cache is keyed by.
+
+        PyTorch fp32 and ONNX int8 vectors differ numerically, so the backend
+        and precision are part of the namespace: switching EMBEDDING_BACKEND
+        or ONNX_QUANTIZE never serves cached vectors (in memory or on disk)
+        produced by the other path.
+
+        Returns:
+            "<model>:<backend>:<fp32|int8>"
+        """
+        backend = get_backend("EMBEDDING_BACKEND")
+        precision = "int8" if backend == "onnx" and quantization_enabled() else "fp32"
+        return f"{cls.MODEL_NAME}:{backend}:{precision}"
 
     @classmethod
     def get_instance(cls) -> "EmbeddingService":
@@ -147,15 +185,23 @@ class EmbeddingService:
             return
 
         try:
-            # Detect device
-            self._device = self._detect_device()
-            logger.info(f"Loading model {self.MODEL_NAME} on device: {self._device}")
-
-            # Load model
-            self._model = SentenceTransformer(
-                self.MODEL_NAME,
-                device=self._device,
-            )
+            if get_backend("EMBEDDING_BACKEND") == "onnx":
+                quantize = quantization_enabled()
+                logger.info(f"Loading ONNX model {self.MODEL_NAME} (int8={quantize})")
+                self._model = OnnxSentenceEncoder.from_pretrained(
+                    self.MODEL_NAME, quantize=quantize
+                )
+                self._device = self._model.device
+            else:
+                # Detect device
+                self._device = self._detect_device()
+                logger.info(f"Loading model {self.MODEL_NAME} on device: {self._device}")
+
+                # Load model
+                self._model = SentenceTransformer(
+                    self.MODEL_NAME,
+                    device=self._device,
+                )
 
             # Set to eval mode for inference
             self._model.eval()
@@ -195,6 +241,35 @@ class EmbeddingService:
         if not text or not isinstance(text, str):
             raise ValueError("Text must be a non-empty string")
 
+        embedding: list[float] = self.embed_text_array(text).tolist()
+        return embedding
+
+    def embed_text_array(self, text: str) -> np.ndarray:
+        """Generate the embedding for a single text as a float32 array.
+
+        ndarray-native variant of embed_text() (same caching). The result can be
+        passed straight to VectorSearchService.search_similar_evidence(), which
+        binds it as a binary pgvector parameter.
+
+        Args:
+            text: Input text to embed. Must be non-empty string.
+
+        Returns:
+            1-D float32 array of 384 values. The array is shared with the cache
+            and read-only; copy it before modifying.
+
+        Raises:
+            ValueError: If text is empty or invalid
+            RuntimeError: If model fails to generate embedding
+        """
+        if not text or not isinstance(text, str):
+            raise ValueError("Text must be a non-empty string")
+
+        cached = self._cache.get_array(text)
+        if cached is not None:
+            logger.debug(f"Embedding cache hit for text of length {len(text)}")
+            return cached
+
         # Ensure model is loaded
         self._load_model()
 
@@ -202,18 +277,19 @@ class EmbeddingService:
             # Generate embedding (returns numpy array)
             # convert_to_tensor=False ensures we get numpy arrays
             assert self._model is not None, "Model must be loaded"
-            embedding_array = self._model.encode(
-                text,
-                normalize_embeddings=True,
-                convert_to_tensor=False,
-                show_progress_bar=False,
+            embedding_array = np.asarray(
+                self._model.encode(
+                    text,
+                    normalize_embeddings=True,
+                    convert_to_tensor=False,
+                    show_progress_bar=False,
+                ),
+                dtype=np.float32,
             )
-
-            # Convert to list for JSON serialization
-            embedding: list[float] = embedding_array.tolist()
+            self._cache.put(text, embedding_array)
 
             logger.debug(f"Generated embedding for text of length {len(text)}")
-            return embedding
+            return embedding_array
 
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
@@ -224,11 +300,17 @@ class EmbeddingService:
         texts: list[str],
         batch_size: int | None = None,
         show_progress: bool = False,
+        max_batch_tokens: int | None = None,
     ) -> list[list[float]]:
         """Generate embeddings for multiple texts efficiently.
 
         This method processes texts in batches for optimal throughput. Batch processing
-        is significantly faster than processing texts individually.
+        is significantly faster than processing texts individually. Only texts that
+        miss the embedding cache (deduplicated, in first-seen order) are sent to the
+        model; cached vectors are merged back in input order.
+
+        Misses are sorted by token length and grouped so that no encode call pads
+        more than max_batch_tokens tokens; batch_size caps the texts per call.
 
         Performance:
             - CPU: >500 texts/second with batch_size=32
@@ -239,6 +321,8 @@ class EmbeddingService:
             batch_size: Number of texts to process at once. If None, uses
                 DEFAULT_BATCH_SIZE (32 for CPU, 128 for GPU).
             show_progress: Whether to display a progress bar
+            max_batch_tokens: Budget on padded tokens per encode call. If None,
+                uses MAX_BATCH_TOKENS (scaled 4x on GPU).
 
         Returns:
             List of embeddings, where each embedding is a list of 384 floats.
@@ -257,12 +341,65 @@ class EmbeddingService:
             >>> all(len(emb) == 384 for emb in embeddings)
             True
         """
+        embeddings: list[list[float]] = self.embed_batch_array(
+            texts,
+            batch_size=batch_size,
+            show_progress=show_progress,
+            max_batch_tokens=max_batch_tokens,
+        ).tolist()
+        return embeddings
+
+    def embed_batch_array(
+        self,
+        texts: list[str],
+        batch_size: int | None = None,
+        show_progress: bool = False,
+        max_batch_tokens: int | None = None,
+    ) -> np.ndarray:
+        """Generate embeddings for multiple texts as one float32 matrix.
+
+        ndarray-native variant of embed_batch() (same caching and batching).
+        The result can be handed to the database layer without converting to
+        Python floats (see OptimizedQueries.batch_create_embeddings_from_array).
+
+        Args:
+            texts: List of input texts to embed. Empty strings will raise an error.
+            batch_size: Number of texts to process at once (see embed_batch)
+            show_progress: Whether to display a progress bar
+            max_batch_tokens: Budget on padded tokens per encode call
+
+        Returns:
+            C-contiguous float32 array of shape (len(texts), 384), rows in input order
+
+        Raises:
+            ValueError: If texts is empty or contains invalid entries
+            RuntimeError: If batch processing fails
+        """
         if not texts:
             raise ValueError("texts list cannot be empty")
 
         if not all(isinstance(t, str) and t for t in texts):
             raise ValueError("All texts must be non-empty strings")
 
+        cached, keys = self._cache.get_many_arrays(texts)
+        embeddings = np.empty((len(texts), self.EMBEDDING_DIMENSION), dtype=np.float32)
+
+        # Unique cache misses in first-seen order
+        miss_positions: dict[str, list[int]] = {}
+        miss_texts: list[str] = []
+        for i, (text, key) in enumerate(zip(texts, keys, strict=True)):
+            if cached[i] is not None:
+                embeddings[i] = cached[i]
+                continue
+            if key not in miss_positions:
+                miss_positions[key] = []
+                miss_texts.append(text)
+            miss_positions[key].append(i)
+
+        if not miss_texts:
+            logger.debug(f"All {len(texts)} embeddings served from cache")
+            return embeddings
+
         # Ensure model is loaded
         self._load_model()
 
@@ -270,30 +407,48 @@ class EmbeddingService:
         if batch_size is None:
             # Use larger batches for GPU
             batch_size = 128 if self._device in ["cuda", "mps"] else self.DEFAULT_BATCH_SIZE
+        if max_batch_tokens is None:
+            scale = 4 if self._device in ["cuda", "mps"] else 1
+            max_batch_tokens = self.MAX_BATCH_TOKENS * scale
 
         try:
             logger.info(
-                f"Processing {len(texts)} texts with batch_size={batch_size} "
+                f"Processing {len(miss_texts)} texts ({len(texts) - len(miss_texts)} cached) "
+                f"with batch_size={batch_size}, max_batch_tokens={max_batch_tokens} "
                 f"on device={self._device}"
             )
 
-            # Generate embeddings (returns numpy array)
             assert self._model is not None, "Model must be loaded"
-            embeddings_array = self._model.encode(
-                texts,
-                batch_size=batch_size,
-                normalize_embeddings=True,
-                convert_to_tensor=False,
-                show_progress_bar=show_progress,
+            model = self._model
+
+            def encode(batch: list[str]) -> np.ndarray:
+                # Each planned batch fits in one encode call of at most batch_size texts
+                return np.asarray(
+                    model.encode(
+                        batch,
+                        batch_size=batch_size,
+                        normalize_embeddings=True,
+                        convert_to_tensor=False,
+                        show_progress_bar=show_progress,
+                    ),
+                    dtype=np.float32,
+                )
+
+            lengths = token_lengths(
+                getattr(model, "tokenizer", None), miss_texts, max_length=self.MAX_SEQ_LENGTH
             )
+            rows = run_token_batches(miss_texts, lengths, encode, max_batch_tokens, batch_size)
+            embeddings_array = np.stack(rows)
+            self._cache.put_many(list(miss_positions), embeddings_array)
 
-            # Convert to list of lists for JSON serialization
-            embeddings: list[list[float]] = embeddings_array.tolist()
+            # Merge fresh embeddings back into input order
+            for positions, vector in zip(miss_positions.values(), embeddings_array, strict=True):
+                embeddings[positions] = vector
 
-            logger.info(f"Successfully generated {len(embeddings)} embeddings")
+            logger.info(f"Successfully generated {len(miss_texts)} embeddings")
 
             # Memory cleanup for large batches
-            if len(texts) > 1000:
+            if len(miss_texts) > 1000:
                 self._cleanup_memory()
 
             return embeddings
@@ -337,6 +492,18 @@ class EmbeddingService:
         """
         return self.EMBEDDING_DIMENSION
 
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get embedding cache hit/miss statistics.
+
+        Returns:
+            Dictionary of cache statistics (see EmbeddingCache.get_stats)
+        """
+        return self._cache.get_stats()
+
+    def clear_cache(self) -> None:
+        """Clear the in-memory embedding cache and reset its counters."""
+        self._cache.clear()
+
     def is_loaded(self) -> bool:
         """Check if the model is currently loaded in memory.
 
@@ -0,0 +1,77 @@
+"""Dedicated thread pool for CPU-bound model inference.
+
+Embedding and NLI calls hold the CPU for tens to hundreds of milliseconds.
+Run on the event loop they stall every other request and worker in the
+process; run on the loop's default executor they compete with (and can
+exhaust) the threads used for database and file I/O. All model calls made
+from async code therefore go through one small, bounded pool. Callers that
+submit more work than the pool has threads wait in its queue without
+blocking the loop.
+
+Configuration (environment):
+    ML_INFERENCE_THREADS: Worker threads for model calls (default 2). The
+        models already use several intra-op threads each, so a small pool
+        is enough to keep the CPU busy.
+
+Example:
+    >>> embedding = await run_inference(embedding_service.embed_text, "claim")
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_INFERENCE_THREADS = int(os.getenv("ML_INFERENCE_THREADS", "2"))
+
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """Get the process-wide model inference executor, creating it on first use.
+
+    Returns:
+        Bounded ThreadPoolExecutor for model calls
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, DEFAULT_INFERENCE_THREADS),
+                    thread_name_prefix="ml-inference",
+                )
+    return _executor
+
+
+async def run_inference(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking model call on the inference executor.
+
+    Args:
+        func: Blocking callable (e.g. embed_text, verify_batch)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        func's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_inference_executor(), partial(func, *args, **kwargs))
+
+
+def shutdown_inference_executor(wait: bool = True) -> None:
+    """Shut down the inference executor (a later call creates a new one).
+
+    Args:
+        wait: Whether to wait for running calls to finish
+    """
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
@@ -313,6 +313,8 @@ class ModelCache:
                 - device_info: Information about compute devices
                 - model_stats: Per-model statistics
                 - system_info: System-level resource information
+                - embedding_cache: Embedding cache hits/misses (if embedding
+                  service is loaded)
 
         Example:
             >>> cache = ModelCache.get_instance()
@@ -347,6 +349,10 @@ class ModelCache:
         except ImportError:
             system_info["psutil_available"] = False
 
+        embedding_cache_stats: dict[str, Any] = {}
+        if self._embedding_service is not None:
+            embedding_cache_stats = self._embedding_service.get_cache_stats()
+
         return {
             "models_loaded": models_loaded,
             "total_memory_mb": total_memory,
@@ -363,6 +369,7 @@ class ModelCache:
                 for name, stats in self._stats.items()
             },
             "system_info": system_info,
+            "embedding_cache": embedding_cache_stats,
         }
 
     def _estimate_model_memory(self) -> float:
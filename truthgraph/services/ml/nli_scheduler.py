@@ -0,0 +1,409 @@
+"""Shared continuous-batching scheduler for NLI inference.
+
+Every claim verification produces a handful of (premise, hypothesis) pairs.
+Run per claim, those pairs rarely fill a model batch, and concurrent claims
+each pay full model latency. NLIBatchScheduler is a single process-wide loop
+that callers submit pairs to; it packs pairs from many requests into full
+batches and resolves one future per pair as soon as its batch finishes.
+
+Scheduling policy:
+    - Earliest deadline first: requests are ordered by deadline (requests
+      without a deadline go last, in arrival order).
+    - Fairness: a batch is filled round-robin, one pair per request per turn,
+      so a claim with 50 evidence items cannot starve a claim with 3.
+    - Deadlines: pairs whose deadline has passed are failed with
+      NLIDeadlineExceeded instead of consuming model time.
+    - Only one batch is in flight at a time. This orders the scheduler's own
+      model calls only; /nli and pipelines built without the scheduler still
+      call the NLIService directly and concurrently.
+
+Metrics (when a MetricsCollector is attached):
+    - nli.scheduler.queue_depth (gauge): pairs waiting when a batch starts
+    - nli.scheduler.batch_size (histogram): pairs per model call
+    - nli.scheduler.requests_per_batch (histogram): distinct requests packed
+    - nli.scheduler.deadline_expired (counter): pairs dropped past deadline
+
+Configuration (environment):
+    NLI_SCHEDULER_BATCH_SIZE: Pairs per model call (default 16)
+    NLI_SCHEDULER_WINDOW_MS: Wait for a fuller batch when the queue is short
+        (default 2)
+
+Example:
+    >>> scheduler = get_nli_scheduler()
+    >>> results = await scheduler.verify([("Paris is in France", "Paris is French")])
+    >>> results[0].label
+    <NLILabel.ENTAILMENT: 'entailment'>
+"""
+
+import asyncio
+import itertools
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+import structlog
+
+from truthgraph.services.ml.inference_executor import get_inference_executor
+from truthgraph.services.ml.nli_service import NLIResult
+
+logger = structlog.get_logger(__name__)
+
+
+class NLIDeadlineExceeded(TimeoutError):
+    """Raised for pairs whose deadline passed before they were scheduled."""
+
+
+@dataclass
+class _PendingRequest:
+    """Pairs submitted together by one caller, consumed front to back."""
+
+    request_id: int
+    deadline: float | None
+    items: deque[tuple[str, str, asyncio.Future[NLIResult]]] = field(default_factory=deque)
+
+    def sort_key(self) -> tuple[float, int]:
+        return (self.deadline if self.deadline is not None else float("inf"), self.request_id)
+
+
+class NLIBatchScheduler:
+    """Packs NLI pairs from concurrent callers into shared model batches.
+
+    Attributes:
+        nli_service: Service providing verify_batch()
+        batch_size: Maximum pairs per model call
+        max_wait_ms: How long to wait for more pairs when a batch is not full
+    """
+
+    _instance: ClassVar["NLIBatchScheduler | None"] = None
+
+    DEFAULT_BATCH_SIZE: ClassVar[int] = int(os.getenv("NLI_SCHEDULER_BATCH_SIZE", "16"))
+    DEFAULT_WINDOW_MS: ClassVar[float] = float(os.getenv("NLI_SCHEDULER_WINDOW_MS", "2"))
+
+    def __init__(
+        self,
+        nli_service: Any = None,
+        batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+        metrics_collector: Any = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            nli_service: Service with verify_batch(); defaults to the NLIService
+                singleton
+            batch_size: Maximum pairs per model call
+            max_wait_ms: Wait for more pairs when fewer than batch_size are queued
+            metrics_collector: Optional MetricsCollector for exported metrics
+
+        Raises:
+            ValueError: If batch_size < 1 or max_wait_ms < 0
+        """
+        if nli_service is None:
+            from truthgraph.services.ml.nli_service import get_nli_service
+
+            nli_service = get_nli_service()
+
+        self.nli_service = nli_service
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.max_wait_ms = self.DEFAULT_WINDOW_MS if max_wait_ms is None else max_wait_ms
+        self.metrics_collector = metrics_collector
+
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+        if self.max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {self.max_wait_ms}")
+
+        self._requests: dict[int, _PendingRequest] = {}
+        self._request_ids = itertools.count()
+        self._pending_pairs = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Statistics
+        self._submitted = 0
+        self._processed = 0
+        self._expired = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._packed_requests = 0
+
+    def submit(
+        self,
+        pairs: list[tuple[str, str]],
+        deadline_ms: float | None = None,
+    ) -> list[asyncio.Future[NLIResult]]:
+        """Queue pairs for inference and return one future per pair.
+
+        Must be called from the event loop the scheduler runs on.
+
+        Args:
+            pairs: (premise, hypothesis) tuples
+            deadline_ms: Optional budget in milliseconds from now; pairs still
+                queued after it elapses fail with NLIDeadlineExceeded
+
+        Returns:
+            Futures resolving to NLIResult, in the same order as pairs
+
+        Raises:
+            ValueError: If pairs is empty or contains empty texts
+        """
+        if not pairs:
+            raise ValueError("Pairs list cannot be empty")
+        for i, (premise, hypothesis) in enumerate(pairs):
+            if not premise or not premise.strip():
+                raise ValueError(f"Premise at index {i} cannot be empty")
+            if not hypothesis or not hypothesis.strip():
+                raise ValueError(f"Hypothesis at index {i} cannot be empty")
+
+        self._ensure_running()
+        assert self._wakeup is not None
+
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+        request = _PendingRequest(request_id=next(self._request_ids), deadline=deadline)
+        futures: list[asyncio.Future[NLIResult]] = []
+        for premise, hypothesis in pairs:
+            future: asyncio.Future[NLIResult] = loop.create_future()
+            request.items.append((premise, hypothesis, future))
+            futures.append(future)
+
+        self._requests[request.request_id] = request
+        self._pending_pairs += len(pairs)
+        self._submitted += len(pairs)
+        self._wakeup.set()
+        return futures
+
+    async def verify(
+        self,
+        pairs: list[tuple[str, str]],
+        deadline_ms: float | None = None,
+    ) -> list[NLIResult]:
+        """Submit pairs and wait for all results.
+
+        Args:
+            pairs: (premise, hypothesis) tuples
+            deadline_ms: Optional scheduling budget in milliseconds
+
+        Returns:
+            NLIResult objects in the same order as pairs
+
+        Raises:
+            ValueError: If pairs are invalid
+            NLIDeadlineExceeded: If any pair missed its deadline
+            RuntimeError: If model inference fails
+        """
+        futures = self.submit(pairs, deadline_ms=deadline_ms)
+        try:
+            return list(await asyncio.gather(*futures))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous loop was closed (e.g. between tests)
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._task = None
+            self._requests.clear()
+            self._pending_pairs = 0
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="nli-batch-scheduler")
+            logger.info(
+                "nli_scheduler_started",
+                batch_size=self.batch_size,
+                max_wait_ms=self.max_wait_ms,
+            )
+
+    def _expire_and_prune(self) -> int:
+        """Fail past-deadline pairs and drop cancelled/empty requests.
+
+        Returns:
+            Number of pairs expired
+        """
+        now = time.monotonic()
+        expired = 0
+        for request_id in list(self._requests):
+            request = self._requests[request_id]
+            live = deque(item for item in request.items if not item[2].done())
+            self._pending_pairs -= len(request.items) - len(live)
+            request.items = live
+
+            if request.deadline is not None and request.deadline <= now:
+                for _, _, future in request.items:
+                    future.set_exception(
+                        NLIDeadlineExceeded("NLI pair not scheduled before its deadline")
+                    )
+                expired += len(request.items)
+                self._pending_pairs -= len(request.items)
+                request.items.clear()
+
+            if not request.items:
+                del self._requests[request_id]
+
+        self._expired += expired
+        return expired
+
+    def _pack_batch(self) -> tuple[list[tuple[str, str, asyncio.Future[NLIResult]]], int]:
+        """Fill one batch round-robin across requests in deadline order.
+
+        Returns:
+            Tuple of (batch items, number of distinct requests represented)
+        """
+        ordered = sorted(self._requests.values(), key=_PendingRequest.sort_key)
+        batch: list[tuple[str, str, asyncio.Future[NLIResult]]] = []
+        represented: set[int] = set()
+
+        while len(batch) < self.batch_size and ordered:
+            still_pending = []
+            for request in ordered:
+                if len(batch) >= self.batch_size:
+                    still_pending.append(request)
+                    continue
+                batch.append(request.items.popleft())
+                represented.add(request.request_id)
+                if request.items:
+                    still_pending.append(request)
+                else:
+                    del self._requests[request.request_id]
+            ordered = still_pending
+
+        self._pending_pairs -= len(batch)
+        return batch, len(represented)
+
+    async def _run(self) -> None:
+        """Scheduler loop: wait for work, pack a batch, run it off-loop."""
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        loop = asyncio.get_running_loop()
+
+        while True:
+            if self._pending_pairs == 0:
+                wakeup.clear()
+                await wakeup.wait()
+
+            # Give concurrent submitters a moment to fill the batch
+            if self._pending_pairs < self.batch_size and self.max_wait_ms > 0:
+                await asyncio.sleep(self.max_wait_ms / 1000)
+
+            expired = self._expire_and_prune()
+            queue_depth = self._pending_pairs
+            batch, request_count = self._pack_batch()
+            if expired:
+                await self._emit("increment_counter", "nli.scheduler.deadline_expired", expired)
+            if not batch:
+                continue
+
+            pairs = [(premise, hypothesis) for premise, hypothesis, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    get_inference_executor(),
+                    lambda pairs=pairs: self.nli_service.verify_batch(
+                        pairs=pairs, batch_size=len(pairs)
+                    ),
+                )
+            except Exception as e:
+                self._failed_batches += 1
+                logger.error("nli_scheduler_batch_failed", error=str(e), batch_size=len(batch))
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError(f"Batch NLI inference failed: {e}"))
+            else:
+                for (_, _, future), result in zip(batch, results, strict=True):
+                    if not future.done():
+                        future.set_result(result)
+
+            self._batches += 1
+            self._processed += len(batch)
+            self._packed_requests += request_count
+            await self._emit("set_gauge", "nli.scheduler.queue_depth", queue_depth)
+            await self._emit("record_histogram", "nli.scheduler.batch_size", len(batch))
+            await self._emit("record_histogram", "nli.scheduler.requests_per_batch", request_count)
+
+    async def _emit(self, method: str, name: str, value: float) -> None:
+        if self.metrics_collector is None:
+            return
+        try:
+            await getattr(self.metrics_collector, method)(name, value)
+        except Exception as e:
+            logger.warning("nli_scheduler_metrics_failed", error=str(e))
+
+    async def stop(self) -> None:
+        """Stop the scheduler loop and fail any pairs still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for request in self._requests.values():
+            for _, _, future in request.items:
+                if not future.done():
+                    future.set_exception(RuntimeError("NLI scheduler stopped"))
+        self._requests.clear()
+        self._pending_pairs = 0
+        self._loop = None
+        logger.info("nli_scheduler_stopped")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary with queue depth, throughput counters, average batch
+            fill ratio, and average requests packed per batch
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queue_depth": self._pending_pairs,
+            "active_requests": len(self._requests),
+            "submitted_pairs": self._submitted,
+            "processed_pairs": self._processed,
+            "expired_pairs": self._expired,
+            "batches": self._batches,
+            "failed_batches": self._failed_batches,
+            "avg_batch_fill": (
+                round(self._processed / (self._batches * self.batch_size), 3)
+                if self._batches
+                else 0.0
+            ),
+            "avg_requests_per_batch": (
+                round(self._packed_requests / self._batches, 2) if self._batches else 0.0
+            ),
+            "batch_size": self.batch_size,
+        }
+
+    @classmethod
+    def get_instance(cls, nli_service: Any = None) -> "NLIBatchScheduler":
+        """Get or create the process-wide scheduler.
+
+        Args:
+            nli_service: Service used if the scheduler is created by this call;
+                ignored afterwards
+
+        Returns:
+            The singleton NLIBatchScheduler instance
+        """
+        if cls._instance is None:
+            from truthgraph.monitoring.metrics_collector import get_metrics_collector
+
+            cls._instance = cls(nli_service=nli_service, metrics_collector=get_metrics_collector())
+        return cls._instance
+
+
+def get_nli_scheduler(nli_service: Any = None) -> NLIBatchScheduler:
+    """Get the singleton NLIBatchScheduler instance.
+
+    Args:
+        nli_service: Service to bind when the scheduler is first created
+
+    Returns:
+        The singleton NLIBatchScheduler instance
+    """
+    return NLIBatchScheduler.get_instance(nli_service)
@@ -2,6 +2,10 @@
 
 This module provides NLI verification using DeBERTa-v3-base models fine-tuned on MNLI.
 It supports single and batch inference with GPU/CPU/MPS device detection.
+Setting NLI_BACKEND=onnx runs the model through ONNX Runtime instead of
+PyTorch (optionally int8-quantized; see onnx_backend). Batched pairs are sorted
+by token length and grouped under a padded-token budget (NLI_MAX_BATCH_TOKENS,
+see token_batching).
 
 Example:
     >>> service = get_nli_service()
@@ -14,6 +18,7 @@ Example:
 """
 
 import gc
+import os
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, ClassVar
@@ -25,6 +30,13 @@ from transformers import (  # type: ignore[import-untyped]
     AutoTokenizer,
 )
 
+from truthgraph.services.ml.onnx_backend import (
+    OnnxSequenceClassifier,
+    get_backend,
+    quantization_enabled,
+)
+from truthgraph.services.ml.token_batching import run_token_batches, token_lengths
+
 logger = structlog.get_logger(__name__)
 
 
@@ -77,11 +89,16 @@ class NLIService:
         2: NLILabel.NEUTRAL,
     }
 
+    MAX_LENGTH: ClassVar[int] = 512
+    # Padded-token budget per forward pass in verify_batch
+    MAX_BATCH_TOKENS: ClassVar[int] = int(os.getenv("NLI_MAX_BATCH_TOKENS", "4096"))
+
     def __init__(self) -> None:
         """Initialize NLI service (private - use get_nli_service() instead)."""
         self.model: Any = None  # AutoModelForSequenceClassification
         self.tokenizer: Any = None  # AutoTokenizer
         self.device: str | None = None
+        self.backend: str = "torch"
         self._initialized: bool = False
 
     @classmethod
@@ -120,6 +137,20 @@ class NLIService:
             return
 
         try:
+            self.backend = get_backend("NLI_BACKEND")
+            if self.backend == "onnx":
+                quantize = quantization_enabled()
+                logger.info("loading_nli_model_onnx", model=self._model_name, int8=quantize)
+                self.model = OnnxSequenceClassifier.from_pretrained(
+                    self._model_name, quantize=quantize
+                )
+                self.tokenizer = self.model.tokenizer
+                # ONNX Runtime consumes host tensors regardless of provider
+                self.device = "cpu"
+                self._initialized = True
+                logger.info("nli_model_loaded", model=self._model_name, backend="onnx")
+                return
+
             self.device = self._detect_device()
             logger.info(
                 "loading_nli_model",
@@ -245,15 +276,20 @@ class NLIService:
         self,
         pairs: list[tuple[str, str]],
         batch_size: int = 8,
+        max_batch_tokens: int | None = None,
     ) -> list[NLIResult]:
         """Verify multiple premise-hypothesis pairs in batches.
 
         This method processes multiple pairs efficiently using batched inference.
-        Batch size 8 is optimal for CPU; increase for GPU.
+        Pairs are sorted by tokenized length and grouped so that no forward pass
+        pads more than max_batch_tokens tokens; batch_size caps the pairs per
+        pass. Batch size 8 is optimal for CPU; increase for GPU.
 
         Args:
             pairs: List of (premise, hypothesis) tuples to verify
-            batch_size: Number of pairs to process in each batch (default: 8)
+            batch_size: Maximum pairs per forward pass (default: 8)
+            max_batch_tokens: Budget on padded tokens per forward pass. If None,
+                uses MAX_BATCH_TOKENS.
 
         Returns:
             List of NLIResult objects in the same order as input pairs
@@ -285,7 +321,65 @@ class NLIService:
         # Ensure model is loaded
         self._load_model()
 
-        results: list[NLIResult] = []
+        if max_batch_tokens is None:
+            max_batch_tokens = self.MAX_BATCH_TOKENS
+        batches_processed = 0
+
+        def infer(batch_pairs: list[tuple[str, str]]) -> list[NLIResult]:
+            nonlocal batches_processed
+            batches_processed += 1
+            premises = [pair[0] for pair in batch_pairs]
+            hypotheses = [pair[1] for pair in batch_pairs]
+
+            # Tokenize batch
+            assert self.tokenizer is not None
+            inputs = self.tokenizer(  # type: ignore[operator]
+                premises,
+                hypotheses,
+                truncation=True,
+                padding=True,
+                max_length=self.MAX_LENGTH,
+                return_tensors="pt",
+            )
+
+            # Move to device
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+            # Run inference
+            assert self.model is not None
+            with torch.no_grad():
+                outputs = self.model(**inputs)  # type: ignore[operator]
+                logits = outputs.logits
+                probabilities = torch.softmax(logits, dim=-1)
+
+            # Extract results for each item in batch
+            batch_results: list[NLIResult] = []
+            probs_numpy = probabilities.cpu().numpy()
+            for j in range(len(batch_pairs)):
+                probs = probs_numpy[j]
+                predicted_idx = int(probs.argmax())
+                predicted_label = self._label_mapping[predicted_idx]
+                confidence = float(probs[predicted_idx])
+
+                scores = {
+                    NLILabel.ENTAILMENT.value: float(probs[0]),
+                    NLILabel.NEUTRAL.value: float(probs[1]),
+                    NLILabel.CONTRADICTION.value: float(probs[2]),
+                }
+
+                batch_results.append(
+                    NLIResult(
+                        label=predicted_label,
+                        confidence=confidence,
+                        scores=scores,
+                    )
+                )
+
+            # Memory management for large batches
+            if self.device == "cuda":
+                torch.cuda.empty_cache()
+
+            return batch_results
 
         try:
             total_pairs = len(pairs)
@@ -293,65 +387,21 @@ class NLIService:
                 "nli_batch_inference_start",
                 total_pairs=total_pairs,
                 batch_size=batch_size,
+                max_batch_tokens=max_batch_tokens,
             )
 
-            # Process in batches
-            for i in range(0, total_pairs, batch_size):
-                batch_pairs = pairs[i : i + batch_size]
-                premises = [pair[0] for pair in batch_pairs]
-                hypotheses = [pair[1] for pair in batch_pairs]
-
-                # Tokenize batch
-                assert self.tokenizer is not None
-                inputs = self.tokenizer(  # type: ignore[operator]
-                    premises,
-                    hypotheses,
-                    truncation=True,
-                    padding=True,
-                    max_length=512,
-                    return_tensors="pt",
-                )
-
-                # Move to device
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
-
-                # Run inference
-                assert self.model is not None
-                with torch.no_grad():
-                    outputs = self.model(**inputs)  # type: ignore[operator]
-                    logits = outputs.logits
-                    probabilities = torch.softmax(logits, dim=-1)
-
-                # Extract results for each item in batch
-                probs_numpy = probabilities.cpu().numpy()
-                for j in range(len(batch_pairs)):
-                    probs = probs_numpy[j]
-                    predicted_idx = int(probs.argmax())
-                    predicted_label = self._label_mapping[predicted_idx]
-                    confidence = float(probs[predicted_idx])
-
-                    scores = {
-                        NLILabel.ENTAILMENT.value: float(probs[0]),
-                        NLILabel.NEUTRAL.value: float(probs[1]),
-                        NLILabel.CONTRADICTION.value: float(probs[2]),
-                    }
-
-                    results.append(
-                        NLIResult(
-                            label=predicted_label,
-                            confidence=confidence,
-                            scores=scores,
-                        )
-                    )
-
-                # Memory management for large batches
-                if self.device == "cuda":
-                    torch.cuda.empty_cache()
+            lengths = token_lengths(
+                self.tokenizer,
+                [pair[0] for pair in pairs],
+                [pair[1] for pair in pairs],
+                max_length=self.MAX_LENGTH,
+            )
+            results = run_token_batches(pairs, lengths, infer, max_batch_tokens, batch_size)
 
             logger.info(
                 "nli_batch_inference_complete",
                 total_pairs=total_pairs,
-                batches_processed=(total_pairs + batch_size - 1) // batch_size,
+                batches_processed=batches_processed,
             )
 
             # Cleanup
@@ -367,11 +417,12 @@ class NLIService:
         """Get information about the loaded model.
 
         Returns:
-            Dictionary with model name, device, and initialization status
+            Dictionary with model name, device, backend, and initialization status
         """
         return {
             "model_name": self._model_name,
             "device": self.device or "not_loaded",
+            "backend": self.backend,
             "initialized": self._initialized,
         }
 
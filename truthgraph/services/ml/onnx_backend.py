@@ -0,0 +1,412 @@
+"""ONNX Runtime inference backend for the embedding and NLI models.
+
+This module exports the PyTorch models used by EmbeddingService and NLIService
+to ONNX once, caches the artifacts on disk, and serves inference through
+ONNX Runtime. Optionally the exported graph is dynamically quantized to int8,
+which typically gives a 2-3x CPU speedup for transformer encoders at a small
+accuracy cost (see tests/accuracy/test_onnx_parity.py).
+
+The runtime wrappers are drop-in replacements for the objects the services
+already hold:
+    - OnnxSentenceEncoder mirrors SentenceTransformer.encode()
+    - OnnxSequenceClassifier mirrors calling a HF sequence-classification
+      model and reading ``outputs.logits``
+
+Configuration (environment):
+    EMBEDDING_BACKEND / NLI_BACKEND: "torch" (default) or "onnx"
+    ONNX_QUANTIZE: "int8" to use dynamically quantized weights (default: none)
+    ONNX_CACHE_DIR: Export cache root (default: ~/.cache/truthgraph/onnx)
+    ONNX_NUM_THREADS: intra-op thread count for ONNX Runtime (default: auto)
+
+Requires the optional ``onnx`` extra (onnx, onnxruntime).
+
+Example:
+    >>> encoder = OnnxSentenceEncoder.from_pretrained(
+    ...     "sentence-transformers/all-MiniLM-L6-v2", quantize=True
+    ... )
+    >>> encoder.encode(["The Earth orbits the Sun"]).shape
+    (1, 384)
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+ONNX_OPSET_VERSION = 17
+_MODEL_FILE = "model.onnx"
+_QUANTIZED_MODEL_FILE = "model.int8.onnx"
+_META_FILE = "export_meta.json"
+
+
+def get_backend(env_var: str) -> str:
+    """Read an inference backend selection from the environment.
+
+    Args:
+        env_var: Environment variable to read (e.g. "EMBEDDING_BACKEND")
+
+    Returns:
+        "torch" or "onnx"
+
+    Raises:
+        ValueError: If the variable holds an unknown backend name
+    """
+    backend = os.getenv(env_var, "torch").strip().lower()
+    if backend not in ("torch", "onnx"):
+        raise ValueError(f"{env_var} must be 'torch' or 'onnx', got '{backend}'")
+    return backend
+
+
+def quantization_enabled() -> bool:
+    """Return True when ONNX_QUANTIZE requests int8 weights."""
+    return os.getenv("ONNX_QUANTIZE", "").strip().lower() == "int8"
+
+
+def get_onnx_cache_dir() -> Path:
+    """Get the root directory for exported ONNX artifacts.
+
+    Returns:
+        Path from ONNX_CACHE_DIR, or ~/.cache/truthgraph/onnx
+    """
+    configured = os.getenv("ONNX_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "truthgraph" / "onnx"
+
+
+def _model_dir(cache_dir: Path, model_name: str, kind: str) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+    return cache_dir / kind / slug
+
+
+def _require_onnxruntime() -> Any:
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise RuntimeError(
+            "ONNX backend requires onnxruntime. Install with: pip install -e '.[onnx]'"
+        ) from e
+    return onnxruntime
+
+
+class _SequenceClassifierGraph(torch.nn.Module):
+    """Export wrapper returning raw logits for named tokenizer inputs."""
+
+    def __init__(self, model: torch.nn.Module, input_names: list[str]) -> None:
+        super().__init__()
+        self.model = model
+        self.input_names = input_names
+
+    def forward(self, *inputs: torch.Tensor) -> torch.Tensor:
+        return self.model(**dict(zip(self.input_names, inputs, strict=True))).logits
+
+
+class _MeanPoolingGraph(torch.nn.Module):
+    """Export wrapper applying attention-masked mean pooling to token states."""
+
+    def __init__(self, transformer: torch.nn.Module, input_names: list[str]) -> None:
+        super().__init__()
+        self.transformer = transformer
+        self.input_names = input_names
+
+    def forward(self, *inputs: torch.Tensor) -> torch.Tensor:
+        kwargs = dict(zip(self.input_names, inputs, strict=True))
+        token_states = self.transformer(**kwargs)[0]
+        mask = kwargs["attention_mask"].unsqueeze(-1).to(token_states.dtype)
+        return (token_states * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+
+
+def _export_graph(
+    graph: torch.nn.Module,
+    tokenizer: Any,
+    input_names: list[str],
+    output_name: str,
+    output_dir: Path,
+    meta: dict[str, Any],
+) -> Path:
+    """Trace a wrapper module to ONNX and save it with its tokenizer.
+
+    The export is written to a temporary directory and renamed into place so
+    concurrent processes never observe a half-written artifact.
+    """
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    graph.eval()
+
+    dummy = tokenizer(
+        ["warmup premise text", "a second, longer warmup sentence for tracing"],
+        ["warmup hypothesis", "another hypothesis"] if meta.get("pairs") else None,
+        padding=True,
+        truncation=True,
+        return_tensors="pt",
+    )
+    args = tuple(dummy[name] for name in input_names)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes[output_name] = {0: "batch"}
+
+    staging = Path(tempfile.mkdtemp(prefix=".export-", dir=output_dir.parent))
+    with torch.no_grad():
+        torch.onnx.export(
+            graph,
+            args,
+            str(staging / _MODEL_FILE),
+            input_names=input_names,
+            output_names=[output_name],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET_VERSION,
+            dynamo=False,
+        )
+    tokenizer.save_pretrained(str(staging))
+    (staging / _META_FILE).write_text(json.dumps({**meta, "input_names": input_names}))
+
+    try:
+        staging.rename(output_dir)
+    except OSError:
+        # Another process finished the same export first; keep theirs
+        logger.info(f"ONNX export already present at {output_dir}")
+        shutil.rmtree(staging, ignore_errors=True)
+    return output_dir
+
+
+def quantize_int8(model_dir: Path) -> Path:
+    """Create (once) a dynamically int8-quantized copy of an exported model.
+
+    Args:
+        model_dir: Directory containing model.onnx
+
+    Returns:
+        Path to model.int8.onnx
+    """
+    target = model_dir / _QUANTIZED_MODEL_FILE
+    if target.exists():
+        return target
+
+    _require_onnxruntime()
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    staging = model_dir / f".{_QUANTIZED_MODEL_FILE}.{os.getpid()}"
+    quantize_dynamic(str(model_dir / _MODEL_FILE), str(staging), weight_type=QuantType.QInt8)
+    os.replace(staging, target)
+    logger.info(f"Quantized ONNX model written to {target}")
+    return target
+
+
+def export_sequence_classifier(model: Any, tokenizer: Any, output_dir: Path) -> Path:
+    """Export a HF sequence-classification model to ONNX.
+
+    Args:
+        model: AutoModelForSequenceClassification instance
+        tokenizer: Matching tokenizer (saved next to the graph)
+        output_dir: Destination directory
+
+    Returns:
+        The output directory
+    """
+    input_names = list(tokenizer.model_input_names)
+    graph = _SequenceClassifierGraph(model.to("cpu"), input_names)
+    return _export_graph(graph, tokenizer, input_names, "logits", output_dir, {"pairs": True})
+
+
+def export_sentence_encoder(st_model: Any, output_dir: Path) -> Path:
+    """Export a mean-pooling SentenceTransformer to ONNX.
+
+    The exported graph returns pooled (not yet normalized) sentence vectors;
+    normalization happens at encode time as in SentenceTransformer.
+
+    Args:
+        st_model: SentenceTransformer instance (Transformer + mean Pooling)
+        output_dir: Destination directory
+
+    Returns:
+        The output directory
+
+    Raises:
+        ValueError: If the model does not use mean pooling
+    """
+    pooling = next((m for m in st_model if type(m).__name__ == "Pooling"), None)
+    # sentence-transformers < 5 exposes boolean flags, newer releases a mode string
+    is_mean = pooling is not None and (
+        getattr(pooling, "pooling_mode_mean_tokens", False)
+        or getattr(pooling, "pooling_mode", None) == "mean"
+    )
+    if not is_mean:
+        raise ValueError("Only mean-pooling SentenceTransformer models can be exported")
+
+    tokenizer = st_model.tokenizer
+    input_names = list(tokenizer.model_input_names)
+    transformer = st_model[0].auto_model.to("cpu")
+    graph = _MeanPoolingGraph(transformer, input_names)
+    meta = {"max_length": int(st_model.max_seq_length)}
+    return _export_graph(graph, tokenizer, input_names, "sentence_embedding", output_dir, meta)
+
+
+class _OnnxModel:
+    """Shared ONNX Runtime session handling for the runtime wrappers."""
+
+    def __init__(self, model_dir: Path, quantize: bool = False) -> None:
+        ort = _require_onnxruntime()
+        from transformers import AutoTokenizer  # type: ignore[import-untyped]
+
+        self.model_dir = Path(model_dir)
+        self.meta: dict[str, Any] = json.loads((self.model_dir / _META_FILE).read_text())
+        self.input_names: list[str] = self.meta["input_names"]
+        self.quantized = quantize
+        model_path = quantize_int8(self.model_dir) if quantize else self.model_dir / _MODEL_FILE
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        num_threads = int(os.getenv("ONNX_NUM_THREADS", "0"))
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+
+        available = ort.get_available_providers()
+        providers = [p for p in ("CUDAExecutionProvider",) if p in available]
+        providers.append("CPUExecutionProvider")
+
+        self.session = ort.InferenceSession(str(model_path), options, providers=providers)
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.model_dir))
+        logger.info(
+            f"Loaded ONNX model {model_path.name} from {self.model_dir} "
+            f"(providers={self.session.get_providers()})"
+        )
+
+    @property
+    def device(self) -> str:
+        """Device string matching the torch services' convention."""
+        return "cuda" if "CUDAExecutionProvider" in self.session.get_providers() else "cpu"
+
+    def _run(self, features: dict[str, Any]) -> np.ndarray:
+        feed = {name: np.asarray(features[name], dtype=np.int64) for name in self.input_names}
+        return self.session.run(None, feed)[0]
+
+    def eval(self) -> "_OnnxModel":
+        """No-op kept for interface parity with torch modules."""
+        return self
+
+    def to(self, device: str) -> "_OnnxModel":
+        """No-op; execution providers are chosen when the session is created."""
+        return self
+
+
+class OnnxSequenceClassifier(_OnnxModel):
+    """ONNX Runtime stand-in for a HF sequence-classification model.
+
+    Calling the instance with tokenizer outputs (torch tensors or arrays)
+    returns an object with a torch ``logits`` tensor, so NLIService's
+    inference code path is unchanged.
+    """
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name: str,
+        quantize: bool = False,
+        cache_dir: Path | None = None,
+    ) -> "OnnxSequenceClassifier":
+        """Load a cached export, exporting from PyTorch on first use.
+
+        Args:
+            model_name: Hugging Face model id
+            quantize: Use int8 dynamically quantized weights
+            cache_dir: Export cache root (defaults to get_onnx_cache_dir())
+
+        Returns:
+            Ready-to-use classifier
+        """
+        model_dir = _model_dir(cache_dir or get_onnx_cache_dir(), model_name, "nli")
+        if not (model_dir / _MODEL_FILE).exists():
+            from transformers import (  # type: ignore[import-untyped]
+                AutoModelForSequenceClassification,
+                AutoTokenizer,
+            )
+
+            logger.info(f"Exporting {model_name} to ONNX at {model_dir}")
+            tokenizer = AutoTokenizer.from_pretrained(model_name, model_max_length=512)
+            model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            export_sequence_classifier(model, tokenizer, model_dir)
+        return cls(model_dir, quantize=quantize)
+
+    def __call__(self, **inputs: Any) -> SimpleNamespace:
+        features = {
+            k: v.cpu().numpy() if isinstance(v, torch.Tensor) else v for k, v in inputs.items()
+        }
+        return SimpleNamespace(logits=torch.from_numpy(self._run(features)))
+
+
+class OnnxSentenceEncoder(_OnnxModel):
+    """ONNX Runtime stand-in for a mean-pooling SentenceTransformer."""
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name: str,
+        quantize: bool = False,
+        cache_dir: Path | None = None,
+    ) -> "OnnxSentenceEncoder":
+        """Load a cached export, exporting from sentence-transformers on first use.
+
+        Args:
+            model_name: sentence-transformers model id
+            quantize: Use int8 dynamically quantized weights
+            cache_dir: Export cache root (defaults to get_onnx_cache_dir())
+
+        Returns:
+            Ready-to-use encoder
+        """
+        model_dir = _model_dir(cache_dir or get_onnx_cache_dir(), model_name, "embedding")
+        if not (model_dir / _MODEL_FILE).exists():
+            from sentence_transformers import SentenceTransformer
+
+            logger.info(f"Exporting {model_name} to ONNX at {model_dir}")
+            export_sentence_encoder(SentenceTransformer(model_name, device="cpu"), model_dir)
+        return cls(model_dir, quantize=quantize)
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        convert_to_tensor: bool = False,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """Encode sentences with the same contract as SentenceTransformer.encode.
+
+        Args:
+            sentences: A single text or a list of texts
+            batch_size: Texts per ONNX Runtime call
+            normalize_embeddings: L2-normalize output vectors
+            convert_to_tensor: Unsupported; numpy arrays are always returned
+            show_progress_bar: Ignored
+
+        Returns:
+            float32 array of shape (dim,) for a single text or (n, dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        max_length = self.meta.get("max_length", 256)
+
+        chunks: list[np.ndarray] = []
+        for start in range(0, len(texts), batch_size):
+            features = self.tokenizer(
+                texts[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=max_length,
+                return_tensors="np",
+            )
+            chunks.append(self._run(features))
+
+        embeddings = np.concatenate(chunks).astype(np.float32, copy=False)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings[0] if single else embeddings
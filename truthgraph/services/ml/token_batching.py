@@ -0,0 +1,207 @@
+"""Length-aware, token-budget batching for transformer inference.
+
+Transformer batches are padded to their longest member, so grouping inputs by
+position lets a single long evidence passage pad every short text in its batch
+up to the model's maximum sequence length. This module sorts inputs by
+tokenized length and cuts batches by a budget on padded tokens
+(items x longest item) instead of a fixed item count. Callers run each batch
+and get results back in the original input order.
+
+Batches are formed longest-first so the most memory-hungry batch runs first and
+any out-of-memory error surfaces immediately rather than at the end of a long
+job. Inputs of equal length keep their relative order.
+
+Example:
+    >>> lengths = token_lengths(tokenizer, texts, max_length=256)
+    >>> outputs = run_token_batches(
+    ...     texts, lengths, model_fn, max_batch_tokens=8192, max_batch_size=32
+    ... )
+    >>> len(outputs) == len(texts)
+    True
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Rough characters-per-token ratio for English WordPiece/SentencePiece vocabularies
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_token_lengths(
+    texts: Sequence[str],
+    text_pairs: Sequence[str] | None = None,
+    max_length: int = 512,
+) -> list[int]:
+    """Estimate token counts from character lengths.
+
+    Used when no tokenizer is available (model not loaded yet, or a tokenizer
+    that cannot report per-item lengths). Only the relative order matters for
+    batching, so a character-based estimate is good enough.
+
+    Args:
+        texts: Input texts (premises for pair inputs)
+        text_pairs: Optional second segment for each text (hypotheses)
+        max_length: Truncation length; estimates are capped at this value
+
+    Returns:
+        Estimated token count per input, including special tokens
+    """
+    if text_pairs is None:
+        return [min(len(t) // _CHARS_PER_TOKEN + 2, max_length) for t in texts]
+    return [
+        min((len(a) + len(b)) // _CHARS_PER_TOKEN + 3, max_length)
+        for a, b in zip(texts, text_pairs, strict=True)
+    ]
+
+
+def token_lengths(
+    tokenizer: Any,
+    texts: Sequence[str],
+    text_pairs: Sequence[str] | None = None,
+    max_length: int = 512,
+) -> list[int]:
+    """Measure the truncated token length of each input.
+
+    Args:
+        tokenizer: Hugging Face tokenizer (fast tokenizers make this cheap
+            relative to inference). If None, lengths are estimated.
+        texts: Input texts (premises for pair inputs)
+        text_pairs: Optional second segment for each text (hypotheses)
+        max_length: Truncation length used by the model
+
+    Returns:
+        Token count per input, including special tokens
+    """
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(
+                list(texts),
+                list(text_pairs) if text_pairs is not None else None,
+                truncation=True,
+                max_length=max_length,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+            )
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            if len(lengths) == len(texts):
+                return lengths
+        except Exception as e:
+            logger.debug(f"Tokenizer length measurement failed, estimating instead: {e}")
+
+    return estimate_token_lengths(texts, text_pairs, max_length)
+
+
+def plan_token_batches(
+    lengths: Sequence[int],
+    max_batch_tokens: int,
+    max_batch_size: int | None = None,
+) -> list[list[int]]:
+    """Group input positions into batches under a padded-token budget.
+
+    Inputs are visited longest-first. A batch is closed when adding the next
+    input would make (items x longest item) exceed max_batch_tokens, or when it
+    already holds max_batch_size items. An input longer than the whole budget
+    gets a batch of its own.
+
+    Args:
+        lengths: Token length of each input
+        max_batch_tokens: Budget on padded tokens per batch
+        max_batch_size: Optional cap on items per batch
+
+    Returns:
+        List of batches, each a list of indices into the input sequence
+
+    Raises:
+        ValueError: If max_batch_tokens or max_batch_size is < 1
+    """
+    if max_batch_tokens < 1:
+        raise ValueError(f"max_batch_tokens must be >= 1, got {max_batch_tokens}")
+    if max_batch_size is not None and max_batch_size < 1:
+        raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+
+    order = sorted(range(len(lengths)), key=lambda i: -lengths[i])
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    width = 0  # Padded length of the current batch (its first, longest item)
+    for i in order:
+        length = max(lengths[i], 1)
+        full = max_batch_size is not None and len(current) >= max_batch_size
+        if current and (full or (len(current) + 1) * width > max_batch_tokens):
+            batches.append(current)
+            current = []
+        if not current:
+            width = length
+        current.append(i)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def padded_token_count(lengths: Sequence[int], batches: Sequence[Sequence[int]]) -> int:
+    """Count the tokens (including padding) that a batch plan will process.
+
+    Args:
+        lengths: Token length of each input
+        batches: Batches of input indices
+
+    Returns:
+        Sum over batches of (items x longest item)
+    """
+    return sum(len(batch) * max(lengths[i] for i in batch) for batch in batches if batch)
+
+
+def run_token_batches(
+    items: Sequence[T],
+    lengths: Sequence[int],
+    fn: Callable[[list[T]], Sequence[R]],
+    max_batch_tokens: int,
+    max_batch_size: int | None = None,
+) -> list[R]:
+    """Run fn over token-budget batches and restore the original order.
+
+    Args:
+        items: Inputs to process
+        lengths: Token length of each input
+        fn: Called once per batch with that batch's items; must return one
+            output per item, in the same order
+        max_batch_tokens: Budget on padded tokens per batch
+        max_batch_size: Optional cap on items per batch
+
+    Returns:
+        Outputs of fn, ordered to match items
+
+    Raises:
+        ValueError: If lengths does not match items or the budget is invalid
+    """
+    if len(lengths) != len(items):
+        raise ValueError(f"Got {len(lengths)} lengths for {len(items)} items")
+
+    batches = plan_token_batches(lengths, max_batch_tokens, max_batch_size)
+    logger.debug(
+        f"Token-budget batching: {len(items)} inputs in {len(batches)} batches, "
+        f"{padded_token_count(lengths, batches)} padded tokens "
+        f"(positional batching: {_positional_padded_tokens(lengths, max_batch_size)})"
+    )
+
+    results: list[Any] = [None] * len(items)
+    for batch in batches:
+        outputs = fn([items[i] for i in batch])
+        for i, output in zip(batch, outputs, strict=True):
+            results[i] = output
+    return results
+
+
+def _positional_padded_tokens(lengths: Sequence[int], max_batch_size: int | None) -> int:
+    """Padded tokens if inputs were batched by position with a fixed item count."""
+    size = max_batch_size or len(lengths) or 1
+    return padded_token_count(
+        lengths, [range(i, min(i + size, len(lengths))) for i in range(0, len(lengths), size)]
+    )
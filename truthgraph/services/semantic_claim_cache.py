@@ -0,0 +1,349 @@
+"""Semantic cache of verdicts for near-duplicate claims.
+
+VerificationCache is keyed by a hash of the normalized claim text, so the
+many paraphrases of a viral claim ("5G towers spread the virus" / "the
+virus is spread by 5G towers") each pay for retrieval and NLI. The
+semantic cache keeps the embeddings of recently verified claims and, when
+a new claim's embedding has cosine similarity >= threshold with a cached
+one, the pipeline returns the cached verdict right after the embedding
+step.
+
+Entries are scoped by tenant and retrieval parameters (top_k,
+min_similarity), expire after a TTL, and are only served while the tenant's
+evidence corpus is unchanged: each scope remembers the corpus version its
+entries were computed against (evidence embedding count and latest
+updated_at, re-read at most every corpus_check_seconds) and is emptied
+when the version moves.
+
+The index is an exact cosine scan over a bounded float32 matrix per scope
+(max_entries rows, oldest entries overwritten first). At this size a
+single matrix-vector product takes well under a millisecond, so an
+approximate graph would add maintenance cost without saving time.
+
+The threshold should stay high: negations and changed numbers ("... is not
+...", "... in 2019" vs "2020") can still score above 0.9.
+
+Hits, misses and stale lookups are exported by CacheStatsCollector
+(monitoring.collectors.cache_stats).
+
+Configuration (environment):
+    SEMANTIC_CACHE_ENABLED: Enable the semantic cache (default false)
+    SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity for a hit (default 0.95)
+    SEMANTIC_CACHE_TTL_SECONDS: Entry lifetime (default 3600)
+    SEMANTIC_CACHE_MAX_ENTRIES: Entries per tenant and parameter scope (default 5000)
+    SEMANTIC_CACHE_CORPUS_CHECK_SECONDS: How long a corpus version is trusted
+        before it is re-read (default 30)
+
+Example:
+    >>> cache = get_semantic_claim_cache()
+    >>> version = cache.corpus_version(db, "default")
+    >>> hit = cache.lookup("default", claim_embedding, version, params=(10, 0.5))
+"""
+
+import os
+import threading
+import time
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar, Optional
+
+import numpy as np
+import structlog
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = structlog.get_logger(__name__)
+
+
+def semantic_cache_enabled() -> bool:
+    """Whether SEMANTIC_CACHE_ENABLED asks for the semantic claim cache."""
+    return os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class SemanticCacheHit:
+    """A cached value whose claim is close enough to the query claim.
+
+    Attributes:
+        value: The cached value (a VerificationPipelineResult)
+        similarity: Cosine similarity between the two claims
+    """
+
+    value: Any
+    similarity: float
+
+
+class _Scope:
+    """Cached entries of one tenant and parameter scope, as a ring of matrix rows.
+
+    Rows are allocated as entries arrive (doubling up to max_entries); once
+    full, the oldest entry is overwritten.
+    """
+
+    INITIAL_CAPACITY: ClassVar[int] = 64
+
+    def __init__(self, dimension: int, max_entries: int, corpus_version: Hashable) -> None:
+        self.corpus_version = corpus_version
+        self.max_entries = max_entries
+        capacity = min(self.INITIAL_CAPACITY, max_entries)
+        self.matrix = np.zeros((capacity, dimension), dtype=np.float32)
+        self.expires_at = np.full(capacity, -np.inf)
+        self.values: list[Any] = [None] * capacity
+        self.size = 0
+        self.next_slot = 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.expires_at[: self.size] > time.monotonic()))
+
+    def take_slot(self) -> int:
+        """Return the row for a new entry, growing the matrix or reusing the oldest row."""
+        if self.size == len(self.matrix) and self.size < self.max_entries:
+            capacity = min(2 * self.size, self.max_entries)
+            self.matrix = np.concatenate(
+                [self.matrix, np.zeros((capacity - self.size, self.matrix.shape[1]), np.float32)]
+            )
+            self.expires_at = np.concatenate(
+                [self.expires_at, np.full(capacity - self.size, -np.inf)]
+            )
+            self.values.extend([None] * (capacity - self.size))
+        if self.size < len(self.matrix):
+            slot = self.size
+            self.size += 1
+            return slot
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.max_entries
+        return slot
+
+
+class SemanticClaimCache:
+    """Per-tenant similarity cache of verification results.
+
+    Thread-safe; one instance is shared by every pipeline in the process.
+
+    Attributes:
+        threshold: Minimum cosine similarity for a hit
+        ttl_seconds: Entry lifetime
+        max_entries: Entries kept per scope
+        corpus_check_seconds: How long a corpus version is reused
+    """
+
+    _instance: ClassVar["SemanticClaimCache | None"] = None
+
+    DEFAULT_THRESHOLD: ClassVar[float] = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    DEFAULT_TTL_SECONDS: ClassVar[float] = float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "3600"))
+    DEFAULT_MAX_ENTRIES: ClassVar[int] = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "5000"))
+    DEFAULT_CORPUS_CHECK_SECONDS: ClassVar[float] = float(
+        os.getenv("SEMANTIC_CACHE_CORPUS_CHECK_SECONDS", "30")
+    )
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        corpus_check_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit, in (0, 1]
+            ttl_seconds: Entry lifetime
+            max_entries: Entries kept per tenant and parameter scope
+            corpus_check_seconds: How long corpus_version() reuses a version
+
+        Raises:
+            ValueError: If threshold is outside (0, 1] or a size/duration is invalid
+        """
+        self.threshold = self.DEFAULT_THRESHOLD if threshold is None else threshold
+        self.ttl_seconds = self.DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self.corpus_check_seconds = (
+            self.DEFAULT_CORPUS_CHECK_SECONDS
+            if corpus_check_seconds is None
+            else corpus_check_seconds
+        )
+
+        if not 0 < self.threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {self.threshold}")
+        if self.ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0, got {self.ttl_seconds}")
+        if self.max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {self.max_entries}")
+
+        self._scopes: dict[tuple[str, Hashable], _Scope] = {}
+        self._versions: dict[str, tuple[Hashable, float]] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    @staticmethod
+    def _unit(embedding: Sequence[float] | np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def lookup(
+        self,
+        tenant_id: str,
+        embedding: Sequence[float] | np.ndarray,
+        corpus_version: Hashable,
+        params: Hashable = (),
+    ) -> Optional[SemanticCacheHit]:
+        """Find a cached value for a claim close to the given embedding.
+
+        Args:
+            tenant_id: Tenant whose entries are searched
+            embedding: Embedding of the new claim
+            corpus_version: Current evidence corpus version of the tenant;
+                entries computed against another version are discarded
+            params: Retrieval parameters the value depends on
+
+        Returns:
+            The most similar live entry at or above the threshold, or None
+        """
+        query = self._unit(embedding)
+        with self._lock:
+            scope = self._scopes.get((tenant_id, params))
+            if scope is not None and scope.corpus_version != corpus_version:
+                # The evidence changed since these verdicts were computed
+                self._stale += 1
+                del self._scopes[(tenant_id, params)]
+                logger.info("semantic_cache_corpus_changed", tenant_id=tenant_id)
+                scope = None
+            if scope is None or scope.matrix.shape[1] != query.shape[0]:
+                self._misses += 1
+                return None
+
+            if scope.size == 0:
+                self._misses += 1
+                return None
+            similarities = scope.matrix[: scope.size] @ query
+            similarities[scope.expires_at[: scope.size] <= time.monotonic()] = -np.inf
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return SemanticCacheHit(value=scope.values[best], similarity=similarity)
+
+    def add(
+        self,
+        tenant_id: str,
+        embedding: Sequence[float] | np.ndarray,
+        value: Any,
+        corpus_version: Hashable,
+        params: Hashable = (),
+    ) -> None:
+        """Cache a value under a claim embedding.
+
+        Args:
+            tenant_id: Tenant the value belongs to
+            embedding: Embedding of the verified claim
+            value: Value to return for similar claims
+            corpus_version: Evidence corpus version the value was computed against
+            params: Retrieval parameters the value depends on
+        """
+        vector = self._unit(embedding)
+        with self._lock:
+            scope = self._scopes.get((tenant_id, params))
+            if (
+                scope is None
+                or scope.corpus_version != corpus_version
+                or scope.matrix.shape[1] != vector.shape[0]
+            ):
+                scope = _Scope(vector.shape[0], self.max_entries, corpus_version)
+                self._scopes[(tenant_id, params)] = scope
+
+            slot = scope.take_slot()
+            scope.matrix[slot] = vector
+            scope.expires_at[slot] = time.monotonic() + self.ttl_seconds
+            scope.values[slot] = value
+
+    def corpus_version(self, db: Session, tenant_id: str = "default") -> Hashable:
+        """Get the tenant's evidence corpus version (blocking; cached briefly).
+
+        The version is the number of evidence embeddings and the latest
+        embeddings.updated_at; it changes when evidence is added, re-embedded
+        or removed.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant identifier
+
+        Returns:
+            Hashable version value
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(tenant_id)
+            if cached is not None and now - cached[1] < self.corpus_check_seconds:
+                return cached[0]
+
+        row = db.execute(
+            text(
+                "SELECT count(*), max(updated_at) FROM embeddings "
+                "WHERE entity_type = 'evidence' AND tenant_id = :tenant_id"
+            ),
+            {"tenant_id": tenant_id},
+        ).one()
+        version = (row[0], row[1])
+
+        with self._lock:
+            self._versions[tenant_id] = (version, now)
+        return version
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> None:
+        """Drop cached entries (and versions) of one tenant, or of all tenants."""
+        with self._lock:
+            if tenant_id is None:
+                self._scopes.clear()
+                self._versions.clear()
+            else:
+                for key in [key for key in self._scopes if key[0] == tenant_id]:
+                    del self._scopes[key]
+                self._versions.pop(tenant_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, stale (lookups that found the corpus
+            changed), hit_ratio, live entries, scopes and threshold
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "entries": sum(len(scope) for scope in self._scopes.values()),
+                "scopes": len(self._scopes),
+                "threshold": self.threshold,
+                "max_entries": self.max_entries,
+            }
+
+    @classmethod
+    def get_instance(cls) -> "SemanticClaimCache":
+        """Get or create the process-wide semantic cache.
+
+        Returns:
+            The singleton SemanticClaimCache instance
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+
+def get_semantic_claim_cache() -> SemanticClaimCache:
+    """Get the singleton SemanticClaimCache instance.
+
+    Returns:
+        The singleton SemanticClaimCache instance
+    """
+    return SemanticClaimCache.get_instance()
@@ -0,0 +1,489 @@
+"""Staged (SEDA-style) execution of the verification pipeline.
+
+VerificationPipelineService.verify_claim runs embed, retrieve, NLI,
+aggregate and persist one after another, so a TaskQueue worker holds all
+of those resources while using only one of them. StagedVerificationPipeline
+runs each step as a separate stage: a bounded queue feeding a fixed number
+of stage workers. A claim moves from stage to stage, so claim N+1 is
+embedded while claim N is in NLI and claim N-1 is being written. Full
+queues push back on the stage before them, and on callers of verify_claim.
+
+The step implementations are those of VerificationPipelineService; only
+the scheduling differs, so results are identical to serial mode. A semantic
+cache hit (see semantic_claim_cache) completes the claim in the retrieve
+stage.
+
+Stages and default concurrency (workers per stage):
+    embed=1, retrieve=4, nli=2, aggregate=1, persist=2
+
+Metrics (when a MetricsCollector is attached), labelled with the stage:
+    - pipeline.stage.queue_depth (gauge): claims waiting when one is taken
+    - pipeline.stage.service_ms (histogram): time a claim spent in the stage
+    - pipeline.stage.failed (counter): claims that failed in the stage
+
+get_stats() reports the same per stage, plus the bottleneck: the stage with
+the highest service time per worker.
+
+Configuration (environment):
+    VERIFICATION_PIPELINE_MODE: serial | staged; VerificationWorker uses the
+        staged pipeline when set to staged (default: serial)
+    STAGED_PIPELINE_CONCURRENCY: Per-stage overrides, e.g. "nli=4,persist=1"
+    STAGED_PIPELINE_QUEUE_SIZE: Capacity of each stage queue (default 32)
+
+Example:
+    >>> pipeline = get_staged_verification_pipeline()
+    >>> result = await pipeline.verify_claim(db, claim_id, "The Earth orbits the Sun")
+    >>> pipeline.get_stats()["bottleneck"]
+    'nli'
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, ClassVar, Hashable, Optional
+from uuid import UUID
+
+import structlog
+from sqlalchemy.orm import Session
+
+from truthgraph.services.vector_search_service import SearchResult
+from truthgraph.services.verification_pipeline_service import (
+    EvidenceItem,
+    VerificationPipelineResult,
+    VerificationPipelineService,
+    get_verification_pipeline_service,
+)
+
+logger = structlog.get_logger(__name__)
+
+STAGE_NAMES = ("embed", "retrieve", "nli", "aggregate", "persist")
+
+
+def _parse_concurrency(spec: str) -> dict[str, int]:
+    """Parse "stage=n,stage=n" into a dict, ignoring blanks.
+
+    Raises:
+        ValueError: If a stage name is unknown or a count is not a positive integer
+    """
+    overrides = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in STAGE_NAMES:
+            raise ValueError(f"Unknown pipeline stage '{name}' in STAGED_PIPELINE_CONCURRENCY")
+        if not value.strip().isdigit() or int(value) < 1:
+            raise ValueError(f"Concurrency for stage '{name}' must be a positive integer")
+        overrides[name] = int(value)
+    return overrides
+
+
+@dataclass
+class _Job:
+    """One claim travelling through the stages."""
+
+    db: Session
+    claim_id: UUID
+    claim_text: str
+    top_k_evidence: int
+    min_similarity: float
+    tenant_id: str
+    use_cache: bool
+    store_result: bool
+    future: asyncio.Future[VerificationPipelineResult]
+    start_time: float = field(default_factory=time.time)
+    embedding: Optional[list[float]] = None
+    corpus_version: Optional[Hashable] = None
+    # Set when a stage produced the final result (semantic cache hit)
+    finished: bool = False
+    search_results: list[SearchResult] = field(default_factory=list)
+    evidence_items: list[EvidenceItem] = field(default_factory=list)
+    result: Optional[VerificationPipelineResult] = None
+
+
+@dataclass
+class _Stage:
+    """A stage: its queue, workers and service-time statistics."""
+
+    name: str
+    concurrency: int
+    handler: Callable[[_Job], Awaitable[None]]
+    queue: Optional[asyncio.Queue[_Job]] = None
+    workers: list[asyncio.Task[None]] = field(default_factory=list)
+    in_flight: int = 0
+    processed: int = 0
+    failed: int = 0
+    max_queue_depth: int = 0
+    total_service_ms: float = 0.0
+    max_service_ms: float = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        avg_service_ms = self.total_service_ms / self.processed if self.processed else 0.0
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_service_ms": round(avg_service_ms, 2),
+            "max_service_ms": round(self.max_service_ms, 2),
+            # Service time per worker: the stage with the highest value limits throughput
+            "load_ms_per_worker": round(avg_service_ms / self.concurrency, 2),
+        }
+
+
+class StagedVerificationPipeline:
+    """Runs the verification pipeline as overlapping stages joined by bounded queues.
+
+    Has the same verify_claim/verify_claims interface as
+    VerificationPipelineService, so VerificationWorker can use either.
+    The stage workers are bound to the event loop they are first used on;
+    they start lazily on the first verify_claim call and are stopped with stop().
+
+    Attributes:
+        pipeline: Service providing the step implementations
+        concurrency: Workers per stage
+        queue_size: Capacity of each stage queue
+    """
+
+    _instance: ClassVar["StagedVerificationPipeline | None"] = None
+
+    DEFAULT_CONCURRENCY: ClassVar[dict[str, int]] = {
+        "embed": 1,
+        "retrieve": 4,
+        "nli": 2,
+        "aggregate": 1,
+        "persist": 2,
+    }
+    DEFAULT_QUEUE_SIZE: ClassVar[int] = int(os.getenv("STAGED_PIPELINE_QUEUE_SIZE", "32"))
+
+    def __init__(
+        self,
+        pipeline: Optional[VerificationPipelineService] = None,
+        concurrency: Optional[dict[str, int]] = None,
+        queue_size: Optional[int] = None,
+        metrics_collector: Any = None,
+    ) -> None:
+        """Initialize the staged pipeline.
+
+        Args:
+            pipeline: Service whose steps the stages run (default: a new
+                get_verification_pipeline_service() instance)
+            concurrency: Per-stage worker counts overriding the defaults and
+                STAGED_PIPELINE_CONCURRENCY
+            queue_size: Capacity of each stage queue
+            metrics_collector: Optional MetricsCollector for exported metrics
+
+        Raises:
+            ValueError: If a stage name is unknown or a count/queue size is < 1
+        """
+        self.pipeline = pipeline or get_verification_pipeline_service()
+        self.concurrency = {
+            **self.DEFAULT_CONCURRENCY,
+            **_parse_concurrency(os.getenv("STAGED_PIPELINE_CONCURRENCY", "")),
+        }
+        for name, count in (concurrency or {}).items():
+            if name not in STAGE_NAMES:
+                raise ValueError(f"Unknown pipeline stage '{name}'")
+            if count < 1:
+                raise ValueError(f"Concurrency for stage '{name}' must be >= 1, got {count}")
+            self.concurrency[name] = count
+        self.queue_size = queue_size or self.DEFAULT_QUEUE_SIZE
+        if self.queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got {self.queue_size}")
+        self.metrics_collector = metrics_collector
+
+        handlers = {
+            "embed": self._embed,
+            "retrieve": self._retrieve,
+            "nli": self._nli,
+            "aggregate": self._aggregate,
+            "persist": self._persist,
+        }
+        self._stages = [
+            _Stage(name=name, concurrency=self.concurrency[name], handler=handlers[name])
+            for name in STAGE_NAMES
+        ]
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def verify_claim(
+        self,
+        db: Session,
+        claim_id: UUID,
+        claim_text: str,
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        tenant_id: str = "default",
+        use_cache: bool = True,
+        store_result: bool = True,
+    ) -> VerificationPipelineResult:
+        """Verify a claim by passing it through the stages.
+
+        Arguments and result are those of VerificationPipelineService.verify_claim.
+        Waits for room in the first stage's queue when the pipeline is saturated.
+
+        Raises:
+            ValueError: If claim_text is empty or invalid
+            RuntimeError: If a stage fails or the pipeline is stopped
+        """
+        if not claim_text or not claim_text.strip():
+            raise ValueError("Claim text cannot be empty")
+
+        if use_cache:
+            cached_result = self.pipeline._get_cached_result(
+                claim_text, tenant_id, top_k_evidence, min_similarity
+            )
+            if cached_result is not None:
+                return self.pipeline._rebind_cached_result(cached_result, claim_id)
+
+        self._ensure_running()
+        job = _Job(
+            db=db,
+            claim_id=claim_id,
+            claim_text=claim_text,
+            top_k_evidence=top_k_evidence,
+            min_similarity=min_similarity,
+            tenant_id=tenant_id,
+            use_cache=use_cache,
+            store_result=store_result,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        await self._put(self._stages[0], job)
+        return await job.future
+
+    async def verify_claims(
+        self,
+        db: Session,
+        claims: list[tuple[UUID, str]],
+        **kwargs: Any,
+    ) -> list[VerificationPipelineResult]:
+        """Verify many claims; delegates to the batched VerificationPipelineService.verify_claims.
+
+        A batch already shares every stage's work across its claims, so it
+        does not go through the stage queues.
+        """
+        return await self.pipeline.verify_claims(db=db, claims=claims, **kwargs)
+
+    # ----- Stages -----
+
+    async def _embed(self, job: _Job) -> None:
+        job.embedding = await self.pipeline._generate_embedding_with_retry(job.claim_text)
+
+    async def _retrieve(self, job: _Job) -> None:
+        if job.use_cache and self.pipeline.semantic_cache is not None:
+            job.corpus_version = await self.pipeline._semantic_corpus_version(
+                job.db, job.tenant_id
+            )
+            job.result = self.pipeline._semantic_cache_lookup(
+                job.claim_id,
+                job.claim_text,
+                job.embedding,
+                job.corpus_version,
+                job.tenant_id,
+                job.top_k_evidence,
+                job.min_similarity,
+            )
+            if job.result is not None:
+                job.finished = True
+                return
+        job.search_results = await self.pipeline._search_evidence_with_retry(
+            db=job.db,
+            query_embedding=job.embedding,
+            top_k=job.top_k_evidence,
+            min_similarity=job.min_similarity,
+            tenant_id=job.tenant_id,
+        )
+
+    async def _nli(self, job: _Job) -> None:
+        job.evidence_items = await self.pipeline._verify_evidence_batch(
+            claim_text=job.claim_text, search_results=job.search_results
+        )
+
+    async def _aggregate(self, job: _Job) -> None:
+        # No evidence yields the same INSUFFICIENT verdict as serial mode
+        skipped, below_floor = self.pipeline._unanalyzed_evidence(
+            job.search_results, job.evidence_items
+        )
+        job.result = self.pipeline._aggregate_verdict(
+            claim_id=job.claim_id,
+            claim_text=job.claim_text,
+            evidence_items=job.evidence_items,
+            pipeline_duration_ms=(time.time() - job.start_time) * 1000,
+            skipped_evidence=skipped,
+            below_floor_evidence=below_floor,
+        )
+
+    async def _persist(self, job: _Job) -> None:
+        if job.store_result:
+            job.result = await self.pipeline._store_verification_result(db=job.db, result=job.result)
+        if job.use_cache:
+            self.pipeline._cache_result(
+                job.claim_text, job.result, job.tenant_id, job.top_k_evidence, job.min_similarity
+            )
+            self.pipeline._semantic_cache_add(
+                job.embedding,
+                job.result,
+                job.corpus_version,
+                job.tenant_id,
+                job.top_k_evidence,
+                job.min_similarity,
+            )
+
+    # ----- Scheduling -----
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous loop was closed (e.g. between tests)
+            self._loop = loop
+            for stage in self._stages:
+                stage.queue = None
+                stage.workers = []
+        for index, stage in enumerate(self._stages):
+            if stage.queue is None:
+                stage.queue = asyncio.Queue(maxsize=self.queue_size)
+            stage.workers = [w for w in stage.workers if not w.done()]
+            next_stage = self._stages[index + 1] if index + 1 < len(self._stages) else None
+            while len(stage.workers) < stage.concurrency:
+                stage.workers.append(
+                    asyncio.create_task(
+                        self._stage_worker(stage, next_stage),
+                        name=f"pipeline-stage-{stage.name}-{len(stage.workers)}",
+                    )
+                )
+
+    async def _put(self, stage: _Stage, job: _Job) -> None:
+        assert stage.queue is not None
+        await stage.queue.put(job)
+        stage.max_queue_depth = max(stage.max_queue_depth, stage.queue.qsize())
+
+    async def _stage_worker(self, stage: _Stage, next_stage: Optional[_Stage]) -> None:
+        """Take claims from the stage queue, run the stage and pass them on."""
+        assert stage.queue is not None
+        while True:
+            job = await stage.queue.get()
+            try:
+                # The caller was cancelled or the pipeline failed it; skip the work
+                if job.future.done():
+                    continue
+
+                queue_depth = stage.queue.qsize()
+                stage.in_flight += 1
+                start = time.perf_counter()
+                try:
+                    await stage.handler(job)
+                except Exception as e:
+                    stage.failed += 1
+                    logger.error(
+                        "pipeline_stage_failed",
+                        stage=stage.name,
+                        claim_id=str(job.claim_id),
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    if not job.future.done():
+                        job.future.set_exception(
+                            RuntimeError(f"Verification pipeline failed: {e}")
+                        )
+                    await self._emit("increment_counter", "pipeline.stage.failed", 1, stage)
+                    continue
+                finally:
+                    stage.in_flight -= 1
+                    service_ms = (time.perf_counter() - start) * 1000
+
+                stage.processed += 1
+                stage.total_service_ms += service_ms
+                stage.max_service_ms = max(stage.max_service_ms, service_ms)
+                await self._emit("set_gauge", "pipeline.stage.queue_depth", queue_depth, stage)
+                await self._emit("record_histogram", "pipeline.stage.service_ms", service_ms, stage)
+
+                if next_stage is not None and not job.finished:
+                    await self._put(next_stage, job)
+                elif not job.future.done():
+                    job.future.set_result(job.result)
+            finally:
+                stage.queue.task_done()
+
+    async def _emit(self, method: str, name: str, value: float, stage: _Stage) -> None:
+        if self.metrics_collector is None:
+            return
+        try:
+            await getattr(self.metrics_collector, method)(name, value, labels={"stage": stage.name})
+        except Exception as e:
+            logger.warning("pipeline_stage_metrics_failed", error=str(e))
+
+    async def stop(self) -> None:
+        """Stop the stage workers and fail any claims still queued."""
+        workers = [worker for stage in self._stages for worker in stage.workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        for stage in self._stages:
+            stage.workers = []
+            if stage.queue is not None:
+                while not stage.queue.empty():
+                    job = stage.queue.get_nowait()
+                    if not job.future.done():
+                        job.future.set_exception(
+                            RuntimeError("Staged verification pipeline stopped")
+                        )
+                stage.queue = None
+        self._loop = None
+
+        logger.info("staged_pipeline_stopped")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-stage statistics.
+
+        Returns:
+            Dictionary with "stages" (queue depth, in-flight, processed, failed
+            and service times per stage), "bottleneck" (the stage with the
+            highest service time per worker, None before any claim completes)
+            and "queue_size"
+        """
+        stages = {stage.name: stage.stats() for stage in self._stages}
+        busiest = max(self._stages, key=lambda s: stages[s.name]["load_ms_per_worker"])
+        return {
+            "running": any(not w.done() for stage in self._stages for w in stage.workers),
+            "queue_size": self.queue_size,
+            "stages": stages,
+            "bottleneck": busiest.name if busiest.processed else None,
+        }
+
+    @classmethod
+    def get_instance(cls) -> "StagedVerificationPipeline":
+        """Get or create the process-wide staged pipeline.
+
+        Returns:
+            The singleton StagedVerificationPipeline instance
+        """
+        if cls._instance is None:
+            from truthgraph.monitoring.metrics_collector import get_metrics_collector
+
+            cls._instance = cls(metrics_collector=get_metrics_collector())
+        return cls._instance
+
+
+def staged_pipeline_enabled() -> bool:
+    """Whether VERIFICATION_PIPELINE_MODE selects the staged pipeline.
+
+    Raises:
+        ValueError: If VERIFICATION_PIPELINE_MODE is not serial or staged
+    """
+    mode = os.getenv("VERIFICATION_PIPELINE_MODE", "serial").strip().lower()
+    if mode not in ("serial", "staged"):
+        raise ValueError(
+            f"Invalid VERIFICATION_PIPELINE_MODE '{mode}'. Expected 'serial' or 'staged'"
+        )
+    return mode == "staged"
+
+
+def get_staged_verification_pipeline() -> StagedVerificationPipeline:
+    """Get the singleton StagedVerificationPipeline instance.
+
+    Returns:
+        The singleton StagedVerificationPipeline instance
+    """
+    return StagedVerificationPipeline.get_instance()
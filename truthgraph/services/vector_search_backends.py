@@ -0,0 +1,57 @@
+"""Selection of the vector search backend.
+
+Backends (VECTOR_SEARCH_BACKEND):
+    pgvector (default): VectorSearchService, ANN query in Postgres
+    ann: ANNVectorSearchService, in-process HNSW graph per tenant
+    exact: ExactVectorSearchService, memory-mapped brute force for tenants up
+        to EXACT_SEARCH_MAX_ROWS evidence rows, pgvector above that
+
+The in-process backends are process-wide singletons so their per-tenant state
+is shared by all requests.
+"""
+
+import os
+
+from truthgraph.services.vector_search_service import VectorSearchService
+
+VECTOR_SEARCH_BACKENDS = ("pgvector", "ann", "exact")
+
+
+def get_vector_search_backend() -> str:
+    """Read the vector search backend selection (VECTOR_SEARCH_BACKEND).
+
+    Returns:
+        "pgvector", "ann" or "exact"
+
+    Raises:
+        ValueError: If the variable holds an unknown backend name
+    """
+    backend = os.getenv("VECTOR_SEARCH_BACKEND", "pgvector").strip().lower()
+    if backend not in VECTOR_SEARCH_BACKENDS:
+        raise ValueError(
+            f"VECTOR_SEARCH_BACKEND must be one of {', '.join(VECTOR_SEARCH_BACKENDS)}, "
+            f"got '{backend}'"
+        )
+    return backend
+
+
+def get_vector_search_service(embedding_dimension: int = 384) -> VectorSearchService:
+    """Get a vector search service for the configured backend.
+
+    Args:
+        embedding_dimension: Embedding dimension
+
+    Returns:
+        The shared in-process backend for "ann" / "exact", otherwise a
+        VectorSearchService
+    """
+    backend = get_vector_search_backend()
+    if backend == "ann":
+        from truthgraph.services.ann_search_service import ANNVectorSearchService
+
+        return ANNVectorSearchService.get_instance(embedding_dimension)
+    if backend == "exact":
+        from truthgraph.services.exact_search_service import ExactVectorSearchService
+
+        return ExactVectorSearchService.get_instance(embedding_dimension)
+    return VectorSearchService(embedding_dimension=embedding_dimension)
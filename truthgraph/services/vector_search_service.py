@@ -1,7 +1,26 @@
 """Vector search service for semantic similarity using pgvector.
 
 This module provides vector search functionality over evidence and claim embeddings
-using pgvector's cosine distance operator for semantic similarity.
+using pgvector distance operators for semantic similarity. The operator comes from
+the configured DistanceMetric (cosine by default) so that it matches the operator
+class of the vector index and the planner can use it. Query vectors
+are bound as float32 numpy arrays through pgvector's binary adapter rather than
+formatted into SQL literals (see db_queries.vector_adapter).
+
+When the index is HNSW, hnsw.ef_search (the recall/latency knob) can be set per
+service, per tenant, or per request; it is applied with SET LOCAL semantics so
+it only lasts for the search transaction, and a later search in the same
+transaction without a value is reset to the server default (see
+db_queries.vector_index).
+
+With a quantization (halfvec or binary) the search runs in two stages:
+candidates are over-fetched from the compact shadow column's index and then
+re-ranked by the exact float32 distance on the full embedding, inside a
+single query (see db_queries.quantization).
+
+search_similar_evidence_batch sends every query vector in one statement: the
+vectors are unnested from a vector[] parameter and each one drives a LATERAL
+top-k subquery.
 
 Supports both embedding models:
 - all-MiniLM-L6-v2: 384 dimensions
@@ -9,15 +28,39 @@ Supports both embedding models:
 """
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Literal, Optional
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from truthgraph.db_queries.distance import DistanceMetric, get_distance_metric
+from truthgraph.db_queries.quantization import (
+    VectorQuantization,
+    get_rerank_oversample,
+    get_vector_quantization,
+    validate_rerank_oversample,
+)
+from truthgraph.db_queries.vector_adapter import (
+    as_float32_matrix,
+    as_float32_vector,
+    vector_connection,
+)
+from truthgraph.db_queries.vector_index import (
+    HNSW_EF_SEARCH_RANGE,
+    apply_local_ef_search,
+    get_default_ef_search,
+    validate_ef_search,
+)
+
 logger = logging.getLogger(__name__)
 
+# pgvector's default hnsw.ef_search; HNSW returns at most this many rows
+SERVER_DEFAULT_EF_SEARCH = 40
+
 
 @dataclass
 class SearchResult:
@@ -28,27 +71,34 @@ class SearchResult:
         content: Full text content of the evidence
         source_url: URL source of the evidence (if available)
         similarity: Cosine similarity score (0.0 to 1.0, higher is more similar)
+        rank_score: Keyword rank score of a match found by keyword search
+            only, which has no similarity (similarity is then 0.0)
     """
 
     evidence_id: UUID
     content: str
     source_url: Optional[str]
     similarity: float
+    rank_score: Optional[float] = None
 
 
 class VectorSearchService:
     """Service for performing vector similarity search on embeddings.
 
-    This service uses pgvector's cosine distance operator (<->) to find
-    semantically similar evidence documents to a query embedding.
+    This service uses the pgvector distance operator of its DistanceMetric
+    (cosine <=> by default) to find semantically similar evidence documents
+    to a query embedding.
 
     Supports polymorphic embeddings table with entity_type filtering.
 
     Performance characteristics:
-        - Uses IVFFlat index for approximate nearest neighbor search
+        - Uses the IVFFlat or HNSW index for approximate nearest neighbor search
+        - HNSW recall/latency is tuned with ef_search (service, tenant or request)
+        - Optional two-stage mode ranks by a halfvec or binary shadow column and
+          re-ranks top_k * rerank_oversample candidates at full precision
         - Target: <100ms query time for 10k+ vectors
-        - Cosine distance: lower values = higher similarity
-        - Returns similarity scores in [0, 1] range (1 = identical)
+        - Distance: lower values = higher similarity
+        - Returns cosine-scale similarity scores (1 = identical)
 
     Example:
         >>> service = VectorSearchService()
@@ -63,38 +113,121 @@ class VectorSearchService:
         ...     print(f"{result.similarity:.3f}: {result.content[:100]}")
     """
 
-    def __init__(self, embedding_dimension: int = 1536) -> None:
+    def __init__(
+        self,
+        embedding_dimension: int = 1536,
+        metric: DistanceMetric | str | None = None,
+        ef_search: Optional[int] = None,
+        tenant_ef_search: Optional[Mapping[str, int]] = None,
+        quantization: VectorQuantization | str | None = None,
+        rerank_oversample: Optional[int] = None,
+    ) -> None:
         """Initialize the vector search service.
 
         Args:
             embedding_dimension: Dimension of embeddings (384 or 1536, default: 1536)
+            metric: Distance metric; must match the vector index operator class.
+                Defaults to VECTOR_DISTANCE_METRIC (cosine).
+            ef_search: Default hnsw.ef_search for searches. Defaults to
+                HNSW_EF_SEARCH; None keeps the server setting.
+            tenant_ef_search: Per-tenant hnsw.ef_search overrides
+            quantization: Stage-one representation (none, halfvec or binary).
+                Defaults to VECTOR_SEARCH_QUANTIZATION (none: single-stage search
+                on the full embedding).
+            rerank_oversample: Candidates fetched per requested result in
+                two-stage mode. Defaults to VECTOR_RERANK_OVERSAMPLE (4).
         """
         if embedding_dimension not in [384, 1536]:
             raise ValueError(f"Unsupported embedding dimension: {embedding_dimension}")
         self.embedding_dimension = embedding_dimension
-        logger.info(f"VectorSearchService initialized with {embedding_dimension}-dim embeddings")
+        self.metric = get_distance_metric() if metric is None else DistanceMetric.parse(metric)
+        self.ef_search = (
+            get_default_ef_search() if ef_search is None else validate_ef_search(ef_search)
+        )
+        self.tenant_ef_search: dict[str, int] = {}
+        for tenant_id, value in (tenant_ef_search or {}).items():
+            self.set_tenant_ef_search(tenant_id, value)
+        self.quantization = (
+            get_vector_quantization()
+            if quantization is None
+            else VectorQuantization.parse(quantization)
+        )
+        self.rerank_oversample = (
+            get_rerank_oversample()
+            if rerank_oversample is None
+            else validate_rerank_oversample(rerank_oversample)
+        )
+        logger.info(
+            f"VectorSearchService initialized with {embedding_dimension}-dim embeddings "
+            f"({self.metric.value} distance, quantization={self.quantization.value})"
+        )
+
+    def set_tenant_ef_search(self, tenant_id: str, ef_search: Optional[int]) -> None:
+        """Set (or with None, clear) a tenant's hnsw.ef_search override.
+
+        Args:
+            tenant_id: Tenant identifier
+            ef_search: Candidate list size for this tenant's searches
+
+        Raises:
+            ValueError: If ef_search is out of range
+        """
+        if ef_search is None:
+            self.tenant_ef_search.pop(tenant_id, None)
+        else:
+            self.tenant_ef_search[tenant_id] = validate_ef_search(ef_search)
+
+    def resolve_ef_search(
+        self,
+        tenant_id: str,
+        top_k: int,
+        ef_search: Optional[int] = None,
+    ) -> Optional[int]:
+        """Pick the hnsw.ef_search for a search.
+
+        The request value wins over the tenant override, which wins over the
+        service default. HNSW returns at most ef_search rows, so the result is
+        raised to top_k when lower.
+
+        Args:
+            tenant_id: Tenant identifier
+            top_k: Number of results requested
+            ef_search: Per-request value, if any
+
+        Returns:
+            ef_search to apply, or None to keep the server setting
+        """
+        if ef_search is None:
+            ef_search = self.tenant_ef_search.get(tenant_id, self.ef_search)
+        if ef_search is None:
+            return None
+        return validate_ef_search(max(ef_search, top_k))
 
     def search_similar_evidence(
         self,
         db: Session,
-        query_embedding: list[float],
+        query_embedding: list[float] | np.ndarray,
         top_k: int = 10,
         min_similarity: float = 0.0,
         tenant_id: str = "default",
         source_filter: Optional[str] = None,
+        ef_search: Optional[int] = None,
     ) -> list[SearchResult]:
         """Search for evidence similar to a query embedding.
 
-        Uses pgvector's cosine distance operator for similarity search.
+        Uses the distance operator of self.metric for similarity search.
         Results are filtered by tenant_id for multi-tenancy support.
 
         Args:
             db: SQLAlchemy database session
-            query_embedding: Query vector (384 or 1536-dimensional list of floats)
+            query_embedding: Query vector (384 or 1536-dimensional list of floats or
+                float32 array; arrays are sent without copying)
             top_k: Maximum number of results to return (default: 10)
             min_similarity: Minimum similarity threshold [0, 1] (default: 0.0)
             tenant_id: Tenant identifier for isolation (default: 'default')
             source_filter: Optional source URL filter (exact match)
+            ef_search: hnsw.ef_search for this search only (overrides the tenant
+                and service settings; ignored by IVFFlat indexes)
 
         Returns:
             List of SearchResult objects ordered by similarity (highest first)
@@ -105,8 +238,10 @@ class VectorSearchService:
 
         Performance:
             - Typical query time: 20-80ms for 10k vectors
-            - Uses IVFFlat index with lists=100 parameter
-            - Set ivfflat.probes for accuracy/speed tradeoff
+            - Uses the IVFFlat or HNSW index built with self.metric.opclass
+            - Set ivfflat.probes (IVFFlat) or ef_search (HNSW) for accuracy/speed tradeoff
+            - In two-stage mode ef_search is raised to the candidate count, and
+              source_filter is applied to the re-ranked candidates
 
         Example:
             >>> results = service.search_similar_evidence(
@@ -122,51 +257,134 @@ class VectorSearchService:
                 f"Query embedding must be {self.embedding_dimension}-dimensional, "
                 f"got {len(query_embedding)}"
             )
+        query_vector = as_float32_vector(query_embedding)
+        candidate_k, effective_ef_search = self.search_limits(tenant_id, top_k, ef_search)
 
         # Convert similarity threshold to distance threshold
-        # Cosine distance = 1 - cosine similarity
         # So: similarity >= min_similarity means distance <= max_distance
-        max_distance = 1.0 - min_similarity
-
-        # Build the query
-        # Note: pgvector's <-> operator returns cosine distance (0 = identical, 2 = opposite)
-        # We convert to similarity score with: similarity = 1 - distance
-        # Format embedding as PostgreSQL array literal
-        embedding_array = "[" + ",".join(str(x) for x in query_embedding) + "]"
-
-        sql_query = f"""
-        SELECT
-            e.id,
-            e.content,
-            e.source_url,
-            1 - (emb.embedding <-> '{embedding_array}'::vector) AS similarity
-        FROM evidence e
-        JOIN embeddings emb ON e.id = emb.entity_id
-        WHERE emb.entity_type = 'evidence'
-            AND emb.tenant_id = %(tenant_id)s
-            AND (emb.embedding <-> '{embedding_array}'::vector) <= %(max_distance)s
-        """
-
-        # Add optional source filter
         params = {
+            "query_vector": query_vector,
             "tenant_id": tenant_id,
-            "max_distance": max_distance,
+            "max_distance": self.metric.max_distance(min_similarity),
             "top_k": top_k,
         }
-
+        if candidate_k is not None:
+            params["candidate_k"] = candidate_k
         if source_filter is not None:
-            sql_query += "    AND e.source_url = %(source_filter)s\n"
             params["source_filter"] = source_filter
 
-        # Order by distance (ascending = most similar first) and limit
-        sql_query += f"""
-        ORDER BY emb.embedding <-> '{embedding_array}'::vector ASC
+        # The query vector is bound in binary format (%(...)b) as a float32 array
+        sql_query = self.top_k_sql("%(query_vector)b", source_filter is not None)
+
+        return self._run_search(
+            db, sql_query, params, effective_ef_search, top_k, min_similarity, tenant_id
+        )
+
+    def search_limits(
+        self,
+        tenant_id: str,
+        top_k: int,
+        ef_search: Optional[int],
+    ) -> tuple[Optional[int], Optional[int]]:
+        """Stage-one candidate count and hnsw.ef_search for a search.
+
+        Also used by HybridSearchService's fused query, so both plan the
+        vector branch the same way.
+
+        Args:
+            tenant_id: Tenant identifier
+            top_k: Number of results requested
+            ef_search: Per-request hnsw.ef_search, if any
+
+        Returns:
+            (candidates to re-rank, or None for single-stage search;
+            ef_search to apply, or None to keep the server setting)
+        """
+        if self.quantization is VectorQuantization.NONE:
+            return None, self.resolve_ef_search(tenant_id, top_k, ef_search)
+
+        candidate_k = max(top_k, min(top_k * self.rerank_oversample, HNSW_EF_SEARCH_RANGE[1]))
+        # HNSW returns at most ef_search rows, so stage one needs at least candidate_k
+        effective_ef_search = self.resolve_ef_search(tenant_id, candidate_k, ef_search)
+        if effective_ef_search is None and candidate_k > SERVER_DEFAULT_EF_SEARCH:
+            effective_ef_search = candidate_k
+        return candidate_k, effective_ef_search
+
+    def top_k_sql(self, query: str, source_filter: bool = False) -> str:
+        """SELECT of (id, content, source_url, similarity) for one query vector.
+
+        Rows are ordered best first and limited to %(top_k)s, filtered by
+        %(tenant_id)s and %(max_distance)s (and %(source_filter)s if requested).
+        Every ORDER BY uses a bare distance expression so an ANN index can
+        serve it.
+
+        HybridSearchService embeds this as the vector branch of its fused
+        query. Single-stage search orders by the full embedding. With a quantization,
+        a LIMIT %(candidate_k)s subquery (not flattened by the planner, so the
+        shadow column's HNSW index serves it) over-fetches candidates that are
+        then re-ranked by the exact distance on the float32 embedding.
+
+        Args:
+            query: Query vector expression (a placeholder or a column)
+            source_filter: Whether to filter on e.source_url
+
+        Returns:
+            SQL text without a trailing semicolon
+        """
+        if self.quantization is VectorQuantization.NONE:
+            column = "emb.embedding"
+            source = """evidence e
+        JOIN embeddings emb ON e.id = emb.entity_id
+        WHERE emb.entity_type = 'evidence'
+            AND emb.tenant_id = %(tenant_id)s
+            AND"""
+        else:
+            column = "c.embedding"
+            stage_one = self.quantization.order_by_sql(self.metric, "emb", query)
+            source = f"""(
+            SELECT emb.entity_id, emb.embedding
+            FROM embeddings emb
+            WHERE emb.entity_type = 'evidence'
+                AND emb.tenant_id = %(tenant_id)s
+            ORDER BY {stage_one} ASC
+            LIMIT %(candidate_k)s
+        ) c
+        JOIN evidence e ON e.id = c.entity_id
+        WHERE"""
+
+        distance = self.metric.distance_sql(column, query)
+        similarity = self.metric.similarity_sql(column, query)
+        source_clause = (
+            "\n            AND e.source_url = %(source_filter)s" if source_filter else ""
+        )
+        return f"""
+        SELECT
+            e.id,
+            e.content,
+            e.source_url,
+            {similarity} AS similarity
+        FROM {source} {distance} <= %(max_distance)s{source_clause}
+        ORDER BY {self.metric.order_by_sql(column, query)} ASC
         LIMIT %(top_k)s
         """
 
+    def _run_search(
+        self,
+        db: Session,
+        sql_query: str,
+        params: dict,
+        effective_ef_search: Optional[int],
+        top_k: int,
+        min_similarity: float,
+        tenant_id: str,
+    ) -> list[SearchResult]:
+        """Execute a search query and convert its rows to SearchResults."""
         try:
-            # Execute raw SQL with psycopg cursor (bypass SQLAlchemy text() to avoid escaping)
-            with db.connection().connection.cursor() as cursor:
+            # Execute raw SQL with psycopg cursor (bypass SQLAlchemy text() so the
+            # vector can use a binary placeholder)
+            connection = vector_connection(db)
+            with connection.cursor() as cursor:
+                apply_local_ef_search(connection, cursor, effective_ef_search)
                 cursor.execute(sql_query, params)
                 rows = cursor.fetchall()
 
@@ -183,7 +401,8 @@ class VectorSearchService:
 
             logger.info(
                 f"Vector search returned {len(search_results)} results "
-                f"(top_k={top_k}, min_similarity={min_similarity:.2f}, tenant={tenant_id})"
+                f"(top_k={top_k}, min_similarity={min_similarity:.2f}, tenant={tenant_id}, "
+                f"quantization={self.quantization.value})"
             )
 
             return search_results
@@ -195,29 +414,37 @@ class VectorSearchService:
     def search_similar_evidence_batch(
         self,
         db: Session,
-        query_embeddings: list[list[float]],
+        query_embeddings: list[list[float]] | np.ndarray,
         top_k: int = 10,
         min_similarity: float = 0.0,
         tenant_id: str = "default",
+        ef_search: Optional[int] = None,
     ) -> list[list[SearchResult]]:
-        """Search for evidence similar to multiple query embeddings.
+        """Search for evidence similar to multiple query embeddings in one statement.
 
-        Performs multiple similarity searches in sequence. For better performance
-        with large batches, consider parallelizing at the application layer.
+        All query vectors are bound as a single binary vector[] parameter and
+        unnested WITH ORDINALITY; a LATERAL subquery runs the same tenant-scoped,
+        min_similarity-filtered top-k search as search_similar_evidence for each
+        of them. Rows come back tagged with their query's position and are
+        split per query, so a batch costs one round-trip instead of one per
+        embedding.
 
         Args:
             db: SQLAlchemy database session
-            query_embeddings: List of query vectors (each matching embedding_dimension)
+            query_embeddings: List of query vectors, or a 2-D float32 array with one
+                row per query (each matching embedding_dimension)
             top_k: Maximum results per query (default: 10)
-            min_similarity: Minimum similarity threshold (default: 0.0)
+            min_similarity: Minimum similarity threshold, applied to every query
+                (default: 0.0)
             tenant_id: Tenant identifier (default: 'default')
+            ef_search: hnsw.ef_search for these searches (see search_similar_evidence)
 
         Returns:
             List of result lists, one per query embedding
 
         Raises:
             ValueError: If any query_embedding is invalid
-            RuntimeError: If database queries fail
+            RuntimeError: If the database query fails
 
         Example:
             >>> embeddings = [[0.1] * 1536, [0.2] * 1536]
@@ -229,30 +456,98 @@ class VectorSearchService:
             >>> for i, results in enumerate(batch_results):
             ...     print(f"Query {i}: {len(results)} results")
         """
-        batch_results = []
-
-        for i, query_embedding in enumerate(query_embeddings):
-            try:
-                results = self.search_similar_evidence(
-                    db=db,
-                    query_embedding=query_embedding,
-                    top_k=top_k,
-                    min_similarity=min_similarity,
-                    tenant_id=tenant_id,
+        if len(query_embeddings) == 0:
+            return []
+        matrix = as_float32_matrix(query_embeddings, self.embedding_dimension)
+        candidate_k, effective_ef_search = self.search_limits(tenant_id, top_k, ef_search)
+
+        params = {
+            # A list of row views binds as vector[] without copying the rows
+            "query_vectors": list(matrix),
+            "tenant_id": tenant_id,
+            "max_distance": self.metric.max_distance(min_similarity),
+            "top_k": top_k,
+        }
+        if candidate_k is not None:
+            params["candidate_k"] = candidate_k
+
+        sql_query = f"""
+        SELECT q.ord - 1 AS query_index, hit.id, hit.content, hit.source_url, hit.similarity
+        FROM unnest(%(query_vectors)b::vector[]) WITH ORDINALITY AS q(vec, ord)
+        CROSS JOIN LATERAL ({self.top_k_sql("q.vec")}) hit
+        ORDER BY q.ord, hit.similarity DESC
+        """
+
+        try:
+            connection = vector_connection(db)
+            with connection.cursor() as cursor:
+                apply_local_ef_search(connection, cursor, effective_ef_search)
+                cursor.execute(sql_query, params)
+                rows = cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Batch vector search failed: {e}", exc_info=True)
+            raise RuntimeError(f"Batch vector search query failed: {e}") from e
+
+        batch_results: list[list[SearchResult]] = [[] for _ in range(len(matrix))]
+        for query_index, evidence_id, content, source_url, similarity in rows:
+            batch_results[query_index].append(
+                SearchResult(
+                    evidence_id=evidence_id,
+                    content=content,
+                    source_url=source_url,
+                    similarity=float(similarity),
                 )
-                batch_results.append(results)
-            except Exception as e:
-                logger.error(f"Batch search failed for query {i}: {e}")
-                # Return empty results for failed queries
-                batch_results.append([])
+            )
 
         logger.info(
-            f"Batch vector search completed: {len(query_embeddings)} queries, "
-            f"total results: {sum(len(r) for r in batch_results)}"
+            f"Batch vector search completed: {len(matrix)} queries, total results: {len(rows)}"
         )
 
         return batch_results
 
+    def _results_for_candidates(
+        self,
+        db: Session,
+        candidate_lists: Sequence[Sequence[tuple[UUID, float]]],
+    ) -> tuple[list[list[SearchResult]], list[UUID]]:
+        """Turn ranked (evidence id, similarity) candidates into SearchResults.
+
+        Used by backends that rank in-process: content for every candidate of
+        every query is fetched in one round-trip.
+
+        Args:
+            db: SQLAlchemy database session
+            candidate_lists: Ranked candidates, one list per query
+
+        Returns:
+            (results per query, candidate ids missing from the evidence table)
+        """
+        ids = list(dict.fromkeys(eid for candidates in candidate_lists for eid, _ in candidates))
+        if not ids:
+            return [[] for _ in candidate_lists], []
+
+        rows = db.execute(
+            text("SELECT id, content, source_url FROM evidence WHERE id = ANY(:ids)"),
+            {"ids": ids},
+        ).fetchall()
+        content = {row[0]: (row[1], row[2]) for row in rows}
+
+        missing = [eid for eid in ids if eid not in content]
+        results = [
+            [
+                SearchResult(
+                    evidence_id=eid,
+                    content=content[eid][0],
+                    source_url=content[eid][1],
+                    similarity=similarity,
+                )
+                for eid, similarity in candidates
+                if eid in content
+            ]
+            for candidates in candidate_lists
+        ]
+        return results, missing
+
     def get_embedding_stats(
         self,
         db: Session,
@@ -0,0 +1,463 @@
+"""Process-wide cache for verification results.
+
+VerificationPipelineService instances are created per request or task, so a
+cache owned by the instance is almost never hit. VerificationCache is a
+single cache per process that all instances share. It stores opaque bytes
+(the pipeline serializes results with a compact binary codec) in a
+pluggable backend:
+
+    - memory (default): in-process LRU with per-entry TTL and a byte budget.
+      Expired entries are dropped as they come due, not only when read.
+    - disk: SQLite file on a local disk, shared by every worker process on
+      the host, with the same TTL, LRU and byte-budget rules.
+
+Hits, misses, evictions and size are exported to MetricsCollector by
+CacheStatsCollector (monitoring.collectors.cache_stats).
+
+Configuration (environment):
+    VERIFICATION_CACHE_BACKEND: memory | disk (default: memory)
+    VERIFICATION_CACHE_MAX_BYTES: Byte budget (default: 67108864, 64 MiB)
+    VERIFICATION_CACHE_PATH: SQLite file for the disk backend
+        (default: ~/.cache/truthgraph/verification_cache.sqlite3)
+
+Example:
+    >>> cache = VerificationCache.get_instance()
+    >>> cache.set("key", b"payload", ttl_seconds=3600)
+    >>> cache.get("key")
+    b'payload'
+"""
+
+import heapq
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+
+logger = logging.getLogger(__name__)
+
+VERIFICATION_CACHE_BACKENDS = ("memory", "disk")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Approximate per-entry bookkeeping cost counted against the memory budget
+_ENTRY_OVERHEAD_BYTES = 128
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries: bytes values with a TTL, bounded by a byte budget.
+
+    Implementations must be thread-safe and count the entries they evict.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a live entry (marking it recently used), or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store an entry, evicting least recently used entries to stay in budget."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Remove every entry and return how many there were."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Return entries, bytes, max_bytes, expired_evictions and capacity_evictions."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry TTL and a byte budget.
+
+    Entries live in an OrderedDict in recency order. A heap of expiry times
+    lets expired entries be dropped on every write in amortized O(log n), so
+    they do not hold memory until someone happens to read them.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Budget for values, keys and per-entry overhead
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"Cache max_bytes must be positive, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._bytes = 0
+        self._expired_evictions = 0
+        self._capacity_evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(key: str, value: bytes) -> int:
+        return len(key) + len(value) + _ENTRY_OVERHEAD_BYTES
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= self._size(key, value)
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Skip heap records of entries that were overwritten or deleted since
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+                self._expired_evictions += 1
+        # Drop stale records when the heap outgrows the live entries
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (expires_at, key) for key, (_, expires_at) in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a live entry (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._expired_evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store an entry, evicting least recently used entries to stay in budget."""
+        size = self._size(key, value)
+        now = time.monotonic()
+        expires_at = now + ttl_seconds
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._purge_expired(now)
+            if size > self.max_bytes:
+                return
+            while self._bytes + size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._capacity_evictions += 1
+            self._entries[key] = (value, expires_at)
+            self._bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> int:
+        """Remove every entry and return how many there were."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
+            return count
+
+    def stats(self) -> dict[str, Any]:
+        """Return entries, bytes, max_bytes, expired_evictions and capacity_evictions."""
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "expired_evictions": self._expired_evictions,
+                "capacity_evictions": self._capacity_evictions,
+            }
+
+
+class DiskCacheBackend(CacheBackend):
+    """SQLite-backed cache shared by the worker processes of one host.
+
+    Each process opens its own connection to the same file (WAL mode, so
+    readers do not block the writer). Entries carry a wall-clock expiry and
+    a last-access time; writes drop expired rows and then the least recently
+    used rows until the stored values fit in max_bytes. Eviction counters
+    are per process.
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite database file on a local disk
+            max_bytes: Budget for stored keys and values
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"Cache max_bytes must be positive, got {max_bytes}")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._expired_evictions = 0
+        self._capacity_evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not be shared across fork(); reopen in each process
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed "
+                "ON cache_entries (accessed_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries (expires_at)"
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a live entry (marking it recently used), or None."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._expired_evictions += 1
+                return None
+            conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store an entry, evicting least recently used entries to stay in budget."""
+        size = len(key) + len(value)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            if size > self.max_bytes:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now + ttl_seconds, now),
+                )
+                self._expired_evictions += conn.execute(
+                    "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+                ).rowcount
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+                excess = total[0] - self.max_bytes
+                if excess > 0:
+                    # Least recently used rows, up to the first that covers the excess
+                    self._capacity_evictions += conn.execute(
+                        """
+                        DELETE FROM cache_entries WHERE key IN (
+                            SELECT key FROM (
+                                SELECT key, size,
+                                       SUM(size) OVER (ORDER BY accessed_at, key) AS freed
+                                FROM cache_entries WHERE key != ?
+                            ) WHERE freed - size < ?
+                        )
+                        """,
+                        (key, excess),
+                    ).rowcount
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self) -> int:
+        """Remove every entry and return how many there were."""
+        with self._lock:
+            return self._connection().execute("DELETE FROM cache_entries").rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """Return entries, bytes, max_bytes, expired_evictions and capacity_evictions."""
+        with self._lock:
+            entries, total = (
+                self._connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries")
+                .fetchone()
+            )
+            return {
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "expired_evictions": self._expired_evictions,
+                "capacity_evictions": self._capacity_evictions,
+            }
+
+
+def get_verification_cache_backend() -> CacheBackend:
+    """Create the backend selected by VERIFICATION_CACHE_BACKEND.
+
+    Raises:
+        ValueError: If the variable holds an unknown backend name
+    """
+    backend = os.getenv("VERIFICATION_CACHE_BACKEND", "memory").strip().lower()
+    if backend not in VERIFICATION_CACHE_BACKENDS:
+        raise ValueError(
+            f"VERIFICATION_CACHE_BACKEND must be one of {', '.join(VERIFICATION_CACHE_BACKENDS)}, "
+            f"got '{backend}'"
+        )
+    max_bytes = int(os.getenv("VERIFICATION_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+    if backend == "disk":
+        configured = os.getenv("VERIFICATION_CACHE_PATH")
+        path = (
+            Path(configured)
+            if configured
+            else Path.home() / ".cache" / "truthgraph" / "verification_cache.sqlite3"
+        )
+        return DiskCacheBackend(path, max_bytes=max_bytes)
+    return MemoryCacheBackend(max_bytes=max_bytes)
+
+
+class VerificationCache:
+    """Process-wide verification result cache over a CacheBackend.
+
+    Counts hits and misses; a backend failure is logged and treated as a
+    miss, so the cache can never fail a verification.
+    """
+
+    _instance: ClassVar[Optional["VerificationCache"]] = None
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend (default: VERIFICATION_CACHE_BACKEND)
+        """
+        self.backend = backend or get_verification_cache_backend()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached bytes, or None on a miss
+        """
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Verification cache read failed: {e}")
+            value = None
+            with self._lock:
+                self._errors += 1
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store an entry.
+
+        Args:
+            key: Cache key
+            value: Serialized result
+            ttl_seconds: Time to live
+        """
+        try:
+            self.backend.set(key, value, ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Verification cache write failed: {e}")
+            with self._lock:
+                self._errors += 1
+
+    def delete(self, key: str) -> None:
+        """Remove an entry (e.g. one that no longer decodes)."""
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            logger.warning(f"Verification cache delete failed: {e}")
+
+    def clear(self) -> int:
+        """Remove every entry (for all users of the cache).
+
+        Returns:
+            Number of entries removed
+        """
+        return self.backend.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, errors, evictions and the
+            backend's entries/bytes/max_bytes
+        """
+        backend_stats = self.backend.stats()
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "errors": self._errors,
+                "evictions": backend_stats["expired_evictions"]
+                + backend_stats["capacity_evictions"],
+                **backend_stats,
+            }
+
+    @classmethod
+    def get_instance(cls) -> "VerificationCache":
+        """Get the process-wide instance.
+
+        Returns:
+            VerificationCache singleton
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
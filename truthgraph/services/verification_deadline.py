@@ -0,0 +1,337 @@
+"""Time budgets for deadline-aware claim verification.
+
+VerificationPipelineService.verify_claim(deadline_ms=...) gives one
+verification a wall-clock budget. Every stage checks what is left before it
+starts and degrades instead of overrunning:
+
+- embed: bounded by the budget minus what retrieval, one NLI pair and
+  persistence need; on timeout, evidence is retrieved by keyword search only
+- retrieve: top_k shrinks to the number of NLI pairs the remaining budget
+  affords, and longer premises are then capped at premise_max_words
+- nli: evidence is classified in similarity order, a few items per round,
+  until the budget is spent; rounds go through the NLI batch scheduler with
+  the remaining budget as their deadline, so pairs still queued when it runs
+  out are dropped instead of occupying an inference thread; the verdict
+  covers the classified items
+- aggregate/persist: always run, inside persist_reserve_ms
+
+Database stages are never abandoned mid-call (the session must not be used
+concurrently); only model calls are cut off with a timeout. The result is
+flagged as degraded with the reasons, and the time spent per stage is
+recorded so the reserves below can be tuned. The NLI cost per pair is
+learned by one NLICostEstimator per NLI service (NLICostEstimator.for_service),
+shared by the pipelines that run NLI on that service but not across services.
+
+Configuration (environment):
+    DEADLINE_RETRIEVAL_RESERVE_MS: Budget kept for evidence retrieval (default 100)
+    DEADLINE_PERSIST_RESERVE_MS: Budget kept for aggregation and storage (default 50)
+    DEADLINE_NLI_PAIR_MS: Initial NLI cost estimate per pair, refined from
+        observed rounds by NLICostEstimator (default 40)
+    DEADLINE_NLI_STEP: Evidence items classified per NLI round (default 4)
+    DEADLINE_PREMISE_MAX_WORDS: Premise length cap when the budget is short
+        (default 128)
+"""
+
+import asyncio
+import os
+import time
+import weakref
+from collections.abc import Awaitable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, ClassVar, Optional, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class DeadlinePolicy:
+    """How a verification budget is split between stages.
+
+    Attributes:
+        retrieval_reserve_ms: Budget kept for evidence retrieval
+        persist_reserve_ms: Budget kept for aggregation and storage
+        nli_pair_ms: NLI cost per pair assumed until rounds have been observed
+        nli_step_size: Evidence items classified per NLI round
+        premise_max_words: Premise length cap when the budget is short
+    """
+
+    retrieval_reserve_ms: float = float(os.getenv("DEADLINE_RETRIEVAL_RESERVE_MS", "100"))
+    persist_reserve_ms: float = float(os.getenv("DEADLINE_PERSIST_RESERVE_MS", "50"))
+    nli_pair_ms: float = float(os.getenv("DEADLINE_NLI_PAIR_MS", "40"))
+    nli_step_size: int = int(os.getenv("DEADLINE_NLI_STEP", "4"))
+    premise_max_words: int = int(os.getenv("DEADLINE_PREMISE_MAX_WORDS", "128"))
+
+    def __post_init__(self) -> None:
+        if self.nli_pair_ms <= 0:
+            raise ValueError(f"nli_pair_ms must be > 0, got {self.nli_pair_ms}")
+        if self.nli_step_size < 1:
+            raise ValueError(f"nli_step_size must be >= 1, got {self.nli_step_size}")
+        if self.premise_max_words < 1:
+            raise ValueError(f"premise_max_words must be >= 1, got {self.premise_max_words}")
+
+
+class NLICostEstimator:
+    """Smoothed NLI cost per pair, refined from observed NLI rounds.
+
+    Kept per NLI service (see for_service), so verifications on different
+    models or hardware do not share an estimate.
+
+    Attributes:
+        initial_pair_ms: Cost per pair assumed until a round has been observed
+    """
+
+    SMOOTHING: ClassVar[float] = 0.2
+
+    _by_service: ClassVar["weakref.WeakKeyDictionary[Any, NLICostEstimator]"] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, initial_pair_ms: float) -> None:
+        """Create an estimator.
+
+        Args:
+            initial_pair_ms: Cost per pair assumed until a round has been observed
+
+        Raises:
+            ValueError: If initial_pair_ms is not positive
+        """
+        if initial_pair_ms <= 0:
+            raise ValueError(f"initial_pair_ms must be > 0, got {initial_pair_ms}")
+        self.initial_pair_ms = initial_pair_ms
+        self._observed_pair_ms: Optional[float] = None
+
+    @classmethod
+    def for_service(cls, nli_service: Any, initial_pair_ms: float) -> "NLICostEstimator":
+        """Get the estimator for an NLI service, creating it on first use.
+
+        Args:
+            nli_service: Service the NLI rounds run on
+            initial_pair_ms: Initial estimate if the estimator is created by
+                this call; ignored afterwards
+
+        Returns:
+            The estimator shared by every caller using nli_service
+        """
+        estimator = cls._by_service.get(nli_service)
+        if estimator is None:
+            estimator = cls._by_service[nli_service] = cls(initial_pair_ms)
+        return estimator
+
+    @property
+    def pair_ms(self) -> float:
+        """Expected NLI cost per pair."""
+        return self._observed_pair_ms or self.initial_pair_ms
+
+    def observe(self, pairs: int, elapsed_ms: float) -> None:
+        """Fold the per-pair cost of a finished NLI round into the estimate."""
+        if pairs <= 0:
+            return
+        pair_ms = elapsed_ms / pairs
+        if self._observed_pair_ms is None:
+            self._observed_pair_ms = pair_ms
+        else:
+            self._observed_pair_ms += self.SMOOTHING * (pair_ms - self._observed_pair_ms)
+
+
+class VerificationDeadline:
+    """Wall-clock budget of one verification, with per-stage accounting.
+
+    Not thread-safe; one instance per verification.
+
+    Attributes:
+        budget_ms: Total budget
+        policy: Stage reserves and NLI planning parameters
+        nli_cost: NLI cost estimate used to plan the NLI work
+        stage_ms: Milliseconds spent per stage, in stage order
+        degradations: Why the result is degraded, in the order it happened
+        truncate_premises: Whether NLI premises are capped at premise_max_words
+    """
+
+    def __init__(
+        self,
+        budget_ms: float,
+        policy: Optional[DeadlinePolicy] = None,
+        nli_cost: Optional[NLICostEstimator] = None,
+    ) -> None:
+        """Start the clock.
+
+        Args:
+            budget_ms: Total budget in milliseconds
+            policy: Stage reserves (default: DeadlinePolicy from the environment)
+            nli_cost: Shared NLI cost estimate to plan with and refine
+                (default: a new one starting at policy.nli_pair_ms)
+
+        Raises:
+            ValueError: If budget_ms is not positive
+        """
+        if budget_ms <= 0:
+            raise ValueError(f"deadline_ms must be > 0, got {budget_ms}")
+        self.budget_ms = budget_ms
+        self.policy = policy or DeadlinePolicy()
+        self.nli_cost = nli_cost or NLICostEstimator(self.policy.nli_pair_ms)
+        self.stage_ms: dict[str, float] = {}
+        self.degradations: list[str] = []
+        self.truncate_premises = False
+        self._start = time.monotonic()
+
+    @property
+    def degraded(self) -> bool:
+        """Whether any stage had to cut corners."""
+        return bool(self.degradations)
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the deadline started."""
+        return (time.monotonic() - self._start) * 1000
+
+    def remaining_ms(self) -> float:
+        """Milliseconds left in the budget (0 once it is spent)."""
+        return max(0.0, self.budget_ms - self.elapsed_ms())
+
+    def degrade(self, reason: str) -> None:
+        """Record that a stage degraded its work to stay within budget."""
+        if reason not in self.degradations:
+            self.degradations.append(reason)
+            logger.info(
+                "verification_degraded",
+                reason=reason,
+                budget_ms=self.budget_ms,
+                remaining_ms=round(self.remaining_ms(), 1),
+            )
+
+    @property
+    def nli_pair_ms(self) -> float:
+        """Expected NLI cost per pair."""
+        return self.nli_cost.pair_ms
+
+    def observe_nli(self, pairs: int, elapsed_ms: float) -> None:
+        """Fold the per-pair cost of a finished NLI round into the estimate."""
+        self.nli_cost.observe(pairs, elapsed_ms)
+
+    @property
+    def embed_reserve_ms(self) -> float:
+        """Budget the claim embedding must leave: retrieval, one NLI pair and storage."""
+        return self.policy.retrieval_reserve_ms + self.nli_pair_ms + self.policy.persist_reserve_ms
+
+    def affordable_pairs(self, reserve_ms: float = 0.0) -> int:
+        """NLI pairs that fit in the remaining budget minus reserve_ms."""
+        return max(0, int((self.remaining_ms() - reserve_ms) // self.nli_pair_ms))
+
+    def plan_top_k(self, top_k: int) -> int:
+        """Shrink top_k (and cap premises) to what the remaining budget affords.
+
+        Premises are only capped from here on; "premise_truncated" is recorded
+        by premise() once one is actually cut.
+
+        Args:
+            top_k: Requested evidence count
+
+        Returns:
+            Evidence count to retrieve (at least 1)
+        """
+        affordable = self.affordable_pairs(
+            self.policy.retrieval_reserve_ms + self.policy.persist_reserve_ms
+        )
+        if affordable >= top_k:
+            return top_k
+        self.truncate_premises = True
+        reduced = max(1, affordable)
+        if reduced < top_k:
+            self.degrade("top_k_reduced")
+        return reduced
+
+    def premise(self, text: str) -> str:
+        """The NLI premise for an evidence text, capped when the budget is short."""
+        if not self.truncate_premises:
+            return text
+        words = text.split()
+        if len(words) <= self.policy.premise_max_words:
+            return text
+        self.degrade("premise_truncated")
+        return " ".join(words[: self.policy.premise_max_words])
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to stage_ms[name]."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.stage_ms[name] = self.stage_ms.get(name, 0.0) + (time.monotonic() - start) * 1000
+
+    async def run(self, name: str, awaitable: Awaitable[T], reserve_ms: float = 0.0) -> Optional[T]:
+        """Await a model call within the budget left after reserve_ms.
+
+        Only for calls that do not use the database session: on timeout the
+        call is abandoned while its worker thread finishes in the background.
+
+        Args:
+            name: Stage name for accounting and the degradation reason
+            awaitable: The call
+            reserve_ms: Budget that must be left for later stages
+
+        Returns:
+            The call's result, or None if it was skipped ("<name>_skipped")
+            or timed out ("<name>_timeout")
+        """
+        with self.stage(name):
+            timeout_ms = self.remaining_ms() - reserve_ms
+            if timeout_ms <= 0:
+                if asyncio.iscoroutine(awaitable):
+                    awaitable.close()
+                self.degrade(f"{name}_skipped")
+                return None
+            try:
+                return await asyncio.wait_for(awaitable, timeout_ms / 1000)
+            except TimeoutError:
+                self.degrade(f"{name}_timeout")
+                return None
+
+    def report(self) -> dict[str, Any]:
+        """Budget consumption summary for logs and metrics."""
+        return {
+            "budget_ms": self.budget_ms,
+            "elapsed_ms": round(self.elapsed_ms(), 1),
+            "stage_ms": {name: round(ms, 1) for name, ms in self.stage_ms.items()},
+            "degradations": list(self.degradations),
+        }
+
+    def degradation_note(self) -> str:
+        """Sentence appended to the reasoning of a degraded verdict."""
+        return (
+            f"Verification was shortened to meet its {self.budget_ms:.0f} ms deadline "
+            f"({', '.join(self.degradations)}); the verdict may differ from a full "
+            f"verification."
+        )
+
+    async def export_metrics(self, metrics_collector: Any) -> None:
+        """Record per-stage budget consumption and degradations; never raises.
+
+        Args:
+            metrics_collector: MetricsCollector to record to
+        """
+        try:
+            for stage, elapsed_ms in self.stage_ms.items():
+                await metrics_collector.record_histogram(
+                    "verification.stage_ms", elapsed_ms, labels={"stage": stage}
+                )
+            await metrics_collector.record_histogram(
+                "verification.budget_used_ratio", self.elapsed_ms() / self.budget_ms
+            )
+            for reason in self.degradations:
+                await metrics_collector.increment_counter(
+                    "verification.degraded", labels={"reason": reason}
+                )
+        except Exception as e:
+            logger.warning("verification_deadline_metrics_failed", error=str(e))
+
+
+def deadline_stage(
+    deadline: Optional[VerificationDeadline], name: str
+) -> AbstractContextManager[None]:
+    """Account the block to a deadline stage, if there is a deadline."""
+    return deadline.stage(name) if deadline is not None else nullcontext()
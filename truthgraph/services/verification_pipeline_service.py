@@ -7,16 +7,39 @@ This module orchestrates the end-to-end verification pipeline:
 4. Verdict aggregation
 5. Result storage and caching
 
+verify_claims runs the same steps for many claims at once, with one
+embedding call, one batched search, shared NLI batches and one commit.
+
+With a VerificationResultPersister attached (VERIFICATION_WRITE_BEHIND=true),
+step 5 only queues the rows; they are written in the background.
+
+With a SemanticClaimCache attached (SEMANTIC_CACHE_ENABLED=true), a claim whose
+embedding is close enough to a recently verified claim of the same tenant
+reuses that verdict and skips steps 2-5.
+
+With NLIEarlyStopping attached (NLI_EARLY_STOPPING=true), step 3 classifies
+evidence in similarity order, a few items at a time, and stops as soon as
+the remaining items can no longer change the verdict.
+
+verify_claim(deadline_ms=...) runs every step within a time budget and
+returns a partial verdict flagged as degraded rather than overrunning it
+(see verification_deadline).
+
 Performance target: <60s end-to-end for typical claim
 """
 
+import asyncio
 import hashlib
+import inspect
+import os
+import struct
 import time
-from dataclasses import dataclass
-from datetime import UTC, datetime, timezone
+import zlib
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Hashable, Optional, TypeVar, Union
 from uuid import UUID
 
 import structlog
@@ -28,15 +51,39 @@ from truthgraph.schemas import (
 from truthgraph.schemas import (
     VerificationResult as VerificationResultModel,
 )
+from truthgraph.services.hybrid_search_service import HybridSearchService
 from truthgraph.services.ml.embedding_service import EmbeddingService
-from truthgraph.services.ml.nli_service import NLILabel, NLIService
+from truthgraph.services.ml.inference_executor import run_inference
+from truthgraph.services.ml.nli_scheduler import NLIBatchScheduler, get_nli_scheduler
+from truthgraph.services.ml.nli_service import NLILabel, NLIResult, NLIService
+from truthgraph.services.semantic_claim_cache import (
+    SemanticClaimCache,
+    get_semantic_claim_cache,
+    semantic_cache_enabled,
+)
+from truthgraph.services.vector_search_backends import get_vector_search_service
 from truthgraph.services.vector_search_service import (
     SearchResult,
     VectorSearchService,
 )
+from truthgraph.services.verification_cache import VerificationCache
+from truthgraph.services.verification_deadline import (
+    DeadlinePolicy,
+    NLICostEstimator,
+    VerificationDeadline,
+    deadline_stage,
+)
+from truthgraph.services.verification_result_persister import (
+    VerificationResultPersister,
+    get_result_persister,
+    write_behind_enabled,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Evidence retrieval modes of VerificationPipelineService.verify_claim
+SEARCH_MODES = ("vector", "hybrid", "keyword")
+
 # Type variable for retry decorator
 T = TypeVar("T")
 
@@ -49,6 +96,9 @@ def retry_on_failure(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator for retrying operations with exponential backoff.
 
+    Works on plain and async functions. Coroutine functions wait between
+    attempts with asyncio.sleep, so a retry never blocks the event loop.
+
     Args:
         max_attempts: Maximum number of retry attempts
         initial_delay: Initial delay in seconds before first retry
@@ -60,36 +110,65 @@ def retry_on_failure(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        func_name = getattr(func, "__name__", "unknown_function")
+
+        def on_failure(attempt: int, delay: float, error: Exception) -> bool:
+            """Log a failed attempt; return whether another attempt follows."""
+            if attempt < max_attempts - 1:
+                logger.warning(
+                    "operation_failed_retrying",
+                    function=func_name,
+                    attempt=attempt + 1,
+                    max_attempts=max_attempts,
+                    delay_seconds=delay,
+                    error=str(error),
+                )
+                return True
+            logger.error(
+                "operation_failed_max_retries",
+                function=func_name,
+                attempts=max_attempts,
+                error=str(error),
+                exc_info=True,
+            )
+            return False
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                delay = initial_delay
+                last_exception = None
+
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+                        if on_failure(attempt, delay, e):
+                            await asyncio.sleep(delay)
+                            delay *= backoff_factor
+
+                # All retries exhausted
+                raise RuntimeError(
+                    f"{func_name} failed after {max_attempts} attempts"
+                ) from last_exception
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             delay = initial_delay
             last_exception = None
-            func_name = getattr(func, "__name__", "unknown_function")
 
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            "operation_failed_retrying",
-                            function=func_name,
-                            attempt=attempt + 1,
-                            max_attempts=max_attempts,
-                            delay_seconds=delay,
-                            error=str(e),
-                        )
+                    if on_failure(attempt, delay, e):
                         time.sleep(delay)
                         delay *= backoff_factor
-                    else:
-                        logger.error(
-                            "operation_failed_max_retries",
-                            function=func_name,
-                            attempts=max_attempts,
-                            error=str(e),
-                            exc_info=True,
-                        )
 
             # All retries exhausted
             raise RuntimeError(
@@ -111,7 +190,11 @@ class VerdictLabel(str, Enum):
 
 @dataclass
 class EvidenceItem:
-    """Evidence item with NLI result."""
+    """Evidence item with NLI result.
+
+    rank_score is set (and similarity is 0.0) for evidence found by keyword
+    search only.
+    """
 
     evidence_id: UUID
     content: str
@@ -120,6 +203,12 @@ class EvidenceItem:
     nli_label: NLILabel
     nli_confidence: float
     nli_scores: dict[str, float]
+    rank_score: Optional[float] = None
+
+
+def _evidence_weight(evidence: Union[SearchResult, EvidenceItem]) -> float:
+    """Aggregation weight of evidence: its similarity, or 1.0 for a keyword-only match."""
+    return evidence.similarity if evidence.rank_score is None else 1.0
 
 
 @dataclass
@@ -139,6 +228,10 @@ class VerificationPipelineResult:
         pipeline_duration_ms: Total pipeline execution time
         retrieval_method: Method used for evidence retrieval
         verification_result_id: UUID of stored verification result (if saved)
+        degradations: Why a deadline-bound verification cut corners (empty
+            when it ran in full)
+        stage_timings_ms: Milliseconds spent per stage of a deadline-bound
+            verification
     """
 
     claim_id: UUID
@@ -153,6 +246,208 @@ class VerificationPipelineResult:
     pipeline_duration_ms: float
     retrieval_method: str
     verification_result_id: Optional[UUID] = None
+    degradations: list[str] = field(default_factory=list)
+    stage_timings_ms: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def degraded(self) -> bool:
+        """Whether the verdict was computed with reduced work to meet a deadline."""
+        return bool(self.degradations)
+
+
+# Binary cache encoding of VerificationPipelineResult. Layout (little-endian):
+#   header:   version u8, flags u8 (bit 0: body is zlib-compressed)
+#   body:     claim_id 16B, has_result_id u8 [+ result_id 16B], verdict u8,
+#             confidence/support/refute/neutral/duration f64 x5,
+#             claim_text, reasoning, retrieval_method (u32 length + UTF-8),
+#             evidence count u32, then per item: evidence_id 16B, content,
+#             has_url u8 [+ source_url], similarity f64, nli_label u8,
+#             nli_confidence f64, score count u8, (key, f64) pairs
+# Bump _CACHE_CODEC_VERSION when the layout changes; entries with another
+# version decode as misses. EvidenceItem.rank_score is not encoded: keyword-only
+# evidence comes from degraded verifications, which are never cached.
+_CACHE_CODEC_VERSION = 1
+_CACHE_COMPRESS_MIN_BYTES = 512
+_VERDICTS = list(VerdictLabel)
+_NLI_LABELS = list(NLILabel)
+_HEADER = struct.Struct("<BB")
+_SCORES = struct.Struct("<5d")
+_EVIDENCE_SCORES = struct.Struct("<dBdB")
+_U32 = struct.Struct("<I")
+_F64 = struct.Struct("<d")
+
+
+def _pack_str(out: bytearray, value: str) -> None:
+    data = value.encode("utf-8")
+    out += _U32.pack(len(data))
+    out += data
+
+
+def encode_cached_result(result: VerificationPipelineResult) -> bytes:
+    """Serialize a pipeline result for the verification cache.
+
+    Args:
+        result: Result to encode
+
+    Returns:
+        Versioned binary encoding, zlib-compressed when that makes it smaller
+    """
+    out = bytearray(result.claim_id.bytes)
+    if result.verification_result_id is None:
+        out.append(0)
+    else:
+        out.append(1)
+        out += result.verification_result_id.bytes
+    out.append(_VERDICTS.index(result.verdict))
+    out += _SCORES.pack(
+        result.confidence,
+        result.support_score,
+        result.refute_score,
+        result.neutral_score,
+        result.pipeline_duration_ms,
+    )
+    _pack_str(out, result.claim_text)
+    _pack_str(out, result.reasoning)
+    _pack_str(out, result.retrieval_method)
+    out += _U32.pack(len(result.evidence_items))
+    for item in result.evidence_items:
+        out += item.evidence_id.bytes
+        _pack_str(out, item.content)
+        if item.source_url is None:
+            out.append(0)
+        else:
+            out.append(1)
+            _pack_str(out, item.source_url)
+        out += _EVIDENCE_SCORES.pack(
+            item.similarity,
+            _NLI_LABELS.index(item.nli_label),
+            item.nli_confidence,
+            len(item.nli_scores),
+        )
+        for key, score in item.nli_scores.items():
+            _pack_str(out, key)
+            out += _F64.pack(score)
+
+    body = bytes(out)
+    flags = 0
+    if len(body) >= _CACHE_COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(body, 1)
+        if len(compressed) < len(body):
+            body, flags = compressed, 1
+    return _HEADER.pack(_CACHE_CODEC_VERSION, flags) + body
+
+
+def decode_cached_result(data: bytes) -> VerificationPipelineResult:
+    """Deserialize a result written by encode_cached_result.
+
+    Args:
+        data: Encoded result
+
+    Returns:
+        The decoded result
+
+    Raises:
+        ValueError: If the data has another codec version or is corrupt
+    """
+    try:
+        version, flags = _HEADER.unpack_from(data)
+        if version != _CACHE_CODEC_VERSION:
+            raise ValueError(f"Unsupported cache codec version {version}")
+        body = zlib.decompress(data[_HEADER.size :]) if flags & 1 else data[_HEADER.size :]
+        view = memoryview(body)
+        offset = 0
+
+        def take(size: int) -> memoryview:
+            nonlocal offset
+            chunk = view[offset : offset + size]
+            if len(chunk) != size:
+                raise ValueError("Truncated cache entry")
+            offset += size
+            return chunk
+
+        def take_uuid() -> UUID:
+            return UUID(bytes=bytes(take(16)))
+
+        def take_str() -> str:
+            (length,) = _U32.unpack(take(_U32.size))
+            return str(take(length), "utf-8")
+
+        claim_id = take_uuid()
+        verification_result_id = take_uuid() if take(1)[0] else None
+        verdict = _VERDICTS[take(1)[0]]
+        confidence, support, refute, neutral, duration = _SCORES.unpack(take(_SCORES.size))
+        claim_text = take_str()
+        reasoning = take_str()
+        retrieval_method = take_str()
+        (count,) = _U32.unpack(take(_U32.size))
+        evidence_items = []
+        for _ in range(count):
+            evidence_id = take_uuid()
+            content = take_str()
+            source_url = take_str() if take(1)[0] else None
+            similarity, label, nli_confidence, score_count = _EVIDENCE_SCORES.unpack(
+                take(_EVIDENCE_SCORES.size)
+            )
+            nli_scores = {}
+            for _ in range(score_count):
+                key = take_str()
+                (nli_scores[key],) = _F64.unpack(take(_F64.size))
+            evidence_items.append(
+                EvidenceItem(
+                    evidence_id=evidence_id,
+                    content=content,
+                    source_url=source_url,
+                    similarity=similarity,
+                    nli_label=_NLI_LABELS[label],
+                    nli_confidence=nli_confidence,
+                    nli_scores=nli_scores,
+                )
+            )
+    except (struct.error, zlib.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupt cache entry: {e}") from e
+
+    return VerificationPipelineResult(
+        claim_id=claim_id,
+        claim_text=claim_text,
+        verdict=verdict,
+        confidence=confidence,
+        support_score=support,
+        refute_score=refute,
+        neutral_score=neutral,
+        evidence_items=evidence_items,
+        reasoning=reasoning,
+        pipeline_duration_ms=duration,
+        retrieval_method=retrieval_method,
+        verification_result_id=verification_result_id,
+    )
+
+
+def nli_early_stopping_enabled() -> bool:
+    """Whether NLI_EARLY_STOPPING asks for adaptive early-stopping NLI."""
+    return os.getenv("NLI_EARLY_STOPPING", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class NLIEarlyStopping:
+    """Adaptive NLI over ranked evidence.
+
+    Evidence is classified in descending similarity order, step_size items
+    per round, until the verdict is decided: even if every unclassified item
+    came back with the least favourable scores, the aggregated verdict would
+    stay the same. The verdict is then identical to classifying everything;
+    scores and confidence are computed over the classified items only.
+
+    Attributes:
+        step_size: Evidence items classified per claim per round
+        min_similarity: Items below this similarity are never classified
+    """
+
+    step_size: int = int(os.getenv("NLI_EARLY_STOPPING_STEP", "3"))
+    min_similarity: float = float(os.getenv("NLI_EARLY_STOPPING_MIN_SIMILARITY", "0.0"))
+
+    def __post_init__(self) -> None:
+        if self.step_size < 1:
+            raise ValueError(f"step_size must be >= 1, got {self.step_size}")
 
 
 class VerificationPipelineService:
@@ -169,12 +464,21 @@ class VerificationPipelineService:
     Performance characteristics:
         - Target: <60s end-to-end for typical claim
         - Parallel NLI processing for evidence batch
-        - Caching for repeated claims
+        - Caching for repeated claims in the process-wide VerificationCache
         - Graceful degradation on partial failures
+        - Never blocks the event loop: model calls run on the bounded
+          inference executor, database calls in worker threads (one at a
+          time per verification, so the session is never shared concurrently)
 
-    Thread safety: NOT thread-safe. Use one instance per request/task.
+    Thread safety: NOT thread-safe. Use one instance per request/task; the
+    result cache is shared between instances.
     """
 
+    # Minimum weighted support/refute score for a SUPPORTED/REFUTED verdict
+    HIGH_CONFIDENCE_THRESHOLD = 0.6
+    # Fewer evidence items than this never give a confident verdict
+    MIN_EVIDENCE_THRESHOLD = 2
+
     def __init__(
         self,
         embedding_service: Optional[EmbeddingService] = None,
@@ -182,32 +486,76 @@ class VerificationPipelineService:
         vector_search_service: Optional[VectorSearchService] = None,
         embedding_dimension: int = 384,
         cache_ttl_seconds: int = 3600,
+        nli_scheduler: Optional[NLIBatchScheduler] = None,
+        cache: Optional[VerificationCache] = None,
+        persister: Optional[VerificationResultPersister] = None,
+        semantic_cache: Optional[SemanticClaimCache] = None,
+        early_stopping: Optional[NLIEarlyStopping] = None,
+        deadline_policy: Optional[DeadlinePolicy] = None,
+        keyword_search_service: Optional[HybridSearchService] = None,
+        metrics_collector: Any = None,
     ):
         """Initialize verification pipeline service.
 
         Args:
             embedding_service: Service for generating embeddings (default: singleton)
             nli_service: Service for NLI verification (default: singleton)
-            vector_search_service: Service for vector search (default: new instance)
+            vector_search_service: Service for vector search (default: VECTOR_SEARCH_BACKEND)
             embedding_dimension: Embedding dimension (default: 384 for MiniLM)
             cache_ttl_seconds: Cache time-to-live in seconds (default: 3600)
+            nli_scheduler: Shared NLI batch scheduler. When set, evidence pairs are
+                packed into batches with other concurrent verifications instead of
+                calling nli_service.verify_batch directly (default: None)
+            cache: Verification result cache (default: process-wide singleton)
+            persister: Write-behind result persister. When set, results are
+                queued for background storage instead of being committed
+                before the verdict is returned (default: None)
+            semantic_cache: Near-duplicate claim cache consulted after the
+                embedding step when use_cache is set (default: None)
+            early_stopping: Classify evidence in similarity order and stop
+                once the verdict is decided, instead of classifying all
+                retrieved evidence (default: None)
+            deadline_policy: Stage reserves for verify_claim(deadline_ms=...)
+                (default: DeadlinePolicy from the environment)
+            keyword_search_service: Hybrid search service for search_mode
+                'hybrid' and 'keyword', and for the keyword-only fallback when a
+                deadline leaves no time to embed the claim (default: created on
+                first use)
+            metrics_collector: Optional MetricsCollector receiving per-stage
+                budget consumption and degradations of deadline-bound runs
         """
         self.embedding_service = embedding_service or EmbeddingService.get_instance()
         self.nli_service = nli_service or NLIService.get_instance()
-        self.vector_search_service = vector_search_service or VectorSearchService(
-            embedding_dimension=embedding_dimension
+        self.vector_search_service = vector_search_service or get_vector_search_service(
+            embedding_dimension
         )
         self.cache_ttl_seconds = cache_ttl_seconds
         self.embedding_dimension = embedding_dimension
+        self.nli_scheduler = nli_scheduler
+
+        self.cache = cache or VerificationCache.get_instance()
+        self.persister = persister
+        self.semantic_cache = semantic_cache
+        self.early_stopping = early_stopping
+        self.deadline_policy = deadline_policy or DeadlinePolicy()
+        # NLI cost per pair, learned from the deadline-bound rounds on this NLI service
+        self.nli_cost = NLICostEstimator.for_service(
+            self.nli_service, self.deadline_policy.nli_pair_ms
+        )
+        self.keyword_search_service = keyword_search_service
+        self.metrics_collector = metrics_collector
 
-        # In-memory cache for recent verifications
-        # Key: claim_text_hash -> (result, timestamp)
-        self._verification_cache: dict[str, tuple[VerificationPipelineResult, datetime]] = {}
+        # NLI pairs classified / skipped by early stopping, for reporting
+        self.nli_pairs_evaluated = 0
+        self.nli_pairs_saved = 0
 
         logger.info(
             "verification_pipeline_initialized",
             embedding_dimension=embedding_dimension,
             cache_ttl_seconds=cache_ttl_seconds,
+            write_behind=persister is not None,
+            semantic_cache=semantic_cache is not None,
+            nli_early_stopping=early_stopping is not None,
         )
 
     def _compute_claim_hash(self, claim_text: str) -> str:
@@ -222,56 +570,222 @@ class VerificationPipelineService:
         normalized = claim_text.strip().lower()
         return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
-    def _get_cached_result(self, claim_text: str) -> Optional[VerificationPipelineResult]:
+    def _cache_key(
+        self,
+        claim_text: str,
+        tenant_id: str = "default",
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        verdict_options: str = "",
+    ) -> str:
+        """Build the cache key for a claim and the retrieval parameters that shape its verdict.
+
+        Args:
+            claim_text: Claim text
+            tenant_id: Tenant whose evidence was searched
+            top_k_evidence: Number of evidence items retrieved
+            min_similarity: Similarity threshold used for retrieval
+            verdict_options: Key part from _verdict_options_key()
+
+        Returns:
+            Cache key
+        """
+        claim_hash = self._compute_claim_hash(claim_text)
+        return (
+            f"verify:{tenant_id}:{top_k_evidence}:{min_similarity!r}:"
+            f"{verdict_options}{claim_hash}"
+        )
+
+    @staticmethod
+    def _verdict_options_key(confidence_threshold: Optional[float], search_mode: str) -> str:
+        """Cache-key part for verify_claim options that change the verdict.
+
+        Empty for the defaults, so their keys are the same as before the
+        options existed.
+        """
+        if confidence_threshold is None and search_mode == "vector":
+            return ""
+        return f"{search_mode}:{confidence_threshold!r}:"
+
+    def _get_cached_result(
+        self,
+        claim_text: str,
+        tenant_id: str = "default",
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        verdict_options: str = "",
+    ) -> Optional[VerificationPipelineResult]:
         """Retrieve cached verification result if available and fresh.
 
         Args:
             claim_text: Claim text to look up
+            tenant_id: Tenant whose evidence was searched
+            top_k_evidence: Number of evidence items retrieved
+            min_similarity: Similarity threshold used for retrieval
+            verdict_options: Key part from _verdict_options_key()
 
         Returns:
             Cached result if available and not expired, None otherwise
         """
-        claim_hash = self._compute_claim_hash(claim_text)
-
-        if claim_hash in self._verification_cache:
-            result, timestamp = self._verification_cache[claim_hash]
-            age_seconds = (datetime.now(tz=timezone.utc) - timestamp).total_seconds()
+        key = self._cache_key(
+            claim_text, tenant_id, top_k_evidence, min_similarity, verdict_options
+        )
+        data = self.cache.get(key)
+        if data is None:
+            return None
 
-            if age_seconds < self.cache_ttl_seconds:
-                logger.info(
-                    "cache_hit",
-                    claim_hash=claim_hash[:16],
-                    age_seconds=age_seconds,
-                )
-                return result
-            else:
-                # Expired, remove from cache
-                del self._verification_cache[claim_hash]
-                logger.info(
-                    "cache_expired",
-                    claim_hash=claim_hash[:16],
-                    age_seconds=age_seconds,
-                )
+        try:
+            result = decode_cached_result(data)
+        except ValueError as e:
+            self.cache.delete(key)
+            logger.warning("cache_entry_undecodable", cache_key=key[:48], error=str(e))
+            return None
 
-        return None
+        logger.info("cache_hit", cache_key=key[:48], entry_bytes=len(data))
+        return result
 
-    def _cache_result(self, claim_text: str, result: VerificationPipelineResult) -> None:
+    def _cache_result(
+        self,
+        claim_text: str,
+        result: VerificationPipelineResult,
+        tenant_id: str = "default",
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        verdict_options: str = "",
+    ) -> None:
         """Cache verification result.
 
         Args:
             claim_text: Claim text to use as cache key
             result: Verification result to cache
+            tenant_id: Tenant whose evidence was searched
+            top_k_evidence: Number of evidence items retrieved
+            min_similarity: Similarity threshold used for retrieval
+            verdict_options: Key part from _verdict_options_key()
         """
-        claim_hash = self._compute_claim_hash(claim_text)
-        self._verification_cache[claim_hash] = (result, datetime.now(tz=timezone.utc))
-        logger.debug("result_cached", claim_hash=claim_hash[:16])
+        key = self._cache_key(
+            claim_text, tenant_id, top_k_evidence, min_similarity, verdict_options
+        )
+        data = encode_cached_result(result)
+        self.cache.set(key, data, self.cache_ttl_seconds)
+        logger.debug("result_cached", cache_key=key[:48], entry_bytes=len(data))
 
     def clear_cache(self) -> None:
-        """Clear all cached verification results."""
-        cache_size = len(self._verification_cache)
-        self._verification_cache.clear()
+        """Clear all cached verification results.
+
+        The cache is shared, so this clears it for every pipeline instance.
+        """
+        cache_size = self.cache.clear()
         logger.info("cache_cleared", entries_removed=cache_size)
 
+    @staticmethod
+    def _rebind_cached_result(
+        cached_result: VerificationPipelineResult, claim_id: UUID
+    ) -> VerificationPipelineResult:
+        """Return a cached result under the requesting claim's id.
+
+        Args:
+            cached_result: Result found in the cache
+            claim_id: Claim being verified
+
+        Returns:
+            The cached result, or a copy for claim_id if it was cached for another claim
+        """
+        if cached_result.claim_id == claim_id:
+            return cached_result
+        # Same text verified for another claim; its stored result row belongs
+        # to that claim
+        return replace(cached_result, claim_id=claim_id, verification_result_id=None)
+
+    async def _semantic_corpus_version(self, db: Session, tenant_id: str) -> Optional[Hashable]:
+        """Get the tenant's evidence corpus version for the semantic cache.
+
+        Returns:
+            The version, or None if there is no semantic cache or the lookup
+            failed (the semantic cache is then skipped for this request)
+        """
+        if self.semantic_cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.semantic_cache.corpus_version, db, tenant_id)
+        except Exception as e:
+            logger.warning("semantic_cache_corpus_version_failed", error=str(e))
+            return None
+
+    @staticmethod
+    def _semantic_params(
+        top_k_evidence: int, min_similarity: float, verdict_options: str
+    ) -> tuple[Any, ...]:
+        """Semantic cache parameters; like _cache_key, unchanged for default options."""
+        params: tuple[Any, ...] = (top_k_evidence, min_similarity)
+        return params + (verdict_options,) if verdict_options else params
+
+    def _semantic_cache_lookup(
+        self,
+        claim_id: UUID,
+        claim_text: str,
+        claim_embedding: list[float],
+        corpus_version: Optional[Hashable],
+        tenant_id: str = "default",
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        verdict_options: str = "",
+    ) -> Optional[VerificationPipelineResult]:
+        """Return the verdict of a near-duplicate claim, rebound to this claim.
+
+        A hit is also cached under the new claim's text, so repeats of the
+        exact paraphrase skip the embedding step too.
+
+        Returns:
+            The reused result, or None
+        """
+        if self.semantic_cache is None or corpus_version is None:
+            return None
+        hit = self.semantic_cache.lookup(
+            tenant_id,
+            claim_embedding,
+            corpus_version,
+            self._semantic_params(top_k_evidence, min_similarity, verdict_options),
+        )
+        if hit is None:
+            return None
+
+        result = replace(
+            hit.value, claim_id=claim_id, claim_text=claim_text, verification_result_id=None
+        )
+        logger.info(
+            "verification_semantic_cache_hit",
+            claim_id=str(claim_id),
+            cached_claim_id=str(hit.value.claim_id),
+            similarity=round(hit.similarity, 4),
+            verdict=result.verdict.value,
+        )
+        self._cache_result(
+            claim_text, result, tenant_id, top_k_evidence, min_similarity, verdict_options
+        )
+        return result
+
+    def _semantic_cache_add(
+        self,
+        claim_embedding: list[float],
+        result: VerificationPipelineResult,
+        corpus_version: Optional[Hashable],
+        tenant_id: str = "default",
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        verdict_options: str = "",
+    ) -> None:
+        """Make a fresh result available to near-duplicate claims."""
+        if self.semantic_cache is None or corpus_version is None:
+            return
+        self.semantic_cache.add(
+            tenant_id,
+            claim_embedding,
+            result,
+            corpus_version,
+            self._semantic_params(top_k_evidence, min_similarity, verdict_options),
+        )
+
     async def verify_claim(
         self,
         db: Session,
@@ -282,18 +796,28 @@ class VerificationPipelineService:
         tenant_id: str = "default",
         use_cache: bool = True,
         store_result: bool = True,
+        deadline_ms: Optional[float] = None,
+        confidence_threshold: Optional[float] = None,
+        search_mode: str = "vector",
     ) -> VerificationPipelineResult:
         """Execute end-to-end verification pipeline for a claim.
 
         Pipeline steps:
         1. Check cache for recent verification
-        2. Generate embedding for claim
-        3. Search for relevant evidence (vector search)
+        2. Generate embedding for claim (then check the semantic cache, if any)
+        3. Search for relevant evidence (vector, hybrid or keyword search)
         4. Run NLI verification on claim vs each evidence
         5. Aggregate NLI results into verdict
         6. Store verification result in database
         7. Cache result for future requests
 
+        With deadline_ms, each step works within what is left of the budget:
+        cached verdicts are still served first, a slow embedding falls back to
+        keyword-only retrieval, top_k shrinks and premises are capped when NLI
+        would not fit, and NLI stops when the budget runs out. Such a result
+        is flagged as degraded, records the time spent per stage, and is not
+        cached.
+
         Args:
             db: Database session (sync)
             claim_id: UUID of the claim to verify
@@ -303,29 +827,44 @@ class VerificationPipelineService:
             tenant_id: Tenant identifier for isolation (default: 'default')
             use_cache: Whether to use cached results (default: True)
             store_result: Whether to store result in database (default: True)
+            deadline_ms: Time budget in milliseconds (default: None, no budget)
+            confidence_threshold: Weighted score a SUPPORTED or REFUTED verdict
+                must exceed (default: HIGH_CONFIDENCE_THRESHOLD)
+            search_mode: Evidence retrieval: 'vector', 'hybrid' (vector and
+                keyword search fused with RRF) or 'keyword' (default: 'vector')
 
         Returns:
             VerificationPipelineResult with verdict and supporting evidence
 
         Raises:
-            ValueError: If claim_text is empty or invalid
+            ValueError: If claim_text is empty or invalid, or search_mode is unknown
             RuntimeError: If pipeline execution fails critically
         """
         if not claim_text or not claim_text.strip():
             raise ValueError("Claim text cannot be empty")
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{search_mode}'")
 
         start_time = time.time()
+        verdict_options = self._verdict_options_key(confidence_threshold, search_mode)
+        deadline = (
+            VerificationDeadline(deadline_ms, self.deadline_policy, self.nli_cost)
+            if deadline_ms is not None
+            else None
+        )
 
         # Step 1: Check cache
         if use_cache:
-            cached_result = self._get_cached_result(claim_text)
+            cached_result = self._get_cached_result(
+                claim_text, tenant_id, top_k_evidence, min_similarity, verdict_options
+            )
             if cached_result is not None:
                 logger.info(
                     "verification_cache_hit",
                     claim_id=str(claim_id),
                     verdict=cached_result.verdict.value,
                 )
-                return cached_result
+                return self._rebind_cached_result(cached_result, claim_id)
 
         logger.info(
             "verification_pipeline_start",
@@ -336,27 +875,51 @@ class VerificationPipelineService:
         )
 
         try:
-            # Step 2: Generate claim embedding (with retry)
+            # Step 2: Generate claim embedding (with retry); keyword search needs none
             embedding_start = time.time()
-            claim_embedding = self._generate_embedding_with_retry(claim_text)
+            claim_embedding = (
+                await self._embed_claim(claim_text, deadline) if search_mode != "keyword" else None
+            )
             embedding_duration = (time.time() - embedding_start) * 1000
 
-            logger.info(
-                "claim_embedding_generated",
-                claim_id=str(claim_id),
-                duration_ms=embedding_duration,
-                embedding_dimension=len(claim_embedding),
-            )
+            if claim_embedding is not None:
+                logger.info(
+                    "claim_embedding_generated",
+                    claim_id=str(claim_id),
+                    duration_ms=embedding_duration,
+                    embedding_dimension=len(claim_embedding),
+                )
+
+            # Near-duplicates of a recently verified claim reuse its verdict
+            corpus_version = None
+            if use_cache and self.semantic_cache is not None and claim_embedding is not None:
+                corpus_version = await self._semantic_corpus_version(db, tenant_id)
+                semantic_result = self._semantic_cache_lookup(
+                    claim_id,
+                    claim_text,
+                    claim_embedding,
+                    corpus_version,
+                    tenant_id,
+                    top_k_evidence,
+                    min_similarity,
+                    verdict_options,
+                )
+                if semantic_result is not None:
+                    return semantic_result
 
             # Step 3: Search for relevant evidence (with retry)
             search_start = time.time()
-            search_results = self._search_evidence_with_retry(
+            search_results = await self._retrieve_evidence(
                 db=db,
-                query_embedding=claim_embedding,
+                claim_text=claim_text,
+                claim_embedding=claim_embedding,
                 top_k=top_k_evidence,
                 min_similarity=min_similarity,
                 tenant_id=tenant_id,
+                deadline=deadline,
+                search_mode=search_mode,
             )
+            retrieval_method = "keyword" if claim_embedding is None else search_mode
             search_duration = (time.time() - search_start) * 1000
 
             logger.info(
@@ -373,14 +936,34 @@ class VerificationPipelineService:
                     claim_text=claim_text,
                     pipeline_duration_ms=(time.time() - start_time) * 1000,
                 )
+                insufficient_result.retrieval_method = retrieval_method
+                self._mark_degraded(insufficient_result, deadline)
 
                 if store_result:
-                    insufficient_result = await self._store_verification_result(
-                        db=db, result=insufficient_result
+                    with deadline_stage(deadline, "persist"):
+                        insufficient_result = await self._store_verification_result(
+                            db=db, result=insufficient_result
+                        )
+                await self._record_deadline(insufficient_result, deadline)
+
+                if use_cache and not insufficient_result.degraded:
+                    self._cache_result(
+                        claim_text,
+                        insufficient_result,
+                        tenant_id,
+                        top_k_evidence,
+                        min_similarity,
+                        verdict_options,
+                    )
+                    self._semantic_cache_add(
+                        claim_embedding,
+                        insufficient_result,
+                        corpus_version,
+                        tenant_id,
+                        top_k_evidence,
+                        min_similarity,
+                        verdict_options,
                     )
-
-                if use_cache:
-                    self._cache_result(claim_text, insufficient_result)
 
                 return insufficient_result
 
@@ -389,6 +972,8 @@ class VerificationPipelineService:
             evidence_items = await self._verify_evidence_batch(
                 claim_text=claim_text,
                 search_results=search_results,
+                deadline=deadline,
+                confidence_threshold=confidence_threshold,
             )
             nli_duration = (time.time() - nli_start) * 1000
 
@@ -401,12 +986,24 @@ class VerificationPipelineService:
 
             # Step 5: Aggregate results into verdict
             aggregation_start = time.time()
-            verdict_result = self._aggregate_verdict(
-                claim_id=claim_id,
-                claim_text=claim_text,
-                evidence_items=evidence_items,
-                pipeline_duration_ms=(time.time() - start_time) * 1000,
-            )
+            with deadline_stage(deadline, "aggregate"):
+                skipped, below_floor = self._unanalyzed_evidence(search_results, evidence_items)
+                verdict_result = self._aggregate_verdict(
+                    claim_id=claim_id,
+                    claim_text=claim_text,
+                    evidence_items=evidence_items,
+                    pipeline_duration_ms=(time.time() - start_time) * 1000,
+                    # Evidence cut off by the deadline is reported with the degradation
+                    skipped_evidence=(
+                        0
+                        if deadline is not None and "nli_partial" in deadline.degradations
+                        else skipped
+                    ),
+                    below_floor_evidence=below_floor,
+                    confidence_threshold=confidence_threshold,
+                )
+                verdict_result.retrieval_method = retrieval_method
+                self._mark_degraded(verdict_result, deadline)
             aggregation_duration = (time.time() - aggregation_start) * 1000
 
             logger.info(
@@ -419,11 +1016,31 @@ class VerificationPipelineService:
 
             # Step 6: Store verification result
             if store_result:
-                verdict_result = await self._store_verification_result(db=db, result=verdict_result)
-
-            # Step 7: Cache result
-            if use_cache:
-                self._cache_result(claim_text, verdict_result)
+                with deadline_stage(deadline, "persist"):
+                    verdict_result = await self._store_verification_result(
+                        db=db, result=verdict_result
+                    )
+            await self._record_deadline(verdict_result, deadline)
+
+            # Step 7: Cache result (partial verdicts are not reused)
+            if use_cache and not verdict_result.degraded:
+                self._cache_result(
+                    claim_text,
+                    verdict_result,
+                    tenant_id,
+                    top_k_evidence,
+                    min_similarity,
+                    verdict_options,
+                )
+                self._semantic_cache_add(
+                    claim_embedding,
+                    verdict_result,
+                    corpus_version,
+                    tenant_id,
+                    top_k_evidence,
+                    min_similarity,
+                    verdict_options,
+                )
 
             total_duration = (time.time() - start_time) * 1000
             logger.info(
@@ -446,9 +1063,351 @@ class VerificationPipelineService:
             )
             raise RuntimeError(f"Verification pipeline failed: {e}") from e
 
+    async def verify_claims(
+        self,
+        db: Session,
+        claims: list[tuple[UUID, str]],
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.5,
+        tenant_id: str = "default",
+        use_cache: bool = True,
+        store_result: bool = True,
+    ) -> list[VerificationPipelineResult]:
+        """Verify many claims with batched model and database calls.
+
+        Produces the same results as calling verify_claim for each claim, but
+        every stage runs once for the whole batch:
+        1. Check cache for each claim
+        2. Embed all uncached claims in one embed_batch call (then check the
+           semantic cache, if any)
+        3. Retrieve evidence for all of them with one batched search
+        4. Run NLI on every claim/evidence pair in shared batches
+        5. Aggregate NLI results per claim
+        6. Store all verification results in one transaction
+        7. Cache results for future requests
+
+        Intended for backfills and bulk requests; for a single claim use
+        verify_claim.
+
+        Args:
+            db: Database session (sync)
+            claims: (claim_id, claim_text) pairs to verify
+            top_k_evidence: Number of evidence items to retrieve per claim (default: 10)
+            min_similarity: Minimum similarity threshold for evidence (default: 0.5)
+            tenant_id: Tenant identifier for isolation (default: 'default')
+            use_cache: Whether to use cached results (default: True)
+            store_result: Whether to store results in database (default: True)
+
+        Returns:
+            One VerificationPipelineResult per claim, in input order
+
+        Raises:
+            ValueError: If any claim_text is empty or invalid
+            RuntimeError: If pipeline execution fails critically
+        """
+        for _, claim_text in claims:
+            if not claim_text or not claim_text.strip():
+                raise ValueError("Claim text cannot be empty")
+
+        start_time = time.time()
+        results: list[Optional[VerificationPipelineResult]] = [None] * len(claims)
+
+        # Step 1: Check cache
+        pending: list[int] = []
+        for index, (claim_id, claim_text) in enumerate(claims):
+            cached_result = None
+            if use_cache:
+                cached_result = self._get_cached_result(
+                    claim_text, tenant_id, top_k_evidence, min_similarity
+                )
+            if cached_result is not None:
+                results[index] = self._rebind_cached_result(cached_result, claim_id)
+            else:
+                pending.append(index)
+
+        logger.info(
+            "verification_batch_start",
+            claim_count=len(claims),
+            cache_hits=len(claims) - len(pending),
+            top_k_evidence=top_k_evidence,
+            min_similarity=min_similarity,
+        )
+
+        if not pending:
+            return results
+
+        try:
+            # Step 2: Embed every uncached claim in one call
+            embedding_start = time.time()
+            claim_embeddings = await self._generate_embeddings_with_retry(
+                [claims[index][1] for index in pending]
+            )
+            embedding_duration = (time.time() - embedding_start) * 1000
+
+            # Near-duplicates of recently verified claims reuse their verdicts
+            corpus_version = None
+            if use_cache and self.semantic_cache is not None:
+                corpus_version = await self._semantic_corpus_version(db, tenant_id)
+                unmatched: list[tuple[int, list[float]]] = []
+                for index, embedding in zip(pending, claim_embeddings, strict=True):
+                    claim_id, claim_text = claims[index]
+                    results[index] = self._semantic_cache_lookup(
+                        claim_id,
+                        claim_text,
+                        embedding,
+                        corpus_version,
+                        tenant_id,
+                        top_k_evidence,
+                        min_similarity,
+                    )
+                    if results[index] is None:
+                        unmatched.append((index, embedding))
+                if not unmatched:
+                    return results
+                pending = [index for index, _ in unmatched]
+                claim_embeddings = [embedding for _, embedding in unmatched]
+
+            # Step 3: One batched evidence search
+            search_start = time.time()
+            search_results = await self._search_evidence_batch_with_retry(
+                db=db,
+                query_embeddings=claim_embeddings,
+                top_k=top_k_evidence,
+                min_similarity=min_similarity,
+                tenant_id=tenant_id,
+            )
+            search_duration = (time.time() - search_start) * 1000
+
+            # Step 4: NLI for all claim/evidence pairs in shared batches
+            nli_start = time.time()
+            evidence = await self._verify_evidence_for_claims(
+                [
+                    (claims[index][1], claim_results)
+                    for index, claim_results in zip(pending, search_results, strict=True)
+                ]
+            )
+            nli_duration = (time.time() - nli_start) * 1000
+
+            logger.info(
+                "verification_batch_inference_complete",
+                claim_count=len(pending),
+                pair_count=sum(len(items) for items in evidence),
+                embedding_duration_ms=embedding_duration,
+                search_duration_ms=search_duration,
+                nli_duration_ms=nli_duration,
+            )
+
+            # Step 5: Aggregate per claim
+            pipeline_duration = (time.time() - start_time) * 1000
+            verified: list[VerificationPipelineResult] = []
+            for index, claim_results, evidence_items in zip(
+                pending, search_results, evidence, strict=True
+            ):
+                skipped, below_floor = self._unanalyzed_evidence(claim_results, evidence_items)
+                verified.append(
+                    self._aggregate_verdict(
+                        claim_id=claims[index][0],
+                        claim_text=claims[index][1],
+                        evidence_items=evidence_items,
+                        pipeline_duration_ms=pipeline_duration,
+                        skipped_evidence=skipped,
+                        below_floor_evidence=below_floor,
+                    )
+                )
+
+            # Step 6: Store all results in one transaction
+            if store_result:
+                verified = await self._store_verification_results(db=db, results=verified)
+
+            # Step 7: Cache results
+            for index, embedding, result in zip(pending, claim_embeddings, verified, strict=True):
+                if use_cache:
+                    self._cache_result(
+                        claims[index][1], result, tenant_id, top_k_evidence, min_similarity
+                    )
+                    self._semantic_cache_add(
+                        embedding, result, corpus_version, tenant_id, top_k_evidence, min_similarity
+                    )
+                results[index] = result
+
+            logger.info(
+                "verification_batch_complete",
+                claim_count=len(claims),
+                verified_count=len(pending),
+                total_duration_ms=(time.time() - start_time) * 1000,
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error(
+                "verification_batch_failed",
+                claim_count=len(claims),
+                error=str(e),
+                exc_info=True,
+            )
+            raise RuntimeError(f"Verification pipeline failed: {e}") from e
+
+    async def _embed_claim(
+        self, claim_text: str, deadline: Optional[VerificationDeadline]
+    ) -> Optional[list[float]]:
+        """Embed the claim, giving up if it would not leave time for the later stages.
+
+        Returns:
+            The embedding, or None if the deadline cut the embedding off
+        """
+        if deadline is None:
+            return await self._generate_embedding_with_retry(claim_text)
+        # Leave room for retrieval, at least one NLI pair and storage
+        return await deadline.run(
+            "embed",
+            self._generate_embedding_with_retry(claim_text),
+            reserve_ms=deadline.embed_reserve_ms,
+        )
+
+    async def _retrieve_evidence(
+        self,
+        db: Session,
+        claim_text: str,
+        claim_embedding: Optional[list[float]],
+        top_k: int,
+        min_similarity: float,
+        tenant_id: str,
+        deadline: Optional[VerificationDeadline],
+        search_mode: str = "vector",
+    ) -> list[SearchResult]:
+        """Retrieve evidence with search_mode, within the deadline if there is one.
+
+        A claim without an embedding is searched by keyword only; with a
+        deadline that is the fallback when the embedding was cut off
+        ("keyword_retrieval"), and top_k is cut to what NLI can still
+        classify. The database call itself is not timed out.
+
+        Returns:
+            Search results, best first
+        """
+        with deadline_stage(deadline, "retrieve"):
+            if deadline is not None:
+                top_k = deadline.plan_top_k(top_k)
+            if claim_embedding is None:
+                if search_mode != "keyword":
+                    assert deadline is not None, "Only a deadline skips the embedding"
+                    deadline.degrade("keyword_retrieval")
+                return await self._keyword_search_evidence(db, claim_text, top_k, tenant_id)
+            if search_mode == "hybrid":
+                return await self._hybrid_search_evidence(
+                    db, claim_text, claim_embedding, top_k, min_similarity, tenant_id
+                )
+            return await self._search_evidence_with_retry(
+                db=db,
+                query_embedding=claim_embedding,
+                top_k=top_k,
+                min_similarity=min_similarity,
+                tenant_id=tenant_id,
+            )
+
+    def _get_keyword_search_service(self) -> HybridSearchService:
+        """The hybrid search service used for keyword and hybrid retrieval."""
+        if self.keyword_search_service is None:
+            self.keyword_search_service = HybridSearchService(
+                embedding_dimension=self.embedding_dimension
+            )
+        return self.keyword_search_service
+
+    async def _hybrid_search_evidence(
+        self,
+        db: Session,
+        claim_text: str,
+        claim_embedding: list[float],
+        top_k: int,
+        min_similarity: float,
+        tenant_id: str,
+    ) -> list[SearchResult]:
+        """Hybrid (vector + keyword, RRF-fused) evidence search in a worker thread.
+
+        Results found by vector search keep their similarity; keyword-only
+        matches carry their rank score instead, as in _keyword_search_evidence.
+
+        Returns:
+            Search results, best first
+        """
+        results, _ = await asyncio.to_thread(
+            self._get_keyword_search_service().hybrid_search,
+            db=db,
+            query_text=claim_text,
+            query_embedding=claim_embedding,
+            top_k=top_k,
+            min_vector_similarity=min_similarity,
+            tenant_id=tenant_id,
+        )
+        return [
+            SearchResult(
+                evidence_id=result.evidence_id,
+                content=result.content,
+                source_url=result.source_url,
+                similarity=result.vector_similarity or 0.0,
+                rank_score=result.rank_score if result.vector_similarity is None else None,
+            )
+            for result in results
+        ]
+
+    async def _keyword_search_evidence(
+        self, db: Session, claim_text: str, top_k: int, tenant_id: str
+    ) -> list[SearchResult]:
+        """Keyword-only evidence search in a worker thread.
+
+        Keyword matches have no similarity: they carry their keyword rank
+        score instead, with similarity 0.0, and are weighted equally when the
+        verdict is aggregated.
+
+        Returns:
+            Search results, best first
+        """
+        results, _ = await asyncio.to_thread(
+            self._get_keyword_search_service().keyword_only_search,
+            db=db,
+            query_text=claim_text,
+            top_k=top_k,
+            tenant_id=tenant_id,
+        )
+        return [
+            SearchResult(
+                evidence_id=result.evidence_id,
+                content=result.content,
+                source_url=result.source_url,
+                similarity=0.0,
+                rank_score=result.rank_score,
+            )
+            for result in results
+        ]
+
+    @staticmethod
+    def _mark_degraded(
+        result: VerificationPipelineResult, deadline: Optional[VerificationDeadline]
+    ) -> None:
+        """Flag a result whose verification cut corners to meet its deadline."""
+        if deadline is None or not deadline.degraded:
+            return
+        result.degradations = list(deadline.degradations)
+        result.reasoning += f" {deadline.degradation_note()}"
+
+    async def _record_deadline(
+        self, result: VerificationPipelineResult, deadline: Optional[VerificationDeadline]
+    ) -> None:
+        """Attach and export the per-stage budget consumption of a verification."""
+        if deadline is None:
+            return
+        result.stage_timings_ms = dict(deadline.stage_ms)
+        logger.info(
+            "verification_deadline_report", claim_id=str(result.claim_id), **deadline.report()
+        )
+
+        if self.metrics_collector is not None:
+            await deadline.export_metrics(self.metrics_collector)
+
     @retry_on_failure(max_attempts=3, initial_delay=1.0, exceptions=(RuntimeError,))
-    def _generate_embedding_with_retry(self, claim_text: str) -> list[float]:
-        """Generate embedding with retry logic.
+    async def _generate_embedding_with_retry(self, claim_text: str) -> list[float]:
+        """Generate embedding on the inference executor, with retry logic.
 
         Args:
             claim_text: Text to embed
@@ -459,10 +1418,10 @@ class VerificationPipelineService:
         Raises:
             RuntimeError: If all retry attempts fail
         """
-        return self.embedding_service.embed_text(claim_text)
+        return await run_inference(self.embedding_service.embed_text, claim_text)
 
     @retry_on_failure(max_attempts=2, initial_delay=0.5, exceptions=(RuntimeError,))
-    def _search_evidence_with_retry(
+    async def _search_evidence_with_retry(
         self,
         db: Session,
         query_embedding: list[float],
@@ -470,7 +1429,7 @@ class VerificationPipelineService:
         min_similarity: float,
         tenant_id: str,
     ) -> list[SearchResult]:
-        """Search for evidence with retry logic.
+        """Search for evidence in a worker thread, with retry logic.
 
         Args:
             db: Database session
@@ -485,7 +1444,8 @@ class VerificationPipelineService:
         Raises:
             RuntimeError: If all retry attempts fail
         """
-        return self.vector_search_service.search_similar_evidence(
+        return await asyncio.to_thread(
+            self.vector_search_service.search_similar_evidence,
             db=db,
             query_embedding=query_embedding,
             top_k=top_k,
@@ -493,37 +1453,311 @@ class VerificationPipelineService:
             tenant_id=tenant_id,
         )
 
+    @retry_on_failure(max_attempts=3, initial_delay=1.0, exceptions=(RuntimeError,))
+    async def _generate_embeddings_with_retry(self, claim_texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several claims in one call on the inference executor.
+
+        Args:
+            claim_texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+
+        Raises:
+            RuntimeError: If all retry attempts fail
+        """
+        return await run_inference(self.embedding_service.embed_batch, claim_texts)
+
+    @retry_on_failure(max_attempts=2, initial_delay=0.5, exceptions=(RuntimeError,))
+    async def _search_evidence_batch_with_retry(
+        self,
+        db: Session,
+        query_embeddings: list[list[float]],
+        top_k: int,
+        min_similarity: float,
+        tenant_id: str,
+    ) -> list[list[SearchResult]]:
+        """Search for evidence for several query embeddings in one statement, in a worker thread.
+
+        Args:
+            db: Database session
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            min_similarity: Minimum similarity threshold
+            tenant_id: Tenant identifier
+
+        Returns:
+            List of search results per query embedding
+
+        Raises:
+            RuntimeError: If all retry attempts fail
+        """
+        return await asyncio.to_thread(
+            self.vector_search_service.search_similar_evidence_batch,
+            db=db,
+            query_embeddings=query_embeddings,
+            top_k=top_k,
+            min_similarity=min_similarity,
+            tenant_id=tenant_id,
+        )
+
     async def _verify_evidence_batch(
         self,
         claim_text: str,
         search_results: list[SearchResult],
+        deadline: Optional[VerificationDeadline] = None,
+        confidence_threshold: Optional[float] = None,
     ) -> list[EvidenceItem]:
-        """Run NLI verification for all evidence items.
+        """Run NLI verification for the evidence of one claim.
 
         Args:
             claim_text: Claim text (hypothesis)
             search_results: Evidence search results (premises)
+            deadline: Time budget NLI must stay within (default: None)
+            confidence_threshold: Verdict threshold early stopping decides
+                against (default: HIGH_CONFIDENCE_THRESHOLD)
 
         Returns:
-            List of EvidenceItem objects with NLI results
+            List of EvidenceItem objects with NLI results; with early stopping
+            or a deadline, only the classified items, in similarity order
         """
-        # Handle empty search results
-        if not search_results:
-            return []
+        (evidence_items,) = await self._verify_evidence_for_claims(
+            [(claim_text, search_results)], deadline, confidence_threshold
+        )
+        return evidence_items
+
+    async def _verify_evidence_for_claims(
+        self,
+        claims: list[tuple[str, list[SearchResult]]],
+        deadline: Optional[VerificationDeadline] = None,
+        confidence_threshold: Optional[float] = None,
+    ) -> list[list[EvidenceItem]]:
+        """Run NLI verification for the evidence of several claims in shared batches.
+
+        Without early stopping or a deadline every (evidence, claim) pair is
+        classified in one _run_nli call. Otherwise each round classifies the
+        next step_size items of every undecided claim in one _run_nli call; a
+        claim drops out once _verdict_is_decided holds (early stopping), and
+        rounds stop when the deadline leaves no time for them ("nli_partial").
+
+        Args:
+            claims: (claim text, search results) per claim
+            deadline: Time budget NLI must stay within (default: None)
+            confidence_threshold: Verdict threshold early stopping decides
+                against (default: HIGH_CONFIDENCE_THRESHOLD)
 
-        # Prepare pairs for batch NLI
-        pairs = [
-            (result.content, claim_text)  # (premise, hypothesis)
-            for result in search_results
+        Returns:
+            Evidence items with NLI results, per claim
+        """
+        if self.early_stopping is None and deadline is None:
+            pairs = [
+                (result.content, claim_text)  # (premise, hypothesis)
+                for claim_text, search_results in claims
+                for result in search_results
+            ]
+            nli_results = await self._run_nli(pairs) if pairs else []
+            self.nli_pairs_evaluated += len(pairs)
+
+            evidence: list[list[EvidenceItem]] = []
+            offset = 0
+            for _, search_results in claims:
+                evidence.append(
+                    self._build_evidence_items(
+                        search_results, nli_results[offset : offset + len(search_results)]
+                    )
+                )
+                offset += len(search_results)
+            return evidence
+
+        if self.early_stopping is not None:
+            step_size = self.early_stopping.step_size
+            min_similarity = self.early_stopping.min_similarity
+        else:
+            step_size = deadline.policy.nli_step_size
+            min_similarity = float("-inf")
+        ranked = [
+            sorted(
+                (
+                    r
+                    for r in search_results
+                    if r.rank_score is not None or r.similarity >= min_similarity
+                ),
+                key=lambda r: r.similarity,
+                reverse=True,
+            )
+            for _, search_results in claims
         ]
+        evidence = [[] for _ in claims]
+        undecided = [index for index, results in enumerate(ranked) if results]
+
+        while undecided:
+            chunks = [
+                (index, ranked[index][len(evidence[index]) :][:step_size]) for index in undecided
+            ]
+            if deadline is not None:
+                # Only the pairs the budget affords, keeping time for storage
+                affordable = deadline.affordable_pairs(deadline.policy.persist_reserve_ms)
+                trimmed = []
+                for index, chunk in chunks:
+                    if affordable <= 0:
+                        break
+                    trimmed.append((index, chunk[:affordable]))
+                    affordable -= len(trimmed[-1][1])
+                chunks = trimmed
+                if not chunks:
+                    break
+
+            pairs = [
+                (deadline.premise(result.content) if deadline else result.content, claims[index][0])
+                for index, chunk in chunks
+                for result in chunk
+            ]
+            if deadline is None:
+                nli_results = await self._run_nli(pairs)
+            else:
+                round_start = time.monotonic()
+                nli_results = await self._run_nli_within(pairs, deadline)
+                if nli_results is None:
+                    break
+                deadline.observe_nli(len(pairs), (time.monotonic() - round_start) * 1000)
+
+            offset = 0
+            for index, chunk in chunks:
+                evidence[index].extend(
+                    self._build_evidence_items(chunk, nli_results[offset : offset + len(chunk)])
+                )
+                offset += len(chunk)
+
+            # Claims the deadline left out of this round stay undecided
+            still_undecided = []
+            for index in undecided:
+                remaining = ranked[index][len(evidence[index]) :]
+                if remaining and (
+                    self.early_stopping is None
+                    or not self._verdict_is_decided(
+                        evidence[index], remaining, confidence_threshold
+                    )
+                ):
+                    still_undecided.append(index)
+            undecided = still_undecided
 
-        # Run batch NLI inference
-        nli_results = self.nli_service.verify_batch(
+        if deadline is not None and undecided:
+            deadline.degrade("nli_partial")
+
+        evaluated = sum(len(items) for items in evidence)
+        total = sum(len(search_results) for _, search_results in claims)
+        self.nli_pairs_evaluated += evaluated
+        self.nli_pairs_saved += total - evaluated
+        logger.info(
+            "nli_early_stopping_complete",
+            claim_count=len(claims),
+            pairs_retrieved=total,
+            pairs_evaluated=evaluated,
+            pairs_saved=total - evaluated,
+        )
+        return evidence
+
+    def _verdict_is_decided(
+        self,
+        evidence_items: list[EvidenceItem],
+        remaining: list[SearchResult],
+        confidence_threshold: Optional[float] = None,
+    ) -> bool:
+        """Whether classifying the remaining evidence could still change the verdict.
+
+        _aggregate_verdict averages the NLI scores weighted by similarity. An
+        unclassified item of weight w can add between 0 and w to each weighted
+        score sum, so the verdict is decided when it holds at both extremes:
+        SUPPORTED (or REFUTED) if that score stays the strict maximum and above
+        HIGH_CONFIDENCE_THRESHOLD even when the remaining weight all goes to a
+        competing label, INSUFFICIENT if neither support nor refute can pass
+        the threshold even when the remaining weight all goes to it.
+
+        Args:
+            evidence_items: Classified evidence
+            remaining: Unclassified evidence
+            confidence_threshold: Verdict threshold (default: HIGH_CONFIDENCE_THRESHOLD)
+
+        Returns:
+            True if the verdict over all evidence equals the verdict over
+            evidence_items
+        """
+        if any(_evidence_weight(result) < 0 for result in remaining):
+            return False
+        remaining_weight = sum(_evidence_weight(result) for result in remaining)
+        total_weight = sum(_evidence_weight(item) for item in evidence_items) + remaining_weight
+        if total_weight <= 0:
+            return False
+
+        support, refute, neutral = (
+            sum(item.nli_scores.get(label, 0.0) * _evidence_weight(item) for item in evidence_items)
+            for label in ("entailment", "contradiction", "neutral")
+        )
+        threshold = self._confidence_threshold(confidence_threshold) * total_weight
+
+        for score, competitors in (
+            (support, (refute, neutral)),
+            (refute, (support, neutral)),
+        ):
+            if score > threshold and all(score > c + remaining_weight for c in competitors):
+                return True
+        return support + remaining_weight <= threshold and refute + remaining_weight <= threshold
+
+    async def _run_nli(self, pairs: list[tuple[str, str]]) -> list[NLIResult]:
+        """Run NLI inference for (premise, hypothesis) pairs.
+
+        Args:
+            pairs: Pairs to classify
+
+        Returns:
+            NLI results in pair order
+        """
+        if self.nli_scheduler is not None:
+            # Shares model batches with other in-flight verifications
+            return await self.nli_scheduler.verify(pairs)
+        return await run_inference(
+            self.nli_service.verify_batch,
             pairs=pairs,
             batch_size=8,  # Optimal for CPU
         )
 
-        # Combine search results with NLI results
+    async def _run_nli_within(
+        self, pairs: list[tuple[str, str]], deadline: VerificationDeadline
+    ) -> Optional[list[NLIResult]]:
+        """Run one deadline-bound NLI round through the batch scheduler.
+
+        The round is submitted with what is left of the budget as its
+        scheduling deadline, so when the budget runs out the scheduler drops
+        the pairs still queued (NLIDeadlineExceeded) rather than running them
+        on an inference thread nobody waits for. Without a scheduler of its
+        own the pipeline uses the shared one for its NLI service.
+
+        Returns:
+            NLI results in pair order, or None if the round was skipped or
+            timed out ("nli_skipped" / "nli_timeout")
+        """
+        scheduler = self.nli_scheduler or get_nli_scheduler(self.nli_service)
+        reserve_ms = deadline.policy.persist_reserve_ms
+        # NLIDeadlineExceeded is a TimeoutError, so deadline.run reports it as nli_timeout
+        return await deadline.run(
+            "nli",
+            scheduler.verify(pairs, deadline_ms=deadline.remaining_ms() - reserve_ms),
+            reserve_ms=reserve_ms,
+        )
+
+    @staticmethod
+    def _build_evidence_items(
+        search_results: list[SearchResult], nli_results: list[NLIResult]
+    ) -> list[EvidenceItem]:
+        """Combine search results with their NLI results.
+
+        Args:
+            search_results: Evidence search results
+            nli_results: NLI results in the same order
+
+        Returns:
+            List of EvidenceItem objects
+        """
         evidence_items = []
         for search_result, nli_result in zip(search_results, nli_results, strict=False):
             evidence_item = EvidenceItem(
@@ -534,17 +1768,44 @@ class VerificationPipelineService:
                 nli_label=nli_result.label,
                 nli_confidence=nli_result.confidence,
                 nli_scores=nli_result.scores,
+                rank_score=search_result.rank_score,
             )
             evidence_items.append(evidence_item)
 
         return evidence_items
 
+    def _unanalyzed_evidence(
+        self, search_results: list[SearchResult], evidence_items: list[EvidenceItem]
+    ) -> tuple[int, int]:
+        """Count the retrieved evidence NLI left unclassified, by reason.
+
+        Args:
+            search_results: Retrieved evidence
+            evidence_items: The classified part of search_results
+
+        Returns:
+            Tuple of (items early stopping skipped, items below the early
+            stopping similarity floor)
+        """
+        below_floor = 0
+        if self.early_stopping is not None:
+            floor = self.early_stopping.min_similarity
+            below_floor = sum(
+                1
+                for result in search_results
+                if result.rank_score is None and result.similarity < floor
+            )
+        return len(search_results) - len(evidence_items) - below_floor, below_floor
+
     def _aggregate_verdict(
         self,
         claim_id: UUID,
         claim_text: str,
         evidence_items: list[EvidenceItem],
         pipeline_duration_ms: float,
+        skipped_evidence: int = 0,
+        below_floor_evidence: int = 0,
+        confidence_threshold: Optional[float] = None,
     ) -> VerificationPipelineResult:
         """Aggregate NLI results into final verdict.
 
@@ -559,6 +1820,13 @@ class VerificationPipelineService:
             claim_text: Text of claim
             evidence_items: List of evidence with NLI results
             pipeline_duration_ms: Total pipeline duration
+            skipped_evidence: Retrieved evidence items that early stopping
+                left unclassified (mentioned in the reasoning)
+            below_floor_evidence: Retrieved evidence items never classified
+                because they were below the early stopping similarity floor
+                (mentioned in the reasoning)
+            confidence_threshold: Weighted score a SUPPORTED or REFUTED verdict
+                must exceed (default: HIGH_CONFIDENCE_THRESHOLD)
 
         Returns:
             VerificationPipelineResult with aggregated verdict
@@ -581,8 +1849,8 @@ class VerificationPipelineService:
         neutral_count = 0
 
         for item in evidence_items:
-            # Use similarity as weight (0-1 range)
-            weight = item.similarity
+            # Use similarity as weight (0-1 range; keyword-only matches weigh 1.0)
+            weight = _evidence_weight(item)
             total_weight += weight
 
             # Weight NLI scores by similarity
@@ -607,18 +1875,15 @@ class VerificationPipelineService:
         # Determine verdict based on scores and counts
         # Use weighted scores as primary signal
         max_score = max(weighted_support, weighted_refute, weighted_neutral)
+        threshold = self._confidence_threshold(confidence_threshold)
 
-        # Confidence thresholds
-        HIGH_CONFIDENCE_THRESHOLD = 0.6
-        MIN_EVIDENCE_THRESHOLD = 2
-
-        if weighted_support == max_score and weighted_support > HIGH_CONFIDENCE_THRESHOLD:
+        if weighted_support == max_score and weighted_support > threshold:
             verdict = VerdictLabel.SUPPORTED
             confidence = weighted_support
-        elif weighted_refute == max_score and weighted_refute > HIGH_CONFIDENCE_THRESHOLD:
+        elif weighted_refute == max_score and weighted_refute > threshold:
             verdict = VerdictLabel.REFUTED
             confidence = weighted_refute
-        elif len(evidence_items) < MIN_EVIDENCE_THRESHOLD:
+        elif len(evidence_items) < self.MIN_EVIDENCE_THRESHOLD:
             # Not enough evidence for confident verdict
             verdict = VerdictLabel.INSUFFICIENT
             confidence = 0.5
@@ -639,6 +1904,16 @@ class VerificationPipelineService:
             neutral_count=neutral_count,
             total_evidence=len(evidence_items),
         )
+        if skipped_evidence:
+            reasoning += (
+                f" {skipped_evidence} lower-ranked evidence items were not analyzed "
+                f"because they could not change the verdict."
+            )
+        if below_floor_evidence:
+            reasoning += (
+                f" {below_floor_evidence} evidence items were not analyzed because their "
+                f"similarity was below the minimum for analysis."
+            )
 
         return VerificationPipelineResult(
             claim_id=claim_id,
@@ -654,6 +1929,12 @@ class VerificationPipelineService:
             retrieval_method="vector",
         )
 
+    def _confidence_threshold(self, confidence_threshold: Optional[float]) -> float:
+        """The verdict threshold: the requested one, or HIGH_CONFIDENCE_THRESHOLD."""
+        if confidence_threshold is None:
+            return self.HIGH_CONFIDENCE_THRESHOLD
+        return confidence_threshold
+
     def _create_insufficient_verdict(
         self,
         claim_id: UUID,
@@ -755,6 +2036,10 @@ class VerificationPipelineService:
     ) -> VerificationPipelineResult:
         """Store verification result in database.
 
+        The blocking writes run in a worker thread. With a persister the
+        result is only queued; its ID is set but the row may not exist yet
+        (see VerificationResultPersister.wait_persisted).
+
         Args:
             db: Database session
             result: Verification result to store
@@ -763,58 +2048,16 @@ class VerificationPipelineService:
             Updated result with verification_result_id set
         """
         try:
-            # Create verification result record
-            verification_record = VerificationResultModel(
-                claim_id=result.claim_id,
-                verdict=result.verdict.value,
-                confidence=result.confidence,
-                support_score=result.support_score,
-                refute_score=result.refute_score,
-                neutral_score=result.neutral_score,
-                evidence_count=len(result.evidence_items),
-                supporting_evidence_count=sum(
-                    1 for item in result.evidence_items if item.nli_label == NLILabel.ENTAILMENT
-                ),
-                refuting_evidence_count=sum(
-                    1 for item in result.evidence_items if item.nli_label == NLILabel.CONTRADICTION
-                ),
-                neutral_evidence_count=sum(
-                    1 for item in result.evidence_items if item.nli_label == NLILabel.NEUTRAL
-                ),
-                reasoning=result.reasoning,
-                retrieval_method=result.retrieval_method,
-                pipeline_version="1.0.0",
-                created_at=datetime.now(UTC),
-            )
-
-            db.add(verification_record)
-            db.flush()  # Get the ID without committing
-
-            # Store individual NLI results
-            for item in result.evidence_items:
-                nli_record = NLIResultModel(
-                    claim_id=result.claim_id,
-                    evidence_id=item.evidence_id,
-                    label=item.nli_label.value,
-                    confidence=item.nli_confidence,
-                    entailment_score=item.nli_scores.get("entailment", 0.0),
-                    contradiction_score=item.nli_scores.get("contradiction", 0.0),
-                    neutral_score=item.nli_scores.get("neutral", 0.0),
-                    model_name="cross-encoder/nli-deberta-v3-base",
-                    premise_text=item.content,
-                    hypothesis_text=result.claim_text,
-                    created_at=datetime.now(UTC),
+            if self.persister is not None:
+                (result.verification_result_id,) = await self._queue_results([result])
+            else:
+                (result.verification_result_id,) = await asyncio.to_thread(
+                    self._write_results, db, [result]
                 )
-                db.add(nli_record)
-
-            db.commit()
-
-            # Update result with stored ID
-            result.verification_result_id = verification_record.id
 
             logger.info(
                 "verification_result_stored",
-                verification_result_id=str(verification_record.id),
+                verification_result_id=str(result.verification_result_id),
                 claim_id=str(result.claim_id),
                 verdict=result.verdict.value,
                 evidence_count=len(result.evidence_items),
@@ -823,7 +2066,6 @@ class VerificationPipelineService:
             return result
 
         except Exception as e:
-            db.rollback()
             logger.error(
                 "verification_result_storage_failed",
                 claim_id=str(result.claim_id),
@@ -833,16 +2075,218 @@ class VerificationPipelineService:
             # Don't fail pipeline on storage error
             return result
 
+    async def _store_verification_results(
+        self,
+        db: Session,
+        results: list[VerificationPipelineResult],
+    ) -> list[VerificationPipelineResult]:
+        """Store several verification results in one transaction.
+
+        The blocking writes run in a worker thread. With a persister the
+        results are only queued, like in _store_verification_result.
+
+        Args:
+            db: Database session
+            results: Verification results to store
+
+        Returns:
+            The results, with verification_result_id set if the commit succeeded
+        """
+        if not results:
+            return results
+
+        try:
+            if self.persister is not None:
+                record_ids = await self._queue_results(results)
+            else:
+                record_ids = await asyncio.to_thread(self._write_results, db, results)
+        except Exception as e:
+            logger.error(
+                "verification_results_storage_failed",
+                result_count=len(results),
+                error=str(e),
+                exc_info=True,
+            )
+            # Don't fail pipeline on storage error
+            return results
+
+        for result, record_id in zip(results, record_ids, strict=True):
+            result.verification_result_id = record_id
+
+        logger.info("verification_results_stored", result_count=len(results))
+        return results
+
+    async def _queue_results(self, results: list[VerificationPipelineResult]) -> list[UUID]:
+        """Hand results to the write-behind persister.
+
+        Args:
+            results: Verification results to store
+
+        Returns:
+            The verification record IDs the rows will be written with
+        """
+        assert self.persister is not None
+        record_ids = []
+        for result in results:
+            verification_row, nli_rows = self._result_rows(result)
+            record_ids.append(await self.persister.submit(verification_row, nli_rows))
+        return record_ids
+
+    def _write_results(
+        self,
+        db: Session,
+        results: list[VerificationPipelineResult],
+    ) -> list[Optional[UUID]]:
+        """Add records for results and commit them in one transaction (blocking).
+
+        Args:
+            db: Database session
+            results: Verification results to store
+
+        Returns:
+            Verification record IDs, in result order
+
+        Raises:
+            Exception: Any database error, after rolling back
+        """
+        try:
+            records = [self._add_result_records(db, result) for result in results]
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return [record.id for record in records]
+
+    def _add_result_records(
+        self,
+        db: Session,
+        result: VerificationPipelineResult,
+    ) -> VerificationResultModel:
+        """Add the verification and NLI records for a result to the session.
+
+        Flushes so the verification record has its ID; the caller commits.
+
+        Args:
+            db: Database session
+            result: Verification result to store
+
+        Returns:
+            The flushed verification record
+        """
+        verification_row, nli_rows = self._result_rows(result)
+
+        # Create verification result record
+        verification_record = VerificationResultModel(**verification_row)
+        db.add(verification_record)
+        db.flush()  # Get the ID without committing
+
+        # Store individual NLI results
+        for nli_row in nli_rows:
+            db.add(NLIResultModel(**nli_row))
+
+        return verification_record
+
+    @staticmethod
+    def _result_rows(
+        result: VerificationPipelineResult,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Build the verification_results and nli_results column values for a result.
+
+        Args:
+            result: Verification result to store
+
+        Returns:
+            Tuple of (verification row, NLI rows); IDs are left to the caller
+        """
+        created_at = datetime.now(UTC)
+        verification_row = {
+            "claim_id": result.claim_id,
+            "verdict": result.verdict.value,
+            "confidence": result.confidence,
+            "support_score": result.support_score,
+            "refute_score": result.refute_score,
+            "neutral_score": result.neutral_score,
+            "evidence_count": len(result.evidence_items),
+            "supporting_evidence_count": sum(
+                1 for item in result.evidence_items if item.nli_label == NLILabel.ENTAILMENT
+            ),
+            "refuting_evidence_count": sum(
+                1 for item in result.evidence_items if item.nli_label == NLILabel.CONTRADICTION
+            ),
+            "neutral_evidence_count": sum(
+                1 for item in result.evidence_items if item.nli_label == NLILabel.NEUTRAL
+            ),
+            "reasoning": result.reasoning,
+            "retrieval_method": result.retrieval_method,
+            "pipeline_version": "1.0.0",
+            "created_at": created_at,
+        }
+        nli_rows = [
+            {
+                "claim_id": result.claim_id,
+                "evidence_id": item.evidence_id,
+                "label": item.nli_label.value,
+                "confidence": item.nli_confidence,
+                "entailment_score": item.nli_scores.get("entailment", 0.0),
+                "contradiction_score": item.nli_scores.get("contradiction", 0.0),
+                "neutral_score": item.nli_scores.get("neutral", 0.0),
+                "model_name": "cross-encoder/nli-deberta-v3-base",
+                "premise_text": item.content,
+                "hypothesis_text": result.claim_text,
+                "created_at": created_at,
+            }
+            for item in result.evidence_items
+        ]
+        return verification_row, nli_rows
+
 
 def get_verification_pipeline_service(
     embedding_dimension: int = 384,
+    embedding_service: Optional[EmbeddingService] = None,
+    nli_service: Optional[NLIService] = None,
+    vector_search_service: Optional[VectorSearchService] = None,
+    keyword_search_service: Optional[HybridSearchService] = None,
 ) -> VerificationPipelineService:
     """Get a new instance of VerificationPipelineService.
 
+    The instance routes NLI through the shared NLIBatchScheduler so that
+    concurrent verifications (e.g. background workers) share model batches.
+    Set NLI_SCHEDULER_ENABLED=false to call the NLI service directly.
+    With VERIFICATION_WRITE_BEHIND=true results are stored through the
+    shared write-behind VerificationResultPersister, and with
+    SEMANTIC_CACHE_ENABLED=true near-duplicate claims are answered from the
+    shared SemanticClaimCache. NLI_EARLY_STOPPING=true enables adaptive
+    early-stopping NLI (see NLIEarlyStopping). Deadline-bound verifications
+    export their per-stage budget consumption to the MetricsCollector, and
+    their NLI rounds always go through the scheduler so that the deadline can
+    drop queued pairs.
+
     Args:
         embedding_dimension: Embedding dimension (default: 384 for MiniLM)
+        embedding_service: Service for generating embeddings (default: singleton)
+        nli_service: Service for NLI verification (default: singleton)
+        vector_search_service: Service for vector search (default: VECTOR_SEARCH_BACKEND)
+        keyword_search_service: Service for hybrid and keyword search (default:
+            created on first use)
 
     Returns:
         New VerificationPipelineService instance
     """
-    return VerificationPipelineService(embedding_dimension=embedding_dimension)
+    from truthgraph.monitoring.metrics_collector import get_metrics_collector
+
+    nli_scheduler = None
+    if os.getenv("NLI_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes"):
+        nli_scheduler = get_nli_scheduler(nli_service)
+
+    return VerificationPipelineService(
+        embedding_service=embedding_service,
+        nli_service=nli_service,
+        vector_search_service=vector_search_service,
+        keyword_search_service=keyword_search_service,
+        embedding_dimension=embedding_dimension,
+        nli_scheduler=nli_scheduler,
+        persister=get_result_persister() if write_behind_enabled() else None,
+        semantic_cache=get_semantic_claim_cache() if semantic_cache_enabled() else None,
+        early_stopping=NLIEarlyStopping() if nli_early_stopping_enabled() else None,
+        metrics_collector=get_metrics_collector(),
+    )
@@ -0,0 +1,432 @@
+"""Write-behind persistence for verification results.
+
+By default VerificationPipelineService inserts a verification_results row
+and one nli_results row per evidence item, then commits, before it returns
+a verdict, so every verification waits on Postgres. With write-behind
+enabled the pipeline instead hands the rows to VerificationResultPersister
+and returns at once. A background flusher groups queued results and writes
+each group with one multi-row INSERT per table in a single transaction.
+
+Row IDs are generated when a result is queued, so the pipeline can return
+verification_result_id immediately. Callers that must know the row exists
+(e.g. before reading it back) await wait_persisted(record_id).
+
+Guarantees:
+    - The queue is bounded; submit() waits when it is full, so a stalled
+      database slows verifications down instead of growing memory.
+    - stop() writes everything still queued before returning.
+    - A failed group is retried one result at a time, so a single bad row
+      (e.g. a claim deleted meanwhile) does not drop the rest.
+
+Metrics (when a MetricsCollector is attached):
+    - persist.queue_depth (gauge): results waiting when a flush starts
+    - persist.batch_size (histogram): results per flush
+    - persist.flush_ms (histogram): duration of a flush transaction
+
+Configuration (environment):
+    VERIFICATION_WRITE_BEHIND: Enable write-behind storage (default false)
+    WRITE_BEHIND_QUEUE_SIZE: Maximum queued results (default 1000)
+    WRITE_BEHIND_BATCH_SIZE: Maximum results per flush (default 100)
+    WRITE_BEHIND_FLUSH_MS: How long to wait for more results (default 50)
+
+Example:
+    >>> persister = get_result_persister()
+    >>> record_id = await persister.submit(verification_row, nli_rows)
+    >>> await persister.wait_persisted(record_id)
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Optional
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from truthgraph.schemas import NLIResult as NLIResultModel
+from truthgraph.schemas import VerificationResult as VerificationResultModel
+
+logger = structlog.get_logger(__name__)
+
+
+def write_behind_enabled() -> bool:
+    """Whether VERIFICATION_WRITE_BEHIND asks for write-behind result storage."""
+    return os.getenv("VERIFICATION_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class _PendingWrite:
+    """Rows for one verification result, waiting to be flushed."""
+
+    record_id: UUID
+    verification_row: dict[str, Any]
+    nli_rows: list[dict[str, Any]]
+
+
+class VerificationResultPersister:
+    """Queues verification result rows and writes them in batches in the background.
+
+    The flusher is bound to the event loop it is first used on. It starts
+    lazily on the first submit() call and is stopped with stop().
+
+    Attributes:
+        session_factory: Callable returning a new database Session
+        max_queue_size: Maximum queued results before submit() waits
+        max_batch_size: Maximum results per flush
+        flush_interval_ms: How long to wait for more results after the first arrives
+    """
+
+    _instance: ClassVar["VerificationResultPersister | None"] = None
+
+    DEFAULT_QUEUE_SIZE: ClassVar[int] = int(os.getenv("WRITE_BEHIND_QUEUE_SIZE", "1000"))
+    DEFAULT_BATCH_SIZE: ClassVar[int] = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "100"))
+    DEFAULT_FLUSH_MS: ClassVar[float] = float(os.getenv("WRITE_BEHIND_FLUSH_MS", "50"))
+
+    # Failed record IDs remembered for wait_persisted()
+    MAX_REMEMBERED_FAILURES: ClassVar[int] = 1000
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        max_queue_size: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[float] = None,
+        metrics_collector: Any = None,
+    ) -> None:
+        """Initialize the persister.
+
+        Args:
+            session_factory: Creates the sessions used by the flusher
+                (default: truthgraph.db.SessionLocal)
+            max_queue_size: Maximum queued results
+            max_batch_size: Maximum results per flush
+            flush_interval_ms: Collection window after the first queued result
+            metrics_collector: Optional MetricsCollector for exported metrics
+
+        Raises:
+            ValueError: If a size is < 1 or flush_interval_ms < 0
+        """
+        if session_factory is None:
+            from truthgraph.db import SessionLocal
+
+            session_factory = SessionLocal
+
+        self.session_factory = session_factory
+        self.max_queue_size = max_queue_size or self.DEFAULT_QUEUE_SIZE
+        self.max_batch_size = max_batch_size or self.DEFAULT_BATCH_SIZE
+        self.flush_interval_ms = (
+            self.DEFAULT_FLUSH_MS if flush_interval_ms is None else flush_interval_ms
+        )
+        self.metrics_collector = metrics_collector
+
+        if self.max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be >= 1, got {self.max_queue_size}")
+        if self.max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {self.max_batch_size}")
+        if self.flush_interval_ms < 0:
+            raise ValueError(f"flush_interval_ms must be >= 0, got {self.flush_interval_ms}")
+
+        self._queue: asyncio.Queue[_PendingWrite] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._collecting: list[_PendingWrite] = []
+        self._current_flush: asyncio.Future[None] | None = None
+        self._waiters: dict[UUID, asyncio.Future[UUID]] = {}
+        self._failures: OrderedDict[UUID, str] = OrderedDict()
+
+        # Statistics
+        self._submitted = 0
+        self._written = 0
+        self._failed = 0
+        self._flushes = 0
+        self._max_queue_depth = 0
+        self._total_flush_ms = 0.0
+
+    async def submit(
+        self,
+        verification_row: dict[str, Any],
+        nli_rows: list[dict[str, Any]],
+    ) -> UUID:
+        """Queue the rows for one verification result.
+
+        Waits while the queue is full.
+
+        Args:
+            verification_row: verification_results column values; an "id"
+                is generated if missing
+            nli_rows: nli_results column values for the result's evidence
+
+        Returns:
+            The verification_results row ID
+        """
+        self._ensure_running()
+        assert self._queue is not None
+
+        record_id = verification_row.get("id") or uuid4()
+        write = _PendingWrite(
+            record_id=record_id,
+            verification_row={**verification_row, "id": record_id},
+            nli_rows=[{"id": uuid4(), **row} for row in nli_rows],
+        )
+        self._waiters[record_id] = asyncio.get_running_loop().create_future()
+
+        await self._queue.put(write)
+        self._submitted += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return record_id
+
+    async def wait_persisted(self, record_id: UUID, timeout: Optional[float] = None) -> UUID:
+        """Wait until a submitted result has been committed.
+
+        Returns at once for IDs that are already written (or were never
+        submitted to this persister).
+
+        Args:
+            record_id: ID returned by submit()
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            record_id
+
+        Raises:
+            RuntimeError: If writing the result failed
+            TimeoutError: If the timeout expires first
+        """
+        if record_id in self._failures:
+            raise RuntimeError(
+                f"Verification result {record_id} was not stored: {self._failures[record_id]}"
+            )
+        waiter = self._waiters.get(record_id)
+        if waiter is None:
+            return record_id
+        # Shield so a timed-out caller does not cancel the waiter for others
+        return await asyncio.wait_for(asyncio.shield(waiter), timeout=timeout)
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous loop was closed (e.g. between tests)
+            self._loop = loop
+            self._queue = None
+            self._task = None
+            self._current_flush = None
+            self._collecting = []
+            self._waiters.clear()
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="verification-result-persister")
+            logger.info(
+                "result_persister_started",
+                max_queue_size=self.max_queue_size,
+                max_batch_size=self.max_batch_size,
+                flush_interval_ms=self.flush_interval_ms,
+            )
+
+    async def _collect_batch(self) -> list[_PendingWrite]:
+        """Wait for one result, then gather more until the window closes or batch is full.
+
+        Results are gathered in self._collecting so stop() can write a
+        partially collected batch.
+        """
+        assert self._queue is not None
+        batch = self._collecting
+        batch.append(await self._queue.get())
+        deadline = time.perf_counter() + self.flush_interval_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+
+        self._collecting = []
+        return batch
+
+    async def _run(self) -> None:
+        """Background loop: collect a batch and flush it."""
+        while True:
+            batch = await self._collect_batch()
+            # Shielded so stop() lets a started write finish instead of abandoning it
+            self._current_flush = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._current_flush)
+
+    async def _flush(self, batch: list[_PendingWrite]) -> None:
+        """Write a batch in a worker thread and resolve its waiters."""
+        queue_depth = (self._queue.qsize() if self._queue is not None else 0) + len(batch)
+        start = time.perf_counter()
+
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+            outcomes: list[Optional[Exception]] = [None] * len(batch)
+        except Exception as e:
+            logger.warning(
+                "result_persister_batch_failed",
+                result_count=len(batch),
+                error=str(e),
+            )
+            outcomes = [e] if len(batch) == 1 else await self._write_individually(batch)
+
+        flush_ms = (time.perf_counter() - start) * 1000
+        self._flushes += 1
+        self._total_flush_ms += flush_ms
+
+        for write, error in zip(batch, outcomes, strict=True):
+            self._resolve(write.record_id, error)
+
+        await self._export_metrics(len(batch), queue_depth, flush_ms)
+
+    async def _write_individually(self, batch: list[_PendingWrite]) -> list[Optional[Exception]]:
+        """Retry each result of a failed batch in its own transaction."""
+        outcomes: list[Optional[Exception]] = []
+        for write in batch:
+            try:
+                await asyncio.to_thread(self._write_batch, [write])
+                outcomes.append(None)
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        """Insert a batch with one multi-row INSERT per table and commit (blocking)."""
+        session = self.session_factory()
+        try:
+            session.execute(
+                insert(VerificationResultModel), [write.verification_row for write in batch]
+            )
+            nli_rows = [row for write in batch for row in write.nli_rows]
+            if nli_rows:
+                session.execute(insert(NLIResultModel), nli_rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _resolve(self, record_id: UUID, error: Optional[Exception]) -> None:
+        waiter = self._waiters.pop(record_id, None)
+        if error is None:
+            self._written += 1
+            if waiter is not None and not waiter.done():
+                waiter.set_result(record_id)
+            return
+
+        self._failed += 1
+        logger.error(
+            "verification_result_write_behind_failed",
+            verification_result_id=str(record_id),
+            error=str(error),
+        )
+        self._failures[record_id] = str(error)
+        while len(self._failures) > self.MAX_REMEMBERED_FAILURES:
+            self._failures.popitem(last=False)
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(
+                RuntimeError(f"Verification result {record_id} was not stored: {error}")
+            )
+            # Nobody may be waiting; don't log "exception never retrieved"
+            waiter.exception()
+
+    async def _export_metrics(self, batch_size: int, queue_depth: int, flush_ms: float) -> None:
+        if self.metrics_collector is None:
+            return
+        try:
+            await self.metrics_collector.set_gauge("persist.queue_depth", queue_depth)
+            await self.metrics_collector.record_histogram("persist.batch_size", batch_size)
+            await self.metrics_collector.record_histogram("persist.flush_ms", flush_ms)
+        except Exception as e:
+            logger.warning("result_persister_metrics_failed", error=str(e))
+
+    async def flush(self) -> None:
+        """Write everything queued so far and wait for it to be committed."""
+        waiters = [w for w in self._waiters.values() if not w.done()]
+        if waiters:
+            await asyncio.gather(*waiters, return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Stop the flusher after writing every queued result."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._current_flush is not None:
+            await self._current_flush
+            self._current_flush = None
+
+        # Write what the cancelled flusher had collected, then whatever is still queued
+        remaining, self._collecting = self._collecting, []
+        if self._queue is not None:
+            while not self._queue.empty():
+                remaining.append(self._queue.get_nowait())
+            self._queue = None
+        for start in range(0, len(remaining), self.max_batch_size):
+            await self._flush(remaining[start : start + self.max_batch_size])
+        self._loop = None
+
+        logger.info("result_persister_stopped", written=self._written, failed=self._failed)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get write-behind statistics.
+
+        Returns:
+            Dictionary with queue depth, submitted/written/failed counts,
+            flush count, average batch size and average flush time
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self._max_queue_depth,
+            "pending": len(self._waiters),
+            "submitted": self._submitted,
+            "written": self._written,
+            "failed": self._failed,
+            "flushes": self._flushes,
+            "avg_batch_size": round((self._written + self._failed) / self._flushes, 2)
+            if self._flushes
+            else 0.0,
+            "avg_flush_ms": round(self._total_flush_ms / self._flushes, 2)
+            if self._flushes
+            else 0.0,
+            "max_queue_size": self.max_queue_size,
+            "max_batch_size": self.max_batch_size,
+        }
+
+    @classmethod
+    def get_instance(cls) -> "VerificationResultPersister":
+        """Get or create the process-wide persister.
+
+        Returns:
+            The singleton VerificationResultPersister instance
+        """
+        if cls._instance is None:
+            from truthgraph.monitoring.metrics_collector import get_metrics_collector
+
+            cls._instance = cls(metrics_collector=get_metrics_collector())
+        return cls._instance
+
+
+def get_result_persister() -> VerificationResultPersister:
+    """Get the singleton VerificationResultPersister instance.
+
+    Returns:
+        The singleton VerificationResultPersister instance
+    """
+    return VerificationResultPersister.get_instance()
@@ -35,6 +35,8 @@ class OptimizationConfig:
         nli_batch_size: Batch size for NLI inference (default: 16 from Feature 2.2)
         vector_search_lists: IVFFlat lists parameter (default: 50 from Feature 2.3)
         vector_search_probes: IVFFlat probes parameter (default: 10 from Feature 2.3)
+        vector_index_type: Vector index method, "ivfflat" or "hnsw" (default: ivfflat)
+        hnsw_ef_search: HNSW ef_search parameter (default: 40, the pgvector default)
         text_truncation_chars: Max text length (default: 256 from Feature 2.1)
         max_evidence_per_claim: Max evidence items to retrieve (default: 10)
         parallel_claim_processing: Enable parallel processing (default: False)
@@ -46,6 +48,8 @@ class OptimizationConfig:
     nli_batch_size: int = 16
     vector_search_lists: int = 50
     vector_search_probes: int = 10
+    vector_index_type: str = "ivfflat"
+    hnsw_ef_search: int = 40
     text_truncation_chars: int = 256
     max_evidence_per_claim: int = 10
     parallel_claim_processing: bool = False
@@ -423,13 +427,18 @@ def configure_database_for_optimization(db_session: Any, config: OptimizationCon
     from sqlalchemy import text
 
     try:
-        # Set IVFFlat probes for vector search
-        db_session.execute(text(f"SET ivfflat.probes = {config.vector_search_probes}"))
+        # Set the query-time knob of the configured vector index
+        if config.vector_index_type == "hnsw":
+            db_session.execute(text(f"SET hnsw.ef_search = {config.hnsw_ef_search}"))
+        else:
+            db_session.execute(text(f"SET ivfflat.probes = {config.vector_search_probes}"))
 
         logger.info(
             "database_configured",
+            index_type=config.vector_index_type,
             probes=config.vector_search_probes,
             lists=config.vector_search_lists,
+            ef_search=config.hnsw_ef_search,
         )
 
     except Exception as e:
@@ -15,6 +15,11 @@ from sqlalchemy.orm import Session
 
 from truthgraph.api.schemas.evidence import EvidenceItem
 from truthgraph.api.schemas.verification import VerificationResult
+from truthgraph.services.staged_verification_pipeline import (
+    StagedVerificationPipeline,
+    get_staged_verification_pipeline,
+    staged_pipeline_enabled,
+)
 from truthgraph.services.verification_pipeline_service import (
     VerificationPipelineService,
     VerdictLabel,
@@ -56,7 +61,9 @@ class VerificationWorker:
 
     def __init__(
         self,
-        pipeline_service: Optional[VerificationPipelineService] = None,
+        pipeline_service: Optional[
+            VerificationPipelineService | StagedVerificationPipeline
+        ] = None,
         max_retries: int = 3,
         initial_backoff: float = 2.0,
         max_backoff: float = 30.0,
@@ -64,18 +71,27 @@ class VerificationWorker:
         """Initialize verification worker.
 
         Args:
-            pipeline_service: Verification pipeline service (default: singleton)
+            pipeline_service: Verification pipeline service (default: the staged
+                pipeline singleton if VERIFICATION_PIPELINE_MODE=staged, else a new
+                VerificationPipelineService)
             max_retries: Maximum retry attempts (default: 3)
             initial_backoff: Initial backoff delay in seconds (default: 2.0)
             max_backoff: Maximum backoff delay in seconds (default: 30.0)
         """
-        self.pipeline_service = pipeline_service or get_verification_pipeline_service()
+        if pipeline_service is None:
+            pipeline_service = (
+                get_staged_verification_pipeline()
+                if staged_pipeline_enabled()
+                else get_verification_pipeline_service()
+            )
+        self.pipeline_service = pipeline_service
         self.max_retries = max_retries
         self.initial_backoff = initial_backoff
         self.max_backoff = max_backoff
 
         logger.info(
             "verification_worker_initialized",
+            pipeline=type(pipeline_service).__name__,
             max_retries=max_retries,
             initial_backoff=initial_backoff,
             max_backoff=max_backoff,
@@ -224,6 +240,115 @@ class VerificationWorker:
             f"Verification failed after {self.max_retries} attempts"
         )
 
+    async def process_verification_batch(
+        self,
+        db: Session,
+        claims: list[tuple[str, UUID, str]],
+        top_k_evidence: int = 10,
+        min_similarity: float = 0.3,
+        tenant_id: str = "default",
+        corpus_ids: Optional[list[str]] = None,
+    ) -> list[VerificationResult]:
+        """Verify many claims in one batched pipeline run, with retry logic.
+
+        Uses VerificationPipelineService.verify_claims, so embedding, evidence
+        search, NLI and persistence are each done once for the whole batch.
+        A retry re-runs the whole batch; cached claims are not recomputed.
+
+        Args:
+            db: Database session
+            claims: (claim_id, claim_uuid, claim_text) for each claim
+            top_k_evidence: Number of evidence items to retrieve per claim
+            min_similarity: Minimum similarity threshold
+            tenant_id: Tenant identifier
+            corpus_ids: Optional corpus filter
+
+        Returns:
+            One VerificationResult per claim, in input order
+
+        Raises:
+            PermanentError: For errors that should not be retried
+            TemporaryError: For errors after max retries exhausted
+        """
+        logger.info("verification_batch_processing_started", claim_count=len(claims))
+
+        start_time = time.time()
+        attempt = 0
+
+        while True:
+            try:
+                pipeline_results = await self.pipeline_service.verify_claims(
+                    db=db,
+                    claims=[(claim_uuid, claim_text) for _, claim_uuid, claim_text in claims],
+                    top_k_evidence=top_k_evidence,
+                    min_similarity=min_similarity,
+                    tenant_id=tenant_id,
+                    use_cache=True,
+                    store_result=True,
+                )
+                break
+
+            except PermanentError as e:
+                logger.error(
+                    "verification_batch_permanent_error",
+                    claim_count=len(claims),
+                    error=str(e),
+                    exc_info=True,
+                )
+                raise
+
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    logger.error(
+                        "verification_batch_max_retries_exceeded",
+                        claim_count=len(claims),
+                        attempts=attempt,
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    raise TemporaryError(
+                        f"Batch verification failed after {self.max_retries} attempts: {e}"
+                    ) from e
+
+                backoff = min(
+                    self.initial_backoff * (2 ** (attempt - 1)),
+                    self.max_backoff,
+                )
+                logger.warning(
+                    "verification_batch_retry",
+                    claim_count=len(claims),
+                    attempt=attempt,
+                    max_retries=self.max_retries,
+                    backoff_seconds=backoff,
+                    error=str(e),
+                )
+                await asyncio.sleep(backoff)
+
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        results = [
+            self._convert_to_api_result(
+                claim_id=claim_id,
+                claim_text=claim_text,
+                pipeline_result=pipeline_result,
+                processing_time_ms=processing_time_ms,
+                corpus_ids=corpus_ids,
+                validation_warnings=None,
+            )
+            for (claim_id, _, claim_text), pipeline_result in zip(
+                claims, pipeline_results, strict=True
+            )
+        ]
+
+        logger.info(
+            "verification_batch_completed",
+            claim_count=len(claims),
+            processing_time_ms=processing_time_ms,
+            attempts=attempt + 1,
+        )
+
+        return results
+
     def _convert_to_api_result(
         self,
         claim_id: str,